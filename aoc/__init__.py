@@ -0,0 +1 @@
+"""aoc package; shared tooling for running and measuring every day."""
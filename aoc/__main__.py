@@ -0,0 +1,85 @@
+"""Command line entrypoint: ``python -m aoc <command>``."""
+import argparse
+import sys
+
+from aoc import (
+    batch,
+    benchmark,
+    cache,
+    daemon,
+    dashboard,
+    engines,
+    generate,
+    runner,
+    scheduler,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser with one subcommand per tool."""
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="time parse/part1/part2 per day")
+    runner.add_arguments(run_parser)
+    run_parser.set_defaults(func=runner.main)
+
+    schedule_parser = subparsers.add_parser(
+        "schedule", help="run days in parallel, longest first"
+    )
+    scheduler.add_arguments(schedule_parser)
+    schedule_parser.set_defaults(func=scheduler.main)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="solve one day for many inputs, streaming json lines"
+    )
+    batch.add_arguments(batch_parser)
+    batch_parser.set_defaults(func=batch.main)
+
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="keep every day imported in warm workers, solving on request"
+    )
+    daemon.add_arguments(daemon_parser)
+
+    dashboard_parser = subparsers.add_parser(
+        "dashboard", help="write an html report of benchmark results across commits"
+    )
+    dashboard.add_arguments(dashboard_parser)
+    dashboard_parser.set_defaults(func=dashboard.main)
+
+    engines_parser = subparsers.add_parser(
+        "engines", help="check that every engine of a part gives the same answers"
+    )
+    engines.add_arguments(engines_parser)
+    engines_parser.set_defaults(func=engines.main)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="write deterministic synthetic inputs at a given scale"
+    )
+    generate.add_arguments(generate_parser)
+    generate_parser.set_defaults(func=generate.main)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="benchmark days and fail on regressions against a baseline"
+    )
+    benchmark.add_arguments(bench_parser)
+    bench_parser.set_defaults(func=benchmark.main)
+
+    cache_parser = subparsers.add_parser(
+        "cache", help="show the size of or clear the parsed input cache"
+    )
+    cache.add_arguments(cache_parser)
+    cache_parser.set_defaults(func=cache.main)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parses arguments and dispatches to the chosen subcommand."""
+    args = build_parser().parse_args(argv)
+    exit_code: int = args.func(args)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
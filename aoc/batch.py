@@ -0,0 +1,181 @@
+"""Solves one day for many inputs, e.g. to check everyone's answers.
+
+Usage: ``python -m aoc batch 16 inputs/ "more/*.txt" --workers 8``
+
+Inputs (files, directories of ``*.txt`` files or globs) are shared out to
+a pool of worker processes that import the day once and then solve one
+input after another, rather than starting a process per input. Each
+input's answers are written as a line of json as soon as it's solved, so
+lines come out in the order inputs finish. Throughput is reported on
+stderr at the end.
+
+Parallelism is across inputs, so days with their own process pool are
+told to use one process (``AOC_WORKERS=1``).
+"""
+import argparse
+import contextlib
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Iterable, TextIO
+
+from aoc import runner
+from aoc.cache import AnswerCache, ParseCache
+from aoc.lib import budget
+from aoc.lib.workers import WORKERS_ENV
+from aoc.runner import ALL_PARTS, PhaseResult
+from aoc.solution import Solution, load_solution
+
+# what each worker process loads once, set by ``init_worker``
+_solution: Solution[Any] | None = None
+_cache: ParseCache | None = None
+_answers: AnswerCache | None = None
+
+
+@dataclass
+class BatchStats:
+    """How many inputs a batch solved, how many failed and how long it took."""
+
+    inputs: int = 0
+    failed: int = 0
+    wall_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Inputs solved per second."""
+        return self.inputs / self.wall_time if self.wall_time else 0.0
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[str]:
+    """Input files named by paths, directories (their ``*.txt``) or globs."""
+    paths: dict[str, None] = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, "*.txt")))
+        elif any(char in pattern for char in "*?["):
+            matches = sorted(glob.glob(pattern))
+        else:
+            matches = [pattern]
+        paths.update(dict.fromkeys(matches))
+    return list(paths)
+
+
+def init_worker(day: int, use_cache: bool) -> None:
+    """Imports the day and opens the caches, once per worker process."""
+    global _solution, _cache, _answers
+    os.environ[WORKERS_ENV] = "1"
+    _solution = load_solution(day)
+    _cache = ParseCache() if use_cache else None
+    _answers = runner.answer_cache(use_cache, False)
+
+
+def record(day: int, path: str, results: list[PhaseResult]) -> dict[str, Any]:
+    """One input's json line: each part's answer, the first error and timings."""
+    line: dict[str, Any] = {"day": day, "input": path}
+    for result in results:
+        if result.phase != runner.PARSE:
+            line[result.phase] = result.answer
+    line["error"] = next((result.error for result in results if result.error), None)
+    line["seconds"] = {result.phase: result.min for result in results}
+    line["cached"] = all(result.cached for result in results)
+    return line
+
+
+def solve_input(path: str, parts: list[int]) -> dict[str, Any]:
+    """Runs in a worker: solves one input with the warm solution."""
+    assert _solution is not None, "init_worker wasn't run"
+    with contextlib.redirect_stdout(sys.stderr):
+        results = runner.run_solution(
+            _solution, path, parts, cache=_cache, answers=_answers
+        )
+    return record(_solution.day, path, results)
+
+
+def run_batch(
+    day: int,
+    paths: list[str],
+    parts: list[int],
+    workers: int,
+    use_cache: bool,
+    file: TextIO,
+) -> BatchStats:
+    """Solves every input, writing a json line for each as it finishes."""
+    stats = BatchStats()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        workers, initializer=init_worker, initargs=(day, use_cache)
+    ) as pool:
+        futures: dict[Future[dict[str, Any]], str] = {
+            pool.submit(solve_input, path, parts): path for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                line = future.result()
+            except Exception as exc:  # e.g. a worker died
+                line = {"day": day, "input": futures[future]}
+                line["error"] = runner.describe_error(exc)
+            stats.inputs += 1
+            stats.failed += line["error"] is not None
+            file.write(json.dumps(line, default=str) + "\n")
+            file.flush()
+    stats.wall_time = time.perf_counter() - start
+    return stats
+
+
+def write_report(stats: BatchStats, workers: int) -> None:
+    """Writes the throughput to stderr."""
+    print(
+        f"{stats.inputs} inputs in {stats.wall_time:.3f}s "
+        f"({stats.throughput:.1f} inputs/s on {workers} workers), "
+        f"{stats.failed} failed",
+        file=sys.stderr,
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``batch`` arguments to a parser."""
+    parser.add_argument("day", type=int, help="day to solve")
+    parser.add_argument(
+        "inputs", nargs="+", help="input files, directories of *.txt files or globs"
+    )
+    parser.add_argument(
+        "--part", nargs="+", type=int, choices=ALL_PARTS, default=list(ALL_PARTS)
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="worker processes"
+    )
+    parser.add_argument("--output", help="write json lines here instead of stdout")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        metavar="SECONDS",
+        help="stop each part after SECONDS, reporting its partial answer",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="parse and solve from scratch, ignoring cached inputs and answers",
+    )
+
+
+def main(args: argparse.Namespace) -> int:
+    """Solves the inputs; returns non-zero if any of them failed."""
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print("no inputs found", file=sys.stderr)
+        return 2
+    if args.budget is not None:
+        budget.set_budget(args.budget)
+    workers = max(1, min(args.workers, len(paths)))
+    use_cache = not args.no_cache
+    if args.output is None:
+        stats = run_batch(args.day, paths, args.part, workers, use_cache, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf8") as file:
+            stats = run_batch(args.day, paths, args.part, workers, use_cache, file)
+    write_report(stats, workers)
+    return 1 if stats.failed else 0
@@ -0,0 +1,401 @@
+"""Benchmarks every day and gates on regressions against a stored baseline.
+
+Each case (one day on one input) runs in a fresh process, so peak memory
+is per case and one day's caches can't speed up another. How long each
+day takes to import is benchmarked too, as its ``startup/import`` phase.
+
+Usage: ``python -m aoc bench 17 --scale 0.25 1 --save`` then
+``python -m aoc bench 17 --scale 0.25 1`` after a change.
+
+Every run's results are also kept in ``.aoc/benchmarks/`` with the commit
+they ran on, for ``python -m aoc dashboard`` to chart across commits.
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, TextIO
+
+from aoc.generate import GENERATED_DIR, write_input
+from aoc.lib.importtime import measure_import
+from aoc.runner import (
+    ALL_PARTS,
+    PhaseResult,
+    describe_error,
+    format_ms,
+    run_solution,
+)
+from aoc.solution import discover_days, load_solution
+
+BASELINE_PATH = ".aoc/benchmark-baseline.json"
+HISTORY_DIR = ".aoc/benchmarks"
+DEFAULT_SCALES = [0.25]
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_NOISE = 0.005
+STARTUP_LABEL = "startup"
+IMPORT = "import"
+
+# fixtures other than ``dayNN/input-small.txt`` for every part
+FIXTURES: dict[int, list[tuple[str, tuple[int, ...]]]] = {
+    1: [("day01/input-small.txt", (1,)), ("day01/input-small2.txt", (2,))],
+    8: [("day08/input-b.txt", (1,)), ("day08/input-c.txt", (2,))],
+    10: [("day10/input-b.txt", (1,)), ("day10/input-d.txt", (2,))],
+    20: [("day20/input-b.txt", (1,))],
+    21: [("day21/input-small.txt", (1,))],
+}
+
+
+@dataclass(frozen=True)
+class Case:
+    """One day on one input."""
+
+    day: int
+    label: str
+    input_path: str
+    parts: tuple[int, ...] = ALL_PARTS
+
+
+@dataclass
+class CaseResult:
+    """Phase timings and peak memory (KiB) of one case."""
+
+    case: Case
+    phases: list[PhaseResult]
+    peak_memory_kb: int | None
+
+    def records(self) -> list[dict[str, Any]]:
+        """Flat json friendly records, one per phase."""
+        return [
+            {
+                "key": record_key(self.case, phase.phase),
+                "label": self.case.label,
+                **phase.to_dict(),
+                "peak_memory_kb": self.peak_memory_kb,
+            }
+            for phase in self.phases
+        ]
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A phase that got slower, hungrier, wrong or broken."""
+
+    key: str
+    metric: str
+    baseline: Any
+    current: Any
+
+    def __str__(self) -> str:
+        """One line description."""
+        if self.metric == "time":
+            return (
+                f"{self.key}: {format_ms(self.baseline)}ms -> "
+                f"{format_ms(self.current)}ms"
+            )
+        if self.metric == "memory":
+            return f"{self.key}: {self.baseline}KiB -> {self.current}KiB peak memory"
+        return f"{self.key}: {self.metric} {self.baseline!r} -> {self.current!r}"
+
+
+def record_key(case: Case, phase: str) -> str:
+    """Baseline key of a phase, e.g. ``day17/x0.25-seed0/part2``."""
+    return f"day{case.day:02}/{case.label}/{phase}"
+
+
+def fixture_cases(day: int) -> list[Case]:
+    """Cases for the small inputs checked into the repo."""
+    fixtures = FIXTURES.get(day, [(f"day{day:02}/input-small.txt", ALL_PARTS)])
+    return [
+        Case(day, os.path.splitext(os.path.basename(path))[0], path, parts)
+        for path, parts in fixtures
+    ]
+
+
+def build_cases(
+    days: Iterable[int],
+    scales: Iterable[float],
+    seed: int = 0,
+    fixtures: bool = True,
+    directory: str = GENERATED_DIR,
+) -> list[Case]:
+    """Fixture and synthetic cases for each day, generating inputs as needed."""
+    cases: list[Case] = []
+    for day in days:
+        if fixtures:
+            cases.extend(fixture_cases(day))
+        for scale in scales:
+            path = write_input(day, scale, seed, directory)
+            cases.append(Case(day, f"x{scale:g}-seed{seed}", path))
+    return cases
+
+
+def peak_memory_kb() -> int | None:
+    """Peak resident memory of this process, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover
+        return None  # windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_case(case: Case, repeat: int = 1) -> CaseResult:
+    """Runs a case in this process; solver output is discarded."""
+    with (
+        open(os.devnull, "w", encoding="utf8") as devnull,
+        contextlib.redirect_stdout(devnull),
+    ):
+        solution = load_solution(case.day)
+        phases = run_solution(solution, case.input_path, case.parts, repeat)
+    return CaseResult(case, phases, peak_memory_kb())
+
+
+def run_cases(cases: list[Case], repeat: int = 1) -> list[CaseResult]:
+    """Runs each case one at a time, each in a fresh process."""
+    results: list[CaseResult] = []
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context, max_tasks_per_child=1) as pool:
+        for case in cases:
+            result = pool.submit(run_case, case, repeat).result()
+            print(f"benchmarked day{case.day:02} {case.label}", file=sys.stderr)
+            results.append(result)
+    return results
+
+
+def import_records(days: Iterable[int], repeat: int = 1) -> list[dict[str, Any]]:
+    """Records of how long each ``dayNN.solution`` takes to import."""
+    records: list[dict[str, Any]] = []
+    for day in days:
+        module = f"day{day:02}.solution"
+        result = PhaseResult(day, IMPORT, module)
+        slowest: dict[str, float] = {}
+        try:
+            import_time = measure_import(module, repeat)
+        except (ImportError, ValueError) as exc:
+            result.error = describe_error(exc)
+        else:
+            result.timings.append(import_time.seconds)
+            slowest = import_time.slowest
+        records.append(
+            {
+                "key": f"day{day:02}/{STARTUP_LABEL}/{IMPORT}",
+                "label": STARTUP_LABEL,
+                **result.to_dict(),
+                "peak_memory_kb": None,
+                "slowest_imports": slowest,
+            }
+        )
+    print("benchmarked imports", file=sys.stderr)
+    return records
+
+
+def load_baseline(path: str) -> dict[str, dict[str, Any]]:
+    """Reads baseline records keyed by ``record_key``; empty if missing."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf8") as file:
+        records: list[dict[str, Any]] = json.load(file)["results"]
+    return {record["key"]: record for record in records}
+
+
+def save_baseline(path: str, records: list[dict[str, Any]]) -> None:
+    """Merges records into the baseline, replacing phases that were re-run."""
+    baseline = load_baseline(path)
+    baseline.update((record["key"], record) for record in records)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf8") as file:
+        json.dump({"results": list(baseline.values())}, file, indent=2, default=str)
+        file.write("\n")
+
+
+def current_commit() -> str | None:
+    """Short hash of the checked out commit, or None outside a git repo."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def save_history(directory: str, records: list[dict[str, Any]]) -> str:
+    """Stores a run's records with its commit and time; returns the file."""
+    commit = current_commit()
+    timestamp = time.time()
+    stamp = datetime.datetime.fromtimestamp(timestamp).strftime("%Y%m%d-%H%M%S-%f")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{stamp}-{commit or 'unknown'}.json")
+    with open(path, "w", encoding="utf8") as file:
+        json.dump(
+            {"commit": commit, "timestamp": timestamp, "results": records},
+            file,
+            indent=2,
+            default=str,
+        )
+        file.write("\n")
+    return path
+
+
+def compare(
+    records: list[dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    memory_threshold: float = DEFAULT_THRESHOLD,
+    noise: float = DEFAULT_NOISE,
+) -> list[Regression]:
+    """Finds phases that regressed against the baseline.
+
+    A phase regresses if it now fails, its answer changed, its fastest time
+    grew by more than ``threshold`` (and by more than ``noise`` seconds), or
+    its peak memory grew by more than ``memory_threshold``. Phases missing
+    from the baseline only fail on errors.
+    """
+    regressions: list[Regression] = []
+    for record in records:
+        key = record["key"]
+        old = baseline.get(key, {})
+        if record["error"] is not None:
+            if old.get("error") is None:
+                regressions.append(Regression(key, "error", None, record["error"]))
+            continue
+        if not old or old["error"] is not None:
+            continue
+
+        if record["answer"] is not None and str(record["answer"]) != str(old["answer"]):
+            regressions.append(
+                Regression(key, "answer", old["answer"], record["answer"])
+            )
+        old_time, time = old["min"], record["min"]
+        if (
+            old_time is not None
+            and time is not None
+            and time > old_time * (1 + threshold)
+            and time - old_time > noise
+        ):
+            regressions.append(Regression(key, "time", old_time, time))
+        old_memory, memory = old["peak_memory_kb"], record["peak_memory_kb"]
+        if (
+            old_memory is not None
+            and memory is not None
+            and memory > old_memory * (1 + memory_threshold)
+        ):
+            regressions.append(Regression(key, "memory", old_memory, memory))
+    return regressions
+
+
+def write_report(
+    records: list[dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    regressions: list[Regression],
+    file: TextIO,
+) -> None:
+    """Writes a table of timings next to the baseline, then the regressions."""
+    file.write(
+        f"{'day':>3} {'input':<16} {'phase':<6} {'min(ms)':>12} "
+        f"{'base(ms)':>12} {'change':>8} {'peak(MiB)':>10}\n"
+    )
+    for record in records:
+        old_time = baseline.get(record["key"], {}).get("min")
+        change = "-"
+        if old_time and record["min"] is not None:
+            change = f"{record['min'] / old_time - 1:+.0%}"
+        memory = record["peak_memory_kb"]
+        memory_str = "-" if memory is None else f"{memory / 1024:.1f}"
+        status = f"  error: {record['error']}" if record["error"] else ""
+        file.write(
+            f"{record['day']:>3} {record['label']:<16} {record['phase']:<6} "
+            f"{format_ms(record['min']):>12} {format_ms(old_time):>12} "
+            f"{change:>8} {memory_str:>10}{status}\n"
+        )
+    if regressions:
+        file.write(f"\n{len(regressions)} regression(s):\n")
+        for regression in regressions:
+            file.write(f"  {regression}\n")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``bench`` arguments to a parser."""
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default all)")
+    parser.add_argument(
+        "--scale",
+        nargs="*",
+        type=float,
+        default=DEFAULT_SCALES,
+        help="synthetic input sizes; pass no values to skip them",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-fixtures", action="store_true", help="skip the checked in inputs"
+    )
+    parser.add_argument(
+        "--no-imports", action="store_true", help="skip the import time benchmark"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per phase")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--save", action="store_true", help="store these results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown, e.g. 0.25 for 25%%",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed peak memory growth",
+    )
+    parser.add_argument(
+        "--noise",
+        type=float,
+        default=DEFAULT_NOISE,
+        help="ignore slowdowns smaller than this many seconds",
+    )
+    parser.add_argument("--output", help="also write the results as json here")
+    parser.add_argument(
+        "--history", default=HISTORY_DIR, help="directory keeping every run's results"
+    )
+    parser.add_argument(
+        "--no-history", action="store_true", help="don't keep this run's results"
+    )
+
+
+def main(args: argparse.Namespace) -> int:
+    """Benchmarks, reports, and returns non-zero on any regression."""
+    days: list[int] = args.days or discover_days()
+    cases = build_cases(days, args.scale, args.seed, not args.no_fixtures)
+    results = run_cases(cases, max(1, args.repeat))
+    records = [record for result in results for record in result.records()]
+    if not args.no_imports:
+        records.extend(import_records(days, max(1, args.repeat)))
+
+    baseline = load_baseline(args.baseline)
+    regressions = compare(
+        records, baseline, args.threshold, args.memory_threshold, args.noise
+    )
+    write_report(records, baseline, regressions, sys.stdout)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf8") as file:
+            json.dump({"results": records}, file, indent=2, default=str)
+            file.write("\n")
+    if not args.no_history:
+        save_history(args.history, records)
+    if args.save:
+        save_baseline(args.baseline, records)
+        return 1 if any(record["error"] for record in records) else 0
+    return 1 if regressions else 0
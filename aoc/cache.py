@@ -0,0 +1,357 @@
+"""Content addressed on-disk caches of parsed inputs and answers.
+
+Parsed inputs are pickled under ``.aoc/cache/parsed`` and answers (with
+their timings) under ``.aoc/cache/answers``, keyed by a hash of the input
+file and of the source code of the day and of ``aoc/lib``, so editing any
+of them invalidates the entry automatically. Least recently used entries
+are evicted once a directory grows past ``AOC_CACHE_MB`` (default 512), or
+past ``DEFAULT_MAX_ANSWERS`` entries for answers.
+
+Usage: ``python -m aoc cache info`` and ``python -m aoc cache clear``.
+"""
+import argparse
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import time
+from typing import Any
+
+from aoc.solution import ROOT, Solution
+
+CACHE_DIR = ".aoc/cache"
+PARSED = "parsed"
+ANSWERS = "answers"
+DEFAULT_MAX_ANSWERS = 1000
+CACHE_SIZE_ENV = "AOC_CACHE_MB"
+DEFAULT_CACHE_MB = 512
+EXTENSION = ".pickle"
+# stored instead of a parsed input that unpickles slower than it parses
+SLOWER_THAN_PARSING = "slower than parsing"
+# parts of a day package that can't change what it parses or solves
+IGNORED_SOURCES = ("tests", "generator.py")
+# shared code the days build their inputs and answers with
+SHARED_SOURCES = os.path.join("aoc", "lib")
+
+
+def cache_size_limit() -> int:
+    """Maximum bytes per cache directory, from ``AOC_CACHE_MB``."""
+    megabytes = float(os.environ.get(CACHE_SIZE_ENV) or DEFAULT_CACHE_MB)
+    return int(megabytes * 1024 * 1024)
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file's contents."""
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def python_version() -> str:
+    """``major.minor``; pickles and timings may differ between versions."""
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def source_digest(digest: "hashlib._Hash", root: str, package: str) -> None:
+    """Adds every source file under ``root/package``, apart from tests/generators."""
+    for directory, subdirectories, files in os.walk(os.path.join(root, package)):
+        subdirectories[:] = sorted(
+            name for name in subdirectories if name not in IGNORED_SOURCES
+        )
+        for name in sorted(files):
+            if not name.endswith(".py") or name in IGNORED_SOURCES:
+                continue
+            path = os.path.join(directory, name)
+            digest.update(os.path.relpath(path, root).encode())
+            digest.update(file_digest(path).encode())
+
+
+@functools.cache
+def code_digest(day: int, root: str | None = None) -> str:
+    """sha256 of the source of ``dayNN`` and of the shared ``aoc/lib`` it uses.
+
+    Cached per process; the code isn't expected to change mid-run.
+    """
+    root = ROOT if root is None else root
+    digest = hashlib.sha256()
+    for package in (f"day{day:02}", SHARED_SOURCES):
+        source_digest(digest, root, package)
+    return digest.hexdigest()
+
+
+def file_size(path: str) -> int | None:
+    """Size of a file, or None if there isn't one."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def dumps(value: Any) -> bytes | None:
+    """Pickles ``value``, or returns None if it can't be pickled."""
+    try:
+        return pickle.dumps(value, protocol=5)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        return None
+
+
+class DiskCache:
+    """Pickled values in a directory, least recently used evicted first.
+
+    Entries are files named after their key; reading one bumps its mtime,
+    which is what eviction orders by. The directory is scanned on the first
+    write, and after that only once a write takes it over a limit; writes
+    from other processes are noticed at the next scan.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+    ):
+        """Cache in ``directory``.
+
+        Args:
+            directory: where entries are stored.
+            max_bytes: size limit; defaults to ``AOC_CACHE_MB``.
+            max_entries: optional limit on the number of entries.
+        """
+        self.directory = directory
+        self.max_bytes = cache_size_limit() if max_bytes is None else max_bytes
+        self.max_entries = max_entries
+        # bytes and entries in the directory, as of the last scan and our writes
+        self.usage: tuple[int, int] | None = None
+
+    def path(self, key: str) -> str:
+        """File holding ``key``."""
+        return os.path.join(self.directory, key + EXTENSION)
+
+    def load(self, key: str) -> tuple[bool, Any]:
+        """Returns ``(True, value)`` on a hit, ``(False, None)`` on a miss.
+
+        Unreadable entries (truncated, or pickled from classes that no
+        longer exist) are deleted and count as misses.
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            self.remove(path)
+            return False, None
+        os.utime(path)
+        return True, value
+
+    def store(self, key: str, value: Any) -> bool:
+        """Pickles ``value`` under ``key``; False if it can't be pickled or fit."""
+        data = dumps(value)
+        return data is not None and self.write(key, data)
+
+    def write(self, key: str, data: bytes) -> bool:
+        """Stores an already pickled value; False if it's too big to keep."""
+        if len(data) > self.max_bytes:
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        replaced = file_size(path)
+        partial_path = f"{path}.{os.getpid()}.partial"
+        with open(partial_path, "wb") as file:
+            file.write(data)
+        os.replace(partial_path, path)
+        if self.usage is None:
+            self.usage = self.measure()
+        else:
+            size, count = self.usage
+            if replaced is None:
+                self.usage = size + len(data), count + 1
+            else:
+                self.usage = size + len(data) - replaced, count
+        if self.over_limits(*self.usage):
+            self.evict()
+        return True
+
+    def entries(self) -> list[os.DirEntry[str]]:
+        """Cache files, least recently used first."""
+        if not os.path.isdir(self.directory):
+            return []
+        entries = [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(EXTENSION)
+        ]
+        return sorted(entries, key=lambda entry: entry.stat().st_mtime)
+
+    def size(self) -> int:
+        """Bytes used by the cache."""
+        return sum(entry.stat().st_size for entry in self.entries())
+
+    def measure(self) -> tuple[int, int]:
+        """Bytes and number of entries in the directory."""
+        entries = self.entries()
+        return sum(entry.stat().st_size for entry in entries), len(entries)
+
+    def over_limits(self, size: int, count: int) -> bool:
+        """True if ``count`` entries of ``size`` bytes are too many to keep."""
+        return size > self.max_bytes or (
+            self.max_entries is not None and count > self.max_entries
+        )
+
+    def evict(self) -> None:
+        """Deletes least recently used entries until under the limits."""
+        entries = self.entries()
+        size = sum(entry.stat().st_size for entry in entries)
+        count = len(entries)
+        for entry in entries:
+            if not self.over_limits(size, count):
+                break
+            size -= entry.stat().st_size
+            count -= 1
+            self.remove(entry.path)
+        self.usage = size, count
+
+    def clear(self) -> int:
+        """Deletes every entry; returns how many there were."""
+        entries = self.entries()
+        for entry in entries:
+            self.remove(entry.path)
+        self.usage = None
+        return len(entries)
+
+    @staticmethod
+    def remove(path: str) -> None:
+        """Deletes a file that another process may have deleted already."""
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+class ParseCache:
+    """Parsed inputs keyed by day, input contents and the day's code.
+
+    Unpickling lots of small objects can be slower than parsing them, so
+    inputs that load slower than they parse are remembered as not worth
+    caching and parsed every time.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int | None = None):
+        """Stores entries in ``directory/parsed``."""
+        self.cache = DiskCache(os.path.join(directory, PARSED), max_bytes)
+
+    @staticmethod
+    def key(solution: Solution[Any], path: str) -> str:
+        """Cache key for parsing ``path`` with this version of the day."""
+        parts = [
+            str(solution.day),
+            file_digest(path),
+            code_digest(solution.day),
+            python_version(),
+        ]
+        digest = hashlib.sha256(":".join(parts).encode()).hexdigest()
+        return f"day{solution.day:02}-{digest[:32]}"
+
+    def parse(self, solution: Solution[Any], path: str) -> tuple[Any, bool]:
+        """Parses ``path``, loading a cached copy if there is one.
+
+        Returns the parsed input and whether it came from the cache. Misses
+        aren't stored here; see ``store``.
+        """
+        hit, data = self.cache.load(self.key(solution, path))
+        if hit and not (isinstance(data, str) and data == SLOWER_THAN_PARSING):
+            return data, True
+        return solution.parse(path), False
+
+    def store(
+        self, solution: Solution[Any], path: str, data: Any, parse_time: float
+    ) -> bool:
+        """Caches freshly parsed ``data``; call before anything mutates it.
+
+        Returns whether ``data`` was cached; if loading it takes longer than
+        ``parse_time`` seconds, a marker saying so is cached instead. Nothing
+        is stored if there's already a marker.
+        """
+        key = self.key(solution, path)
+        if os.path.exists(self.cache.path(key)):
+            return False
+        pickled = dumps(data)
+        if pickled is None:
+            return False
+        start = time.perf_counter()
+        pickle.loads(pickled)
+        if time.perf_counter() - start >= parse_time:
+            self.cache.store(key, SLOWER_THAN_PARSING)
+            return False
+        return self.cache.write(key, pickled)
+
+
+class AnswerCache:
+    """Answers and timings of each phase, keyed by day, input and code.
+
+    A hit means this version of the day already solved this input, so the
+    phase needn't run at all.
+    """
+
+    def __init__(
+        self, directory: str = CACHE_DIR, max_entries: int = DEFAULT_MAX_ANSWERS
+    ):
+        """Stores entries in ``directory/answers``, keeping ``max_entries``."""
+        self.cache = DiskCache(
+            os.path.join(directory, ANSWERS), max_entries=max_entries
+        )
+
+    @staticmethod
+    def key(day: int, phase: str, input_digest: str) -> str:
+        """Cache key of a phase of this version of the day, on an input."""
+        parts = [str(day), phase, input_digest, code_digest(day), python_version()]
+        digest = hashlib.sha256(":".join(parts).encode()).hexdigest()
+        return f"day{day:02}-{phase}-{digest[:32]}"
+
+    def load(
+        self, day: int, phase: str, input_digest: str
+    ) -> tuple[Any, list[float]] | None:
+        """Returns the cached ``(answer, timings)`` of a phase, if any."""
+        hit, entry = self.cache.load(self.key(day, phase, input_digest))
+        if not hit:
+            return None
+        answer, timings = entry
+        return answer, timings
+
+    def store(
+        self,
+        day: int,
+        phase: str,
+        input_digest: str,
+        answer: Any,
+        timings: list[float],
+    ) -> bool:
+        """Caches a phase that ran successfully."""
+        return self.cache.store(self.key(day, phase, input_digest), (answer, timings))
+
+
+def caches(directory: str = CACHE_DIR) -> dict[str, DiskCache]:
+    """Every cache by name, for ``info``/``clear``."""
+    return {PARSED: ParseCache(directory).cache, ANSWERS: AnswerCache(directory).cache}
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``cache`` arguments to a parser."""
+    parser.add_argument("action", choices=["info", "clear"])
+    parser.add_argument("--directory", default=CACHE_DIR)
+
+
+def main(args: argparse.Namespace) -> int:
+    """Prints the size of each cache, or empties them."""
+    for name, cache in caches(args.directory).items():
+        if args.action == "clear":
+            print(f"{name}: removed {cache.clear()} entries")
+        else:
+            entries, size = len(cache.entries()), cache.size()
+            limit = cache.max_bytes / 1024 / 1024
+            max_entries = "" if cache.max_entries is None else f"/{cache.max_entries}"
+            print(
+                f"{name}: {entries}{max_entries} entries, "
+                f"{size / 1024 / 1024:.1f}/{limit:g}MiB"
+            )
+    return 0
@@ -0,0 +1,342 @@
+"""Keeps every day imported in a pool of worker processes, solving on request.
+
+Usage: ``python -m aoc daemon serve --workers 4``, then
+``python -m aoc daemon request 16 --input day16/input-small.txt``.
+
+Each ``python -m dayNN.dayN`` pays for interpreter start-up and imports.
+The daemon pays once: its workers import every day (and the solver
+libraries in ``PRELOAD``) when they start. It listens on a Unix socket, or
+on localhost with ``--port`` (e.g. on Windows), for one line of json per
+request::
+
+    {"day": 16, "part": 2, "input_path": "day16/input-small.txt"}
+
+``part`` (a part or list of parts) and ``input_path`` default to both
+parts and the day's input, and ``budget`` to the daemon's ``--budget``.
+Each request gets one line back, with the same fields as a line of
+``python -m aoc batch``, plus ``queued`` (seconds spent waiting for a
+worker) and ``elapsed`` (seconds from request to response).
+
+At most ``--workers`` requests are solved at once, and ``--max-pending``
+more wait for a worker; requests beyond that are turned away with an
+error straight away. ``{"command": "status"}`` and
+``{"command": "shutdown"}`` inspect and stop the daemon.
+"""
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from aoc import batch, runner
+from aoc.cache import AnswerCache, ParseCache
+from aoc.lib import budget
+from aoc.lib.workers import WORKERS_ENV
+from aoc.runner import ALL_PARTS
+from aoc.solution import discover_days, load_solution
+
+DEFAULT_SOCKET = ".aoc/daemon.sock"
+DEFAULT_MAX_PENDING = 64
+# libraries that solvers import when they first need them
+PRELOAD = ("numpy", "networkx", "z3", "tqdm.contrib.concurrent")
+
+# a Unix socket path, or a localhost port
+Address = str | int
+
+# caches of each worker process, opened by ``preload``
+_cache: ParseCache | None = None
+_answers: AnswerCache | None = None
+
+
+def preload(use_cache: bool) -> None:
+    """Imports every day and the solver libraries, once per worker process."""
+    global _cache, _answers
+    os.environ[WORKERS_ENV] = "1"
+    for day in discover_days():
+        load_solution(day)
+    for name in PRELOAD:
+        with contextlib.suppress(ImportError):
+            importlib.import_module(name)
+    _cache = ParseCache() if use_cache else None
+    _answers = runner.answer_cache(use_cache, False)
+
+
+def solve_request(
+    day: int, parts: list[int], input_path: str | None, seconds: float | None
+) -> dict[str, Any]:
+    """Runs in a worker: solves one request with the warm imports."""
+    started = time.time()
+    solution = load_solution(day)
+    budget.set_budget(seconds)
+    with contextlib.redirect_stdout(sys.stderr):
+        results = runner.run_solution(
+            solution, input_path, parts, cache=_cache, answers=_answers
+        )
+    line = batch.record(day, results[0].input_path, results)
+    line["started"] = started
+    return line
+
+
+def parse_request(
+    message: dict[str, Any], seconds: float | None = None
+) -> tuple[int, list[int], str | None, float | None]:
+    """Day, parts, input path and time budget of a solve request.
+
+    The budget defaults to ``seconds``.
+
+    Raises:
+        ValueError: if the request is malformed.
+    """
+    day = message.get("day")
+    if not isinstance(day, int):
+        raise ValueError(f"day must be an int: {day!r}")
+    parts = message.get("part", list(ALL_PARTS))
+    parts = [parts] if isinstance(parts, int) else parts
+    if not isinstance(parts, list) or not set(parts) <= set(ALL_PARTS):
+        raise ValueError(f"part must be one or more of {ALL_PARTS}: {parts!r}")
+    input_path = message.get("input_path")
+    if input_path is not None and not isinstance(input_path, str):
+        raise ValueError(f"input_path must be a string: {input_path!r}")
+    seconds = message.get("budget", seconds)
+    if seconds is not None and (
+        isinstance(seconds, bool)
+        or not isinstance(seconds, (int, float))
+        or seconds <= 0
+    ):
+        raise ValueError(f"budget must be a positive number or null: {seconds!r}")
+    return day, parts, input_path, seconds
+
+
+class Daemon:
+    """Solves requests in a warm pool, turning them away once it's too busy."""
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        use_cache: bool = True,
+        seconds: float | None = None,
+    ) -> None:
+        """Starts ``workers`` processes and waits until they're warm."""
+        self.workers = workers
+        self.seconds = seconds
+        self.pool = ProcessPoolExecutor(
+            workers, initializer=preload, initargs=(use_cache,)
+        )
+        self.slots = threading.BoundedSemaphore(workers + max_pending)
+        self.active = 0
+        self.lock = threading.Lock()
+        self.shutdown_requested = threading.Event()
+        for future in [self.pool.submit(time.sleep, 0) for _ in range(workers)]:
+            future.result()
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        self.pool.shutdown(cancel_futures=True)
+
+    def status(self) -> dict[str, Any]:
+        """Pool size and how many requests are in progress or waiting.
+
+        The pool takes requests in order, so all but ``workers`` of the
+        active ones are waiting for a worker.
+        """
+        with self.lock:
+            active = self.active
+        running = min(active, self.workers)
+        return {
+            "workers": self.workers,
+            "running": running,
+            "waiting": active - running,
+        }
+
+    def respond(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Response to a request, which is never an exception."""
+        received = time.time()
+        command = message.get("command", "solve")
+        if command == "status":
+            return self.status()
+        if command == "shutdown":
+            self.shutdown_requested.set()
+            return {"shutdown": True}
+        if command != "solve":
+            return {"error": f"unknown command: {command!r}"}
+        if not self.slots.acquire(blocking=False):
+            return {"error": "busy: too many requests waiting"}
+        with self.lock:
+            self.active += 1
+        try:
+            day, parts, input_path, seconds = parse_request(message, self.seconds)
+            future = self.pool.submit(solve_request, day, parts, input_path, seconds)
+            response = future.result()
+            response["queued"] = response.pop("started") - received
+        except Exception as exc:
+            response = {"error": runner.describe_error(exc)}
+        finally:
+            with self.lock:
+                self.active -= 1
+            self.slots.release()
+        response["elapsed"] = time.time() - received
+        return response
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Answers each line of json on a connection with a line of json."""
+
+    daemon: Daemon
+
+    def handle(self) -> None:
+        """Reads requests until the client closes the connection."""
+        for line in self.rfile:
+            try:
+                message = json.loads(line)
+                if not isinstance(message, dict):
+                    raise ValueError("request must be a json object")
+                response = self.daemon.respond(message)
+            except ValueError as exc:
+                response = {"error": runner.describe_error(exc)}
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+            if self.daemon.shutdown_requested.is_set():
+                # from this handler's thread, since shutdown waits for serve_forever
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+
+def make_server(daemon: Daemon, address: Address) -> socketserver.BaseServer:
+    """Threaded server for ``daemon`` on a Unix socket or localhost port."""
+
+    class Handler(RequestHandler):
+        pass
+
+    Handler.daemon = daemon
+    if isinstance(address, int):
+        return socketserver.ThreadingTCPServer(("127.0.0.1", address), Handler)
+    if os.path.exists(address):
+        os.remove(address)  # left by a daemon that didn't stop cleanly
+    directory = os.path.dirname(address)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return socketserver.ThreadingUnixStreamServer(address, Handler)
+
+
+def connect(address: Address, timeout: float | None = None) -> socket.socket:
+    """A connection to the daemon at ``address``."""
+    if isinstance(address, int):
+        return socket.create_connection(("127.0.0.1", address), timeout)
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    client.connect(address)
+    return client
+
+
+def request(
+    message: dict[str, Any], address: Address, timeout: float | None = None
+) -> dict[str, Any]:
+    """Sends one request to the daemon and returns its response."""
+    with connect(address, timeout) as client, client.makefile("rwb") as stream:
+        stream.write(json.dumps(message).encode() + b"\n")
+        stream.flush()
+        response: dict[str, Any] = json.loads(stream.readline())
+    return response
+
+
+def get_address(args: argparse.Namespace) -> Address:
+    """The port if one was given, else the socket path."""
+    address: Address = args.port if args.port is not None else args.socket
+    return address
+
+
+def serve(args: argparse.Namespace) -> int:
+    """``daemon serve``: runs until stopped."""
+    address = get_address(args)
+    daemon = Daemon(
+        max(1, args.workers), max(0, args.max_pending), not args.no_cache, args.budget
+    )
+    try:
+        with make_server(daemon, address) as server:
+            print(
+                f"listening on {address} with {daemon.workers} warm workers",
+                file=sys.stderr,
+            )
+            with contextlib.suppress(KeyboardInterrupt):
+                server.serve_forever()
+    finally:
+        daemon.close()
+        if isinstance(address, str) and os.path.exists(address):
+            os.remove(address)
+    return 0
+
+
+def send(args: argparse.Namespace) -> int:
+    """``daemon request``/``status``/``stop``: prints the response."""
+    message: dict[str, Any] = {"command": args.command_name}
+    if args.command_name == "solve":
+        # the daemon's working directory may not be ours
+        input_path = os.path.abspath(args.input) if args.input else None
+        message.update(day=args.day, part=args.part, input_path=input_path)
+        if args.budget is not None:
+            message["budget"] = args.budget
+    try:
+        response = request(message, get_address(args))
+    except OSError as exc:
+        print(f"no daemon at {get_address(args)}: {exc}", file=sys.stderr)
+        return 2
+    print(json.dumps(response, default=str))
+    return 1 if response.get("error") else 0
+
+
+def add_address_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the options that say where the daemon listens."""
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument(
+        "--port", type=int, help="listen on this localhost port instead of a socket"
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``daemon`` subcommands to a parser."""
+    subparsers = parser.add_subparsers(dest="daemon_command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="start the daemon")
+    add_address_arguments(serve_parser)
+    serve_parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="requests at once"
+    )
+    serve_parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=DEFAULT_MAX_PENDING,
+        help="requests that may wait for a worker before more are turned away",
+    )
+    serve_parser.add_argument(
+        "--budget", type=float, metavar="SECONDS", help="default time budget per part"
+    )
+    serve_parser.add_argument(
+        "--no-cache", action="store_true", help="ignore cached inputs and answers"
+    )
+    serve_parser.set_defaults(func=serve)
+
+    request_parser = subparsers.add_parser("request", help="solve a day")
+    add_address_arguments(request_parser)
+    request_parser.add_argument("day", type=int)
+    request_parser.add_argument(
+        "--part", nargs="+", type=int, choices=ALL_PARTS, default=list(ALL_PARTS)
+    )
+    request_parser.add_argument("--input", help="input file (default the day's)")
+    request_parser.add_argument("--budget", type=float, metavar="SECONDS")
+    request_parser.set_defaults(func=send, command_name="solve")
+
+    for name, command, description in (
+        ("status", "status", "show how busy the daemon is"),
+        ("stop", "shutdown", "stop the daemon"),
+    ):
+        command_parser = subparsers.add_parser(name, help=description)
+        add_address_arguments(command_parser)
+        command_parser.set_defaults(func=send, command_name=command)
@@ -0,0 +1,445 @@
+"""Static HTML and json dashboard of benchmark results across commits.
+
+Usage: ``python -m aoc dashboard`` then open ``.aoc/dashboard.html``.
+
+Reads the runs that ``python -m aoc bench`` keeps in ``.aoc/benchmarks/``
+(or the given files, directories of ``*.json`` files and globs, such as
+``bench --output`` files), oldest first. It writes one self-contained page
+whose charts are inline SVG with native tooltips, so it needs no scripts,
+network or other files. The page shows:
+
+* the slowest phases of the latest run,
+* the biggest regressions of the latest run against the run before it,
+* scaling curves: each phase's time against the synthetic input scale,
+  in the latest run,
+* each phase's time, and each day's peak memory, across runs, with one
+  line per input.
+
+``--json`` writes the same data for other tools.
+"""
+import argparse
+import glob
+import html
+import json
+import math
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Sequence
+
+from aoc.benchmark import DEFAULT_THRESHOLD, HISTORY_DIR, Regression, compare
+from aoc.runner import format_ms
+
+DEFAULT_OUTPUT = ".aoc/dashboard.html"
+DEFAULT_TOP = 10
+# input label of a synthetic input, e.g. ``x0.25-seed0``
+SCALE_LABEL = re.compile(r"x(?P<scale>[0-9.e+-]+)-seed(?P<seed>\d+)")
+COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b")
+# chart size, its margin, and the room to its right for the legend
+WIDTH, HEIGHT, MARGIN, LEGEND = 420, 200, 40, 100
+STYLE = """
+body { font-family: sans-serif; margin: 2em; color: #222; }
+table { border-collapse: collapse; }
+td, th { padding: 2px 10px; text-align: right; }
+th { border-bottom: 1px solid #999; }
+.charts { display: flex; flex-wrap: wrap; gap: 12px; }
+figure { margin: 0; border: 1px solid #ddd; padding: 4px; }
+figcaption { font-weight: bold; font-size: 0.9em; }
+.regression { color: #b00; }
+svg text { font-size: 10px; }
+.axis { stroke: #999; fill: none; }
+"""
+
+# points of each line of a chart, by line name
+Lines = dict[str, list[tuple[float, float]]]
+
+
+@dataclass
+class Run:
+    """One benchmark run's records, and the commit and time it ran at."""
+
+    name: str
+    timestamp: float
+    records: list[dict[str, Any]]
+    commit: str | None = None
+
+    @property
+    def label(self) -> str:
+        """Name and time, since several runs can be of the same commit."""
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.timestamp))
+        return f"{self.name} ({when})"
+
+
+def expand_paths(patterns: Iterable[str]) -> list[str]:
+    """Files named by paths, directories (their ``*.json``) or globs that exist."""
+    paths: dict[str, None] = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.update(dict.fromkeys(glob.glob(os.path.join(pattern, "*.json"))))
+        else:
+            paths.update(dict.fromkeys(glob.glob(pattern)))
+    return list(paths)
+
+
+def load_run(path: str) -> Run:
+    """Reads a run; files without a commit are named after themselves."""
+    with open(path, encoding="utf8") as file:
+        data = json.load(file)
+    commit = data.get("commit")
+    timestamp = data.get("timestamp") or os.path.getmtime(path)
+    name = commit or os.path.splitext(os.path.basename(path))[0]
+    return Run(name, timestamp, data["results"], commit)
+
+
+def load_runs(patterns: Iterable[str]) -> list[Run]:
+    """Every run in the given files, oldest first."""
+    runs = [load_run(path) for path in expand_paths(patterns)]
+    return sorted(runs, key=lambda run: run.timestamp)
+
+
+def split_key(record: dict[str, Any]) -> tuple[str, str, str]:
+    """``(day, input label, phase)`` of a record, e.g. ``day17``, ``x1-seed0``."""
+    day, label, phase = record["key"].split("/")
+    return day, label, phase
+
+
+def collect(
+    runs: Sequence[Run],
+    metric: str,
+    chart_of: Callable[[str, str, str], str],
+) -> dict[str, Lines]:
+    """``metric`` of every record across runs, charted by ``chart_of`` and input.
+
+    Records that failed or lack the metric are left out; a chart's line gets
+    one point per run.
+    """
+    charts: dict[str, dict[str, dict[float, float]]] = {}
+    for index, run in enumerate(runs):
+        for record in run.records:
+            value = record.get(metric)
+            if value is None or record.get("error") is not None:
+                continue
+            day, label, phase = split_key(record)
+            line = charts.setdefault(chart_of(day, label, phase), {})
+            line.setdefault(label, {})[index] = value
+    return {
+        chart: {
+            label: sorted(points.items()) for label, points in sorted(lines.items())
+        }
+        for chart, lines in sorted(charts.items())
+    }
+
+
+def time_history(runs: Sequence[Run]) -> dict[str, Lines]:
+    """Each phase's fastest time (seconds) across runs, by input."""
+    return collect(runs, "min", lambda day, _, phase: f"{day}/{phase}")
+
+
+def memory_history(runs: Sequence[Run]) -> dict[str, Lines]:
+    """Each day's peak memory (KiB) across runs, by input."""
+    return collect(runs, "peak_memory_kb", lambda day, _, __: day)
+
+
+def scaling(records: Iterable[dict[str, Any]]) -> dict[str, Lines]:
+    """Each phase's fastest time (seconds) against input scale, by seed."""
+    charts: dict[str, Lines] = {}
+    for record in records:
+        day, label, phase = split_key(record)
+        match = SCALE_LABEL.fullmatch(label)
+        if match is None or record.get("min") is None or record.get("error"):
+            continue
+        lines = charts.setdefault(f"{day}/{phase}", {})
+        point = (float(match["scale"]), record["min"])
+        lines.setdefault(f"seed{match['seed']}", []).append(point)
+    return {
+        chart: {seed: sorted(points) for seed, points in lines.items()}
+        for chart, lines in sorted(charts.items())
+        if any(len(points) > 1 for points in lines.values())
+    }
+
+
+def slowest(records: Iterable[dict[str, Any]], count: int) -> list[dict[str, Any]]:
+    """The ``count`` records with the longest fastest time."""
+    timed = [record for record in records if record.get("min") is not None]
+    return sorted(timed, key=lambda record: -record["min"])[:count]
+
+
+def severity(regression: Regression) -> float:
+    """How bad a regression is: failures first, then by how much it grew."""
+    if regression.metric not in ("time", "memory") or not regression.baseline:
+        return math.inf
+    return float(regression.current) / float(regression.baseline)
+
+
+def regressions(
+    runs: Sequence[Run], threshold: float = DEFAULT_THRESHOLD
+) -> list[Regression]:
+    """Regressions of the latest run against the one before, worst first."""
+    if len(runs) < 2:
+        return []
+    baseline = {record["key"]: record for record in runs[-2].records}
+    found = compare(runs[-1].records, baseline, threshold, threshold)
+    return sorted(found, key=severity, reverse=True)
+
+
+def summarise(
+    runs: Sequence[Run], top: int = DEFAULT_TOP, threshold: float = DEFAULT_THRESHOLD
+) -> dict[str, Any]:
+    """Everything the dashboard shows, as json friendly data."""
+    latest = runs[-1].records if runs else []
+    return {
+        "runs": [
+            {
+                "name": run.name,
+                "label": run.label,
+                "commit": run.commit,
+                "timestamp": run.timestamp,
+            }
+            for run in runs
+        ],
+        "slowest": [
+            {"key": record["key"], "min": record["min"], "answer": record["answer"]}
+            for record in slowest(latest, top)
+        ],
+        "regressions": [
+            {
+                "key": regression.key,
+                "metric": regression.metric,
+                "baseline": regression.baseline,
+                "current": regression.current,
+                "description": str(regression),
+            }
+            for regression in regressions(runs, threshold)
+        ],
+        "scaling": scaling(latest),
+        "time": time_history(runs),
+        "memory": memory_history(runs),
+    }
+
+
+class Chart:
+    """Inline SVG line chart, with a tooltip on every point."""
+
+    def __init__(
+        self,
+        lines: Lines,
+        unit: str,
+        log: bool = False,
+        x_names: Sequence[str] = (),
+    ) -> None:
+        """Chart of ``lines``, whose values are in ``unit``.
+
+        Args:
+            lines: points of each line by name.
+            unit: unit of the y values, e.g. ``ms``.
+            log: log scale on both axes, e.g. for scaling curves; points
+                that aren't positive are left out.
+            x_names: names of x values ``0, 1, ...``, shown instead of them.
+        """
+        self.lines = {
+            name: [point for point in line if not log or min(point) > 0]
+            for name, line in lines.items()
+        }
+        self.unit = unit
+        self.log = log
+        self.x_names = x_names
+        points = [point for line in self.lines.values() for point in line]
+        xs = [self.scale(x) for x, _ in points] or [0.0]
+        ys = [self.scale(y) for _, y in points] or [0.0]
+        self.x_range = (min(xs), max(xs))
+        self.y_range = (min(ys), max(ys)) if log else (0.0, max(ys))
+
+    def scale(self, value: float) -> float:
+        """A value on the chart's axis scale."""
+        return math.log10(value) if self.log else float(value)
+
+    def unscale(self, value: float) -> float:
+        """A value on the chart's axis scale, back as a value."""
+        return 10**value if self.log else value
+
+    def position(self, x: float, y: float) -> tuple[float, float]:
+        """Where a point is drawn."""
+        (x_low, x_high), (y_low, y_high) = self.x_range, self.y_range
+        width, height = WIDTH - 2 * MARGIN - LEGEND, HEIGHT - 2 * MARGIN
+        left = MARGIN + (self.scale(x) - x_low) / ((x_high - x_low) or 1) * width
+        top = MARGIN + (1 - (self.scale(y) - y_low) / ((y_high - y_low) or 1)) * height
+        return round(left, 1), round(top, 1)
+
+    def x_name(self, x: float) -> str:
+        """Label of an x value."""
+        return self.x_names[int(x)] if self.x_names else f"{x:g}"
+
+    def axes(self) -> list[str]:
+        """Axis lines, with the lowest and highest value on each."""
+        bottom, right = HEIGHT - MARGIN, WIDTH - MARGIN - LEGEND
+        parts = [f'<path d="M{MARGIN},{MARGIN} V{bottom} H{right}" class="axis"/>']
+        (x_low, x_high), (y_low, y_high) = self.x_range, self.y_range
+        for x, anchor in ((x_low, "start"), (x_high, "end")):
+            left = MARGIN if x == x_low else right
+            name = html.escape(self.x_name(self.unscale(x)))
+            parts.append(
+                f'<text x="{left}" y="{bottom + 14}" text-anchor="{anchor}">{name}</text>'
+            )
+        for y in (y_low, y_high):
+            top = bottom if y == y_low else MARGIN
+            parts.append(
+                f'<text x="{MARGIN - 4}" y="{top}" text-anchor="end">'
+                f"{self.unscale(y):.3g}</text>"
+            )
+        parts.append(f'<text x="4" y="{MARGIN - 12}">{html.escape(self.unit)}</text>')
+        return parts
+
+    def line(self, index: int, name: str, points: list[tuple[float, float]]) -> str:
+        """One line, its points with their tooltips, and its legend entry."""
+        color = COLORS[index % len(COLORS)]
+        positions = [self.position(x, y) for x, y in points]
+        coordinates = " ".join(f"{left},{top}" for left, top in positions)
+        parts = [f'<polyline points="{coordinates}" stroke="{color}" fill="none"/>']
+        for (x, y), (left, top) in zip(points, positions):
+            tooltip = html.escape(f"{name} at {self.x_name(x)}: {y:.4g} {self.unit}")
+            parts.append(
+                f'<circle cx="{left}" cy="{top}" r="3" fill="{color}">'
+                f"<title>{tooltip}</title></circle>"
+            )
+        legend_left = WIDTH - LEGEND - MARGIN + 8
+        parts.append(
+            f'<text x="{legend_left}" y="{MARGIN + 12 * index}" fill="{color}">'
+            f"{html.escape(name)}</text>"
+        )
+        return "".join(parts)
+
+    def render(self) -> str:
+        """The chart as an ``<svg>`` element."""
+        if not any(self.lines.values()):
+            return "<p>no data</p>"
+        parts = [f'<svg width="{WIDTH}" height="{HEIGHT}" role="img">', *self.axes()]
+        for index, (name, points) in enumerate(self.lines.items()):
+            parts.append(self.line(index, name, points))
+        parts.append("</svg>")
+        return "".join(parts)
+
+
+def in_units(lines: Lines, factor: float) -> Lines:
+    """Lines with their y values multiplied by ``factor``."""
+    return {
+        name: [(x, y * factor) for x, y in points] for name, points in lines.items()
+    }
+
+
+def figure(caption: str, chart: Chart) -> str:
+    """A captioned chart."""
+    return (
+        f"<figure><figcaption>{html.escape(caption)}</figcaption>"
+        f"{chart.render()}</figure>"
+    )
+
+
+def slowest_table(rows: list[dict[str, Any]]) -> str:
+    """Table of the slowest phases."""
+    lines = ["<table><tr><th>phase</th><th>min(ms)</th><th>answer</th></tr>"]
+    for row in rows:
+        answer = "" if row["answer"] is None else html.escape(str(row["answer"]))
+        lines.append(
+            f"<tr><td>{html.escape(row['key'])}</td><td>{format_ms(row['min'])}</td>"
+            f"<td>{answer}</td></tr>"
+        )
+    lines.append("</table>")
+    return "\n".join(lines)
+
+
+def regression_list(rows: list[dict[str, Any]], runs: list[dict[str, Any]]) -> str:
+    """Highlighted list of the regressions since the previous run."""
+    if len(runs) < 2:
+        return "<p>Only one run so far.</p>"
+    if not rows:
+        return f"<p>None since {html.escape(runs[-2]['label'])}.</p>"
+    items = "".join(f"<li>{html.escape(row['description'])}</li>" for row in rows)
+    return (
+        f"<p>Since {html.escape(runs[-2]['label'])}:</p>"
+        f'<ul class="regression">{items}</ul>'
+    )
+
+
+def render_html(summary: dict[str, Any]) -> str:
+    """The dashboard page, with everything inline."""
+    runs = summary["runs"]
+    names = [run["label"] for run in runs]
+    latest = html.escape(names[-1]) if names else "none"
+    sections = [
+        "<h1>Benchmarks</h1>",
+        f"<p>{len(runs)} run(s), latest {latest}.</p>",
+        "<h2>Slowest phases</h2>",
+        slowest_table(summary["slowest"]),
+        "<h2>Regressions</h2>",
+        regression_list(summary["regressions"], runs),
+        "<h2>Scaling</h2>",
+        '<div class="charts">',
+        *(
+            figure(name, Chart(in_units(lines, 1000), "ms", log=True))
+            for name, lines in summary["scaling"].items()
+        ),
+        "</div>",
+        "<h2>Time per phase</h2>",
+        '<div class="charts">',
+        *(
+            figure(name, Chart(in_units(lines, 1000), "ms", x_names=names))
+            for name, lines in summary["time"].items()
+        ),
+        "</div>",
+        "<h2>Peak memory per day</h2>",
+        '<div class="charts">',
+        *(
+            figure(name, Chart(in_units(lines, 1 / 1024), "MiB", x_names=names))
+            for name, lines in summary["memory"].items()
+        ),
+        "</div>",
+    ]
+    body = "\n".join(sections)
+    return (
+        '<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+        f"<title>Benchmarks</title><style>{STYLE}</style></head>\n"
+        f"<body>\n{body}\n</body></html>\n"
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``dashboard`` arguments to a parser."""
+    parser.add_argument(
+        "runs",
+        nargs="*",
+        default=[HISTORY_DIR],
+        help=f"benchmark json files, directories or globs (default {HISTORY_DIR})",
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="html file to write")
+    parser.add_argument("--json", help="also write the dashboard's data here")
+    parser.add_argument(
+        "--top", type=int, default=DEFAULT_TOP, help="how many slowest phases to list"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown or memory growth that counts as a regression",
+    )
+
+
+def main(args: argparse.Namespace) -> int:
+    """Writes the dashboard; returns non-zero if there were no runs."""
+    runs = load_runs(args.runs)
+    if not runs:
+        print("no benchmark runs found; run python -m aoc bench", file=sys.stderr)
+        return 2
+    summary = summarise(runs, args.top, args.threshold)
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w", encoding="utf8") as file:
+        file.write(render_html(summary))
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf8") as file:
+            json.dump(summary, file, indent=2, default=str)
+            file.write("\n")
+    print(f"wrote {args.output} from {len(runs)} run(s)", file=sys.stderr)
+    return 0
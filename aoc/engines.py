@@ -0,0 +1,135 @@
+"""Differential checks: every engine of a part must give the same answer.
+
+Usage: ``python -m aoc engines 6 18 --scale 0.1 1 --seed 0 1 2``
+
+Days can register several engines for a part (``Solution.engines``), such
+as a naive version next to a fast one. This runs every engine of every
+part on seeded synthetic inputs (see ``aoc.generate``) and on the day's
+small input, and fails if any of them disagree. Each engine's time is
+reported too, so it doubles as a benchmark of the engines against each
+other.
+"""
+import argparse
+import contextlib
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Iterable, TextIO
+
+from aoc.generate import GENERATED_DIR, write_input
+from aoc.runner import PhaseResult, format_ms, part_name, run_solution
+from aoc.solution import ROOT, discover_days, load_solution
+
+DEFAULT_SCALES = [0.1]
+DEFAULT_SEEDS = [0, 1, 2]
+
+
+@dataclass
+class Comparison:
+    """Every engine's result for one part of one day on one input."""
+
+    day: int
+    part: int
+    input_path: str
+    results: list[PhaseResult] = field(default_factory=list)
+
+    @property
+    def answers(self) -> dict[str, Any]:
+        """Answer of each engine that didn't fail."""
+        return {
+            result.engine: result.answer
+            for result in self.results
+            if result.error is None
+        }
+
+    @property
+    def agrees(self) -> bool:
+        """True if no engine failed and they all gave the same answer."""
+        answers = list(self.answers.values())
+        return len(answers) == len(self.results) and all(
+            answer == answers[0] for answer in answers
+        )
+
+
+def engine_days(days: Iterable[int]) -> list[int]:
+    """The days with more than one engine for some part."""
+    return [day for day in days if load_solution(day).engines]
+
+
+def engine_inputs(
+    day: int,
+    scales: Iterable[float],
+    seeds: Iterable[int],
+    directory: str = GENERATED_DIR,
+) -> list[str]:
+    """The day's small input, if it has one, and a generated input per scale and seed."""
+    small = os.path.join(ROOT, f"day{day:02}", "input-small.txt")
+    paths = [small] if os.path.exists(small) else []
+    for scale in scales:
+        for seed in seeds:
+            paths.append(write_input(day, scale, seed, directory))
+    return paths
+
+
+def compare_engines(day: int, input_path: str) -> list[Comparison]:
+    """Runs every engine of every part of ``day`` that has several on an input."""
+    solution = load_solution(day)
+    comparisons: list[Comparison] = []
+    for part in solution.engines:
+        comparison = Comparison(day, part, input_path)
+        for engine in solution.part_engines(part):
+            # parsed for each engine, since some days mutate their input
+            _, result = run_solution(solution, input_path, [part], engine=engine)
+            comparison.results.append(result)
+        comparisons.append(comparison)
+    return comparisons
+
+
+def write_report(comparisons: list[Comparison], file: TextIO) -> None:
+    """Writes each engine's time and answer, marking disagreements."""
+    file.write(f"{'day':>3} {'phase':<6} {'engine':<12} {'min(ms)':>12}  answer\n")
+    for comparison in comparisons:
+        file.write(f"{comparison.input_path}\n")
+        status = "" if comparison.agrees else "  MISMATCH"
+        for result in comparison.results:
+            answer = f"error: {result.error}" if result.error else result.answer
+            file.write(
+                f"{comparison.day:>3} {part_name(comparison.part):<6} "
+                f"{result.engine:<12} {format_ms(result.min):>12}  {answer}{status}\n"
+            )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``engines`` arguments to a parser."""
+    parser.add_argument(
+        "days", nargs="*", type=int, help="days to check (default all with engines)"
+    )
+    parser.add_argument(
+        "--scale", nargs="+", type=float, default=DEFAULT_SCALES, help="input sizes"
+    )
+    parser.add_argument(
+        "--seed", nargs="+", type=int, default=DEFAULT_SEEDS, help="inputs per size"
+    )
+    parser.add_argument(
+        "--input-dir", default=GENERATED_DIR, help="where generated inputs are written"
+    )
+
+
+def main(args: argparse.Namespace) -> int:
+    """Compares the engines; returns non-zero if any disagree."""
+    days = engine_days(args.days or discover_days())
+    if not days:
+        print("no engines to compare in the given days", file=sys.stderr)
+        return 2
+    comparisons: list[Comparison] = []
+    with contextlib.redirect_stdout(sys.stderr):
+        for day in days:
+            for path in engine_inputs(day, args.scale, args.seed, args.input_dir):
+                comparisons.extend(compare_engines(day, path))
+    write_report(comparisons, sys.stdout)
+    mismatches = [comparison for comparison in comparisons if not comparison.agrees]
+    print(
+        f"{len(comparisons) - len(mismatches)}/{len(comparisons)} comparisons agree",
+        file=sys.stderr,
+    )
+    return 1 if mismatches else 0
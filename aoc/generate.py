@@ -0,0 +1,92 @@
+"""Deterministic synthetic inputs, scaled relative to a real puzzle input.
+
+Every day ships a ``dayNN/generator.py`` with
+``generate(scale: float, rng: random.Random) -> str``. ``scale=1`` is
+roughly the size of a real input; what ``scale`` grows (lines, grid area,
+graph size) is documented per day.
+"""
+import argparse
+import importlib
+import os
+import random
+import sys
+from typing import Callable
+
+from aoc.solution import discover_days
+
+GENERATED_DIR = ".aoc/inputs"
+DEFAULT_SCALES = [1.0]
+
+Generator = Callable[[float, random.Random], str]
+
+
+def load_generator(day: int) -> Generator:
+    """Imports ``dayNN.generator`` and returns its ``generate`` function."""
+    module = importlib.import_module(f"day{day:02}.generator")
+    generator: Generator = module.generate
+    return generator
+
+
+def generate_input(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    """Returns the input text for ``day``; same arguments, same text."""
+    rng = random.Random(f"day{day:02}:{scale}:{seed}")
+    return load_generator(day)(scale, rng)
+
+
+def generated_path(
+    day: int, scale: float, seed: int, directory: str = GENERATED_DIR
+) -> str:
+    """Where ``write_input`` stores a generated input."""
+    return os.path.join(directory, f"day{day:02}-x{scale:g}-seed{seed}.txt")
+
+
+def write_input(
+    day: int,
+    scale: float = 1.0,
+    seed: int = 0,
+    directory: str = GENERATED_DIR,
+    force: bool = False,
+) -> str:
+    """Writes a generated input and returns its path.
+
+    Generation is deterministic, so an existing file is reused unless
+    ``force`` is set.
+    """
+    path = generated_path(day, scale, seed, directory)
+    if force or not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        partial_path = path + ".partial"
+        with open(partial_path, "w", encoding="utf8") as file:
+            file.write(generate_input(day, scale, seed))
+        os.replace(partial_path, path)
+    return path
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``generate`` arguments to a parser."""
+    parser.add_argument(
+        "days", nargs="*", type=int, help="days to generate (default all)"
+    )
+    parser.add_argument(
+        "--scale",
+        nargs="+",
+        type=float,
+        default=DEFAULT_SCALES,
+        help="size relative to a real input, e.g. 10 100 1000",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-dir", default=GENERATED_DIR)
+    parser.add_argument(
+        "--force", action="store_true", help="regenerate existing files"
+    )
+
+
+def main(args: argparse.Namespace) -> int:
+    """Writes one input per day and scale, printing each path."""
+    days: list[int] = args.days or discover_days()
+    for day in days:
+        for scale in args.scale:
+            path = write_input(day, scale, args.seed, args.output_dir, args.force)
+            print(path)
+            sys.stdout.flush()
+    return 0
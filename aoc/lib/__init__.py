@@ -0,0 +1 @@
+"""Libraries shared between days."""
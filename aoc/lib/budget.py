@@ -0,0 +1,127 @@
+"""Time budgets, so that long searches stop in time with what they found.
+
+With ``AOC_BUDGET`` set to a number of seconds (the runner's ``--budget``),
+each part gets a deadline that long after it starts. Solvers call ``check``
+every so often from their main loops, with how much of their search is done
+and their best answer so far. Once the deadline has passed it raises
+``BudgetExceeded`` with those, which the runner reports as a partial result.
+At verbose output ``check`` also reports them, at most once a second.
+
+Worker processes get the deadline in ``AOC_DEADLINE`` (seconds since the
+epoch, so that every process agrees on it). Pool tasks check ``expired``
+to skip their work once it has passed, and the parent raises with the
+results of the tasks that did run. Without a budget, ``check`` returns at
+once and nothing expires.
+"""
+import contextlib
+import os
+import time
+from typing import Any, Iterator
+
+from aoc.lib import output
+
+BUDGET_ENV = "AOC_BUDGET"
+DEADLINE_ENV = "AOC_DEADLINE"
+REPORT_INTERVAL = 1.0  # seconds between progress reports
+
+
+class BudgetExceeded(Exception):
+    """A solver ran out of time; ``best`` is its answer so far, if it has one."""
+
+    def __init__(self, fraction: float | None = None, best: Any = None) -> None:
+        """Stores how much of the search was done, and the best answer found."""
+        super().__init__(fraction, best)
+        self.fraction = fraction
+        self.best = best
+
+    def __str__(self) -> str:
+        """Reason for the runner's error column."""
+        if self.fraction is None:
+            return "time budget exceeded"
+        return f"time budget exceeded with {self.fraction:.0%} done"
+
+
+def env_seconds(name: str) -> float | None:
+    """Seconds in the environment variable ``name``, or None if unset."""
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+_deadline = env_seconds(DEADLINE_ENV)
+_last_report = 0.0
+
+
+def get_budget() -> float | None:
+    """Seconds each part may take, or None for no limit."""
+    return env_seconds(BUDGET_ENV)
+
+
+def set_budget(seconds: float | None) -> None:
+    """Sets the budget for this process and any process it starts."""
+    if seconds is None:
+        os.environ.pop(BUDGET_ENV, None)
+    else:
+        os.environ[BUDGET_ENV] = str(seconds)
+
+
+@contextlib.contextmanager
+def deadline(seconds: float | None = None) -> Iterator[None]:
+    """Ends the block's time ``seconds`` (by default the budget) from now.
+
+    Does nothing if there's no budget.
+    """
+    global _deadline
+    if seconds is None:
+        seconds = get_budget()
+    if seconds is None:
+        yield
+        return
+    previous = _deadline
+    _deadline = time.time() + seconds
+    os.environ[DEADLINE_ENV] = repr(_deadline)
+    try:
+        yield
+    finally:
+        _deadline = previous
+        if previous is None:
+            os.environ.pop(DEADLINE_ENV, None)
+        else:
+            os.environ[DEADLINE_ENV] = repr(previous)
+
+
+def active() -> bool:
+    """True if there's a deadline to keep to."""
+    return _deadline is not None
+
+
+def expired() -> bool:
+    """True once the deadline has passed."""
+    return _deadline is not None and time.time() > _deadline
+
+
+def describe(fraction: float | None, best: Any) -> str:
+    """Progress report, e.g. ``42% done, best so far 6420``."""
+    parts = []
+    if fraction is not None:
+        parts.append(f"{fraction:.0%} done")
+    if best is not None:
+        parts.append(f"best so far {best}")
+    return ", ".join(parts) or "still searching"
+
+
+def check(fraction: float | None = None, best: Any = None) -> None:
+    """Reports progress, raising ``BudgetExceeded`` once the deadline has passed.
+
+    Args:
+        fraction: how much of the search is done, from 0 to 1, if known.
+        best: the best answer so far, if there is one.
+    """
+    global _last_report
+    if _deadline is None and not output.enabled(output.Level.VERBOSE):
+        return
+    now = time.time()
+    if _deadline is not None and now > _deadline:
+        raise BudgetExceeded(fraction, best)
+    if now - _last_report >= REPORT_INTERVAL:
+        _last_report = now
+        output.verbose(lambda: describe(fraction, best))
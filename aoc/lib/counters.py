@@ -0,0 +1,152 @@
+"""Opt-in counters that solvers use to say how much work they did.
+
+Solvers call ``add`` (summed, e.g. nodes expanded or memo hits) and
+``maximum`` (e.g. the biggest a queue got) with totals once a search is
+done, rather than once per step. A name is either summed or a maximum,
+never both. While counting is off both return at once, and work done
+only to feed a counter should be guarded by ``enabled()``.
+
+Counting is on when ``AOC_COUNTERS`` names a directory; the runner sets
+it for ``--counters`` and reads the counts of each phase with
+``collected``. Worker processes can't return their counts, so pool tasks
+wrapped in ``count_worker`` leave them in that directory instead, named
+after the process collecting them, and ``collected`` adds them in.
+"""
+import contextlib
+import functools
+import glob
+import json
+import os
+import tempfile
+from typing import Callable, Iterator, ParamSpec, TypeVar
+
+COUNTERS_ENV = "AOC_COUNTERS"
+# pid of the process whose ``collected`` block a worker's counts belong to
+OWNER_ENV = "AOC_COUNTERS_OWNER"
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_enabled = bool(os.environ.get(COUNTERS_ENV))
+_sums: dict[str, int] = {}
+_maxima: dict[str, int] = {}
+# pid collecting counts, and the pid whose counts a worker has reset
+_owner_pid: int | None = None
+_worker_pid: int | None = None
+
+
+def enabled() -> bool:
+    """True if counting is on."""
+    return _enabled
+
+
+def enable() -> None:
+    """Turns counting on for this process and any process it starts."""
+    global _enabled
+    if not os.environ.get(COUNTERS_ENV):
+        os.environ[COUNTERS_ENV] = tempfile.mkdtemp(prefix="aoc-counters-")
+    _enabled = True
+
+
+def disable() -> None:
+    """Turns counting off again, for this process and those it starts."""
+    global _enabled
+    os.environ.pop(COUNTERS_ENV, None)
+    _enabled = False
+
+
+def check_kind(name: str, others: dict[str, int]) -> None:
+    """Raises ValueError if ``name`` is already a counter of the other kind."""
+    if name in others:
+        kind = "maximum" if others is _maxima else "sum"
+        raise ValueError(f"counter {name!r} is already a {kind}")
+
+
+def add(name: str, value: int = 1) -> None:
+    """Adds ``value`` to the counter ``name``."""
+    if _enabled:
+        check_kind(name, _maxima)
+        _sums[name] = _sums.get(name, 0) + value
+
+
+def maximum(name: str, value: int) -> None:
+    """Raises the counter ``name`` to ``value`` if that's higher."""
+    if _enabled:
+        check_kind(name, _sums)
+        if value > _maxima.get(name, value - 1):
+            _maxima[name] = value
+
+
+def merge(sums: dict[str, int], maxima: dict[str, int]) -> None:
+    """Adds counts from elsewhere, e.g. a worker, to this process's."""
+    for name, value in sums.items():
+        check_kind(name, _maxima)
+        _sums[name] = _sums.get(name, 0) + value
+    for name, value in maxima.items():
+        check_kind(name, _sums)
+        _maxima[name] = max(_maxima.get(name, value), value)
+
+
+def worker_file(pid: int | str) -> str:
+    """File a worker process leaves its counts in; ``*`` for any worker."""
+    owner = os.environ.get(OWNER_ENV, "")
+    return os.path.join(os.environ[COUNTERS_ENV], f"worker-{owner}-{pid}.json")
+
+
+def worker_files() -> list[str]:
+    """Files that workers collected by this process left their counts in."""
+    return glob.glob(worker_file("*"))
+
+
+@contextlib.contextmanager
+def collected() -> Iterator[dict[str, int]]:
+    """Counts of the block, including its workers', filled in at its end.
+
+    Yields an empty dictionary if counting is off.
+    """
+    global _owner_pid
+    counts: dict[str, int] = {}
+    if not _enabled:
+        yield counts
+        return
+    _owner_pid = os.getpid()
+    os.environ[OWNER_ENV] = str(_owner_pid)
+    _sums.clear()
+    _maxima.clear()
+    for stale in worker_files():
+        os.remove(stale)
+    try:
+        yield counts
+    finally:
+        for path in worker_files():
+            with open(path, encoding="utf8") as file:
+                merge(**json.load(file))
+            os.remove(path)
+        counts.update(sorted({**_sums, **_maxima}.items()))
+
+
+def count_worker(func: Callable[P, R]) -> Callable[P, R]:
+    """Decorates a process pool task so that its counts reach ``collected``.
+
+    Counts accumulate per worker process and are written after every task,
+    since pool workers can exit without running cleanup code.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        global _worker_pid
+        pid = os.getpid()
+        if not _enabled or pid == _owner_pid:
+            return func(*args, **kwargs)
+        if _worker_pid != pid:
+            # forked from a counting process: drop the inherited counts
+            _sums.clear()
+            _maxima.clear()
+            _worker_pid = pid
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with open(worker_file(pid), "w", encoding="utf8") as file:
+                json.dump({"sums": _sums, "maxima": _maxima}, file)
+
+    return wrapper
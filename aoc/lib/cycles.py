@@ -0,0 +1,139 @@
+"""Cycle detection for states that are stepped deterministically.
+
+A sequence ``start, step(start), step(step(start)), ...`` of finitely many
+states has to repeat: after ``mu`` steps it enters a cycle of ``lam``
+states. Once those are known, ``Cycle.state_after`` jumps to the state
+after any number of steps, such as 10**18, without taking them all.
+
+``floyd`` and ``brent`` find the cycle in constant memory by comparing
+states with ``==``, so they suit small immutable states. ``find_cycle``
+keeps a hash table of each state's key instead, which takes one pass;
+use ``fingerprint`` to key big states by 8 bytes rather than the whole
+state. ``CycleDetector`` is that hash table on its own, for when the
+caller does the stepping.
+"""
+import hashlib
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Hashable, TypeVar
+
+from aoc.lib import counters
+
+T = TypeVar("T")
+
+
+@dataclass
+class Cycle(Generic[T]):
+    """Where the states from ``start`` start repeating, and how often."""
+
+    mu: int  # steps before the first state on the cycle
+    lam: int  # length of the cycle
+    entry: T = field(repr=False)  # the state after ``mu`` steps
+    start: T = field(repr=False)
+    step: Callable[[T], T] = field(repr=False)
+
+    def reduce(self, steps: int) -> int:
+        """Fewest steps that give the same state as ``steps`` steps."""
+        if steps < self.mu:
+            return steps
+        return self.mu + (steps - self.mu) % self.lam
+
+    def state_after(self, steps: int) -> T:
+        """The state after ``steps`` steps from the start."""
+        steps = self.reduce(steps)
+        state = self.start
+        if steps >= self.mu:
+            state, steps = self.entry, steps - self.mu
+        for _ in range(steps):
+            state = self.step(state)
+        return state
+
+
+def _count(mu: int, lam: int) -> None:
+    """Reports a found cycle to the counters."""
+    counters.add("cycles_found")
+    counters.maximum("cycle_start", mu)
+    counters.maximum("cycle_length", lam)
+
+
+def floyd(start: T, step: Callable[[T], T]) -> Cycle[T]:
+    """Floyd's tortoise and hare; about three steps per state up to the cycle."""
+    tortoise, hare = step(start), step(step(start))
+    while tortoise != hare:
+        tortoise, hare = step(tortoise), step(step(hare))
+    # the hare is now a multiple of lam ahead, so they meet at the entry
+    mu, tortoise = 0, start
+    while tortoise != hare:
+        tortoise, hare = step(tortoise), step(hare)
+        mu += 1
+    lam, hare = 1, step(tortoise)
+    while tortoise != hare:
+        hare = step(hare)
+        lam += 1
+    _count(mu, lam)
+    return Cycle(mu, lam, tortoise, start, step)
+
+
+def brent(start: T, step: Callable[[T], T]) -> Cycle[T]:
+    """Brent's algorithm; fewer steps than ``floyd`` and lam found directly."""
+    power = lam = 1
+    tortoise, hare = start, step(start)
+    while tortoise != hare:
+        if power == lam:  # move the tortoise up to the next power of two
+            tortoise, power, lam = hare, power * 2, 0
+        hare = step(hare)
+        lam += 1
+    tortoise = hare = start
+    for _ in range(lam):
+        hare = step(hare)
+    mu = 0
+    while tortoise != hare:
+        tortoise, hare = step(tortoise), step(hare)
+        mu += 1
+    _count(mu, lam)
+    return Cycle(mu, lam, tortoise, start, step)
+
+
+@dataclass
+class CycleDetector:
+    """Remembers when each key was seen, to spot the first repeat."""
+
+    seen: dict[Hashable, int] = field(default_factory=dict, repr=False)
+    mu: int | None = None
+    lam: int | None = None
+
+    @property
+    def found(self) -> bool:
+        """True once a key has repeated."""
+        return self.lam is not None
+
+    def add(self, key: Hashable) -> bool:
+        """Records the next state's key; True if it's been seen before."""
+        if self.lam is not None:
+            return True
+        first = self.seen.get(key)
+        if first is None:
+            self.seen[key] = len(self.seen)
+            return False
+        self.mu, self.lam = first, len(self.seen) - first
+        _count(self.mu, self.lam)
+        return True
+
+
+def find_cycle(
+    start: T, step: Callable[[T], T], key: Callable[[T], Hashable] | None = None
+) -> Cycle[T]:
+    """Finds the cycle with a hash table of ``key(state)`` for each state.
+
+    States with equal keys must be equal; by default the state is its own key.
+    """
+    detector = CycleDetector()
+    state = start
+    while not detector.add(state if key is None else key(state)):
+        state = step(state)
+    assert detector.mu is not None and detector.lam is not None
+    return Cycle(detector.mu, detector.lam, state, start, step)
+
+
+def fingerprint(data: bytes) -> int:
+    """64 bit hash of some bytes; collisions are vanishingly unlikely."""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
@@ -0,0 +1,68 @@
+"""Compass directions as small ints, with their moves and turns in tables.
+
+``NORTH``, ``EAST``, ``SOUTH`` and ``WEST`` are ``0`` to ``3``, in
+clockwise order, so hot loops can keep a direction as a plain int and look
+up where it goes instead of comparing enum members::
+
+    row, col = row + ROW_DELTAS[direction], col + COL_DELTAS[direction]
+    direction = MIRRORS["/"][direction]
+
+``Direction`` is an ``IntEnum`` of the same ints, with methods backed by
+the same tables, for code that prefers named members.
+"""
+from enum import IntEnum
+
+NORTH, EAST, SOUTH, WEST = range(4)
+DIRECTIONS = (NORTH, EAST, SOUTH, WEST)
+ROW_DELTAS = (-1, 0, 1, 0)
+COL_DELTAS = (0, 1, 0, -1)
+OPPOSITE = (SOUTH, WEST, NORTH, EAST)
+CLOCKWISE = (EAST, SOUTH, WEST, NORTH)
+COUNTER_CLOCKWISE = (WEST, NORTH, EAST, SOUTH)
+ARROWS = "^>v<"
+# direction a beam leaves a mirror in, per direction it was travelling in
+MIRRORS = {
+    "/": (EAST, NORTH, WEST, SOUTH),
+    "\\": (WEST, SOUTH, EAST, NORTH),
+}
+
+
+class Direction(IntEnum):
+    """A compass direction, with the same value as its int code."""
+
+    NORTH = NORTH
+    EAST = EAST
+    SOUTH = SOUTH
+    WEST = WEST
+
+    def __str__(self) -> str:
+        """Return ``NORTH`` etc."""
+        return self.name
+
+    @property
+    def arrow(self) -> str:
+        """``^``, ``>``, ``v`` or ``<``."""
+        return ARROWS[self]
+
+    def opposite(self) -> "Direction":
+        """Return opposite direction, e.g. ``EAST``<->``WEST``."""
+        return _MEMBERS[OPPOSITE[self]]
+
+    def clockwise(self) -> "Direction":
+        """Direction after a right turn, e.g. ``NORTH`` -> ``EAST``."""
+        return _MEMBERS[CLOCKWISE[self]]
+
+    def counter_clockwise(self) -> "Direction":
+        """Direction after a left turn, e.g. ``NORTH`` -> ``WEST``."""
+        return _MEMBERS[COUNTER_CLOCKWISE[self]]
+
+    def reflect(self, mirror: str) -> "Direction":
+        r"""Direction after bouncing off a ``/`` or ``\`` mirror."""
+        return _MEMBERS[MIRRORS[mirror][self]]
+
+    def offset(self, row: int, col: int, steps: int = 1) -> tuple[int, int]:
+        """Offset a row/col by ``steps`` in our direction."""
+        return row + ROW_DELTAS[self] * steps, col + COL_DELTAS[self] * steps
+
+
+_MEMBERS = tuple(Direction)
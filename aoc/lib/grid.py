@@ -0,0 +1,249 @@
+"""Zero-copy loading of rectangular character grids.
+
+``load_grid`` memory-maps an input file and returns a 2D ``uint8`` numpy
+view of it: each row starts ``cols + 1`` bytes after the previous one, so
+the newlines are skipped through the row stride instead of being copied
+out. Apart from the ``mmap`` itself, loading only reads one byte per row
+(to check that the rows line up), so cells are paged in once they're used.
+
+The helpers below convert a view into the cells each day works with, and
+``Grid`` stores a grid compactly for the days to search and mutate. numpy
+is imported lazily so that importing a day stays cheap.
+"""
+import copy
+import mmap
+from typing import TYPE_CHECKING, Mapping, Sequence
+
+from aoc.lib.positions import Positions
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    GridView = npt.NDArray[np.uint8]
+
+NEWLINE = b"\n"
+LINE_ENDINGS = (b"\n", b"\r")
+# default value of the cells around a Grid; not a printable character
+BORDER = 0
+
+
+def open_mmap(path: str) -> mmap.mmap | bytes:
+    """Maps ``path`` read only; empty files can't be mapped so give ``b""``."""
+    with open(path, "rb") as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return b""
+
+
+def grid_view(buffer: mmap.mmap | bytes, start: int, end: int) -> "GridView":
+    """Rows of ``buffer[start:end]`` as a 2D view, without copying.
+
+    Windows line endings are skipped the same way. Trailing blank lines are
+    ignored, and the last row needn't end with a newline.
+
+    Raises:
+        ValueError: if the rows aren't all the same length.
+    """
+    import numpy as np
+
+    while end > start and buffer[end - 1 : end] in LINE_ENDINGS:
+        end -= 1
+    first_newline = buffer.find(NEWLINE, start, end)
+    if first_newline == -1:
+        first_newline = end
+    cols = first_newline - start
+    newline_size = 1
+    if cols and buffer[first_newline - 1 : first_newline] == b"\r":
+        cols -= 1
+        newline_size = 2
+    stride = cols + newline_size
+    size = end - start + newline_size  # as if the last row was terminated
+    rows, remainder = divmod(size, stride)
+    if cols == 0:
+        raise ValueError("empty grid")
+    if remainder:
+        raise ValueError(f"not a rectangular grid: {size} bytes, rows of {stride}")
+    # only the line endings are checked, so the cells are never read here
+    endings = buffer[start + cols : end : stride]
+    if endings.count(buffer[start + cols : start + cols + 1]) != rows - 1:
+        raise ValueError("not a rectangular grid: rows have different lengths")
+    return np.ndarray(
+        (rows, cols), dtype=np.uint8, buffer=buffer, offset=start, strides=(stride, 1)
+    )
+
+
+def load_grid(path: str) -> "GridView":
+    """Memory-maps ``path`` as a read only ``(rows, cols)`` ``uint8`` grid."""
+    buffer = open_mmap(path)
+    return grid_view(buffer, 0, len(buffer))
+
+
+def load_grids(path: str) -> list["GridView"]:
+    """Memory-maps blank line separated grids, which may differ in size."""
+    buffer = open_mmap(path)
+    grids: list["GridView"] = []
+    first_newline = buffer.find(NEWLINE)
+    line_ending = NEWLINE
+    if first_newline > 0 and buffer[first_newline - 1 : first_newline] == b"\r":
+        line_ending = b"\r\n"
+    blank_line = NEWLINE + line_ending
+    start, end = 0, len(buffer)
+    while start < end:
+        if buffer[start : start + 1] in LINE_ENDINGS:
+            start += 1  # blank lines between grids
+            continue
+        block_end = buffer.find(blank_line, start, end)
+        block_end = end if block_end == -1 else block_end + 1
+        grids.append(grid_view(buffer, start, block_end))
+        start = block_end
+    return grids
+
+
+def to_strings(grid: "GridView") -> list[str]:
+    """Rows as strings."""
+    cols = grid.shape[1]
+    data = grid.tobytes().decode("ascii")
+    return [data[start : start + cols] for start in range(0, len(data), cols)]
+
+
+def to_chars(grid: "GridView") -> list[list[str]]:
+    """Rows as lists of single character strings."""
+    return [list(row) for row in to_strings(grid)]
+
+
+def to_digits(grid: "GridView") -> list[list[int]]:
+    """Rows of ``0-9`` cells as lists of ints."""
+    digits: list[list[int]] = (grid - ord("0")).tolist()
+    return digits
+
+
+def encode(grid: "GridView", codes: Mapping[str, int], default: int = 0) -> "GridView":
+    """Maps each cell's character to a small integer code, in one pass.
+
+    Characters missing from ``codes`` become ``default``.
+    """
+    import numpy as np
+
+    table = np.full(256, default, dtype=np.uint8)
+    for char, code in codes.items():
+        table[ord(char)] = code
+    encoded: "GridView" = table[grid]
+    return encoded
+
+
+def find(grid: "GridView", char: str) -> list[tuple[int, int]]:
+    """``(row, col)`` of every cell holding ``char``, in reading order."""
+    import numpy as np
+
+    return [(int(row), int(col)) for row, col in np.argwhere(grid == ord(char))]
+
+
+class Grid(Positions):
+    """A rectangular grid of byte cells, stored row by row in a bytearray.
+
+    Cells are addressed by their ``Positions`` index rather than ``(row,
+    col)``. The grid is surrounded by a one cell wide border of ``border``
+    cells, so stepping one cell off the edge lands on a border cell instead
+    of needing a bounds check. The neighbours of a cell are ``index +
+    offset`` for each offset in ``offsets`` (north, east, south, west).
+    """
+
+    cells: bytearray
+    border: int
+
+    def __init__(
+        self, num_rows: int, num_cols: int, fill: int = BORDER, border: int = BORDER
+    ) -> None:
+        """Creates a grid with every cell set to ``fill``."""
+        super().__init__(num_rows, num_cols, padding=1)
+        self.border = border
+        row = bytes([border]) + bytes([fill]) * num_cols + bytes([border])
+        edge = bytes([border]) * self.stride
+        self.cells = bytearray(edge + row * num_rows + edge)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[str | Sequence[int]], border: int = BORDER
+    ) -> "Grid":
+        """Grid of equally long strings, or of rows of byte values."""
+        grid = cls(len(rows), len(rows[0]), border=border)
+        for row_index, row in enumerate(rows):
+            start = grid.index(row_index, 0)
+            data = row.encode("ascii") if isinstance(row, str) else bytes(row)
+            grid.cells[start : start + grid.num_cols] = data
+        return grid
+
+    @classmethod
+    def from_view(cls, view: "GridView", border: int = BORDER) -> "Grid":
+        """Copies a 2D ``uint8`` array, such as one from ``load_grid``."""
+        import numpy as np
+
+        num_rows, num_cols = view.shape
+        grid = cls(num_rows, num_cols, border=border)
+        grid.interior()[:] = np.asarray(view, dtype=np.uint8)
+        return grid
+
+    @classmethod
+    def load(cls, path: str, border: int = BORDER) -> "Grid":
+        """Reads a grid of characters from a file."""
+        return cls.from_view(load_grid(path), border)
+
+    def __getitem__(self, index: int) -> int:
+        """Value of the cell at ``index``."""
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        """Sets the cell at ``index``."""
+        self.cells[index] = value
+
+    def char(self, index: int) -> str:
+        """Cell at ``index`` as a character."""
+        return chr(self.cells[index])
+
+    def array(self) -> "GridView":
+        """Writable 2D numpy view of every cell, border included."""
+        import numpy as np
+
+        array = np.frombuffer(self.cells, dtype=np.uint8)
+        return array.reshape(self.num_rows + 2, self.stride)
+
+    def interior(self) -> "GridView":
+        """Writable 2D numpy view of the cells inside the border."""
+        return self.array()[1:-1, 1:-1]
+
+    def count(self, value: int) -> int:
+        """Number of cells (excluding the border) equal to ``value``."""
+        return int((self.interior() == value).sum())
+
+    def find(self, value: int) -> list[int]:
+        """Indices of every cell equal to ``value``, in reading order."""
+        import numpy as np
+
+        indices = np.flatnonzero(self.interior() == value)
+        rows, cols = np.divmod(indices, self.num_cols)
+        found: list[int] = ((rows + 1) * self.stride + cols + 1).tolist()
+        return found
+
+    def replace(self, old: int, new: int) -> None:
+        """Sets every cell equal to ``old`` to ``new``."""
+        interior = self.interior()
+        interior[interior == old] = new
+
+    def copy(self) -> "Grid":
+        """Copy with its own cells."""
+        grid = copy.copy(self)
+        grid.cells = self.cells[:]
+        return grid
+
+    def rows(self) -> list[str]:
+        """Rows inside the border, as strings."""
+        return [
+            self.cells[start : start + self.num_cols].decode("latin-1")
+            for start in (self.index(row, 0) for row in range(self.num_rows))
+        ]
+
+    def __str__(self) -> str:
+        """Rows joined by newlines."""
+        return "\n".join(self.rows())
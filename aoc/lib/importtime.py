@@ -0,0 +1,74 @@
+"""Import time of a module in a fresh interpreter, via ``-X importtime``."""
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from aoc.solution import ROOT
+
+TOP_N = 5
+IMPORT_LINE = r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$"
+
+
+@dataclass
+class ImportTime:
+    """Seconds to import a module, and the packages that took longest.
+
+    ``slowest`` maps top level package names to the seconds spent in their
+    own modules while importing ``module``.
+    """
+
+    module: str
+    seconds: float
+    slowest: dict[str, float] = field(default_factory=dict)
+
+
+def parse_importtime(output: str, module: str, top: int = TOP_N) -> ImportTime:
+    """Reads ``-X importtime`` output for ``import module``.
+
+    Only the imports triggered by ``module`` count, not interpreter startup.
+    """
+    entries: list[tuple[int, int, str]] = []
+    for line in output.splitlines():
+        match = re.match(IMPORT_LINE, line)
+        if match is None:
+            continue
+        own, cumulative, indent, name = match.groups()
+        if not indent and name == module:
+            entries.append((int(own), int(cumulative), name))
+            by_package: dict[str, int] = {}
+            for entry_own, _, entry_name in entries:
+                package = entry_name.split(".")[0]
+                by_package[package] = by_package.get(package, 0) + entry_own
+            slowest = sorted(by_package.items(), key=lambda item: -item[1])[:top]
+            return ImportTime(
+                module,
+                int(cumulative) / 1e6,
+                {package: micros / 1e6 for package, micros in slowest},
+            )
+        if not indent:
+            entries.clear()  # finished an unrelated top level import
+        else:
+            entries.append((int(own), int(cumulative), name))
+    raise ValueError(f"{module} not found in importtime output")
+
+
+def measure_import(module: str, repeat: int = 1, top: int = TOP_N) -> ImportTime:
+    """Imports ``module`` in ``repeat`` fresh interpreters; keeps the fastest."""
+    best: ImportTime | None = None
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if process.returncode != 0:
+            error = process.stderr.strip().splitlines()[-1:] or ["import failed"]
+            raise ImportError(f"{module}: {error[0]}")
+        result = parse_importtime(process.stderr, module, top)
+        if best is None or result.seconds < best.seconds:
+            best = result
+    assert best is not None
+    return best
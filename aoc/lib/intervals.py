@@ -0,0 +1,161 @@
+"""Half-open integer intervals and N-dimensional boxes, as plain tuples.
+
+An interval is a ``(start, end)`` tuple holding ``start <= x < end``, and
+a box is a tuple of intervals, one per dimension. Operations return new
+tuples (or None when nothing is left) rather than objects per fragment.
+
+The ``*_many`` functions work on a whole ``(n, 2)`` numpy array of
+intervals at once, for when there are millions of them. numpy is imported
+lazily so that importing a day stays cheap.
+"""
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    # (n, 2) array of (start, end) rows
+    IntervalArray = npt.NDArray[np.int64]
+
+Interval = tuple[int, int]
+Box = tuple[Interval, ...]
+
+
+def size(interval: Interval) -> int:
+    """Number of integers in an interval."""
+    return max(interval[1] - interval[0], 0)
+
+
+def intersect(first: Interval, second: Interval) -> Interval | None:
+    """Overlap of two intervals, or None if they don't overlap."""
+    start, end = max(first[0], second[0]), min(first[1], second[1])
+    return (start, end) if start < end else None
+
+
+def split(interval: Interval, value: int) -> tuple[Interval | None, Interval | None]:
+    """Splits into the parts below ``value`` and from ``value`` up.
+
+    A part is None if the whole interval is on the other side.
+    """
+    start, end = interval
+    if value >= end:
+        return interval, None
+    if value <= start:
+        return None, interval
+    return (start, value), (value, end)
+
+
+def subtract(interval: Interval, other: Interval) -> list[Interval]:
+    """Parts of ``interval`` outside ``other``; at most two."""
+    start, end = interval
+    result = []
+    if start < other[0]:
+        result.append((start, min(end, other[0])))
+    if other[1] < end:
+        result.append((max(start, other[1]), end))
+    return result
+
+
+def coalesce(intervals: Iterable[Interval]) -> list[Interval]:
+    """Sorted, with overlapping and touching intervals merged."""
+    result: list[Interval] = []
+    for start, end in sorted(intervals):
+        if start >= end:
+            continue
+        if result and start <= result[-1][1]:
+            if end > result[-1][1]:
+                result[-1] = (result[-1][0], end)
+        else:
+            result.append((start, end))
+    return result
+
+
+def box_size(box: Box) -> int:
+    """Number of integer points in a box."""
+    result = 1
+    for start, end in box:
+        result *= max(end - start, 0)
+    return result
+
+
+def split_box(box: Box, axis: int, value: int) -> tuple[Box | None, Box | None]:
+    """Splits a box along one axis, like ``split``."""
+    low, high = split(box[axis], value)
+    return (
+        None if low is None else box[:axis] + (low,) + box[axis + 1 :],
+        None if high is None else box[:axis] + (high,) + box[axis + 1 :],
+    )
+
+
+def intersect_box(first: Box, second: Box) -> Box | None:
+    """Overlap of two boxes, or None if they don't overlap."""
+    result = []
+    for first_interval, second_interval in zip(first, second):
+        overlap = intersect(first_interval, second_interval)
+        if overlap is None:
+            return None
+        result.append(overlap)
+    return tuple(result)
+
+
+def to_array(intervals: Iterable[Interval]) -> "IntervalArray":
+    """Intervals as an ``(n, 2)`` int64 array."""
+    import numpy as np
+
+    return np.array(list(intervals), dtype=np.int64).reshape(-1, 2)
+
+
+def split_many(intervals: "IntervalArray", points: Sequence[int]) -> "IntervalArray":
+    """Splits every interval at each of the sorted ``points`` inside it.
+
+    Fragments come out in the order of the intervals they're from.
+    """
+    import numpy as np
+
+    cuts = np.asarray(points, dtype=np.int64)
+    if len(cuts) == 0:
+        return intervals.copy()
+    starts, ends = intervals[:, 0], intervals[:, 1]
+    first = np.searchsorted(cuts, starts, side="right")
+    counts = np.searchsorted(cuts, ends, side="left") - first
+    counts = np.maximum(counts, 0)
+    pieces = counts + 1
+    owner = np.repeat(np.arange(len(intervals)), pieces)
+    # how far into its interval's fragments each fragment is
+    nth = np.arange(len(owner)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    point = first[owner] + nth
+    last = len(cuts) - 1
+    fragment_starts = np.where(
+        nth == 0, starts[owner], cuts[np.clip(point - 1, 0, last)]
+    )
+    fragment_ends = np.where(
+        nth == counts[owner], ends[owner], cuts[np.clip(point, 0, last)]
+    )
+    return np.stack([fragment_starts, fragment_ends], axis=1)
+
+
+def intersect_many(intervals: "IntervalArray", interval: Interval) -> "IntervalArray":
+    """Overlap of each interval with ``interval``, dropping empty ones."""
+    import numpy as np
+
+    clipped = np.clip(intervals, interval[0], interval[1])
+    result: "IntervalArray" = clipped[clipped[:, 0] < clipped[:, 1]]
+    return result
+
+
+def coalesce_many(intervals: "IntervalArray") -> "IntervalArray":
+    """Sorted, with overlapping and touching intervals merged, like ``coalesce``."""
+    import numpy as np
+
+    intervals = intervals[intervals[:, 0] < intervals[:, 1]]
+    if len(intervals) == 0:
+        return intervals
+    intervals = intervals[np.argsort(intervals[:, 0], kind="stable")]
+    reach = np.maximum.accumulate(intervals[:, 1])
+    # an interval starts a new group unless it touches everything before it
+    new_group = np.empty(len(intervals), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = intervals[1:, 0] > reach[:-1]
+    group_starts = np.flatnonzero(new_group)
+    group_ends = np.append(group_starts[1:], len(intervals)) - 1
+    return np.stack([intervals[group_starts, 0], reach[group_ends]], axis=1)
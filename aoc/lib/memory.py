@@ -0,0 +1,247 @@
+"""Peak memory and top allocation sites of a block, via tracemalloc.
+
+Only allocations made by Python in this process are traced; memory used by
+worker processes (day16, day23) isn't included.
+
+Near the peak the solvers' dataclass instances are counted too, and the
+bytes each one takes are measured by building copies of one of them, so a
+class that drops its ``__dict__`` for ``__slots__`` shows the difference.
+"""
+import contextlib
+import dataclasses
+import gc
+import os
+import threading
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+TOP_N = 10
+# copies built to measure the size of one instance
+CLONES = 100
+# modules whose instances are counted
+INSTANCE_MODULES = ("day",)
+SAMPLE_INTERVAL = 0.005  # seconds between checks for a new peak
+# take a new snapshot once the block's memory grows this much past the last one
+SNAPSHOT_GROWTH = 1.1
+
+# files whose allocations are bookkeeping rather than the solver's
+IGNORED = {
+    tracemalloc.__file__,
+    __file__,
+    threading.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+}
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """Memory (bytes) allocated by one source line and still alive."""
+
+    filename: str
+    lineno: int
+    size: int
+    count: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Json friendly dictionary."""
+        return {
+            "site": f"{self.filename}:{self.lineno}",
+            "size": self.size,
+            "count": self.count,
+        }
+
+
+@dataclass(frozen=True)
+class InstanceCount:
+    """Live instances of one class, and the bytes each one takes."""
+
+    name: str
+    count: int
+    per_instance: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Json friendly dictionary."""
+        return {
+            "class": self.name,
+            "count": self.count,
+            "per_instance": self.per_instance,
+            "size": self.count * self.per_instance,
+        }
+
+
+@dataclass
+class MemoryUsage:
+    """Peak memory (bytes) of a block above what was allocated before it.
+
+    ``top`` holds the lines that allocated the most, and ``instances`` the
+    classes with the most memory in live instances, as seen near the peak.
+    """
+
+    peak: int = 0
+    top: list[AllocationSite] = field(default_factory=list)
+    instances: list[InstanceCount] = field(default_factory=list)
+
+
+def short_filename(filename: str) -> str:
+    """Path relative to the current directory if it's inside it."""
+    relative = os.path.relpath(filename)
+    return filename if relative.startswith("..") else relative
+
+
+def top_sites(
+    snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot, limit: int
+) -> list[AllocationSite]:
+    """Lines that grew the most between two snapshots."""
+    sites: list[AllocationSite] = []
+    for stat in snapshot.compare_to(baseline, "lineno"):
+        if stat.size_diff <= 0 or len(sites) == limit:
+            break
+        frame = stat.traceback[0]
+        if frame.filename in IGNORED:
+            continue
+        sites.append(
+            AllocationSite(
+                short_filename(frame.filename),
+                frame.lineno,
+                stat.size_diff,
+                stat.count_diff,
+            )
+        )
+    return sites
+
+
+def census() -> dict[type, tuple[int, Any]]:
+    """Live dataclass instances from the solvers' modules, by class.
+
+    Returns the number of instances of each class, and one of them. The
+    counting runs in C, so the traced block can't run (or allocate) during it.
+    """
+    objects = gc.get_objects()
+    wanted = {
+        cls: count
+        for cls, count in Counter(map(type, objects)).items()
+        if cls.__module__.startswith(INSTANCE_MODULES) and dataclasses.is_dataclass(cls)
+    }
+    samples: dict[type, Any] = {}
+    for obj in objects:
+        cls = type(obj)
+        if cls in wanted and cls not in samples:
+            samples[cls] = obj
+            if len(samples) == len(wanted):
+                break
+    return {cls: (count, samples[cls]) for cls, count in wanted.items()}
+
+
+def instance_bytes(sample: Any) -> int:
+    """Traced bytes one more instance like ``sample`` takes.
+
+    Copies are built field by field, the way ``__init__`` would, so
+    instances keep their compact attribute storage; tracing must be on.
+    """
+    cls = type(sample)
+    values = [
+        (item.name, getattr(sample, item.name))
+        for item in dataclasses.fields(sample)
+        if hasattr(sample, item.name)
+    ]
+    clones: list[Any] = [None] * CLONES
+    before, _ = tracemalloc.get_traced_memory()
+    for index in range(CLONES):
+        clone = object.__new__(cls)
+        for name, value in values:
+            object.__setattr__(clone, name, value)
+        clones[index] = clone
+    after, _ = tracemalloc.get_traced_memory()
+    return round((after - before) / CLONES)
+
+
+def top_instances(
+    counts: dict[type, tuple[int, Any]], limit: int
+) -> list[InstanceCount]:
+    """Classes whose instances take the most memory."""
+    instances = [
+        InstanceCount(cls.__qualname__, count, instance_bytes(sample))
+        for cls, (count, sample) in counts.items()
+    ]
+    instances.sort(key=lambda item: item.count * item.per_instance, reverse=True)
+    return instances[:limit]
+
+
+class PeakSampler(threading.Thread):
+    """Snapshots the heap from a background thread each time it grows.
+
+    Snapshots are only taken after ``SNAPSHOT_GROWTH``, so a phase that
+    keeps growing costs a logarithmic number of them.
+    """
+
+    def __init__(self, start: int, interval: float = SAMPLE_INTERVAL):
+        """Samples every ``interval`` seconds until stopped.
+
+        Args:
+            start: traced memory before the block; growth is measured from it.
+            interval: seconds between samples.
+        """
+        super().__init__(daemon=True)
+        self.start_size = start
+        self.interval = interval
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.counts: dict[type, tuple[int, Any]] = {}
+        self.peak = 0  # peak before the last census
+        self.snapshot_growth = 0
+        self.stopped = threading.Event()
+
+    def sample(self) -> None:
+        """Takes a snapshot if memory grew enough since the last one."""
+        current, _ = tracemalloc.get_traced_memory()
+        growth = current - self.start_size
+        if growth > 0 and growth > self.snapshot_growth * SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            # the census lists every object; don't count that towards the peak
+            _, peak = tracemalloc.get_traced_memory()
+            self.counts = census()
+            tracemalloc.reset_peak()
+            self.peak = max(self.peak, peak)
+            self.snapshot_growth = growth
+
+    def run(self) -> None:
+        """Samples until ``stop``."""
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> None:
+        """Stops sampling, then checks one last time."""
+        self.stopped.set()
+        self.join()
+        self.sample()
+
+
+@contextlib.contextmanager
+def traced(top: int = TOP_N) -> Iterator[MemoryUsage]:
+    """Measures the block's peak memory and where it was allocated.
+
+    Tracing makes code several times slower, so don't time the same block.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    usage = MemoryUsage()
+    baseline = tracemalloc.take_snapshot()
+    start, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    sampler = PeakSampler(start)
+    sampler.start()
+    try:
+        yield usage
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        sampler.stop()
+        usage.peak = max(0, max(peak, sampler.peak) - start)
+        if sampler.snapshot is not None:
+            usage.top = top_sites(sampler.snapshot, baseline, top)
+        usage.instances = top_instances(sampler.counts, top)
+        if not was_tracing:
+            tracemalloc.stop()
@@ -0,0 +1,88 @@
+"""Leveled output for solvers, so they do no I/O unless asked to.
+
+Solvers report through ``verbose`` (debug values) and ``visual`` (rendered
+grids and paths) instead of printing, and ``write_file`` instead of opening
+files. A message can be a function returning the text, which is only called
+when its level is on, so rendering costs nothing by default.
+
+The level comes from ``AOC_OUTPUT`` (``quiet``, ``verbose`` or ``visual``)
+and defaults to quiet; the runner sets it for ``-v``/``-vv``. Like
+``AOC_PROFILE``, worker processes inherit it.
+"""
+import contextlib
+import os
+from enum import IntEnum
+from typing import Callable, Iterator
+
+OUTPUT_ENV = "AOC_OUTPUT"
+
+# the text itself, or a function that renders it
+Message = str | Callable[[], str]
+
+
+class Level(IntEnum):
+    """How much solvers may output."""
+
+    QUIET = 0  # nothing; the runner reports the answers
+    VERBOSE = 1  # debug values from inside solvers
+    VISUAL = 2  # also rendered maps and visualisation files
+
+    @classmethod
+    def from_env(cls) -> "Level":
+        """Level named by ``AOC_OUTPUT``, quiet if unset or unknown."""
+        name = os.environ.get(OUTPUT_ENV, "").upper()
+        return cls.__members__.get(name, cls.QUIET)
+
+
+_level = Level.from_env()
+
+
+def get_level() -> Level:
+    """The current output level."""
+    return _level
+
+
+def set_level(level: Level) -> None:
+    """Sets the level for this process and any process it starts."""
+    global _level
+    _level = level
+    os.environ[OUTPUT_ENV] = level.name.lower()
+
+
+@contextlib.contextmanager
+def output_level(level: Level) -> Iterator[None]:
+    """Sets the level within the block."""
+    previous = _level
+    set_level(level)
+    try:
+        yield
+    finally:
+        set_level(previous)
+
+
+def enabled(level: Level) -> bool:
+    """True if output at ``level`` is on; guards work that only feeds output."""
+    return _level >= level
+
+
+def emit(level: Level, message: Message) -> None:
+    """Prints ``message`` if ``level`` is on, rendering it only then."""
+    if _level >= level:
+        print(message if isinstance(message, str) else message())
+
+
+def verbose(message: Message) -> None:
+    """Prints a debug message at ``Level.VERBOSE``."""
+    emit(Level.VERBOSE, message)
+
+
+def visual(message: Message) -> None:
+    """Prints a rendering at ``Level.VISUAL``."""
+    emit(Level.VISUAL, message)
+
+
+def write_file(path: str, render: Callable[[], str]) -> None:
+    """Writes ``render()`` to ``path`` at ``Level.VISUAL``."""
+    if _level >= Level.VISUAL:
+        with open(path, "w", encoding="utf8") as file:
+            file.write(render())
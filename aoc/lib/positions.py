@@ -0,0 +1,58 @@
+"""Grid positions encoded as single ints, ``row * width + col``.
+
+Searches can keep positions (and states such as ``position * 4 +
+direction``) as plain ints: a step is ``position + offsets[direction]``
+and turning around is ``OPPOSITE[direction]``, so the inner loops index
+tuples and flat arrays instead of allocating a position object per step.
+
+Directions are the ints of ``aoc.lib.directions``.
+"""
+from typing import Iterator
+
+
+class Positions:
+    """Encoding of the positions of a ``num_rows`` by ``num_cols`` grid.
+
+    ``padding`` rows and columns around the grid are encodable too, so a
+    step off the edge (of at most ``padding`` cells) gives a position of its
+    own rather than wrapping onto the other side of the grid.
+    """
+
+    num_rows: int
+    num_cols: int
+    padding: int
+    stride: int  # distance between vertically adjacent positions
+    size: int  # number of encodable positions, padding included
+    offsets: tuple[int, int, int, int]  # per direction
+
+    def __init__(self, num_rows: int, num_cols: int, padding: int = 0) -> None:
+        """Encoding of a grid, with ``padding`` extra cells on every side."""
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.padding = padding
+        self.stride = num_cols + 2 * padding
+        self.size = (num_rows + 2 * padding) * self.stride
+        self.offsets = (-self.stride, 1, self.stride, -1)
+
+    def index(self, row: int, col: int) -> int:
+        """Position of ``(row, col)``; rows and columns may be in the padding."""
+        return (row + self.padding) * self.stride + col + self.padding
+
+    def row_col(self, index: int) -> tuple[int, int]:
+        """``(row, col)`` of a position."""
+        row, col = divmod(index, self.stride)
+        return row - self.padding, col - self.padding
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """True if ``(row, col)`` is inside the grid rather than the padding."""
+        return 0 <= row < self.num_rows and 0 <= col < self.num_cols
+
+    def neighbours(self, index: int) -> list[int]:
+        """Positions next to ``index``, in direction order."""
+        return [index + offset for offset in self.offsets]
+
+    def indices(self) -> Iterator[int]:
+        """Every position inside the padding, in reading order."""
+        for row in range(self.num_rows):
+            start = self.index(row, 0)
+            yield from range(start, start + self.num_cols)
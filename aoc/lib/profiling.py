@@ -0,0 +1,192 @@
+"""Opt-in cProfile hooks for solver phases and their worker processes.
+
+Profiling is on when ``AOC_PROFILE`` names an output directory; the runner
+sets it for ``--profile``. Each profiled phase writes into that directory:
+
+* ``<name>.prof``: the phase itself, loadable with ``pstats`` or snakeviz.
+* ``<name>.worker-<pid>.prof``: one per worker process that ran tasks.
+* ``<name>.txt``: the top functions by cumulative and own time, with call
+  counts, over the phase and its workers.
+* ``<name>.collapsed``: collapsed stacks (microseconds) for flamegraph.pl
+  or speedscope.
+"""
+import contextlib
+import cProfile
+import functools
+import glob
+import os
+import pstats
+from typing import Callable, Iterator, ParamSpec, TypeVar
+
+PROFILE_ENV = "AOC_PROFILE"
+PHASE_ENV = "AOC_PROFILE_PHASE"
+TOP_N = 30
+# stacks cheaper than this share of the total are folded into their caller
+MIN_STACK_SHARE = 0.001
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# profiler of the phase running in this process, and the pid that owns it;
+# forked workers inherit both and must not report into them.
+_phase_profile: cProfile.Profile | None = None
+_phase_pid: int | None = None
+_worker_profile: cProfile.Profile | None = None
+_worker_pid: int | None = None
+
+FunctionKey = tuple[str, int, str]
+
+
+def profile_dir() -> str | None:
+    """Directory profiles go to, or None when profiling is off."""
+    return os.environ.get(PROFILE_ENV) or None
+
+
+def enable_profiling(directory: str) -> None:
+    """Turns profiling on for this process and any process it starts."""
+    os.environ[PROFILE_ENV] = directory
+
+
+@contextlib.contextmanager
+def profiled(name: str, enabled: bool = True) -> Iterator[None]:
+    """Profiles the block as phase ``name``; does nothing if profiling is off.
+
+    Worker processes started inside the block report under the same name
+    when their task function is wrapped in ``profile_worker``.
+    """
+    global _phase_profile, _phase_pid
+    directory = profile_dir()
+    if directory is None or not enabled or _phase_pid == os.getpid():
+        yield
+        return
+
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, name)
+    for stale in glob.glob(glob.escape(base) + ".worker-*.prof"):
+        os.remove(stale)
+    previous_phase = os.environ.get(PHASE_ENV)
+    os.environ[PHASE_ENV] = name
+    _phase_profile, _phase_pid = cProfile.Profile(), os.getpid()
+    _phase_profile.enable()
+    try:
+        yield
+    finally:
+        _phase_profile.disable()
+        _phase_profile.dump_stats(base + ".prof")
+        _phase_profile, _phase_pid = None, None
+        if previous_phase is None:
+            del os.environ[PHASE_ENV]
+        else:
+            os.environ[PHASE_ENV] = previous_phase
+        write_reports(base)
+
+
+def profile_worker(func: Callable[P, R]) -> Callable[P, R]:
+    """Decorates a process pool task so that it is profiled with its phase.
+
+    Stats accumulate per worker process and are dumped after every task,
+    since pool workers can exit without running cleanup code.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        global _worker_profile, _worker_pid
+        directory, phase = profile_dir(), os.environ.get(PHASE_ENV)
+        pid = os.getpid()
+        if directory is None or phase is None or _phase_pid == pid:
+            return func(*args, **kwargs)
+
+        if _worker_pid != pid:
+            # forked from a profiled process: drop the inherited profilers
+            for inherited in (_phase_profile, _worker_profile):
+                if inherited is not None:
+                    inherited.disable()
+            _worker_profile, _worker_pid = cProfile.Profile(), pid
+        assert _worker_profile is not None
+        _worker_profile.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _worker_profile.disable()
+            path = os.path.join(directory, f"{phase}.worker-{pid}.prof")
+            _worker_profile.dump_stats(path)
+
+    return wrapper
+
+
+def load_stats(base: str) -> pstats.Stats:
+    """Stats of a phase merged with those of its workers."""
+    worker_files = sorted(glob.glob(glob.escape(base) + ".worker-*.prof"))
+    return pstats.Stats(base + ".prof", *worker_files)
+
+
+def write_reports(base: str, top: int = TOP_N) -> None:
+    """Writes the text summary and collapsed stacks next to ``<base>.prof``."""
+    with open(base + ".txt", "w", encoding="utf8") as file:
+        stats = load_stats(base)
+        stats.stream = file  # type: ignore[attr-defined]
+        file.write(f"# {os.path.basename(base)}: top {top} by cumulative time\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        file.write(f"# {os.path.basename(base)}: top {top} by own time\n")
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+
+    with open(base + ".collapsed", "w", encoding="utf8") as file:
+        for stack, micros in sorted(collapsed_stacks(load_stats(base)).items()):
+            file.write(f"{stack} {micros}\n")
+
+
+def function_label(function: FunctionKey) -> str:
+    """Short frame label such as ``solve (day16.py:16)``."""
+    filename, line, name = function
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[str, int]:
+    """Approximates stacks (``a;b;c`` -> own microseconds) from a call graph.
+
+    cProfile only records caller/callee pairs, so a function's time is
+    split between its callers in proportion to what each caller spent in
+    it. Recursion is cut at the first repeat.
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+    callees: dict[FunctionKey, dict[FunctionKey, float]] = {}
+    roots: dict[FunctionKey, float] = {}
+    for function, (_, calls, _, cumulative, callers) in raw.items():
+        for caller, (_, _, _, edge_cumulative) in callers.items():
+            callees.setdefault(caller, {})[function] = edge_cumulative
+        # calls made from outside the profile, e.g. the first of a recursion
+        if calls > sum(edge[1] for edge in callers.values()) and cumulative > 0:
+            called = sum(
+                edge[3] for caller, edge in callers.items() if caller != function
+            )
+            roots[function] = max(0.0, 1 - called / cumulative)
+
+    total = sum(raw[root][3] * share for root, share in roots.items()) or 1.0
+    result: dict[str, int] = {}
+
+    def walk(
+        function: FunctionKey, stack: list[str], share: float, seen: set[FunctionKey]
+    ) -> None:
+        own, cumulative = raw[function][2] * share, raw[function][3] * share
+        if cumulative < total * MIN_STACK_SHARE:
+            own = cumulative  # too small to split further
+        else:
+            for callee, edge_cumulative in callees.get(function, {}).items():
+                if callee in seen or raw[callee][3] <= 0:
+                    continue
+                callee_share = share * edge_cumulative / raw[callee][3]
+                seen.add(callee)
+                stack.append(function_label(callee))
+                walk(callee, stack, callee_share, seen)
+                stack.pop()
+                seen.remove(callee)
+        micros = round(own * 1_000_000)
+        if micros > 0:
+            key = ";".join(stack)
+            result[key] = result.get(key, 0) + micros
+
+    for root, share in roots.items():
+        walk(root, [function_label(root)], share, {root})
+    return result
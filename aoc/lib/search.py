@@ -0,0 +1,238 @@
+"""Graph searches over integer states.
+
+States are ints, such as the positions of ``aoc.lib.positions`` or a
+position combined with a direction, and a graph is a ``neighbours``
+function of a state. ``bfs`` walks unweighted graphs with a deque,
+``dijkstra`` weighted ones with a bucket queue (one bucket per distance,
+which beats a heap when weights are small ints) and ``astar`` adds a
+heuristic on top of a heap.
+
+These searches return a ``SearchResult`` with the distance and parent of
+each state they reached, plus how many states they pushed and expanded,
+and report those to ``aoc.lib.counters`` (with the queue's high-water
+mark, which is only measured while counting is on). ``grid_bfs`` is a
+faster special case for grids of open and closed cells, which steps by
+offsets instead of calling a function per state.
+"""
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Sequence
+
+from aoc.lib import counters
+
+# states next to a state, and the weight of each step for weighted searches
+Neighbours = Callable[[int], Iterable[int]]
+WeightedNeighbours = Callable[[int], Iterable[tuple[int, int]]]
+Goal = Callable[[int], bool]
+
+
+@dataclass
+class SearchResult:
+    """What a search reached, and how much work it took."""
+
+    distances: dict[int, int] = field(default_factory=dict)
+    parents: dict[int, int] = field(default_factory=dict)
+    goal: int | None = None  # the goal state found, if any
+    pushed: int = 0
+    expanded: int = 0
+    queue_peak: int = 0  # most states queued at once; 0 unless counting
+
+    def count(self) -> "SearchResult":
+        """Reports the work done to ``aoc.lib.counters``; returns self."""
+        counters.add("pushed", self.pushed)
+        counters.add("expanded", self.expanded)
+        counters.maximum("queue_peak", self.queue_peak)
+        return self
+
+    def reach(self, state: int, distance: int, parent: int | None) -> None:
+        """Records a new (or shorter) distance to ``state``."""
+        self.distances[state] = distance
+        if parent is not None:
+            self.parents[state] = parent
+        self.pushed += 1
+
+    def path(self, state: int | None = None) -> list[int]:
+        """States from a start to ``state`` (by default the goal).
+
+        Raises:
+            ValueError: if the state wasn't reached.
+        """
+        if state is None:
+            state = self.goal
+        if state is None or state not in self.distances:
+            raise ValueError(f"state not reached: {state}")
+        path = [state]
+        while path[-1] in self.parents:
+            path.append(self.parents[path[-1]])
+        path.reverse()
+        return path
+
+    @property
+    def cost(self) -> int:
+        """Distance to the goal.
+
+        Raises:
+            ValueError: if no goal was found.
+        """
+        if self.goal is None:
+            raise ValueError("no goal found")
+        return self.distances[self.goal]
+
+
+def bfs(
+    starts: Iterable[int],
+    neighbours: Neighbours,
+    goal: Goal | None = None,
+    max_depth: int | None = None,
+) -> SearchResult:
+    """Breadth first search, stopping once a goal state is expanded.
+
+    States ``max_depth`` steps from a start are reached but not expanded.
+    """
+    result = SearchResult()
+    distances, parents = result.distances, result.parents
+    to_visit: deque[int] = deque()
+    for start in starts:
+        result.reach(start, 0, None)
+        to_visit.append(start)
+    expanded = peak = 0
+    track = counters.enabled()
+    while to_visit:
+        if track and len(to_visit) > peak:
+            peak = len(to_visit)
+        state = to_visit.popleft()
+        if goal is not None and goal(state):
+            result.goal = state
+            break
+        distance = distances[state]
+        if distance == max_depth:
+            continue
+        expanded += 1
+        for neighbour in neighbours(state):
+            if neighbour not in distances:
+                distances[neighbour] = distance + 1
+                parents[neighbour] = state
+                to_visit.append(neighbour)
+    result.expanded = expanded
+    result.pushed = len(distances)
+    result.queue_peak = peak
+    return result.count()
+
+
+def grid_bfs(
+    starts: Iterable[int],
+    open_cells: Sequence[int],
+    offsets: Sequence[int],
+    max_depth: int | None = None,
+) -> list[int]:
+    """Breadth first search of a grid, without a ``neighbours`` callback.
+
+    States are cell indices (see ``aoc.lib.positions``), and a step moves by
+    one of ``offsets`` onto a cell that's truthy in ``open_cells``; the grid
+    needs a closed border (or ``max_depth``) to keep steps inside it.
+
+    Returns the distance to each cell, -1 for cells that weren't reached.
+    """
+    distances = [-1] * len(open_cells)
+    frontier = []
+    for start in starts:
+        if distances[start] == -1:
+            distances[start] = 0
+            frontier.append(start)
+    distance = expanded = peak = 0
+    while frontier and distance != max_depth:
+        distance += 1
+        expanded += len(frontier)
+        peak = max(peak, len(frontier))
+        next_frontier: list[int] = []
+        for state in frontier:
+            for offset in offsets:
+                neighbour = state + offset
+                if open_cells[neighbour] and distances[neighbour] == -1:
+                    distances[neighbour] = distance
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    counters.add("expanded", expanded)
+    counters.maximum("queue_peak", peak)
+    return distances
+
+
+def dijkstra(
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    goal: Goal | None = None,
+) -> SearchResult:
+    """Shortest paths by non-negative integer weights, using a bucket queue.
+
+    States are kept in a list per distance, so pushing and popping are
+    O(1); scanning the buckets costs O(largest distance) in total.
+    """
+    result = SearchResult()
+    distances = result.distances
+    buckets: list[list[int]] = [[]]
+    for start in starts:
+        result.reach(start, 0, None)
+        buckets[0].append(start)
+    distance = 0
+    track = counters.enabled()
+    while distance < len(buckets):
+        if track:  # earlier buckets are empty
+            queued = sum(map(len, buckets[distance:]))
+            result.queue_peak = max(result.queue_peak, queued)
+        bucket = buckets[distance]
+        while bucket:
+            state = bucket.pop()
+            if distances[state] != distance:
+                continue  # reached again more cheaply since being pushed
+            if goal is not None and goal(state):
+                result.goal = state
+                return result.count()
+            result.expanded += 1
+            for neighbour, weight in neighbours(state):
+                new_distance = distance + weight
+                if new_distance < distances.get(neighbour, new_distance + 1):
+                    result.reach(neighbour, new_distance, state)
+                    while len(buckets) <= new_distance:
+                        buckets.append([])
+                    buckets[new_distance].append(neighbour)
+        distance += 1
+    return result.count()
+
+
+def astar(
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    heuristic: Callable[[int], int],
+    goal: Goal,
+) -> SearchResult:
+    """A* search; ``heuristic`` must never overestimate the distance to a goal.
+
+    States are expanded in order of distance plus heuristic, so a good
+    heuristic expands fewer states than ``dijkstra``.
+    """
+    result = SearchResult()
+    distances = result.distances
+    to_visit: list[tuple[int, int, int]] = []
+    for start in starts:
+        result.reach(start, 0, None)
+        to_visit.append((heuristic(start), 0, start))
+    heapq.heapify(to_visit)
+    track = counters.enabled()
+    while to_visit:
+        if track:
+            result.queue_peak = max(result.queue_peak, len(to_visit))
+        _, distance, state = heapq.heappop(to_visit)
+        if distances[state] != distance:
+            continue  # reached again more cheaply since being pushed
+        if goal(state):
+            result.goal = state
+            break
+        result.expanded += 1
+        for neighbour, weight in neighbours(state):
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbour, new_distance + 1):
+                result.reach(neighbour, new_distance, state)
+                priority = new_distance + heuristic(neighbour)
+                heapq.heappush(to_visit, (priority, new_distance, neighbour))
+    return result.count()
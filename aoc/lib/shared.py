@@ -0,0 +1,143 @@
+"""Read-only arrays published once to the worker processes of a pool.
+
+A pool task that takes a big argument, such as a day's grid or graph,
+pickles it again for every chunk of tasks sent to a worker. ``map_tasks``
+instead copies numpy arrays into ``multiprocessing.shared_memory`` blocks
+once; each worker attaches zero-copy views of them when it starts, and its
+tasks read them with ``get``. Tasks are then sent as small arguments, one
+at a time by default so that a worker that finishes early takes the next
+task instead of idling while another works through a long chunk.
+
+An ``initializer`` runs in each worker once the arrays are attached, e.g.
+to build the structure the tasks search from them. With one worker
+everything runs in this process instead, on the arrays themselves.
+numpy is imported lazily so that importing a day stays cheap.
+"""
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Sequence, TypeVar
+
+from aoc.lib.workers import worker_count
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+    import numpy.typing as npt
+
+    Array = npt.NDArray[Any]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# shared memory block name, shape and dtype of a published array
+ArraySpec = tuple[str, tuple[int, ...], str]
+
+# arrays the tasks of this process can ``get``, and the blocks behind them
+_arrays: dict[str, "Array"] = {}
+_blocks: list["SharedMemory"] = []
+
+
+@contextlib.contextmanager
+def publish(arrays: Mapping[str, "Array"]) -> Iterator[dict[str, ArraySpec]]:
+    """Copies arrays into shared memory for the block, yielding how to attach them.
+
+    The shared memory is freed at the end of the block.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    import numpy as np
+
+    blocks: list[SharedMemory] = []
+    specs: dict[str, ArraySpec] = {}
+    try:
+        for name, array in arrays.items():
+            block = SharedMemory(create=True, size=max(1, array.nbytes))
+            blocks.append(block)
+            view: "Array" = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            view[...] = array
+            specs[name] = (block.name, array.shape, array.dtype.str)
+        yield specs
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def attach(specs: Mapping[str, ArraySpec]) -> None:
+    """Makes published arrays available to ``get``, without copying them."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    import numpy as np
+
+    for name, (block_name, shape, dtype) in specs.items():
+        # pool workers share the publishing process's resource tracker, so
+        # the block is still freed (once) when ``publish`` unlinks it
+        block = SharedMemory(name=block_name)
+        _blocks.append(block)
+        view: "Array" = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        view.flags.writeable = False
+        _arrays[name] = view
+
+
+def detach() -> None:
+    """Forgets the attached arrays and closes their blocks.
+
+    Workers never need to, as their blocks close when they exit.
+    """
+    _arrays.clear()
+    while _blocks:
+        _blocks.pop().close()
+
+
+def get(name: str) -> "Array":
+    """A published array, read only."""
+    return _arrays[name]
+
+
+def init_worker(
+    specs: Mapping[str, ArraySpec],
+    initializer: Callable[..., None] | None,
+    initargs: Sequence[Any],
+) -> None:
+    """Attaches the published arrays in a new worker, then runs ``initializer``."""
+    attach(specs)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def map_tasks(
+    func: Callable[[T], R],
+    tasks: Sequence[T],
+    arrays: Mapping[str, "Array"],
+    initializer: Callable[..., None] | None = None,
+    initargs: Sequence[Any] = (),
+    workers: int | None = None,
+    chunksize: int = 1,
+) -> list[R]:
+    """``[func(task) for task in tasks]`` in a pool sharing ``arrays``.
+
+    Args:
+        func: task function; reads the arrays with ``get``.
+        tasks: small arguments, sent to the workers in chunks.
+        arrays: read only arrays every task can ``get`` by name.
+        initializer: run with ``initargs`` in each worker once it has the arrays.
+        initargs: arguments of ``initializer``.
+        workers: worker processes, by default ``worker_count()``.
+        chunksize: tasks per chunk, by default 1 so uneven tasks balance out.
+    """
+    workers = min(workers or worker_count(), len(tasks))
+    if workers <= 1:
+        previous = dict(_arrays)
+        _arrays.update(arrays)
+        try:
+            if initializer is not None:
+                initializer(*initargs)
+            return [func(task) for task in tasks]
+        finally:
+            _arrays.clear()
+            _arrays.update(previous)
+
+    with publish(arrays) as specs, ProcessPoolExecutor(
+        workers, initializer=init_worker, initargs=(specs, initializer, initargs)
+    ) as pool:
+        return list(pool.map(func, tasks, chunksize=chunksize))
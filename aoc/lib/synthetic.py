@@ -0,0 +1,131 @@
+"""Helpers shared by the per-day synthetic input generators."""
+import math
+import random
+import string
+from typing import Sequence
+
+Point = tuple[int, int]
+
+
+def scaled(count: int, scale: float, minimum: int = 1) -> int:
+    """Scales a count (lines, nodes, ...) linearly with ``scale``."""
+    return max(minimum, round(count * scale))
+
+
+def scaled_side(side: int, scale: float, minimum: int = 3) -> int:
+    """Scales the side of a square grid so that its area grows with ``scale``."""
+    return max(minimum, round(side * math.sqrt(scale)))
+
+
+def random_grid(
+    rng: random.Random, rows: int, cols: int, chars: str, weights: Sequence[float]
+) -> list[list[str]]:
+    """Returns a grid of ``chars`` picked with the given ``weights``."""
+    return [rng.choices(chars, weights, k=cols) for _ in range(rows)]
+
+
+def render_grid(grid: list[list[str]]) -> str:
+    """Joins a grid back into newline terminated rows."""
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+def unique_names(
+    rng: random.Random,
+    count: int,
+    alphabet: str = string.ascii_lowercase,
+    length: int = 3,
+) -> list[str]:
+    """Returns ``count`` distinct random names.
+
+    Names grow past ``length`` when the name space would get crowded.
+    """
+    while len(alphabet) ** length < 2 * count:
+        length += 1
+    result: list[str] = []
+    for index in rng.sample(range(len(alphabet) ** length), count):
+        chars = []
+        for _ in range(length):
+            index, remainder = divmod(index, len(alphabet))
+            chars.append(alphabet[remainder])
+        result.append("".join(chars))
+    return result
+
+
+def primes_between(low: int, high: int) -> list[int]:
+    """Returns all primes ``p`` with ``low <= p < high``."""
+    sieve = bytearray([1]) * max(high, 2)
+    sieve[0] = sieve[1] = 0
+    for value in range(2, math.isqrt(high - 1) + 1):
+        if sieve[value]:
+            sieve[value * value :: value] = bytes(
+                len(range(value * value, high, value))
+            )
+    return [value for value in range(max(low, 2), high) if sieve[value]]
+
+
+def column_convex_loop(
+    tops: list[int], bottoms: list[int], widths: list[int]
+) -> list[Point]:
+    """Corners of a simple rectilinear loop, as (row, col) points.
+
+    Column ``i`` is ``widths[i]`` wide and spans rows ``tops[i]`` to
+    ``bottoms[i]``. Neighbouring columns must overlap by at least one row
+    (``max(tops) < min(bottoms)`` is enough), which keeps the loop simple.
+
+    The loop is closed: the last point equals the first. Points where the
+    loop doesn't turn are dropped.
+    """
+    col = 0
+    points: list[Point] = [(tops[0], 0), (bottoms[0], 0)]
+    for index, width in enumerate(widths):
+        col += width
+        points.append((bottoms[index], col))
+        if index + 1 < len(widths):
+            points.append((bottoms[index + 1], col))
+    points.append((tops[-1], col))
+    for index in reversed(range(len(widths))):
+        col -= widths[index]
+        points.append((tops[index], col))
+        if index > 0:
+            points.append((tops[index - 1], col))
+
+    corners: list[Point] = [points[0]]
+    for point in points[1:]:
+        if point == corners[-1]:
+            continue
+        if len(corners) >= 2 and collinear(corners[-2], corners[-1], point):
+            corners[-1] = point
+        else:
+            corners.append(point)
+    return corners
+
+
+def collinear(first: Point, second: Point, third: Point) -> bool:
+    """Whether three axis aligned points are on one line."""
+    return (first[0] == second[0] == third[0]) or (first[1] == second[1] == third[1])
+
+
+def random_walk(
+    rng: random.Random, count: int, low: int, high: int, step: int
+) -> list[int]:
+    """Returns ``count`` values in ``[low, high]``; neighbours differ if they can."""
+    values = [rng.randint(low, high)]
+    while len(values) < count:
+        value = values[-1] + rng.randint(-step, step)
+        value = min(high, max(low, value))
+        if value != values[-1] or low == high:
+            values.append(value)
+    return values
+
+
+def trace(corners: list[Point]) -> list[Point]:
+    """Expands straight segments between corners into every point on them."""
+    result: list[Point] = [corners[0]]
+    for row, col in corners[1:]:
+        last_row, last_col = result[-1]
+        d_row = (row > last_row) - (row < last_row)
+        d_col = (col > last_col) - (col < last_col)
+        while result[-1] != (row, col):
+            last_row, last_col = result[-1]
+            result.append((last_row + d_row, last_col + d_col))
+    return result
@@ -0,0 +1,16 @@
+"""How many worker processes a solver may use."""
+import os
+
+WORKERS_ENV = "AOC_WORKERS"
+
+
+def worker_count() -> int:
+    """Returns the worker budget for solvers that fork internally.
+
+    Defaults to the cpu count; the scheduler lowers it via ``AOC_WORKERS``
+    so that parallel days don't oversubscribe the machine.
+    """
+    override = os.environ.get(WORKERS_ENV)
+    if override is not None:
+        return max(1, int(override))
+    return os.cpu_count() or 1
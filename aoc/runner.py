@@ -0,0 +1,532 @@
+"""Runs days as separately timed parse/part1/part2 phases.
+
+Usage: ``python -m aoc run 6 16 --repeat 5 --format json``
+"""
+import argparse
+import contextlib
+import csv
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, TextIO
+
+from aoc.cache import AnswerCache, ParseCache, file_digest
+from aoc.lib import budget, counters
+from aoc.lib.budget import BudgetExceeded
+from aoc.lib.memory import MemoryUsage, traced
+from aoc.lib.output import Level, set_level
+from aoc.lib.profiling import enable_profiling, profile_dir, profiled
+from aoc.solution import DEFAULT_ENGINE, Solution, discover_days, load_solution
+
+PARSE = "parse"
+ALL_PARTS = (1, 2)
+CSV_FIELDS = [
+    "day",
+    "phase",
+    "input",
+    "repeat",
+    "min",
+    "median",
+    "answer",
+    "error",
+    "peak_memory",
+    "cached",
+    "engine",
+]
+
+
+@dataclass
+class PhaseResult:
+    """Timings (seconds) and answer for one phase of one day.
+
+    With ``--memory``, also the phase's peak traced memory (bytes), the
+    source lines that allocated the most of it and the classes with the
+    most memory in live instances. With ``--counters``, the work the last
+    run of the phase reported to ``aoc.lib.counters``, such as states
+    expanded or memo hits. ``engine`` names the engine that solved a part.
+    ``cached`` marks a parse that was loaded from the parse cache rather
+    than parsed, or a phase whose answer and timings came from the answer
+    cache.
+    """
+
+    day: int
+    phase: str
+    input_path: str
+    timings: list[float] = field(default_factory=list)
+    answer: Any = None
+    error: str | None = None
+    peak_memory: int | None = None
+    allocations: list[dict[str, Any]] = field(default_factory=list)
+    instances: list[dict[str, Any]] = field(default_factory=list)
+    counters: dict[str, int] = field(default_factory=dict)
+    cached: bool = False
+    engine: str = DEFAULT_ENGINE
+
+    @property
+    def min(self) -> float | None:
+        """Fastest timing, or None if the phase never completed."""
+        return min(self.timings) if self.timings else None
+
+    @property
+    def median(self) -> float | None:
+        """Median timing, or None if the phase never completed."""
+        return statistics.median(self.timings) if self.timings else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flat dictionary for json/csv output."""
+        return {
+            "day": self.day,
+            "phase": self.phase,
+            "input": self.input_path,
+            "repeat": len(self.timings),
+            "min": self.min,
+            "median": self.median,
+            "answer": self.answer,
+            "error": self.error,
+            "peak_memory": self.peak_memory,
+            "allocations": self.allocations,
+            "instances": self.instances,
+            "counters": self.counters,
+            "cached": self.cached,
+            "engine": self.engine,
+        }
+
+    @property
+    def cache_phase(self) -> str:
+        """Phase name in the answer cache; other engines are cached apart."""
+        if self.engine == DEFAULT_ENGINE:
+            return self.phase
+        return f"{self.phase}-{self.engine}"
+
+    def record_memory(self, usage: MemoryUsage) -> None:
+        """Stores what ``aoc.lib.memory.traced`` measured."""
+        self.peak_memory = usage.peak
+        self.allocations = [site.to_dict() for site in usage.top]
+        self.instances = [instance.to_dict() for instance in usage.instances]
+
+
+def part_name(part: int) -> str:
+    """Returns the phase name of a part, e.g. ``part1``."""
+    return f"part{part}"
+
+
+def timed(func: Callable[[Any], Any], arg: Any) -> tuple[Any, float]:
+    """Calls ``func(arg)``, returning its result and how long it took."""
+    start = time.perf_counter()
+    result = func(arg)
+    return result, time.perf_counter() - start
+
+
+def profile_name(day: int, phase: str) -> str:
+    """Name of a phase's profile files, e.g. ``day16-part2``."""
+    return f"day{day:02}-{phase}"
+
+
+def describe_error(exc: BaseException) -> str:
+    """Short one line description of an exception."""
+    return f"{type(exc).__name__}: {exc}"
+
+
+def parse_input(
+    solution: Solution[Any], path: str, cache: ParseCache | None = None
+) -> tuple[Any, bool]:
+    """Parses ``path`` through the cache, if any; also says if it was a hit."""
+    if cache is None:
+        return solution.parse(path), False
+    return cache.parse(solution, path)
+
+
+def run_solution(
+    solution: Solution[Any],
+    input_path: str | None = None,
+    parts: Iterable[int] = ALL_PARTS,
+    repeat: int = 1,
+    memory: bool = False,
+    cache: ParseCache | None = None,
+    answers: AnswerCache | None = None,
+    engine: str | None = None,
+) -> list[PhaseResult]:
+    """Runs parse and each part ``repeat`` times, timing each phase.
+
+    Parts registered with ``engine`` are solved by it (see ``Solution``).
+
+    The first part re-uses the timed parse; later parts get a fresh
+    (untimed) parse since some days mutate their input while solving.
+    A phase that raises is marked with an error and not run again.
+
+    With profiling on (``--profile``), the first run of each phase is
+    profiled. A parse feeding only some parts is named after them, so that
+    parallel jobs for different parts don't overwrite each other's profile.
+
+    With ``memory``, every phase then runs once more under tracemalloc, so
+    that tracing doesn't slow down the timed runs.
+
+    With a ``cache``, the first parse is loaded from it, or stored into it
+    on a miss. Later repeats only use the cache if the first run hit it, so
+    that every timing of a phase measures the same thing.
+
+    With ``answers``, nothing runs if every phase (with at least ``repeat``
+    timings) is in the answer cache; otherwise everything runs and
+    successful phases are cached.
+    """
+    path = input_path or solution.input_path
+    solvers = solution.parts()
+    parse_result = PhaseResult(solution.day, PARSE, path)
+    part_results = {
+        part: PhaseResult(
+            solution.day, part_name(part), path, engine=solution.engine_of(part, engine)
+        )
+        for part in parts
+        if part in solvers
+    }
+
+    results = [parse_result, *part_results.values()]
+    digest = input_digest(path) if answers is not None else None
+    if load_answers(answers, digest, results, repeat):
+        return results
+
+    parse_name = profile_name(solution.day, PARSE)
+    if set(part_results) != set(solvers):
+        parse_name += "".join(f"-{part_name(part)}" for part in part_results)
+
+    timed_cache = cache
+    for iteration in range(repeat):
+        first = iteration == 0
+        try:
+            with counters.collected() as counts, profiled(parse_name, first):
+                (data, hit), elapsed = timed(
+                    lambda source: parse_input(solution, source, timed_cache), path
+                )
+        except Exception as exc:
+            parse_result.error = describe_error(exc)
+            for result in part_results.values():
+                result.error = result.error or "not run: parse failed"
+            break
+        parse_result.timings.append(elapsed)
+        parse_result.counters = counts
+        if first:
+            parse_result.cached = hit
+            if cache is not None and not hit:
+                cache.store(solution, path, data, elapsed)
+                timed_cache = None
+        run_parts(solution, path, data, part_results, cache, first)
+
+    if memory:
+        trace_memory(solution, path, parse_result, part_results)
+    store_answers(answers, digest, results)
+    return results
+
+
+def answer_cache(use_cache: bool, memory: bool) -> AnswerCache | None:
+    """The answer cache, unless phases must really run to trace, profile or count."""
+    if not use_cache or memory or profile_dir() is not None or counters.enabled():
+        return None
+    return AnswerCache()
+
+
+def input_digest(path: str) -> str | None:
+    """Hash of an input, or None if it can't be read."""
+    try:
+        return file_digest(path)
+    except OSError:
+        return None
+
+
+def load_answers(
+    answers: AnswerCache | None,
+    digest: str | None,
+    results: list[PhaseResult],
+    repeat: int,
+) -> bool:
+    """Fills in every result from the answer cache, if all of them are there."""
+    if answers is None or digest is None:
+        return False
+    entries = [
+        answers.load(result.day, result.cache_phase, digest) for result in results
+    ]
+    if not all(entry is not None and len(entry[1]) >= repeat for entry in entries):
+        return False
+    for result, entry in zip(results, entries):
+        assert entry is not None
+        result.answer, timings = entry
+        result.timings = timings[:repeat]
+        result.cached = True
+    return True
+
+
+def store_answers(
+    answers: AnswerCache | None, digest: str | None, results: list[PhaseResult]
+) -> None:
+    """Caches the answers and timings of phases that succeeded."""
+    if answers is None or digest is None:
+        return
+    for result in results:
+        if result.error is None and result.timings:
+            answers.store(
+                result.day, result.cache_phase, digest, result.answer, result.timings
+            )
+
+
+def run_parts(
+    solution: Solution[Any],
+    path: str,
+    data: Any,
+    part_results: dict[int, PhaseResult],
+    cache: ParseCache | None = None,
+    profile: bool = False,
+) -> None:
+    """Times each part once; the first gets ``data``, the rest a fresh parse.
+
+    A part that runs out of time budget keeps its partial answer, if any.
+    """
+    fresh = True
+    for part, result in part_results.items():
+        if result.error is not None:
+            continue
+        try:
+            if not fresh:
+                data, _ = parse_input(solution, path, cache)
+            fresh = False
+            with counters.collected() as counts, budget.deadline(), profiled(
+                profile_name(solution.day, result.phase), profile
+            ):
+                solver = solution.parts(result.engine)[part]
+                result.answer, elapsed = timed(solver, data)
+        except BudgetExceeded as exc:
+            result.answer, result.error = exc.best, str(exc)
+            continue
+        except Exception as exc:
+            result.error = describe_error(exc)
+            continue
+        result.timings.append(elapsed)
+        result.counters = counts
+
+
+def trace_memory(
+    solution: Solution[Any],
+    path: str,
+    parse_result: PhaseResult,
+    part_results: dict[int, PhaseResult],
+) -> None:
+    """Runs each phase that succeeded once more, recording its memory use."""
+    if parse_result.error is not None:
+        return
+    with traced() as usage:
+        data = solution.parse(path)
+    parse_result.record_memory(usage)
+
+    fresh = True
+    for part, result in part_results.items():
+        if result.error is not None:
+            continue
+        if not fresh:
+            data = solution.parse(path)
+        fresh = False
+        try:
+            with traced() as usage:
+                solution.parts(result.engine)[part](data)
+        except Exception as exc:
+            result.error = describe_error(exc)
+            continue
+        result.record_memory(usage)
+
+
+def run_days(
+    days: Iterable[int],
+    input_path: str | None = None,
+    parts: Iterable[int] = ALL_PARTS,
+    repeat: int = 1,
+    memory: bool = False,
+    cache: ParseCache | None = None,
+    answers: AnswerCache | None = None,
+    engine: str | None = None,
+) -> list[PhaseResult]:
+    """Runs several days one after another.
+
+    Anything the solvers print goes to stderr so stdout stays machine-readable.
+    """
+    results: list[PhaseResult] = []
+    with contextlib.redirect_stdout(sys.stderr):
+        for day in days:
+            solution = load_solution(day)
+            results.extend(
+                run_solution(
+                    solution, input_path, parts, repeat, memory, cache, answers, engine
+                )
+            )
+    return results
+
+
+def format_ms(seconds: float | None) -> str:
+    """Formats seconds as milliseconds for the text table."""
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.3f}"
+
+
+def format_kb(size: int | None) -> str:
+    """Formats bytes as KiB for the text table."""
+    if size is None:
+        return "-"
+    return f"{size / 1024:.1f}"
+
+
+def write_text(results: list[PhaseResult], file: TextIO) -> None:
+    """Writes a human readable table; peak memory only if it was traced."""
+    memory = any(result.peak_memory is not None for result in results)
+    memory_header = f" {'peak(KiB)':>12}" if memory else ""
+    file.write(
+        f"{'day':>3} {'phase':<6} {'min(ms)':>12} {'median(ms)':>12}"
+        f"{memory_header}  answer\n"
+    )
+    for result in results:
+        answer = "" if result.answer is None else result.answer
+        if result.error:  # with the partial answer of a part out of time
+            answer = f"{answer} error: {result.error}".lstrip()
+        if result.engine != DEFAULT_ENGINE:
+            answer = f"{answer} ({result.engine})".lstrip()
+        if result.cached:
+            answer = f"{answer} (cached)".lstrip()
+        memory_str = f" {format_kb(result.peak_memory):>12}" if memory else ""
+        file.write(
+            f"{result.day:>3} {result.phase:<6} {format_ms(result.min):>12} "
+            f"{format_ms(result.median):>12}{memory_str}  {answer}\n"
+        )
+
+
+def write_json(results: list[PhaseResult], file: TextIO) -> None:
+    """Writes results as a json document."""
+    document = {"results": [result.to_dict() for result in results]}
+    json.dump(document, file, indent=2, default=str)
+    file.write("\n")
+
+
+def write_csv(results: list[PhaseResult], file: TextIO) -> None:
+    """Writes results as csv, one row per phase."""
+    writer = csv.DictWriter(
+        file, fieldnames=CSV_FIELDS, lineterminator="\n", extrasaction="ignore"
+    )
+    writer.writeheader()
+    for result in results:
+        writer.writerow(result.to_dict())
+
+
+WRITERS: dict[str, Callable[[list[PhaseResult], TextIO], None]] = {
+    "text": write_text,
+    "json": write_json,
+    "csv": write_csv,
+}
+
+
+def write_results(
+    results: list[PhaseResult], output_format: str, output: str | None
+) -> None:
+    """Writes results to a file, or stdout if no file is given."""
+    writer = WRITERS[output_format]
+    if output is None:
+        writer(results, sys.stdout)
+        return
+    with open(output, "w", encoding="utf8", newline="") as file:
+        writer(results, file)
+
+
+def report_profiles() -> None:
+    """Tells the user where profiles went, if profiling is on."""
+    directory = profile_dir()
+    if directory is not None:
+        print(f"profiles written to {directory}", file=sys.stderr)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``run`` arguments to a parser."""
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default all)")
+    parser.add_argument("--input", help="input file; only valid with a single day")
+    parser.add_argument(
+        "--part", nargs="+", type=int, choices=ALL_PARTS, default=list(ALL_PARTS)
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="runs per phase")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="text")
+    parser.add_argument("--output", help="write results here instead of stdout")
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="cProfile each phase (and its worker processes) into DIR",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also trace each phase's peak memory and top allocation sites",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="also report the work solvers count, e.g. states expanded or memo hits",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        metavar="SECONDS",
+        help="stop each part after SECONDS, reporting its partial answer",
+    )
+    parser.add_argument(
+        "--engine",
+        help="solve parts that have this engine with it (see python -m aoc engines)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="parse and solve from scratch, ignoring cached inputs and answers",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="let solvers print debug output; twice to also render and write maps",
+    )
+
+
+def unknown_engine(days: Iterable[int], engine: str | None) -> bool:
+    """True (after saying so) if none of the days has ``engine``."""
+    if engine is None or engine == DEFAULT_ENGINE:
+        return False
+    for day in days:
+        if any(engine in engines for engines in load_solution(day).engines.values()):
+            return False
+    print(f"no engine {engine!r} in the given days", file=sys.stderr)
+    return True
+
+
+def main(args: argparse.Namespace) -> int:
+    """Runs the requested days; returns non-zero if any phase failed."""
+    days: list[int] = args.days or discover_days()
+    if args.input is not None and len(days) != 1:
+        print("--input requires exactly one day", file=sys.stderr)
+        return 2
+    if unknown_engine(days, args.engine):
+        return 2
+    if args.profile is not None:
+        enable_profiling(args.profile)
+    if args.counters:
+        counters.enable()
+    if args.budget is not None:
+        budget.set_budget(args.budget)
+    if args.verbose:
+        set_level(Level(min(args.verbose, Level.VISUAL)))
+    cache = None if args.no_cache else ParseCache()
+    answers = answer_cache(not args.no_cache, args.memory)
+    results = run_days(
+        days,
+        args.input,
+        args.part,
+        max(1, args.repeat),
+        args.memory,
+        cache,
+        answers,
+        args.engine,
+    )
+    write_results(results, args.format, args.output)
+    report_profiles()
+    return 1 if any(result.error for result in results) else 0
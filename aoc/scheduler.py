@@ -0,0 +1,290 @@
+"""Runs days and parts in parallel across a process pool, longest job first.
+
+Usage: ``python -m aoc schedule --workers 8``
+
+Each ``(day, part)`` is a job that parses its own input, so jobs are
+independent and the best possible wall time is the slowest single job
+(the critical path). Jobs are ordered by how long they took last time;
+jobs we've never timed go first since they might be slow.
+
+Parts that fork internally (``Solution.forking_parts``) reserve a larger
+share of the worker budget and are told how many processes they may use
+via ``AOC_WORKERS``.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from aoc import runner
+from aoc.cache import ParseCache
+from aoc.lib import budget, counters
+from aoc.lib.output import Level, set_level
+from aoc.lib.profiling import enable_profiling
+from aoc.lib.workers import WORKERS_ENV
+from aoc.runner import PhaseResult
+from aoc.solution import discover_days, load_solution
+
+HISTORY_PATH = ".aoc/history.json"
+FORK_SHARE = 0.5  # fraction of the worker budget given to a forking job
+
+
+@dataclass(frozen=True)
+class Job:
+    """One part of one day, and how many worker slots it reserves."""
+
+    day: int
+    part: int
+    input_path: str
+    repeat: int = 1
+    slots: int = 1
+    memory: bool = False
+    use_cache: bool = False
+    engine: str | None = None
+
+    @property
+    def key(self) -> str:
+        """History key; costs depend on the input and engine so they're included."""
+        key = f"{self.input_path}:part{self.part}"
+        return key if self.engine is None else f"{key}:{self.engine}"
+
+
+@dataclass
+class JobResult:
+    """Results of a job plus when it ran, relative to the schedule start."""
+
+    job: Job
+    results: list[PhaseResult]
+    start: float = 0.0
+    end: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        """Wall time of the job including its parse."""
+        return self.end - self.start
+
+
+@dataclass
+class Schedule:
+    """Everything that ran, for reporting."""
+
+    workers: int
+    job_results: list[JobResult] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def critical_path(self) -> JobResult | None:
+        """The slowest job; the schedule can't finish faster than this."""
+        if not self.job_results:
+            return None
+        return max(self.job_results, key=lambda item: item.duration)
+
+    @property
+    def busy_time(self) -> float:
+        """Sum of every job's wall time."""
+        return sum(item.duration for item in self.job_results)
+
+    def phase_results(self) -> list[PhaseResult]:
+        """Flattened results, with one parse row per day, sorted by day."""
+        by_day: dict[int, dict[str, PhaseResult]] = {}
+        for item in sorted(self.job_results, key=lambda item: item.job.part):
+            phases = by_day.setdefault(item.job.day, {})
+            for result in item.results:
+                phases.setdefault(result.phase, result)
+        return [
+            result
+            for day in sorted(by_day)
+            for _, result in sorted(by_day[day].items(), key=phase_order)
+        ]
+
+
+def phase_order(item: tuple[str, PhaseResult]) -> tuple[bool, str]:
+    """Sort key putting ``parse`` before the parts."""
+    phase, _ = item
+    return (phase != runner.PARSE, phase)
+
+
+def load_history(path: str) -> dict[str, float]:
+    """Loads previous job durations; missing/corrupt files give no history."""
+    try:
+        with open(path, encoding="utf8") as file:
+            history: dict[str, float] = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return history
+
+
+def save_history(path: str, schedule: Schedule, history: dict[str, float]) -> None:
+    """Merges this run's successful job durations into the history file.
+
+    Jobs answered entirely from the answer cache took next to no time, so
+    they keep whatever duration was recorded when they really ran.
+    """
+    for item in schedule.job_results:
+        if any(result.error for result in item.results):
+            continue
+        if all(result.cached for result in item.results):
+            continue
+        history[item.job.key] = item.duration
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf8") as file:
+        json.dump(history, file, indent=2, sort_keys=True)
+
+
+def build_jobs(
+    days: list[int],
+    input_path: str | None,
+    parts: list[int],
+    repeat: int,
+    workers: int,
+    memory: bool = False,
+    use_cache: bool = False,
+    engine: str | None = None,
+) -> list[Job]:
+    """Creates a job for every requested part of every day."""
+    jobs: list[Job] = []
+    fork_slots = max(1, int(workers * FORK_SHARE))
+    for day in days:
+        solution = load_solution(day)
+        for part in parts:
+            if part not in solution.parts():
+                continue
+            slots = fork_slots if part in solution.forking_parts else 1
+            path = input_path or solution.input_path
+            part_engine = engine if engine in solution.engines.get(part, {}) else None
+            jobs.append(
+                Job(day, part, path, repeat, slots, memory, use_cache, part_engine)
+            )
+    return jobs
+
+
+def order_jobs(jobs: list[Job], history: dict[str, float]) -> list[Job]:
+    """Longest first; jobs with no history are assumed to be the longest."""
+    return sorted(jobs, key=lambda job: -history.get(job.key, float("inf")))
+
+
+def run_job(job: Job) -> list[PhaseResult]:
+    """Runs a job inside a worker process."""
+    os.environ[WORKERS_ENV] = str(job.slots)
+    with contextlib.redirect_stdout(sys.stderr):
+        solution = load_solution(job.day)
+        cache = ParseCache() if job.use_cache else None
+        answers = runner.answer_cache(job.use_cache, job.memory)
+        return runner.run_solution(
+            solution,
+            job.input_path,
+            [job.part],
+            job.repeat,
+            job.memory,
+            cache,
+            answers,
+            job.engine,
+        )
+
+
+def run_schedule(jobs: list[Job], workers: int) -> Schedule:
+    """Runs jobs in order, starting each one as soon as its slots are free.
+
+    If the next job doesn't fit, later (smaller) jobs are started in the
+    meantime so no worker sits idle.
+    """
+    schedule = Schedule(workers)
+    pending = list(jobs)
+    running: dict[Future[list[PhaseResult]], JobResult] = {}
+    free_slots = workers
+    origin = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            for job in list(pending):
+                slots = min(job.slots, workers)
+                if slots > free_slots:
+                    continue
+                pending.remove(job)
+                free_slots -= slots
+                future = pool.submit(run_job, job)
+                running[future] = JobResult(job, [], time.perf_counter() - origin)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job_result = running.pop(future)
+                job_result.end = time.perf_counter() - origin
+                job_result.results = future.result()
+                free_slots += min(job_result.job.slots, workers)
+                schedule.job_results.append(job_result)
+
+    schedule.wall_time = time.perf_counter() - origin
+    return schedule
+
+
+def write_report(schedule: Schedule) -> None:
+    """Writes the critical path and utilisation to stderr."""
+    critical = schedule.critical_path
+    if critical is None:
+        return
+    job = critical.job
+    busy = schedule.busy_time
+    print(f"workers: {schedule.workers}", file=sys.stderr)
+    print(f"wall time: {schedule.wall_time:.3f}s", file=sys.stderr)
+    print(
+        f"critical path: day{job.day:02} part{job.part} {critical.duration:.3f}s"
+        f" ({critical.duration / schedule.wall_time:.0%} of wall time)",
+        file=sys.stderr,
+    )
+    print(
+        f"busy time: {busy:.3f}s "
+        f"(utilisation {busy / (schedule.wall_time * schedule.workers):.0%})",
+        file=sys.stderr,
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``schedule`` arguments; the same as ``run`` plus pool options."""
+    runner.add_arguments(parser)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="total processes"
+    )
+    parser.add_argument("--history", default=HISTORY_PATH, help="job cost history")
+
+
+def main(args: argparse.Namespace) -> int:
+    """Schedules the requested days; returns non-zero if any phase failed."""
+    days: list[int] = args.days or discover_days()
+    if args.input is not None and len(days) != 1:
+        print("--input requires exactly one day", file=sys.stderr)
+        return 2
+    if runner.unknown_engine(days, args.engine):
+        return 2
+    if args.profile is not None:
+        enable_profiling(args.profile)
+    if args.counters:
+        counters.enable()
+    if args.budget is not None:
+        budget.set_budget(args.budget)
+    if args.verbose:
+        set_level(Level(min(args.verbose, Level.VISUAL)))
+    workers = max(1, args.workers)
+    history = load_history(args.history)
+    repeat = max(1, args.repeat)
+    jobs = build_jobs(
+        days,
+        args.input,
+        args.part,
+        repeat,
+        workers,
+        args.memory,
+        not args.no_cache,
+        args.engine,
+    )
+    schedule = run_schedule(order_jobs(jobs, history), workers)
+    save_history(args.history, schedule, history)
+
+    results = schedule.phase_results()
+    runner.write_results(results, args.format, args.output)
+    write_report(schedule)
+    runner.report_profiles()
+    return 1 if any(result.error for result in results) else 0
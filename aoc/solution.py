@@ -0,0 +1,87 @@
+"""Uniform parse/part1/part2 hooks so every day can be run the same way."""
+import importlib
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Mapping, TypeVar
+
+T = TypeVar("T")
+
+# name of the engine that ``part1``/``part2`` themselves are
+DEFAULT_ENGINE = "default"
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAY_PACKAGE_REGEX = r"^day(\d\d)$"
+
+
+@dataclass(frozen=True)
+class Solution(Generic[T]):
+    """How to parse and solve a single day.
+
+    ``parse`` turns an input path into whatever the parts consume.
+    Several days mutate their parsed input, so every part should be handed
+    a freshly parsed copy.
+
+    ``forking_parts`` lists parts that spin up their own process pool; the
+    scheduler gives those a bigger share of the worker budget.
+
+    ``engines`` registers other ways of solving a part, by name, such as a
+    naive version kept next to a fast one. The runner picks one with
+    ``--engine``, and ``python -m aoc engines`` checks that they all agree.
+    """
+
+    day: int
+    input_path: str
+    parse: Callable[[str], T]
+    part1: Callable[[T], Any]
+    part2: Callable[[T], Any] | None = None
+    forking_parts: tuple[int, ...] = ()
+    engines: Mapping[int, Mapping[str, Callable[[T], Any]]] = field(
+        default_factory=dict
+    )
+
+    def parts(self, engine: str | None = None) -> dict[int, Callable[[T], Any]]:
+        """Returns mapping of part number to solver, skipping missing parts.
+
+        Parts that have ``engine`` are solved by it instead.
+        """
+        result: dict[int, Callable[[T], Any]] = {1: self.part1}
+        if self.part2 is not None:
+            result[2] = self.part2
+        for part in result:
+            result[part] = self.part_engines(part).get(engine or "", result[part])
+        return result
+
+    def part_engines(self, part: int) -> dict[str, Callable[[T], Any]]:
+        """Every engine of a part by name, the default first."""
+        engines: dict[str, Callable[[T], Any]] = {}
+        default = {1: self.part1, 2: self.part2}.get(part)
+        if default is not None:
+            engines[DEFAULT_ENGINE] = default
+            engines.update(self.engines.get(part, {}))
+        return engines
+
+    def engine_of(self, part: int, engine: str | None) -> str:
+        """Name of the engine that ``parts(engine)`` solves ``part`` with."""
+        if engine is not None and engine in self.engines.get(part, {}):
+            return engine
+        return DEFAULT_ENGINE
+
+
+def discover_days(root: str = ROOT) -> list[int]:
+    """Returns every ``dayNN`` package that provides a ``solution`` module."""
+    days: list[int] = []
+    for entry in os.scandir(root):
+        match = re.match(DAY_PACKAGE_REGEX, entry.name)
+        if match is None or not entry.is_dir():
+            continue
+        if os.path.exists(os.path.join(entry.path, "solution.py")):
+            days.append(int(match.group(1)))
+    return sorted(days)
+
+
+def load_solution(day: int) -> Solution[Any]:
+    """Imports ``dayNN.solution`` and returns its ``SOLUTION``."""
+    module = importlib.import_module(f"day{day:02}.solution")
+    solution: Solution[Any] = module.SOLUTION
+    return solution
@@ -0,0 +1 @@
+"""aoc tests package."""
@@ -0,0 +1,59 @@
+"""Tests for batch mode."""
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from aoc.__main__ import main
+from aoc.batch import expand_inputs, run_batch
+
+INPUT_16 = "day16/input-small.txt"
+
+
+def test_expand_inputs() -> None:
+    """Directories give their ``*.txt`` files; duplicates are dropped."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in ("b.txt", "a.txt", "notes.md"):
+            with open(os.path.join(temp_dir, name), "w", encoding="utf8"):
+                pass
+        a_txt, b_txt = (os.path.join(temp_dir, name) for name in ("a.txt", "b.txt"))
+        assert expand_inputs([temp_dir]) == [a_txt, b_txt]
+        assert expand_inputs([b_txt, os.path.join(temp_dir, "*.txt")]) == [b_txt, a_txt]
+        assert expand_inputs(["missing.txt"]) == ["missing.txt"]
+
+
+def test_run_batch() -> None:
+    """One json line per input, including inputs that fail."""
+    file = io.StringIO()
+    stats = run_batch(16, [INPUT_16, "missing.txt", INPUT_16], [1, 2], 2, False, file)
+    assert (stats.inputs, stats.failed) == (3, 1)
+    assert stats.throughput > 0
+    lines = [json.loads(line) for line in file.getvalue().splitlines()]
+    assert sorted(line["input"] for line in lines) == [
+        INPUT_16,
+        INPUT_16,
+        "missing.txt",
+    ]
+    for line in lines:
+        if line["input"] == INPUT_16:
+            assert (line["part1"], line["part2"], line["error"]) == (46, 51, None)
+            assert set(line["seconds"]) == {"parse", "part1", "part2"}
+        else:
+            assert line["error"].startswith("FileNotFoundError")
+
+
+def test_main() -> None:
+    """``python -m aoc batch`` entrypoint."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in ("one.txt", "two.txt"):
+            shutil.copy(INPUT_16, os.path.join(temp_dir, name))
+        output = os.path.join(temp_dir, "results.jsonl")
+        args = ["batch", "16", temp_dir, "--part", "1", "--no-cache"]
+        assert main([*args, "--output", output]) == 0
+        with open(output, encoding="utf8") as file:
+            lines = [json.loads(line) for line in file]
+        assert [line["part1"] for line in lines] == [46, 46]
+        assert all("part2" not in line for line in lines)
+
+        assert main(["batch", "16", os.path.join(temp_dir, "*.nothing")]) == 2
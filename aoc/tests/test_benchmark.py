@@ -0,0 +1,147 @@
+"""Tests for the benchmark suite and its regression gate."""
+import json
+import os
+import tempfile
+from typing import Any
+
+import pytest
+
+from aoc.__main__ import main
+from aoc.benchmark import (
+    Case,
+    build_cases,
+    compare,
+    import_records,
+    load_baseline,
+    run_case,
+    save_baseline,
+)
+from aoc.lib.importtime import TOP_N
+
+
+def record(key: str = "day06/x1-seed0/part1", **kwargs: Any) -> dict[str, Any]:
+    """A benchmark record with sensible defaults."""
+    result: dict[str, Any] = {
+        "key": key,
+        "answer": 10,
+        "min": 1.0,
+        "error": None,
+        "peak_memory_kb": 1000,
+    }
+    result.update(kwargs)
+    return result
+
+
+def test_build_cases() -> None:
+    """Fixtures come first, then one synthetic input per scale."""
+    with tempfile.TemporaryDirectory() as directory:
+        cases = build_cases([1, 6], [0.5, 2], seed=3, directory=directory)
+        assert [(case.day, case.label, case.parts) for case in cases] == [
+            (1, "input-small", (1,)),
+            (1, "input-small2", (2,)),
+            (1, "x0.5-seed3", (1, 2)),
+            (1, "x2-seed3", (1, 2)),
+            (6, "input-small", (1, 2)),
+            (6, "x0.5-seed3", (1, 2)),
+            (6, "x2-seed3", (1, 2)),
+        ]
+        assert all(os.path.exists(case.input_path) for case in cases)
+
+        cases = build_cases([6], [], fixtures=False, directory=directory)
+        assert not cases
+
+
+def test_run_case() -> None:
+    """Runs each phase and records peak memory."""
+    result = run_case(Case(6, "input-small", "day06/input-small.txt"), repeat=2)
+    records = result.records()
+    assert [item["key"] for item in records] == [
+        "day06/input-small/parse",
+        "day06/input-small/part1",
+        "day06/input-small/part2",
+    ]
+    assert records[1]["answer"] == 288
+    assert records[1]["repeat"] == 2
+    assert records[1]["peak_memory_kb"] > 0
+
+
+def test_compare() -> None:
+    """Slower, hungrier, wrong or failing phases are regressions."""
+    baseline = {"day06/x1-seed0/part1": record()}
+
+    assert not compare([record()], baseline)
+    # within threshold, or too small to matter
+    assert not compare([record(min=1.2)], baseline)
+    assert not compare([record(min=0.002)], {"day06/x1-seed0/part1": record(min=0.001)})
+    # unknown phases only fail on errors
+    assert not compare([record("day07/x1-seed0/part1", min=5.0)], baseline)
+
+    metrics = [
+        regression.metric
+        for regression in compare(
+            [record(min=1.3, answer=11, peak_memory_kb=2000)], baseline
+        )
+    ]
+    assert metrics == ["answer", "time", "memory"]
+    assert not compare([record(min=1.3)], baseline, threshold=0.5)
+
+    (regression,) = compare([record(error="ValueError: boom")], baseline)
+    assert regression.metric == "error"
+    assert "boom" in str(regression)
+    # already failing in the baseline
+    failing = {"day06/x1-seed0/part1": record(error="ValueError: boom")}
+    assert not compare([record(error="ValueError: boom")], failing)
+
+
+def test_save_baseline() -> None:
+    """Saving merges into the existing baseline."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "nested", "baseline.json")
+        assert load_baseline(path) == {}
+        save_baseline(path, [record("a", min=1.0), record("b")])
+        save_baseline(path, [record("a", min=2.0)])
+        baseline = load_baseline(path)
+        assert sorted(baseline) == ["a", "b"]
+        assert baseline["a"]["min"] == 2.0
+
+
+def test_main(capsys: pytest.CaptureFixture[str]) -> None:
+    """Saving a baseline, passing against it, then failing a regression."""
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_path = os.path.join(directory, "baseline.json")
+        output = os.path.join(directory, "results.json")
+        argv = ["bench", "6", "--scale", "--repeat", "1", "--no-imports"]
+        history = os.path.join(directory, "history")
+        argv += ["--baseline", baseline_path, "--history", history]
+        assert main([*argv, "--save", "--output", output]) == 0
+        with open(output, encoding="utf8") as file:
+            assert len(json.load(file)["results"]) == 3
+        assert main(argv) == 0
+
+        # pretend the baseline was much faster
+        baseline = load_baseline(baseline_path)
+        for item in baseline.values():
+            item["min"] = 0.0
+        save_baseline(baseline_path, list(baseline.values()))
+        capsys.readouterr()
+        assert main([*argv, "--noise", "0"]) == 1
+        assert "regression(s)" in capsys.readouterr().out
+
+        # every run was kept, with the commit it ran on
+        runs = sorted(os.listdir(history))
+        assert len(runs) == 3
+        with open(os.path.join(history, runs[0]), encoding="utf8") as file:
+            run = json.load(file)
+        assert set(run) == {"commit", "timestamp", "results"}
+        assert len(run["results"]) == 3
+
+
+def test_import_records() -> None:
+    """Import time is a ``startup/import`` phase that the gate understands."""
+    (item,) = import_records([25])
+    assert item["key"] == "day25/startup/import"
+    assert item["error"] is None and item["min"] > 0
+    slowest = list(item["slowest_imports"].values())
+    assert 0 < len(slowest) <= TOP_N and slowest == sorted(slowest, reverse=True)
+    assert not compare([item], {item["key"]: {**item, "min": item["min"] * 2}})
+    assert compare([item], {item["key"]: {**item, "min": 0.0}}, noise=0)
@@ -0,0 +1,51 @@
+"""Tests for solver time budgets."""
+import os
+import pickle
+
+import pytest
+
+from aoc.lib import budget
+from aoc.lib.budget import BUDGET_ENV, DEADLINE_ENV, BudgetExceeded
+from aoc.runner import run_solution
+from aoc.solution import load_solution
+
+
+def test_no_budget() -> None:
+    """Without a budget nothing expires and ``check`` never raises."""
+    assert budget.get_budget() is None
+    with budget.deadline():
+        assert not budget.active()
+        assert not budget.expired()
+        budget.check(0.5, 10)
+    assert DEADLINE_ENV not in os.environ
+
+
+def test_deadline() -> None:
+    """Past the deadline, ``check`` raises with the progress it was given."""
+    with budget.deadline(3600):
+        assert float(os.environ[DEADLINE_ENV]) > 0
+        budget.check(0.5, 10)
+        with budget.deadline(0), pytest.raises(BudgetExceeded) as raised:
+            budget.check(0.25, 42)
+        assert budget.active() and not budget.expired()
+    assert DEADLINE_ENV not in os.environ
+    assert not budget.active()
+
+    exc = pickle.loads(pickle.dumps(raised.value))  # as if from a worker
+    assert (exc.fraction, exc.best) == (0.25, 42)
+    assert str(exc) == "time budget exceeded with 25% done"
+    assert budget.describe(None, None) == "still searching"
+
+
+def test_run_solution() -> None:
+    """A part out of time reports its partial answer as an error."""
+    budget.set_budget(0)
+    try:
+        results = run_solution(load_solution(23), "day23/input-small.txt", [2])
+    finally:
+        budget.set_budget(None)
+    assert BUDGET_ENV not in os.environ
+    part2 = results[1]
+    assert part2.answer == 0
+    assert part2.error == "time budget exceeded with 0% done"
+    assert not part2.timings
@@ -0,0 +1,251 @@
+"""Tests for the parsed input cache."""
+import math
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from typing import Any
+
+import pytest
+
+from aoc.__main__ import main
+from aoc.benchmark import fixture_cases
+from aoc.cache import AnswerCache, DiskCache, ParseCache, code_digest
+from aoc.runner import run_solution
+from aoc.solution import ROOT, Solution, discover_days, load_solution
+
+
+def test_disk_cache() -> None:
+    """Values round trip; unreadable entries are misses."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiskCache(directory, max_bytes=1000)
+        assert cache.load("a") == (False, None)
+        assert cache.store("a", {"x": [1, 2]})
+        assert cache.load("a") == (True, {"x": [1, 2]})
+
+        assert not cache.store("unpicklable", lambda: 1)
+        assert not cache.store("big", b"x" * 2000)
+
+        with open(cache.path("a"), "wb") as file:
+            file.write(pickle.dumps([1, 2])[:-3])
+        assert cache.load("a") == (False, None)
+        assert not os.path.exists(cache.path("a"))
+
+
+def test_disk_cache_eviction() -> None:
+    """Least recently used entries go first."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiskCache(directory, max_bytes=250)
+        for index, key in enumerate("ab"):
+            cache.store(key, b"x" * 100)
+            os.utime(cache.path(key), (index, index))
+        # a is older than b, but reading it makes b the least recently used
+        assert cache.load("a")[0]
+        cache.store("c", b"x" * 100)
+        assert not cache.load("b")[0]
+        assert cache.load("a")[0] and cache.load("c")[0]
+
+        cache.store("d", b"x" * 100)
+        assert len(cache.entries()) == 2
+        assert cache.size() <= 250
+        assert cache.clear() == 2 and not cache.entries()
+
+
+def copy_sources(root: str, day: int) -> None:
+    """Copies a day and the shared ``aoc/lib`` it uses into ``root``."""
+    for package in (f"day{day:02}", os.path.join("aoc", "lib")):
+        shutil.copytree(os.path.join(ROOT, package), os.path.join(root, package))
+
+
+def test_code_digest() -> None:
+    """Editing a day's or shared code changes its digest; tests/generators don't."""
+    with tempfile.TemporaryDirectory() as root:
+        copy_sources(root, 6)
+        before = code_digest(6, root)
+        with open(os.path.join(root, "day06", "tests", "test_day6.py"), "a") as file:
+            file.write("# comment\n")
+        code_digest.cache_clear()
+        assert code_digest(6, root) == before
+
+        with open(os.path.join(root, "day06", "day6.py"), "a") as file:
+            file.write("# comment\n")
+        code_digest.cache_clear()
+        edited = code_digest(6, root)
+        assert edited != before
+
+        with open(os.path.join(root, "aoc", "lib", "search.py"), "a") as file:
+            file.write("# comment\n")
+        code_digest.cache_clear()
+        assert code_digest(6, root) != edited
+    code_digest.cache_clear()
+
+
+def test_shared_code_invalidates(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Editing ``aoc/lib`` misses both the parse and the answer cache."""
+    solution = load_solution(17)
+    path = "day17/input-small.txt"
+    with tempfile.TemporaryDirectory() as root:
+        copy_sources(root, 17)
+        monkeypatch.setattr("aoc.cache.ROOT", root)
+        code_digest.cache_clear()
+        parsed, answers = ParseCache(root), AnswerCache(root)
+        data = solution.parse(path)
+        assert parsed.store(solution, path, data, math.inf)
+        assert answers.store(17, "part1", "abc", 102, [0.1])
+        assert parsed.parse(solution, path)[1]
+        assert answers.load(17, "part1", "abc") is not None
+
+        with open(os.path.join(root, "aoc", "lib", "search.py"), "a") as file:
+            file.write("# comment\n")
+        code_digest.cache_clear()
+        assert not parsed.parse(solution, path)[1]
+        assert answers.load(17, "part1", "abc") is None
+    code_digest.cache_clear()
+
+
+def test_parse_cache() -> None:
+    """Misses parse; stored inputs come back on the next parse."""
+    solution = load_solution(6)
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(directory)
+        path = "day06/input-small.txt"
+        data, hit = cache.parse(solution, path)
+        assert not hit
+        assert cache.store(solution, path, data, math.inf)
+        assert cache.parse(solution, path) == (data, True)
+
+        # a copy of the input is a hit too: keys are content based
+        copy = os.path.join(directory, "copy.txt")
+        shutil.copy(path, copy)
+        assert cache.parse(solution, copy)[1]
+
+        # inputs that load slower than they parse are marked, not stored
+        other = os.path.join(directory, "other.txt")
+        with open(other, "w", encoding="utf8") as file:
+            file.write("Time: 1 2\nDistance: 0 1\n")
+        data, hit = cache.parse(solution, other)
+        assert not hit
+        assert not cache.store(solution, other, data, 0.0)
+        assert cache.parse(solution, other) == (data, False)
+        assert not cache.store(solution, other, data, math.inf)
+
+
+@pytest.mark.parametrize("day", discover_days())
+def test_cached_answers(day: int) -> None:
+    """Every day's parsed input survives the cache with the same answers."""
+    solution = load_solution(day)
+    case = fixture_cases(day)[0]
+    expected = run_solution(solution, case.input_path, case.parts)
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(directory)
+        data = solution.parse(case.input_path)
+        cache.store(solution, case.input_path, data, math.inf)
+        results = run_solution(solution, case.input_path, case.parts, cache=cache)
+    assert results[0].cached
+    assert [result.answer for result in results] == [
+        result.answer for result in expected
+    ]
+
+
+def test_run_solution_cache() -> None:
+    """The first run stores the parse, the next one loads it."""
+    solution = load_solution(7)
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(directory)
+        path = "day07/input-small.txt"
+        first = run_solution(solution, path, repeat=2, cache=cache)
+        second = run_solution(solution, path, repeat=2, cache=cache)
+    assert not first[0].cached and second[0].cached
+    assert [result.answer for result in first] == [result.answer for result in second]
+
+
+def test_main(capsys: pytest.CaptureFixture[str]) -> None:
+    """``python -m aoc cache`` reports sizes and clears."""
+    with tempfile.TemporaryDirectory() as directory:
+        ParseCache(directory).cache.store("a", time.time())
+        assert main(["cache", "info", "--directory", directory]) == 0
+        AnswerCache(directory).store(6, "part1", "abc", 288, [0.1])
+        assert main(["cache", "info", "--directory", directory]) == 0
+        output = capsys.readouterr().out
+        assert "parsed: 1 entries" in output and "answers: 1/1000 entries" in output
+        assert main(["cache", "clear", "--directory", directory]) == 0
+        assert "removed 1 entries" in capsys.readouterr().out
+
+
+def test_disk_cache_max_entries() -> None:
+    """Only the most recently used ``max_entries`` are kept."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiskCache(directory, max_entries=2)
+        for index, key in enumerate("abc"):
+            cache.store(key, index)
+            os.utime(cache.path(key), (index, index))
+        assert [entry.name for entry in cache.entries()] == ["b.pickle", "c.pickle"]
+
+
+def test_disk_cache_usage(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Writes under the limits don't scan the directory, overwrites count once."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiskCache(directory, max_entries=3)
+        cache.store("a", 1)
+        size = os.path.getsize(cache.path("a"))
+        assert cache.usage == (size, 1)
+
+        scans: list[int] = []
+        entries = cache.entries
+
+        def counted_entries() -> list[os.DirEntry[str]]:
+            scans.append(1)
+            return entries()
+
+        monkeypatch.setattr(cache, "entries", counted_entries)
+        for key in "abac":
+            cache.store(key, 1)
+        assert not scans and cache.usage == (3 * size, 3)
+        cache.store("d", 1)
+        assert len(scans) == 1 and cache.usage == (3 * size, 3)
+        assert len(entries()) == 3
+
+
+def test_answer_cache() -> None:
+    """Answers are keyed by day, phase and input."""
+    with tempfile.TemporaryDirectory() as directory:
+        answers = AnswerCache(directory)
+        assert answers.load(6, "part1", "abc") is None
+        assert answers.store(6, "part1", "abc", 288, [0.1, 0.2])
+        assert answers.load(6, "part1", "abc") == (288, [0.1, 0.2])
+        assert answers.load(6, "part2", "abc") is None
+        assert answers.load(6, "part1", "abd") is None
+        assert answers.load(7, "part1", "abc") is None
+
+
+def test_run_solution_answers() -> None:
+    """A fully cached day doesn't run; failures and new repeats do."""
+    calls: list[int] = []
+
+    def part1(data: Any) -> int:
+        calls.append(1)
+        return 42
+
+    solution = Solution(6, "day06/input-small.txt", lambda path: path, part1)
+    with tempfile.TemporaryDirectory() as directory:
+        answers = AnswerCache(directory)
+        first = run_solution(solution, repeat=2, answers=answers)
+        second = run_solution(solution, answers=answers)
+        assert calls == [1, 1]
+        assert [result.answer for result in second] == [None, 42]
+        assert all(result.cached for result in second)
+        assert [len(result.timings) for result in second] == [1, 1]
+        assert second[1].timings == first[1].timings[:1]
+
+        run_solution(solution, repeat=3, answers=answers)
+        assert len(calls) == 5
+
+        # failed phases aren't cached, so they run again
+        other = os.path.join(directory, "other.txt")
+        with open(other, "w", encoding="utf8") as file:
+            file.write("other")
+        failing = Solution(6, other, lambda path: path, lambda data: 1 // 0)
+        assert run_solution(failing, answers=answers)[1].error is not None
+        results = run_solution(failing, answers=answers)
+        assert results[1].error is not None and not results[1].cached
@@ -0,0 +1,94 @@
+"""Tests for the solver work counters."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from aoc.lib import counters
+from aoc.lib.counters import COUNTERS_ENV, count_worker
+from aoc.lib.search import bfs
+from aoc.lib.workers import WORKERS_ENV
+from aoc.runner import run_solution
+from aoc.solution import load_solution
+
+
+@count_worker
+def count_task(value: int) -> int:
+    """Counts in a pool worker."""
+    counters.add("tasks")
+    counters.maximum("biggest", value)
+    return value
+
+
+def test_disabled() -> None:
+    """Counting is off by default, and counts nothing."""
+    assert not counters.enabled()
+    with counters.collected() as counts:
+        counters.add("nodes", 5)
+        counters.maximum("queue", 3)
+        assert count_task(2) == 2
+    assert counts == {}
+
+
+def test_collected() -> None:
+    """Counts of a block add up across searches and worker processes."""
+    counters.enable()
+    directory = os.environ[COUNTERS_ENV]
+    try:
+        with counters.collected() as counts:
+            bfs([0], lambda state: [state + 1, state + 2], max_depth=3)
+            count_task(1)  # in the collecting process it just counts
+            with ProcessPoolExecutor(2) as pool:
+                assert list(pool.map(count_task, range(6))) == list(range(6))
+        assert counts == {
+            "biggest": 5,
+            "expanded": 5,
+            "pushed": 7,
+            "queue_peak": 2,
+            "tasks": 7,
+        }
+        assert not os.listdir(directory)
+        with counters.collected() as counts:
+            counters.add("nodes")
+        assert counts == {"nodes": 1}
+    finally:
+        counters.disable()
+        os.rmdir(directory)
+
+
+def test_sum_or_maximum() -> None:
+    """A counter can't be both summed and a maximum, as one would hide the other."""
+    counters.enable()
+    directory = os.environ[COUNTERS_ENV]
+    try:
+        with counters.collected() as counts:
+            counters.add("nodes", 2)
+            counters.maximum("queue", 3)
+            with pytest.raises(ValueError, match="'nodes' is already a sum"):
+                counters.maximum("nodes", 5)
+            with pytest.raises(ValueError, match="'queue' is already a maximum"):
+                counters.add("queue")
+            with pytest.raises(ValueError, match="'queue' is already a maximum"):
+                counters.merge({"queue": 1}, {})
+        assert counts == {"nodes": 2, "queue": 3}
+    finally:
+        counters.disable()
+        os.rmdir(directory)
+
+
+def test_run_solution() -> None:
+    """The runner keeps each phase's counts, including day16's workers'."""
+    counters.enable()
+    os.environ[WORKERS_ENV] = "2"
+    try:
+        results = run_solution(load_solution(16), "day16/input-small.txt")
+    finally:
+        os.rmdir(os.environ[COUNTERS_ENV])
+        counters.disable()
+        del os.environ[WORKERS_ENV]
+    parse, part1, part2 = results
+    assert (part1.answer, part2.answer) == (46, 51)
+    assert parse.counters == {}
+    assert part1.counters == {"lasers_traced": 51, "memo_hits": 3}
+    assert part2.counters["lasers_traced"] > part1.counters["lasers_traced"]
+    assert part2.to_dict()["counters"] == part2.counters
@@ -0,0 +1,41 @@
+"""Tests for cycle detection."""
+from aoc.lib.cycles import CycleDetector, brent, find_cycle, fingerprint, floyd
+
+
+def step(state: int) -> int:
+    """A sequence that enters a cycle after a few steps."""
+    return (state * state + 1) % 255
+
+
+def test_cycles() -> None:
+    """Every algorithm finds the same cycle, and can skip ahead."""
+    states = [3]
+    while states[-1] not in states[:-1]:
+        states.append(step(states[-1]))
+    mu = states.index(states[-1])
+    lam = len(states) - 1 - mu
+
+    for cycle in (
+        floyd(3, step),
+        brent(3, step),
+        find_cycle(3, step),
+        find_cycle(3, step, lambda state: fingerprint(bytes([state]))),
+    ):
+        assert (cycle.mu, cycle.lam) == (mu, lam)
+        assert cycle.entry == states[mu]
+        for steps in range(len(states) * 2):
+            expected = 3
+            for _ in range(steps):
+                expected = step(expected)
+            assert cycle.state_after(steps) == expected
+        assert cycle.state_after(10**18) == states[cycle.reduce(10**18)]
+
+
+def test_cycle_detector() -> None:
+    """The detector reports the first repeated key."""
+    detector = CycleDetector()
+    assert not any(detector.add(key) for key in "abcd")
+    assert not detector.found
+    assert detector.add("b")
+    assert (detector.mu, detector.lam) == (1, 3)
+    assert detector.add("z")
@@ -0,0 +1,96 @@
+"""Tests for the solver daemon."""
+import os
+import tempfile
+import threading
+from typing import Any
+
+import pytest
+
+from aoc.__main__ import main
+from aoc.daemon import Daemon, connect, make_server, parse_request, request
+
+INPUT_16 = "day16/input-small.txt"
+
+
+def test_parse_request() -> None:
+    """Parts default to both, and a single part can be given as an int."""
+    assert parse_request({"day": 16}) == (16, [1, 2], None, None)
+    assert parse_request({"day": 16}, 2.5) == (16, [1, 2], None, 2.5)
+    message = {"day": 16, "part": 2, "input_path": "x", "budget": None}
+    assert parse_request(message, 2.5) == (16, [2], "x", None)
+    assert parse_request({"day": 16, "budget": 1}) == (16, [1, 2], None, 1)
+    messages: list[dict[str, Any]] = [{}, {"day": "16"}, {"day": 16, "part": 3}]
+    messages += [{"day": 16, "budget": budget} for budget in ("1", [1], -1, 0, True)]
+    for message in messages:
+        with pytest.raises(ValueError):
+            parse_request(message)
+
+
+def test_daemon() -> None:
+    """Requests over a socket, a full daemon, bad requests and shutting down."""
+    daemon = Daemon(1, max_pending=0, use_cache=False)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        address = os.path.join(temp_dir, "daemon.sock")
+        try:
+            with make_server(daemon, address) as server:
+                thread = threading.Thread(target=server.serve_forever)
+                thread.start()
+
+                message = {"day": 16, "part": 1, "input_path": INPUT_16}
+                response = request(message, address)
+                assert (response["part1"], response["error"]) == (46, None)
+                assert "part2" not in response
+                assert 0 <= response["queued"] <= response["elapsed"]
+
+                with daemon.slots:  # the only slot is taken
+                    assert request(message, address)["error"].startswith("busy")
+                assert request({"day": 16, "part": 3}, address)["error"]
+                assert request({"command": "status"}, address) == {
+                    "workers": 1,
+                    "running": 0,
+                    "waiting": 0,
+                }
+                with connect(address) as client, client.makefile("rwb") as stream:
+                    stream.write(b"not json\n")
+                    stream.flush()
+                    assert b"JSONDecodeError" in stream.readline()
+
+                assert request({"command": "shutdown"}, address) == {"shutdown": True}
+                thread.join(10)
+                assert not thread.is_alive()
+        finally:
+            daemon.close()
+
+
+def test_send(monkeypatch: pytest.MonkeyPatch) -> None:
+    """``daemon request`` sends the input as an absolute path."""
+    sent: list[dict[str, Any]] = []
+
+    def fake_request(message: dict[str, Any], *_: Any) -> dict[str, Any]:
+        sent.append(message)
+        return {"error": None}
+
+    monkeypatch.setattr("aoc.daemon.request", fake_request)
+    expected = os.path.abspath(INPUT_16)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        monkeypatch.chdir(temp_dir)
+        assert main(["daemon", "request", "16", "--input", expected]) == 0
+        assert main(["daemon", "request", "16", "--input", "input-small.txt"]) == 0
+        assert main(["daemon", "request", "16"]) == 0
+        assert [message["input_path"] for message in sent] == [
+            expected,
+            os.path.join(os.path.realpath(temp_dir), "input-small.txt"),
+            None,
+        ]
+
+
+def test_status() -> None:
+    """Requests beyond the pool's size are reported as waiting."""
+    daemon = Daemon(2, use_cache=False)
+    try:
+        daemon.active = 3
+        assert daemon.status() == {"workers": 2, "running": 2, "waiting": 1}
+        daemon.active = 1
+        assert daemon.status() == {"workers": 2, "running": 1, "waiting": 0}
+    finally:
+        daemon.close()
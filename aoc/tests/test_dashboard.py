@@ -0,0 +1,106 @@
+"""Tests for the benchmark dashboard."""
+import json
+import os
+import tempfile
+from typing import Any
+
+from aoc.__main__ import main
+from aoc.dashboard import Chart, load_runs, scaling, summarise
+
+
+def record(key: str, seconds: float, memory: int = 1024) -> dict[str, Any]:
+    """A benchmark record of ``key``."""
+    day = int(key[3:5])
+    return {
+        "key": key,
+        "day": day,
+        "phase": key.rsplit("/", 1)[1],
+        "min": seconds,
+        "answer": 42,
+        "error": None,
+        "peak_memory_kb": memory,
+    }
+
+
+def write_run(
+    directory: str, name: str, timestamp: float, records: list[dict[str, Any]]
+) -> None:
+    """Writes a run the way ``bench`` keeps them."""
+    with open(os.path.join(directory, f"{name}.json"), "w", encoding="utf8") as file:
+        json.dump({"commit": name, "timestamp": timestamp, "results": records}, file)
+
+
+def runs_records(slowdown: float) -> list[dict[str, Any]]:
+    """Records of a run, with day 17 part 2 ``slowdown`` times slower."""
+    return [
+        record("day17/input-small/part2", 0.01 * slowdown),
+        record("day17/x0.5-seed0/part2", 0.1 * slowdown),
+        record("day17/x1-seed0/part2", 0.4 * slowdown),
+        record("day06/x1-seed0/part1", 0.001),
+    ]
+
+
+def test_summarise() -> None:
+    """Slowest phases, regressions and curves come from the runs in time order."""
+    with tempfile.TemporaryDirectory() as directory:
+        write_run(directory, "bbbbbbb", 2000.0, runs_records(2))
+        write_run(directory, "aaaaaaa", 1000.0, runs_records(1))
+        runs = load_runs([directory])
+        assert [run.name for run in runs] == ["aaaaaaa", "bbbbbbb"]
+
+        summary = summarise(runs, top=2)
+        assert [row["key"] for row in summary["slowest"]] == [
+            "day17/x1-seed0/part2",
+            "day17/x0.5-seed0/part2",
+        ]
+        assert {row["key"] for row in summary["regressions"]} == {
+            "day17/input-small/part2",
+            "day17/x0.5-seed0/part2",
+            "day17/x1-seed0/part2",
+        }
+        assert {row["metric"] for row in summary["regressions"]} == {"time"}
+        assert summary["time"]["day17/part2"]["x1-seed0"] == [(0, 0.4), (1, 0.8)]
+        assert list(summary["memory"]) == ["day06", "day17"]
+        # day 6 only has one scale, so no curve
+        assert summary["scaling"] == {
+            "day17/part2": {"seed0": [(0.5, 0.2), (1.0, 0.8)]}
+        }
+
+
+def test_scaling_skips_failures() -> None:
+    """Failed phases and fixture inputs aren't on the scaling curves."""
+    failed = {**record("day17/x2-seed0/part2", 1.0), "error": "ValueError: oops"}
+    records = [*runs_records(1), failed]
+    assert scaling(records)["day17/part2"] == {"seed0": [(0.5, 0.1), (1.0, 0.4)]}
+
+
+def test_chart() -> None:
+    """Charts are inline SVG with a tooltip per point."""
+    svg = Chart({"x1": [(0, 1.0), (1, 2.0)]}, "ms", x_names=["a", "b"]).render()
+    assert svg.startswith("<svg") and svg.endswith("</svg>")
+    assert svg.count("<circle") == 2
+    assert "x1 at b: 2 ms" in svg
+    # log scale leaves out points it can't draw
+    svg = Chart({"seed0": [(0.0, 1.0), (1.0, 2.0)]}, "ms", log=True).render()
+    assert svg.count("<circle") == 1
+    assert Chart({}, "ms").render() == "<p>no data</p>"
+
+
+def test_main() -> None:
+    """``python -m aoc dashboard`` writes a self-contained page and json."""
+    with tempfile.TemporaryDirectory() as directory:
+        write_run(directory, "aaaaaaa", 1000.0, runs_records(1))
+        write_run(directory, "bbbbbbb", 2000.0, runs_records(2))
+        output = os.path.join(directory, "out", "dashboard.html")
+        data = os.path.join(directory, "dashboard.json")
+        argv = ["dashboard", directory, "--output", output, "--json", data]
+        assert main(argv) == 0
+        with open(output, encoding="utf8") as file:
+            page = file.read()
+        assert page.startswith("<!DOCTYPE html>")
+        assert "<svg" in page and 'class="regression"' in page
+        assert "http" not in page and "<script" not in page
+        with open(data, encoding="utf8") as file:
+            assert len(json.load(file)["runs"]) == 2
+
+        assert main(["dashboard", os.path.join(directory, "missing")]) == 2
@@ -0,0 +1,61 @@
+"""Tests for the shared direction tables."""
+from aoc.lib.directions import (
+    CLOCKWISE,
+    COUNTER_CLOCKWISE,
+    DIRECTIONS,
+    MIRRORS,
+    OPPOSITE,
+    Direction,
+)
+
+
+def test_direction() -> None:
+    """Test ``Direction`` class."""
+    assert Direction.WEST.opposite() == Direction.EAST
+    assert Direction.EAST.opposite() == Direction.WEST
+    assert Direction.SOUTH.opposite() == Direction.NORTH
+    assert Direction.NORTH.opposite() == Direction.SOUTH
+
+    assert Direction.EAST.offset(0, 0) == (0, 1)
+    assert Direction.WEST.offset(0, 0) == (0, -1)
+    assert Direction.NORTH.offset(0, 0) == (-1, 0)
+    assert Direction.SOUTH.offset(0, 0) == (1, 0)
+    assert Direction.SOUTH.offset(5, 5, steps=4) == (9, 5)
+
+    assert str(Direction.WEST) == "WEST"
+    assert [direction.arrow for direction in Direction] == ["^", ">", "v", "<"]
+    assert Direction(2) is Direction.SOUTH
+
+
+def test_turns() -> None:
+    """Clockwise and counter-clockwise turns."""
+    assert Direction.NORTH.clockwise() == Direction.EAST
+    assert Direction.EAST.clockwise() == Direction.SOUTH
+    assert Direction.SOUTH.clockwise() == Direction.WEST
+    assert Direction.WEST.clockwise() == Direction.NORTH
+
+    assert Direction.NORTH.counter_clockwise() == Direction.WEST
+    assert Direction.EAST.counter_clockwise() == Direction.NORTH
+    assert Direction.SOUTH.counter_clockwise() == Direction.EAST
+    assert Direction.WEST.counter_clockwise() == Direction.SOUTH
+
+    for direction in DIRECTIONS:
+        assert COUNTER_CLOCKWISE[CLOCKWISE[direction]] == direction
+        assert CLOCKWISE[CLOCKWISE[direction]] == OPPOSITE[direction]
+
+
+def test_mirrors() -> None:
+    r"""Beams bounce off ``/`` and ``\`` mirrors."""
+    assert Direction.EAST.reflect("/") == Direction.NORTH
+    assert Direction.NORTH.reflect("/") == Direction.EAST
+    assert Direction.SOUTH.reflect("/") == Direction.WEST
+    assert Direction.WEST.reflect("/") == Direction.SOUTH
+
+    assert Direction.EAST.reflect("\\") == Direction.SOUTH
+    assert Direction.SOUTH.reflect("\\") == Direction.EAST
+    assert Direction.NORTH.reflect("\\") == Direction.WEST
+    assert Direction.WEST.reflect("\\") == Direction.NORTH
+
+    for reflections in MIRRORS.values():
+        for direction in DIRECTIONS:
+            assert reflections[reflections[direction]] == direction
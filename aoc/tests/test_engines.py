@@ -0,0 +1,84 @@
+"""Tests for engine selection and differential checks."""
+import os
+import tempfile
+
+import pytest
+
+from aoc.__main__ import main
+from aoc.engines import Comparison, compare_engines, engine_days, engine_inputs
+from aoc.runner import PhaseResult, run_solution, unknown_engine
+from aoc.scheduler import build_jobs
+from aoc.solution import ROOT, load_solution
+
+INPUT_18 = "day18/input-small.txt"
+
+
+def test_part_engines() -> None:
+    """The default engine comes first; unknown engines fall back to it."""
+    solution = load_solution(18)
+    assert list(solution.part_engines(1)) == ["default", "shoelace"]
+    assert list(solution.part_engines(2)) == ["default"]
+    assert solution.engine_of(1, "shoelace") == "shoelace"
+    assert solution.engine_of(2, "shoelace") == "default"
+    assert solution.parts("shoelace")[2] is solution.parts()[2]
+    assert engine_days([1, 6, 18]) == [6, 18]
+
+
+def test_run_engine() -> None:
+    """Runner results say which engine solved each part."""
+    solution = load_solution(18)
+    _, part1, part2 = run_solution(solution, INPUT_18, engine="shoelace")
+    assert (part1.engine, part1.answer) == ("shoelace", 62)
+    assert part2.engine == "default"
+    assert part1.cache_phase == "part1-shoelace"
+    assert part2.cache_phase == "part2"
+    assert unknown_engine([6, 18], "shoelace") is False
+    assert unknown_engine([6], "shoelace") is True
+    assert main(["run", "18", "--engine", "nope"]) == 2
+
+
+def test_build_jobs_engine() -> None:
+    """Only parts with the engine get it, and it keeps their own history."""
+    jobs = build_jobs([18], INPUT_18, [1, 2], 1, 1, engine="shoelace")
+    assert [job.engine for job in jobs] == ["shoelace", None]
+    assert jobs[0].key != build_jobs([18], INPUT_18, [1], 1, 1)[0].key
+
+
+def test_compare_engines(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every engine agrees on small and generated inputs."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        monkeypatch.chdir(temp_dir)  # the small input is found from anywhere
+        paths = engine_inputs(18, [0.1], [0], temp_dir)
+        monkeypatch.undo()
+        assert paths[0] == os.path.join(ROOT, INPUT_18)
+        assert len(paths) == 2
+        for path in paths:
+            (comparison,) = compare_engines(18, path)
+            assert comparison.part == 1
+            assert set(comparison.answers) == {"default", "shoelace"}
+            assert comparison.agrees
+    for comparison in compare_engines(6, "day06/input-small.txt"):
+        assert comparison.agrees
+        assert len(comparison.results) == 2
+
+
+def test_mismatch() -> None:
+    """Different answers, or a failed engine, don't agree."""
+    comparison = Comparison(1, 1, "input.txt")
+    for engine, answer in (("default", 1), ("fast", 2)):
+        result = PhaseResult(1, "part1", "input.txt", answer=answer, engine=engine)
+        comparison.results.append(result)
+    assert not comparison.agrees
+    comparison.results[1].answer = 1
+    assert comparison.agrees
+    comparison.results[1].error = "ValueError: oops"
+    assert not comparison.agrees
+
+
+def test_main() -> None:
+    """``python -m aoc engines`` entrypoint."""
+    with tempfile.TemporaryDirectory() as directory:
+        argv = ["engines", "18", "--scale", "0.1", "--seed", "0"]
+        assert main([*argv, "--input-dir", directory]) == 0
+        assert os.listdir(directory) == ["day18-x0.1-seed0.txt"]
+    assert main(["engines", "1"]) == 2
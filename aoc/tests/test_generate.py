@@ -0,0 +1,72 @@
+"""Tests for the synthetic input generators."""
+import os
+import tempfile
+
+import pytest
+
+from aoc.__main__ import main
+from aoc.generate import generate_input, generated_path, write_input
+from aoc.runner import run_solution
+from aoc.solution import load_solution
+
+ALL_DAYS = list(range(1, 26))
+# small enough to solve quickly; day21's grid can't shrink below 131
+SMALL_SCALES = {17: 0.01}
+SLOW_PARTS = {21: [1]}
+
+
+@pytest.mark.parametrize("day", ALL_DAYS)
+def test_deterministic(day: int) -> None:
+    """Same seed, same text; another seed, another text."""
+    first = generate_input(day, 0.05, seed=1)
+    assert first == generate_input(day, 0.05, seed=1)
+    assert first != generate_input(day, 0.05, seed=2)
+
+
+@pytest.mark.parametrize("day", ALL_DAYS)
+def test_generated_inputs_solve(day: int) -> None:
+    """Every day's solver accepts its generated input."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(day, SMALL_SCALES.get(day, 0.05), 0, directory)
+        parts = SLOW_PARTS.get(day, [1, 2])
+        results = run_solution(load_solution(day), path, parts)
+    assert len(results) > 1
+    assert all(result.error is None for result in results)
+
+
+def test_scale() -> None:
+    """Scale multiplies the size of the input."""
+    assert len(generate_input(7, 1).splitlines()) == 1000
+    assert len(generate_input(7, 2.5).splitlines()) == 2500
+    assert len(generate_input(14, 4).splitlines()) == 200
+
+
+def test_write_input() -> None:
+    """Existing inputs are reused unless forced."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(6, 2, 3, directory)
+        assert path == generated_path(6, 2, 3, directory)
+        assert os.path.basename(path) == "day06-x2-seed3.txt"
+        with open(path, "w", encoding="utf8") as file:
+            file.write("stale")
+        assert write_input(6, 2, 3, directory) == path
+        with open(path, encoding="utf8") as file:
+            assert file.read() == "stale"
+        write_input(6, 2, 3, directory, force=True)
+        with open(path, encoding="utf8") as file:
+            assert file.read() == generate_input(6, 2, 3)
+
+
+def test_main(capsys: pytest.CaptureFixture[str]) -> None:
+    """``generate`` writes one file per day and scale."""
+    with tempfile.TemporaryDirectory() as directory:
+        argv = ["generate", "6", "9", "--scale", "1", "10", "--output-dir", directory]
+        assert main(argv) == 0
+        paths = capsys.readouterr().out.split()
+        assert [os.path.basename(path) for path in paths] == [
+            "day06-x1-seed0.txt",
+            "day06-x10-seed0.txt",
+            "day09-x1-seed0.txt",
+            "day09-x10-seed0.txt",
+        ]
+        assert all(os.path.exists(path) for path in paths)
@@ -0,0 +1,107 @@
+"""Tests for the memory-mapped grid loader and ``Grid``."""
+import pathlib
+
+import numpy as np
+import pytest
+
+from aoc.lib.grid import (
+    BORDER,
+    Grid,
+    encode,
+    find,
+    load_grid,
+    load_grids,
+    to_chars,
+    to_digits,
+    to_strings,
+)
+
+
+def write(tmp_path: pathlib.Path, data: bytes) -> str:
+    """Writes ``data`` to a file and returns its path."""
+    path = tmp_path / "grid.txt"
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "data", [b"ab\ncd\n", b"ab\ncd", b"ab\ncd\n\n", b"ab\r\ncd\r\n", b"ab\r\ncd"]
+)
+def test_load_grid(tmp_path: pathlib.Path, data: bytes) -> None:
+    """Line endings are skipped, whatever they are."""
+    grid = load_grid(write(tmp_path, data))
+    assert grid.shape == (2, 2)
+    assert to_strings(grid) == ["ab", "cd"]
+
+
+def test_load_grid_zero_copy(tmp_path: pathlib.Path) -> None:
+    """The grid is a read only view of the mapped file."""
+    grid = load_grid(write(tmp_path, b"abc\ndef\n"))
+    assert grid.dtype == np.uint8
+    assert grid.strides == (4, 1)
+    assert not grid.flags.owndata
+    assert not grid.flags.writeable
+
+
+@pytest.mark.parametrize("data", [b"", b"\n", b"ab\nc\n", b"abc\nd\nef\n"])
+def test_load_grid_invalid(tmp_path: pathlib.Path, data: bytes) -> None:
+    """Empty and ragged grids are rejected."""
+    with pytest.raises(ValueError):
+        load_grid(write(tmp_path, data))
+
+
+def test_load_grids(tmp_path: pathlib.Path) -> None:
+    """Blank lines separate grids of different sizes."""
+    path = write(tmp_path, b"ab\ncd\n\nxyz\n\n\nq\n")
+    grids = [to_strings(grid) for grid in load_grids(path)]
+    assert grids == [["ab", "cd"], ["xyz"], ["q"]]
+    path = write(tmp_path, b"ab\r\ncd\r\n\r\nxyz\r\n")
+    assert [to_strings(grid) for grid in load_grids(path)] == [["ab", "cd"], ["xyz"]]
+
+
+def test_conversions(tmp_path: pathlib.Path) -> None:
+    """Cells convert to chars, digits and per-day codes."""
+    grid = load_grid(write(tmp_path, b"12\n3S\n"))
+    assert to_chars(grid) == [["1", "2"], ["3", "S"]]
+    assert find(grid, "S") == [(1, 1)]
+    assert find(grid, "#") == []
+    assert encode(grid, {"S": 7, "1": 1}, default=9).tolist() == [[1, 9], [9, 7]]
+    grid = load_grid(write(tmp_path, b"19\n05\n"))
+    assert to_digits(grid) == [[1, 9], [0, 5]]
+
+
+def test_grid() -> None:
+    """Cells are addressed by index, with a border all around."""
+    grid = Grid.from_rows(["ab", "cd", "ef"])
+    assert (grid.num_rows, grid.num_cols) == (3, 2)
+    index = grid.index(1, 1)
+    assert grid.char(index) == "d"
+    assert grid.row_col(index) == (1, 1)
+    north, east, south, west = grid.neighbours(index)
+    assert (grid.char(north), grid.char(west), grid.char(south)) == ("b", "c", "f")
+    assert grid[east] == BORDER
+    assert grid[grid.index(-1, -1)] == grid[grid.index(3, 2)] == BORDER
+    assert [grid.char(index) for index in grid.indices()] == list("abcdef")
+    assert not grid.in_bounds(3, 0) and grid.in_bounds(2, 1)
+    assert str(grid) == "ab\ncd\nef"
+
+
+def test_grid_bulk() -> None:
+    """Bulk operations are vectorized over the cells inside the border."""
+    grid = Grid(2, 3, fill=ord("."), border=ord("#"))
+    assert grid.count(ord(".")) == 6 and grid.count(ord("#")) == 0
+    grid[grid.index(1, 2)] = ord("S")
+    assert grid.find(ord("S")) == [grid.index(1, 2)]
+    copy = grid.copy()
+    copy.replace(ord("."), ord("o"))
+    assert str(copy) == "ooo\nooS"
+    assert str(grid) == "...\n..S"
+    assert grid.array().shape == (4, 5)
+    assert Grid.from_rows([[1, 2], [3, 4]]).interior().tolist() == [[1, 2], [3, 4]]
+
+
+def test_grid_load(tmp_path: pathlib.Path) -> None:
+    """Grids load from files through the memory-mapped view."""
+    grid = Grid.load(write(tmp_path, b"#.\n.#\n"), border=ord("#"))
+    assert grid.rows() == ["#.", ".#"]
+    assert grid.count(ord("#")) == 2
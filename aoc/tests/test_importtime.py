@@ -0,0 +1,60 @@
+"""Tests for import time measurement."""
+import subprocess
+import sys
+
+import pytest
+
+from aoc.lib.importtime import measure_import, parse_importtime
+from aoc.solution import ROOT, discover_days
+
+# only needed for visualisation, parsing grids or by a single part, so imported lazily
+HEAVY = [
+    "colorama",
+    "graphviz",
+    "matplotlib",
+    "networkx",
+    "numpy",
+    "tqdm",
+    "vpython",
+    "z3",
+]
+
+OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:      2000 |       2100 | site
+import time:       300 |        300 |     networkx.utils
+import time:       400 |        700 |   networkx
+import time:        50 |         50 |   day25.lib
+import time:        60 |        810 | day25.solution
+"""
+
+
+def test_parse_importtime() -> None:
+    """Startup imports are left out; the rest is grouped by package."""
+    result = parse_importtime(OUTPUT, "day25.solution", top=2)
+    assert result.seconds == pytest.approx(0.00081)
+    assert result.slowest == pytest.approx({"networkx": 0.0007, "day25": 0.00011})
+    with pytest.raises(ValueError):
+        parse_importtime(OUTPUT, "day24.solution")
+
+
+def test_measure_import() -> None:
+    """Imports run in a fresh interpreter."""
+    result = measure_import("day01.solution", repeat=2)
+    assert 0 < result.seconds < 5
+    with pytest.raises(ImportError):
+        measure_import("day99.solution")
+
+
+def test_days_import_lazily() -> None:
+    """Importing any day doesn't import the heavy third party packages."""
+    imports = "".join(f"import day{day:02}.solution;" for day in discover_days())
+    check = f"import sys;{imports}print(sorted(set({HEAVY}) & set(sys.modules)))"
+    process = subprocess.run(
+        [sys.executable, "-c", check],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert process.stdout.strip() == "[]"
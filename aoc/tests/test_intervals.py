@@ -0,0 +1,57 @@
+"""Tests for the interval and box algebra."""
+from aoc.lib.intervals import (
+    box_size,
+    coalesce,
+    coalesce_many,
+    intersect,
+    intersect_box,
+    intersect_many,
+    size,
+    split,
+    split_box,
+    split_many,
+    subtract,
+    to_array,
+)
+
+
+def test_intervals() -> None:
+    """Scalar interval operations."""
+    assert size((3, 7)) == 4
+    assert size((7, 3)) == 0
+    assert intersect((0, 10), (5, 15)) == (5, 10)
+    assert intersect((0, 5), (5, 10)) is None
+    assert split((0, 10), 4) == ((0, 4), (4, 10))
+    assert split((0, 10), 0) == (None, (0, 10))
+    assert split((0, 10), 10) == ((0, 10), None)
+    assert subtract((0, 10), (3, 5)) == [(0, 3), (5, 10)]
+    assert subtract((0, 10), (-5, 5)) == [(5, 10)]
+    assert subtract((0, 10), (-5, 15)) == []
+    assert coalesce([(5, 8), (0, 3), (3, 4), (6, 10), (12, 12)]) == [(0, 4), (5, 10)]
+
+
+def test_boxes() -> None:
+    """Boxes split and intersect one axis at a time."""
+    box = ((0, 10), (0, 4))
+    assert box_size(box) == 40
+    assert split_box(box, 1, 1) == (((0, 10), (0, 1)), ((0, 10), (1, 4)))
+    assert split_box(box, 0, 20) == (box, None)
+    assert intersect_box(box, ((5, 15), (2, 3))) == ((5, 10), (2, 3))
+    assert intersect_box(box, ((5, 15), (4, 8))) is None
+
+
+def test_batches() -> None:
+    """Batch operations agree with the scalar ones."""
+    intervals = to_array([(0, 10), (20, 25), (8, 12)])
+    assert split_many(intervals, []).tolist() == intervals.tolist()
+    assert split_many(intervals, [5, 10, 22]).tolist() == [
+        [0, 5],
+        [5, 10],
+        [20, 22],
+        [22, 25],
+        [8, 10],
+        [10, 12],
+    ]
+    assert intersect_many(intervals, (9, 21)).tolist() == [[9, 10], [20, 21], [9, 12]]
+    assert coalesce_many(intervals).tolist() == [[0, 12], [20, 25]]
+    assert coalesce_many(to_array([])).tolist() == []
@@ -0,0 +1,65 @@
+"""Tests for tracemalloc based memory accounting."""
+import time
+import tracemalloc
+
+from aoc.lib.memory import traced
+from aoc.runner import run_solution
+from aoc.solution import load_solution
+
+
+def allocate(count: int) -> list[list[int]]:
+    """One small list per item, like a grid of objects."""
+    return [[index] for index in range(count)]
+
+
+def test_traced() -> None:
+    """Peak is measured from the start of the block, sites near the peak."""
+    kept = allocate(10_000)
+    with traced() as usage:
+        grid = allocate(20_000)
+        time.sleep(0.05)  # let the sampler see the peak
+        del grid
+    assert not tracemalloc.is_tracing()
+    # 20k lists of ~100 bytes, not counting the 10k allocated before
+    assert 1_000_000 < usage.peak < 4_000_000
+    assert usage.top and usage.top[0].filename.endswith("test_memory.py")
+    assert usage.top[0].size > 1_000_000
+    assert usage.top[0].to_dict()["site"].endswith(f":{usage.top[0].lineno}")
+    assert len(kept) == 10_000
+
+
+def test_traced_nested() -> None:
+    """Tracing that was already on is left on."""
+    tracemalloc.start()
+    try:
+        with traced() as usage:
+            kept = allocate(1000)
+        assert tracemalloc.is_tracing()
+        assert usage.peak > 0 and len(kept) == 1000
+    finally:
+        tracemalloc.stop()
+
+
+def test_run_solution_memory() -> None:
+    """``memory`` adds peak memory and allocation sites to every phase."""
+    results = run_solution(load_solution(10), "day10/input-d.txt", memory=True)
+    for result in results:
+        assert result.peak_memory is not None and result.peak_memory > 0
+        assert len(result.timings) == 1
+    parse = results[0].to_dict()
+    # day10 parses into the shared Grid
+    assert parse["allocations"][0]["site"].startswith(("day10", "aoc"))
+
+    results = run_solution(load_solution(10), "day10/input-d.txt")
+    assert all(result.peak_memory is None for result in results)
+
+
+def test_instances() -> None:
+    """Live solver dataclasses are counted, with bytes per instance."""
+    results = run_solution(load_solution(11), "day11/input-small.txt", memory=True)
+    parse = results[0].to_dict()
+    galaxies = [item for item in parse["instances"] if item["class"] == "Galaxy"]
+    assert galaxies and galaxies[0]["count"] >= 9
+    # three ints in slots; a __dict__ would take about 40 bytes more
+    assert 40 <= galaxies[0]["per_instance"] < 80
+    assert galaxies[0]["size"] == galaxies[0]["count"] * galaxies[0]["per_instance"]
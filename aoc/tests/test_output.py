@@ -0,0 +1,45 @@
+"""Tests for leveled solver output."""
+import contextlib
+import io
+import os
+import tempfile
+
+from aoc.lib import output
+from aoc.lib.output import OUTPUT_ENV, Level, output_level
+
+
+def render() -> str:
+    """A rendering that must not run when quiet."""
+    raise AssertionError("rendered while quiet")
+
+
+def test_quiet() -> None:
+    """Quiet by default: nothing printed, rendered or written."""
+    stdout = io.StringIO()
+    with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(
+        stdout
+    ), output_level(Level.QUIET):
+        output.verbose("hidden")
+        output.visual(render)
+        output.write_file(os.path.join(temp_dir, "map.txt"), render)
+        assert not os.listdir(temp_dir)
+    assert stdout.getvalue() == ""
+
+
+def test_levels() -> None:
+    """Each level shows its own output and everything below it."""
+    stdout = io.StringIO()
+    with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(stdout):
+        path = os.path.join(temp_dir, "map.txt")
+        with output_level(Level.VERBOSE):
+            assert os.environ[OUTPUT_ENV] == "verbose"
+            output.verbose(lambda: "shown")
+            output.visual(render)
+            output.write_file(path, render)
+        with output_level(Level.VISUAL):
+            output.visual("map")
+            output.write_file(path, lambda: "#.#")
+        with open(path, encoding="utf8") as file:
+            assert file.read() == "#.#"
+    assert stdout.getvalue() == "shown\nmap\n"
+    assert output.get_level() == Level.QUIET
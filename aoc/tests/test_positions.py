@@ -0,0 +1,54 @@
+"""Tests for the integer position encoding."""
+from aoc.lib.directions import (
+    COL_DELTAS,
+    DIRECTIONS,
+    EAST,
+    NORTH,
+    OPPOSITE,
+    ROW_DELTAS,
+    SOUTH,
+    WEST,
+)
+from aoc.lib.positions import Positions
+
+
+def test_positions() -> None:
+    """Positions round trip, and step by the direction offsets."""
+    positions = Positions(3, 4)
+    assert positions.size == 12
+    assert positions.index(1, 2) == 6
+    assert positions.row_col(6) == (1, 2)
+    assert list(positions.indices()) == list(range(12))
+    north, east, south, west = positions.neighbours(6)
+    assert positions.row_col(north) == (0, 2)
+    assert positions.row_col(east) == (1, 3)
+    assert positions.row_col(south) == (2, 2)
+    assert positions.row_col(west) == (1, 1)
+    for direction in DIRECTIONS:
+        row, col = positions.row_col(6 + positions.offsets[direction])
+        assert (row - 1, col - 2) == (ROW_DELTAS[direction], COL_DELTAS[direction])
+
+
+def test_padding() -> None:
+    """Padding keeps positions just off the grid distinct."""
+    positions = Positions(2, 2, padding=1)
+    assert positions.size == 16
+    assert positions.index(0, 0) == 5
+    assert positions.row_col(positions.index(-1, 2)) == (-1, 2)
+    assert not positions.in_bounds(-1, 2) and positions.in_bounds(1, 1)
+    assert list(positions.indices()) == [5, 6, 9, 10]
+
+
+def test_opposite() -> None:
+    """Opposites pair up, and undo each other's offsets."""
+    assert [OPPOSITE[direction] for direction in DIRECTIONS] == [
+        SOUTH,
+        WEST,
+        NORTH,
+        EAST,
+    ]
+    positions = Positions(5, 5)
+    for direction in DIRECTIONS:
+        assert OPPOSITE[OPPOSITE[direction]] == direction
+        offset = positions.offsets[direction]
+        assert offset + positions.offsets[OPPOSITE[direction]] == 0
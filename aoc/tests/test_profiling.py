@@ -0,0 +1,120 @@
+"""Tests for the profiling hooks."""
+import os
+import pstats
+import tempfile
+
+from aoc.__main__ import main
+from aoc.lib.profiling import (
+    PHASE_ENV,
+    PROFILE_ENV,
+    collapsed_stacks,
+    profile_worker,
+    profiled,
+)
+from aoc.lib.workers import WORKERS_ENV
+from aoc.runner import run_solution
+from aoc.solution import load_solution
+
+
+def fib(value: int) -> int:
+    """Something recursive to profile."""
+    return value if value < 2 else fib(value - 1) + fib(value - 2)
+
+
+@profile_worker
+def fib_task(value: int) -> int:
+    """``fib`` as a pool task."""
+    return fib(value)
+
+
+def test_profiled_disabled() -> None:
+    """Without ``AOC_PROFILE`` nothing is written and workers run as is."""
+    os.environ.pop(PROFILE_ENV, None)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with profiled("nothing"):
+            assert fib_task(10) == 55
+        assert not os.listdir(temp_dir)
+    assert PHASE_ENV not in os.environ
+
+
+def test_profiled() -> None:
+    """A phase writes its profile, summary and collapsed stacks."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ[PROFILE_ENV] = temp_dir
+        try:
+            with profiled("fib"):
+                assert os.environ[PHASE_ENV] == "fib"
+                # in the profiling process, tasks don't get a profile of their own
+                fib_task(15)
+            with profiled("skipped", enabled=False):
+                fib(5)
+        finally:
+            del os.environ[PROFILE_ENV]
+        assert PHASE_ENV not in os.environ
+        assert sorted(os.listdir(temp_dir)) == ["fib.collapsed", "fib.prof", "fib.txt"]
+
+        with open(os.path.join(temp_dir, "fib.txt"), encoding="utf8") as file:
+            summary = file.read()
+        assert "by cumulative time" in summary and "by own time" in summary
+        assert "1973/1" in summary  # call counts of fib(15)
+
+        with open(os.path.join(temp_dir, "fib.collapsed"), encoding="utf8") as file:
+            lines = file.read().splitlines()
+        assert any("fib_task (test_profiling.py" in line for line in lines)
+        for line in lines:
+            stack, micros = line.rsplit(" ", 1)
+            assert stack and int(micros) > 0
+
+
+def test_collapsed_stacks() -> None:
+    """Time is conserved, and recursion doesn't repeat frames."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ[PROFILE_ENV] = temp_dir
+        try:
+            with profiled("fib"):
+                fib(18)
+        finally:
+            del os.environ[PROFILE_ENV]
+        stats = pstats.Stats(os.path.join(temp_dir, "fib.prof"))
+    stacks = collapsed_stacks(stats)
+    total = stats.total_tt  # type: ignore[attr-defined]
+    assert abs(sum(stacks.values()) - total * 1_000_000) < 0.05 * total * 1_000_000
+    for stack in stacks:
+        frames = stack.split(";")
+        assert len(frames) == len(set(frames))
+
+
+def test_profile_workers() -> None:
+    """Worker processes of day16 part2 are profiled with their phase."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ[PROFILE_ENV] = temp_dir
+        os.environ[WORKERS_ENV] = "2"
+        try:
+            results = run_solution(load_solution(16), "day16/input-small.txt", [2])
+        finally:
+            del os.environ[PROFILE_ENV]
+            del os.environ[WORKERS_ENV]
+        assert results[1].answer == 51
+        files = os.listdir(temp_dir)
+        assert "day16-parse-part2.prof" in files
+        assert any(name.startswith("day16-part2.worker-") for name in files)
+        with open(os.path.join(temp_dir, "day16-part2.txt"), encoding="utf8") as file:
+            assert "solve_task_wrapper" in file.read()
+
+
+def test_main() -> None:
+    """``--profile`` profiles each phase once, whatever ``--repeat`` is."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        args = ["run", "6", "--input", "day06/input-small.txt", "--repeat", "2"]
+        try:
+            assert main([*args, "--profile", temp_dir]) == 0
+        finally:
+            del os.environ[PROFILE_ENV]
+        prof_files = sorted(
+            name for name in os.listdir(temp_dir) if name.endswith(".prof")
+        )
+        assert prof_files == [
+            "day06-parse.prof",
+            "day06-part1.prof",
+            "day06-part2.prof",
+        ]
@@ -0,0 +1,78 @@
+"""Tests for the runner."""
+import csv
+import io
+import json
+import os
+import tempfile
+
+from aoc.__main__ import main
+from aoc.runner import PhaseResult, run_solution, write_csv, write_json, write_text
+from aoc.solution import load_solution
+
+INPUT_SMALL = "day06/input-small.txt"
+
+
+def test_run_solution() -> None:
+    """Each phase is timed once per repeat."""
+    results = run_solution(load_solution(6), INPUT_SMALL, repeat=3)
+    assert [result.phase for result in results] == ["parse", "part1", "part2"]
+    for result in results:
+        assert len(result.timings) == 3
+        assert result.min is not None and result.median is not None
+        assert result.min <= result.median
+    assert results[1].answer == 288
+    assert results[2].answer == 71503
+
+    # only part2
+    results = run_solution(load_solution(6), INPUT_SMALL, parts=[2])
+    assert [result.phase for result in results] == ["parse", "part2"]
+
+    # day25 has no part2
+    results = run_solution(load_solution(25), "day25/input-small.txt")
+    assert [result.phase for result in results] == ["parse", "part1"]
+
+
+def test_run_solution_error() -> None:
+    """A missing input is reported rather than raised."""
+    parse, part1, part2 = run_solution(load_solution(6), "day06/missing.txt")
+    assert parse.error is not None and "FileNotFoundError" in parse.error
+    assert parse.min is None and parse.median is None
+    assert part1.error is not None and part2.error is not None
+
+
+def test_writers() -> None:
+    """Text, json and csv outputs."""
+    results: list[PhaseResult] = run_solution(load_solution(6), INPUT_SMALL)
+
+    output = io.StringIO()
+    write_json(results, output)
+    document = json.loads(output.getvalue())
+    assert [row["answer"] for row in document["results"]] == [None, 288, 71503]
+
+    output = io.StringIO()
+    write_csv(results, output)
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert [row["phase"] for row in rows] == ["parse", "part1", "part2"]
+    assert rows[1]["answer"] == "288"
+
+    output = io.StringIO()
+    write_text(results, output)
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 4
+    assert lines[2].endswith("288")
+
+
+def test_main() -> None:
+    """``python -m aoc run`` entrypoint."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "results.json")
+        # without the cache, so answers come from this code, not .aoc/cache
+        args = ["run", "6", "--input", INPUT_SMALL, "--format", "json", "--no-cache"]
+        assert main([*args, "--output", path, "--repeat", "2"]) == 0
+        with open(path, encoding="utf8") as file:
+            document = json.load(file)
+        assert all(row["repeat"] == 2 for row in document["results"])
+        assert not any(row["cached"] for row in document["results"])
+
+    assert main(["run", "6", "7", "--input", INPUT_SMALL, "--no-cache"]) == 2
+    assert main(["run", "6", "--input", "day06/missing.txt", "--no-cache"]) == 1
@@ -0,0 +1,113 @@
+"""Tests for the parallel scheduler."""
+import json
+import os
+import tempfile
+
+from aoc.__main__ import main
+from aoc.scheduler import (
+    Job,
+    build_jobs,
+    load_history,
+    order_jobs,
+    run_job,
+    run_schedule,
+    save_history,
+)
+
+INPUT_16 = "day16/input-small.txt"
+
+
+def test_build_jobs() -> None:
+    """Forking parts reserve a bigger share of the workers."""
+    jobs = build_jobs([16, 25], None, [1, 2], 1, workers=8)
+    assert [(job.day, job.part, job.slots) for job in jobs] == [
+        (16, 1, 1),
+        (16, 2, 4),
+        (25, 1, 1),
+    ]
+    assert jobs[0].input_path == "day16/input.txt"
+
+    jobs = build_jobs([16], INPUT_16, [2], 1, workers=1)
+    assert jobs == [Job(16, 2, INPUT_16, 1, 1)]
+
+
+def test_order_jobs() -> None:
+    """Longest first, unknown jobs before everything else."""
+    fast = Job(6, 1, "a")
+    slow = Job(6, 2, "a")
+    unknown = Job(7, 1, "b")
+    history = {fast.key: 0.1, slow.key: 5.0}
+    assert order_jobs([fast, slow, unknown], history) == [unknown, slow, fast]
+
+
+def test_run_job() -> None:
+    """A job runs parse and its single part."""
+    results = run_job(Job(6, 2, "day06/input-small.txt"))
+    assert [result.phase for result in results] == ["parse", "part2"]
+    assert results[1].answer == 71503
+
+
+def test_run_schedule() -> None:
+    """Jobs are merged back into one parse row per day."""
+    jobs = [
+        Job(16, 2, INPUT_16, slots=2),
+        Job(16, 1, INPUT_16),
+        Job(6, 1, "day06/input-small.txt"),
+    ]
+    schedule = run_schedule(jobs, workers=2)
+    assert len(schedule.job_results) == 3
+    results = schedule.phase_results()
+    assert [(result.day, result.phase) for result in results] == [
+        (6, "parse"),
+        (6, "part1"),
+        (16, "parse"),
+        (16, "part1"),
+        (16, "part2"),
+    ]
+    assert [result.answer for result in results[3:]] == [46, 51]
+
+    critical = schedule.critical_path
+    assert critical is not None
+    assert critical.duration <= schedule.wall_time
+    assert schedule.busy_time >= critical.duration
+
+
+def test_history() -> None:
+    """History round-trips; failed and fully cached jobs are not recorded."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "nested", "history.json")
+        assert load_history(path) == {}
+
+        schedule = run_schedule(
+            [Job(6, 1, "day06/input-small.txt"), Job(6, 1, "day06/missing.txt")], 1
+        )
+        save_history(path, schedule, {"old": 1.0})
+        history = load_history(path)
+        assert set(history) == {"old", "day06/input-small.txt:part1"}
+
+        cached = run_schedule([Job(6, 1, "day06/input-small.txt")], 1)
+        for result in cached.job_results[0].results:
+            result.cached = True
+        save_history(path, cached, dict(history))
+        assert load_history(path) == history
+
+
+def test_main() -> None:
+    """``python -m aoc schedule`` entrypoint."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        history = os.path.join(temp_dir, "history.json")
+        output = os.path.join(temp_dir, "results.json")
+        # without the cache, so the jobs really run and get recorded
+        args = ["schedule", "16", "--input", INPUT_16, "--history", history]
+        args.append("--no-cache")
+        assert main([*args, "--format", "json", "--output", output]) == 0
+        with open(output, encoding="utf8") as file:
+            document = json.load(file)
+        assert [row["phase"] for row in document["results"]] == [
+            "parse",
+            "part1",
+            "part2",
+        ]
+        assert len(load_history(history)) == 2
+
+    assert main(["schedule", "6", "7", "--input", INPUT_16]) == 2
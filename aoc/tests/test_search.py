@@ -0,0 +1,78 @@
+"""Tests for the integer state searches."""
+import pytest
+
+from aoc.lib import search
+from aoc.lib.grid import Grid
+
+MAZE = ["..#", ".##", "..."]
+
+
+def open_grid() -> tuple[Grid, bytes]:
+    """The maze, and a flag per cell that's 1 if it's open."""
+    grid = Grid.from_rows(MAZE)
+    return grid, bytes(value == ord(".") for value in grid.cells)
+
+
+def test_bfs() -> None:
+    """Distances and paths come out of a breadth first search."""
+    grid, open_cells = open_grid()
+
+    def neighbours(index: int) -> list[int]:
+        return [index + offset for offset in grid.offsets if open_cells[index + offset]]
+
+    start, end = grid.index(0, 0), grid.index(2, 2)
+    result = search.bfs([start], neighbours, goal=lambda state: state == end)
+    assert result.cost == 4
+    assert [grid.row_col(state) for state in result.path()] == [
+        (0, 0),
+        (1, 0),
+        (2, 0),
+        (2, 1),
+        (2, 2),
+    ]
+    assert result.expanded == 5
+
+    result = search.bfs([start], neighbours, max_depth=1)
+    assert sorted(result.distances.values()) == [0, 1, 1]
+    with pytest.raises(ValueError):
+        result.path(end)
+    with pytest.raises(ValueError):
+        _ = result.cost
+
+
+def test_grid_bfs() -> None:
+    """The grid special case agrees with ``bfs``."""
+    grid, open_cells = open_grid()
+    distances = search.grid_bfs([grid.index(0, 0)], open_cells, grid.offsets)
+    assert distances[grid.index(2, 2)] == 4
+    assert distances[grid.index(0, 2)] == -1
+    distances = search.grid_bfs([grid.index(0, 0)], open_cells, grid.offsets, 2)
+    assert distances[grid.index(2, 0)] == 2 and distances[grid.index(2, 1)] == -1
+
+
+def weighted(state: int) -> list[tuple[int, int]]:
+    """A line of states where skipping ahead by 2 costs 3."""
+    return [(state + 1, 2), (state + 2, 3)] if state < 10 else []
+
+
+def test_dijkstra() -> None:
+    """Cheapest paths are found with a bucket queue."""
+    result = search.dijkstra([0], weighted, goal=lambda state: state == 10)
+    assert result.cost == 15
+    assert result.path() == [0, 2, 4, 6, 8, 10]
+    result = search.dijkstra([0], weighted)
+    assert result.goal is None and result.distances[11] == 17
+
+
+def test_astar() -> None:
+    """A* matches Dijkstra, expanding fewer states with a heuristic."""
+    goal = 10
+
+    def heuristic(state: int) -> int:
+        return (goal - state) * 3 // 2 if state <= goal else 0
+
+    result = search.astar([0], weighted, heuristic, lambda state: state == goal)
+    assert result.cost == 15
+    dijkstra = search.dijkstra([0], weighted, goal=lambda state: state == goal)
+    assert result.expanded <= dijkstra.expanded
+    assert result.pushed > 0
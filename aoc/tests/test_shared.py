@@ -0,0 +1,47 @@
+"""Tests for arrays shared with pool workers."""
+import numpy as np
+import pytest
+
+from aoc.lib import shared
+
+_offset = 0
+
+
+def init_offset(offset: int) -> None:
+    """Initializer: sets an offset for ``lookup``."""
+    global _offset
+    _offset = offset
+
+
+def lookup(index: int) -> int:
+    """Task: reads a shared array."""
+    return int(shared.get("values")[index]) + _offset
+
+
+def test_publish_attach() -> None:
+    """Attached arrays have the published contents and are read only."""
+    array = np.arange(12, dtype=np.int32).reshape(3, 4)
+    with shared.publish({"array": array}) as specs:
+        shared.attach(specs)
+        try:
+            view = shared.get("array")
+            assert view.dtype == np.int32
+            assert (view == array).all()
+            with pytest.raises(ValueError):
+                view[0, 0] = 1
+            del view  # a block can't close while a view of it exists
+        finally:
+            shared.detach()
+    with pytest.raises(KeyError):
+        shared.get("array")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_tasks(workers: int) -> None:
+    """Workers (or this process) read the arrays, after the initializer."""
+    values = np.array([10, 20, 30, 40], dtype=np.int64)
+    results = shared.map_tasks(
+        lookup, [3, 0, 2, 1, 0], {"values": values}, init_offset, (1,), workers
+    )
+    assert results == [41, 11, 31, 21, 11]
+    assert shared.map_tasks(lookup, [], {"values": values}) == []
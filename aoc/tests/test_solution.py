@@ -0,0 +1,70 @@
+"""Tests every day's runner hooks against the small inputs."""
+from typing import Any
+
+import pytest
+
+from aoc.runner import run_solution
+from aoc.solution import discover_days, load_solution
+
+# day, input, part, expected answer
+SMALL_ANSWERS: list[tuple[int, str, int, Any]] = [
+    (1, "day01/input-small.txt", 1, 142),
+    (1, "day01/input-small2.txt", 2, 281),
+    (2, "day02/input-small.txt", 1, 8),
+    (2, "day02/input-small.txt", 2, 2286),
+    (3, "day03/input-small.txt", 1, 4361),
+    (3, "day03/input-small.txt", 2, 467835),
+    (4, "day04/input-small.txt", 1, 13),
+    (4, "day04/input-small.txt", 2, 30),
+    (5, "day05/input-small.txt", 1, 35),
+    (5, "day05/input-small.txt", 2, 46),
+    (6, "day06/input-small.txt", 1, 288),
+    (6, "day06/input-small.txt", 2, 71503),
+    (7, "day07/input-small.txt", 1, 6440),
+    (7, "day07/input-small.txt", 2, 5905),
+    (8, "day08/input-b.txt", 1, 6),
+    (8, "day08/input-c.txt", 2, 6),
+    (9, "day09/input-small.txt", 1, 114),
+    (9, "day09/input-small.txt", 2, 2),
+    (10, "day10/input-b.txt", 1, 8),
+    (10, "day10/input-d.txt", 2, 8),
+    (11, "day11/input-small.txt", 1, 374),
+    (12, "day12/input-small.txt", 1, 21),
+    (12, "day12/input-small.txt", 2, 525152),
+    (13, "day13/input-small.txt", 1, 405),
+    (13, "day13/input-small.txt", 2, 400),
+    (14, "day14/input-small.txt", 1, 136),
+    (14, "day14/input-small.txt", 2, 64),
+    (15, "day15/input-small.txt", 1, 1320),
+    (15, "day15/input-small.txt", 2, 145),
+    (16, "day16/input-small.txt", 1, 46),
+    (16, "day16/input-small.txt", 2, 51),
+    (17, "day17/input-small.txt", 1, 102),
+    (17, "day17/input-small.txt", 2, 94),
+    (18, "day18/input-small.txt", 1, 62),
+    (18, "day18/input-small.txt", 2, 952408144115),
+    (19, "day19/input-small.txt", 1, 19114),
+    (19, "day19/input-small.txt", 2, 167409079868000),
+    (20, "day20/input-b.txt", 1, 11687500),
+    (22, "day22/input-small.txt", 1, 5),
+    (22, "day22/input-small.txt", 2, 7),
+    (23, "day23/input-small.txt", 1, 94),
+    (23, "day23/input-small.txt", 2, 154),
+    (24, "day24/input-small.txt", 1, 2),
+    (24, "day24/input-small.txt", 2, 47),
+    (25, "day25/input-small.txt", 1, 54),
+]
+
+
+def test_discover_days() -> None:
+    """Every day package has runner hooks."""
+    assert discover_days() == list(range(1, 26))
+
+
+@pytest.mark.parametrize("day,path,part,expected", SMALL_ANSWERS)
+def test_small_answers(day: int, path: str, part: int, expected: Any) -> None:
+    """Runner hooks give the same answers as the day's own tests."""
+    parse_result, part_result = run_solution(load_solution(day), path, [part])
+    assert parse_result.error is None
+    assert part_result.error is None
+    assert part_result.answer == expected
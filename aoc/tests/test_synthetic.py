@@ -0,0 +1,62 @@
+"""Tests for the generator helpers."""
+import random
+
+from aoc.lib.synthetic import (
+    column_convex_loop,
+    primes_between,
+    random_walk,
+    scaled,
+    scaled_side,
+    trace,
+    unique_names,
+)
+
+
+def test_scaled() -> None:
+    """Counts scale linearly, sides with the square root."""
+    assert scaled(1000, 10) == 10000
+    assert scaled(10, 0.01) == 1
+    assert scaled_side(100, 100) == 1000
+    assert scaled_side(100, 0.0001, minimum=5) == 5
+
+
+def test_unique_names() -> None:
+    """Names are distinct, and grow when the name space is small."""
+    names = unique_names(random.Random(0), 100, "ab", 2)
+    assert len(set(names)) == 100
+    assert all(len(name) == 8 for name in names)
+
+
+def test_primes_between() -> None:
+    """Sieve returns primes in the half open range."""
+    assert primes_between(0, 20) == [2, 3, 5, 7, 11, 13, 17, 19]
+    assert primes_between(11, 19) == [11, 13, 17]
+
+
+def test_random_walk() -> None:
+    """Values stay in range and neighbours differ."""
+    values = random_walk(random.Random(0), 200, 3, 6, 2)
+    assert all(3 <= value <= 6 for value in values)
+    assert all(left != right for left, right in zip(values, values[1:]))
+
+
+def test_column_convex_loop() -> None:
+    """Loops are closed, simple, and only list their corners."""
+    corners = column_convex_loop([1, 0, 2], [3, 4, 4], [2, 1, 1])
+    assert corners == [
+        (1, 0),
+        (3, 0),
+        (3, 2),
+        (4, 2),
+        (4, 4),
+        (2, 4),
+        (2, 3),
+        (0, 3),
+        (0, 2),
+        (1, 2),
+        (1, 0),
+    ]
+    points = trace(corners)
+    assert points[0] == points[-1]
+    assert len(set(points[:-1])) == len(points) - 1
+    assert len(points) - 1 == 16
@@ -3,6 +3,8 @@
 
 from dataclasses import dataclass
 
+from aoc.lib import output
+
 INPUT = "day01/input.txt"
 INPUT_SMALL = "day01/input-small2.txt"
 
@@ -66,7 +68,7 @@ def process_line(line: str) -> int:
             if substring == mapping.word:
                 index_to_chars[index] = mapping.number
 
-    print(index_to_chars, line)
+    output.verbose(lambda: f"{index_to_chars} {line}")
     first_index = min(index_to_chars.keys())
     last_index = max(index_to_chars.keys())
 
@@ -0,0 +1,32 @@
+"""Synthetic input generator for day01."""
+import random
+import string
+
+from aoc.lib.synthetic import scaled
+
+LINES = 1000
+DIGITS = "123456789"
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Lines of letters, digits and spelled out digits.
+
+    ``scale`` multiplies the line count. Every line has a real digit, so
+    both parts have an answer.
+    """
+    lines: list[str] = []
+    for _ in range(scaled(LINES, scale)):
+        tokens = [rng.choice(DIGITS)]
+        for _ in range(rng.randint(2, 8)):
+            roll = rng.random()
+            if roll < 0.25:
+                tokens.append(rng.choice(DIGITS))
+            elif roll < 0.5:
+                tokens.append(rng.choice(WORDS))
+            else:
+                letters = rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))
+                tokens.append("".join(letters))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,11 @@
+"""Runner hooks for day01."""
+from aoc.solution import Solution
+from day01 import day1a, day1b
+
+SOLUTION = Solution(
+    day=1,
+    input_path=day1a.INPUT,
+    parse=day1a.get_input,
+    part1=day1a.part1,
+    part2=day1b.part2,
+)
@@ -0,0 +1,19 @@
+"""Synthetic input generator for day02."""
+import random
+
+from aoc.lib.synthetic import scaled
+
+GAMES = 100
+COLORS = ["red", "green", "blue"]
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Games of 1-6 draws; ``scale`` multiplies the game count."""
+    lines: list[str] = []
+    for game_id in range(1, scaled(GAMES, scale) + 1):
+        draws: list[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: " + "; ".join(draws))
+    return "\n".join(lines) + "\n"
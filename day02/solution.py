@@ -0,0 +1,5 @@
+"""Runner hooks for day02."""
+from aoc.solution import Solution
+from day02.day2 import INPUT, get_games, part1, part2
+
+SOLUTION = Solution(day=2, input_path=INPUT, parse=get_games, part1=part1, part2=part2)
@@ -0,0 +1,29 @@
+"""Synthetic input generator for day03."""
+import random
+
+from aoc.lib.synthetic import render_grid, scaled_side
+
+SIDE = 140
+SYMBOLS = "*#+$/@%=&-"
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Engine schematic of numbers and symbols; ``scale`` multiplies the area."""
+    side = scaled_side(SIDE, scale)
+    grid: list[list[str]] = []
+    for _ in range(side):
+        row: list[str] = []
+        while len(row) < side:
+            roll = rng.random()
+            length = rng.randint(1, 3)
+            if roll < 0.08 and len(row) + length <= side:
+                row.append(rng.choice("123456789"))
+                row.extend(rng.choices("0123456789", k=length - 1))
+                if len(row) < side:
+                    row.append(".")
+            elif roll < 0.12:
+                row.append("*" if rng.random() < 0.4 else rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        grid.append(row)
+    return render_grid(grid)
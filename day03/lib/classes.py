@@ -6,7 +6,7 @@ NON_PART = "123456789."
 NUMBER_REGEX = r"\d+"
 
 
-@dataclass
+@dataclass(slots=True)
 class PartNumber:
     """Class respresenting a potential part number, and its position."""
 
@@ -32,7 +32,7 @@ class PartNumber:
         return self.col + self.length
 
 
-@dataclass
+@dataclass(slots=True)
 class Gear:
     """Class representing a potential gear (``*`` icon)."""
 
@@ -0,0 +1,28 @@
+"""Runner hooks for day03."""
+from aoc.solution import Solution
+from day03.day3 import INPUT, part1, part2
+from day03.lib.classes import Matrix, PartNumber
+from day03.lib.parsers import get_matrix
+
+
+def parse(path: str) -> tuple[list[PartNumber], Matrix]:
+    """Load the matrix and pull out the engine part numbers."""
+    matrix: Matrix = get_matrix(path)
+    part_numbers = matrix.filter_engine_parts(matrix.get_part_numbers())
+    return part_numbers, matrix
+
+
+def solve_part1(data: tuple[list[PartNumber], Matrix]) -> int:
+    """Sum of engine part numbers."""
+    part_numbers, _ = data
+    return part1(part_numbers)
+
+
+def solve_part2(data: tuple[list[PartNumber], Matrix]) -> int:
+    """Sum of gear ratios."""
+    return part2(*data)
+
+
+SOLUTION = Solution(
+    day=3, input_path=INPUT, parse=parse, part1=solve_part1, part2=solve_part2
+)
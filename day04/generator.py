@@ -0,0 +1,37 @@
+"""Synthetic input generator for day04."""
+import random
+
+from aoc.lib.synthetic import scaled
+
+CARDS = 200
+WINNING = 10
+HAVE = 25
+NUMBERS = range(1, 100)
+MATCHES = [0, 0, 0, 0, 1, 1, 2, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+# cards holding this many copies stop winning, like a real input's counts
+MAX_COPIES = 100_000
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Scratchcards; ``scale`` multiplies the card count.
+
+    Cards never win copies of cards past the end of the table, and part2's
+    copy counts stay bounded however many cards there are.
+    """
+    card_count = scaled(CARDS, scale)
+    copies = [1] * (card_count + 1)
+    lines: list[str] = []
+    for card_id in range(1, card_count + 1):
+        matches = min(rng.choice(MATCHES), card_count - card_id)
+        if copies[card_id] >= MAX_COPIES:
+            matches = 0
+        for won_id in range(card_id + 1, card_id + matches + 1):
+            copies[won_id] += copies[card_id]
+        numbers = rng.sample(NUMBERS, WINNING + HAVE - matches)
+        winning = numbers[:WINNING]
+        have = rng.sample(winning, matches) + numbers[WINNING:]
+        rng.shuffle(have)
+        winning_str = " ".join(f"{number:2}" for number in winning)
+        have_str = " ".join(f"{number:2}" for number in have)
+        lines.append(f"Card {card_id:3}: {winning_str} | {have_str}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,5 @@
+"""Runner hooks for day04."""
+from aoc.solution import Solution
+from day04.day4 import INPUT, grab_data, part1, part2
+
+SOLUTION = Solution(day=4, input_path=INPUT, parse=grab_data, part1=part1, part2=part2)
@@ -1,8 +1,14 @@
 """Day5 solution."""
 
+from typing import TYPE_CHECKING
+
+from aoc.lib.intervals import to_array
 from day05.lib.classes import MappingRange, NamedMap
 from day05.lib.parsers import grab_inputs
 
+if TYPE_CHECKING:
+    from aoc.lib.intervals import IntervalArray
+
 INPUT = "day05/input.txt"
 INPUT_SMALL = "day05/input-small.txt"
 INPUT_GAPS = "day05/input-gaps.txt"
@@ -16,14 +22,23 @@ def get_location(seed: int, maps: list[NamedMap]) -> int:
     return result
 
 
+def get_location_intervals(
+    seed_intervals: "IntervalArray", maps: list[NamedMap]
+) -> "IntervalArray":
+    """Given an ``(n, 2)`` array of seed ranges, returns the location ranges."""
+    result = seed_intervals
+    for named_map in maps:
+        result = named_map.map_intervals(result)
+    return result
+
+
 def get_location_ranges(
     seed_ranges: list[MappingRange], maps: list[NamedMap]
 ) -> list[MappingRange]:
     """Given a list of MappingRange, returns a list of MappingRange's for the final location."""
-    result = seed_ranges[:]
-    for named_map in maps:
-        result = named_map.get_mapping_ranges(result)
-    return result
+    seed_intervals = to_array((item.start, item.end) for item in seed_ranges)
+    result = get_location_intervals(seed_intervals, maps)
+    return [MappingRange(int(start), int(end)) for start, end in result]
 
 
 def seed_to_mapping_ranges(data: list[int]) -> list[MappingRange]:
@@ -57,9 +72,10 @@ def part1(seeds: list[int], maps: list[NamedMap]) -> int:
 
 def part2(seeds: list[int], maps: list[NamedMap]) -> int:
     """Parses multiple seed ranges, and finds the lowest location start."""
-    start_ranges = seed_to_mapping_ranges(seeds)
-    end_locations = get_location_ranges(start_ranges, maps)
-    return min(location.start for location in end_locations)
+    pairs = zip(seeds[::2], seeds[1::2])
+    seed_intervals = to_array((start, start + size) for start, size in pairs)
+    end_locations = get_location_intervals(seed_intervals, maps)
+    return int(end_locations[:, 0].min())
 
 
 def main() -> None:
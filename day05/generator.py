@@ -0,0 +1,54 @@
+"""Synthetic input generator for day05."""
+import random
+
+from aoc.lib.synthetic import scaled
+from day05.lib.classes import INT_MAX
+
+SEED_PAIRS = 10
+RANGES_PER_MAP = 30
+MAP_NAMES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+
+def generate_map(rng: random.Random, range_count: int) -> list[str]:
+    """Returns ``dest src size`` lines for one map.
+
+    Source ranges never overlap and leave gaps; destinations are the same
+    ranges shuffled into one contiguous block.
+    """
+    cuts = sorted(rng.sample(range(1, INT_MAX), range_count + 1))
+    segments = [
+        (start, end - start)
+        for start, end in zip(cuts, cuts[1:])
+        if rng.random() < 0.85
+    ]
+    if not segments:
+        segments = [(cuts[0], cuts[-1] - cuts[0])]
+    total = sum(size for _, size in segments)
+    dest = rng.randrange(INT_MAX - total + 1)
+    rng.shuffle(segments)
+    lines: list[str] = []
+    for src, size in segments:
+        lines.append(f"{dest} {src} {size}")
+        dest += size
+    return lines
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Seeds and seven maps; ``scale`` multiplies seeds and ranges per map."""
+    seeds: list[int] = []
+    for _ in range(scaled(SEED_PAIRS, scale)):
+        start = rng.randrange(INT_MAX - 1)
+        seeds.extend([start, rng.randint(1, min(INT_MAX - start, 1 << 28))])
+    sections = ["seeds: " + " ".join(str(seed) for seed in seeds)]
+    for name in MAP_NAMES:
+        lines = generate_map(rng, scaled(RANGES_PER_MAP, scale))
+        sections.append(f"{name} map:\n" + "\n".join(lines))
+    return "\n\n".join(sections) + "\n"
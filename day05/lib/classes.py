@@ -1,11 +1,17 @@
 """classes for day05."""
 from bisect import bisect_left
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from aoc.lib.intervals import coalesce_many, split_many
+
+if TYPE_CHECKING:
+    from aoc.lib.intervals import IntervalArray
 
 INT_MAX = 4294967296
 
 
-@dataclass
+@dataclass(slots=True)
 class MappingRange:
     """Simple class for start/end range."""
 
@@ -13,7 +19,7 @@ class MappingRange:
     end: int
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class Mapping:
     """Simple range based mapping."""
 
@@ -37,26 +43,15 @@ class Mapping:
 
         raise ValueError(f"Item not within mapping range {src_value, self}")
 
-    def get_mappings(self, start: int, end: int) -> tuple[MappingRange, int]:
-        """Returns the chunk from start to end, followed by the remainder."""
-        dest_start = start - self.src_start + self.dest_start
-        dest_end_uncapped = end - self.src_start + self.dest_start
-
-        if dest_end_uncapped < self.dest_end:
-            remaining = 0
-        else:
-            remaining = dest_end_uncapped - self.dest_end
-
-        dest_end_capped = min(dest_end_uncapped, self.dest_end)
-
-        return MappingRange(dest_start, dest_end_capped), remaining
-
 
 class NamedMap:
     """a named map with a list of mappings."""
 
     name: str
     mappings: list[Mapping]
+    # where each mapping starts, and how far it moves values; see finalize
+    src_starts: list[int]
+    shifts: list[int]
 
     def __init__(self, name: str):
         """Create empty NamedMap from just its name.
@@ -70,6 +65,8 @@ class NamedMap:
         """
         self.name = name
         self.mappings = []
+        self.src_starts = []
+        self.shifts = []
 
     def add_mapping(self, mapping: Mapping) -> None:
         """Adds a mapping to our list."""
@@ -100,6 +97,10 @@ class NamedMap:
         mappings.sort()
 
         self.mappings = self.extend_mapping_range(mappings)
+        self.src_starts = [mapping.src_start for mapping in self.mappings]
+        self.shifts = [
+            mapping.dest_start - mapping.src_start for mapping in self.mappings
+        ]
 
     def extend_mapping_range(self, mappings: list[Mapping]) -> list[Mapping]:
         """Ensure that mappings go from 0 -> INT_MAX."""
@@ -119,36 +120,18 @@ class NamedMap:
         mapping = self.mappings[mapping_idx]
         return mapping.get_mapping(value)
 
-    def get_mapping_ranges(
-        self, src_mapping_ranges: list[MappingRange]
-    ) -> list[MappingRange]:
-        """Given a list of mapping ranges, returns a new list of mapping ranges."""
-        result = []
-        for src_mapping_range in src_mapping_ranges:
-            mappings = self.get_mapping_range(src_mapping_range)
-            result.extend(mappings)
-        return result
+    def map_intervals(self, intervals: "IntervalArray") -> "IntervalArray":
+        """Remaps an ``(n, 2)`` array of source ranges to destination ranges.
 
-    def get_mapping_range(self, src_mapping_range: MappingRange) -> list[MappingRange]:
-        """Remaps a source range to a list of destination ranges."""
-        # make a quick copy first
-        src_start, src_end = src_mapping_range.start, src_mapping_range.end
-        result: list[MappingRange] = []
-
-        # find out where the start is
-        mapping_start_idx = bisect_left(
-            self.mappings, src_start, key=lambda m: m.src_end
-        )
-        remaining = src_end - src_start
-
-        while remaining != 0:
-            mapping_start = self.mappings[mapping_start_idx]
-            mapping_range, remaining = mapping_start.get_mappings(src_start, src_end)
-            result.append(mapping_range)
-            src_start = src_end - remaining  # move src_start upwards over time
-            mapping_start_idx += 1  # no need to re-bisect. just go next
+        Ranges are split wherever a mapping starts, each fragment is moved by
+        its mapping, then overlapping results are merged.
+        """
+        import numpy as np
 
-        return result
+        fragments = split_many(intervals, self.src_starts[1:])
+        owners = np.searchsorted(self.src_starts, fragments[:, 0], side="right") - 1
+        shifts = np.asarray(self.shifts, dtype=np.int64)[owners]
+        return coalesce_many(fragments + shifts[:, np.newaxis])
 
     def __str__(self) -> str:
         """Return string for list of mappings."""
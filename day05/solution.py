@@ -0,0 +1,20 @@
+"""Runner hooks for day05."""
+from aoc.solution import Solution
+from day05.day5 import INPUT, part1, part2
+from day05.lib.classes import NamedMap
+from day05.lib.parsers import grab_inputs
+
+
+def solve_part1(data: tuple[list[int], list[NamedMap]]) -> int:
+    """Lowest location of any single seed."""
+    return part1(*data)
+
+
+def solve_part2(data: tuple[list[int], list[NamedMap]]) -> int:
+    """Lowest location of any seed range."""
+    return part2(*data)
+
+
+SOLUTION = Solution(
+    day=5, input_path=INPUT, parse=grab_inputs, part1=solve_part1, part2=solve_part2
+)
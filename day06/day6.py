@@ -81,17 +81,27 @@ def calculate_race(race: Race) -> int:
 
 
 def calculate_constant_time(race: Race) -> int:
-    """TL;DR Quadratic formula."""
-    x_top = race.time - math.sqrt((race.time * race.time) - 4 * race.record_distance)
-    x_neg = x_top / 2
-
-    # start is always x_neg j, end is always race.time - start
-    start = math.ceil(x_neg)
-    end = math.floor(race.time - start)
-
-    # add one because hypothetically if end == start, then you'd get 0 which is wrong.
+    """TL;DR Quadratic formula.
+
+    Uses integer square roots, since floats lose the exact intercepts of
+    big races, and an intercept that's a whole number only ties the record.
+    """
+    discriminant = race.time * race.time - 4 * race.record_distance
+    if discriminant < 0:
+        return 0  # the record can't even be reached
+
+    # start from the lower intercept, then step to the first charge time that wins
+    start = max(0, (race.time - math.isqrt(discriminant)) // 2)
+    while start * (race.time - start) <= race.record_distance:
+        start += 1
+        if start > race.time // 2:
+            return 0  # tying the record at best
+    while start > 0 and (start - 1) * (race.time - start + 1) > race.record_distance:
+        start -= 1
+
+    # end is always race.time - start; add one since both ends win
     # typical fencepost :)
-    return end - start + 1
+    return race.time - 2 * start + 1
 
 
 def part1(races: list[Race]) -> int:
@@ -103,6 +113,11 @@ def part1(races: list[Race]) -> int:
     return permutations
 
 
+def part1_quadratic(races: list[Race]) -> int:
+    """``part1``, solving each race with the quadratic formula."""
+    return math.prod(calculate_constant_time(race) for race in races)
+
+
 def part2(race: Race) -> int:
     """Return amoutn of ways we can win the race."""
     return calculate_constant_time(race)
@@ -0,0 +1,36 @@
+"""Synthetic input generator for day06."""
+import random
+
+RACES = 4
+MIN_TIME = 40
+MAX_TIME = 100
+
+
+def best_distance(time: int) -> int:
+    """Furthest distance reachable in a race of ``time``."""
+    return (time // 2) * (time - time // 2)
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Four races; ``scale`` multiplies race times, hence part1's search.
+
+    Records are always beatable, including for the concatenated part2 race.
+    """
+    while True:
+        times = [
+            rng.randint(
+                max(2, round(MIN_TIME * scale)), max(2, round(MAX_TIME * scale))
+            )
+            for _ in range(RACES)
+        ]
+        records = [
+            rng.randint(best_distance(time) // 2, best_distance(time) - 1)
+            for time in times
+        ]
+        big_time = int("".join(str(time) for time in times))
+        big_record = int("".join(str(record) for record in records))
+        if big_record < best_distance(big_time):
+            break
+    time_str = " ".join(f"{time:>5}" for time in times)
+    record_str = " ".join(f"{record:>5}" for record in records)
+    return f"Time:     {time_str}\nDistance: {record_str}\n"
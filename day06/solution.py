@@ -0,0 +1,32 @@
+"""Runner hooks for day06."""
+from aoc.solution import Solution
+from day06.day6 import (
+    INPUT,
+    Race,
+    calculate_race,
+    get_giga_race,
+    part1,
+    part1_quadratic,
+    part2,
+    read_inputs,
+)
+
+
+def solve_part2(races: list[Race]) -> int:
+    """Ways to win the single giga race."""
+    return part2(get_giga_race(races))
+
+
+def solve_part2_naive(races: list[Race]) -> int:
+    """Ways to win the single giga race, trying every charge time."""
+    return calculate_race(get_giga_race(races))
+
+
+SOLUTION = Solution(
+    day=6,
+    input_path=INPUT,
+    parse=read_inputs,
+    part1=part1,
+    part2=solve_part2,
+    engines={1: {"quadratic": part1_quadratic}, 2: {"naive": solve_part2_naive}},
+)
@@ -6,6 +6,7 @@ from day06.day6 import (
     calculate_race,
     get_giga_race,
     part1,
+    part1_quadratic,
     part2,
     read_inputs,
 )
@@ -30,6 +31,7 @@ def test_part1() -> None:
     """Tests part1."""
     races: list[Race] = read_inputs(INPUT_SMALL)
     assert part1(races) == 288
+    assert part1_quadratic(races) == 288
 
 
 def test_part2() -> None:
@@ -45,6 +47,12 @@ def test_calculate_race() -> None:
     assert calculate_race(race) == 4
     assert calculate_constant_time(race) == 4
 
+    # intercepts at 10 and 20 only tie the record
+    race = Race(30, 200)
+    assert calculate_race(race) == calculate_constant_time(race) == 9
+    race = Race(4, 4)
+    assert calculate_race(race) == calculate_constant_time(race) == 0
+
 
 def test_calculate_constant_time() -> None:
     """Test calculating constant time."""
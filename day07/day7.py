@@ -80,16 +80,19 @@ def parse_lines(cls: type, path: str) -> list[Hand]:
     return results
 
 
-def calculate_hands(cls: type, input_path: str) -> int:
-    """Generates class `cls` then calculates points."""
-    hands = sorted(parse_lines(cls, input_path))
-
+def score_hands(hands: list[Hand]) -> int:
+    """Sorts hands by strength then sums ``rank * bet``."""
     score = 0
-    for rank, hand in enumerate(hands):
+    for rank, hand in enumerate(sorted(hands)):
         score += (rank + 1) * hand.bet
     return score
 
 
+def calculate_hands(cls: type, input_path: str) -> int:
+    """Generates class `cls` then calculates points."""
+    return score_hands(parse_lines(cls, input_path))
+
+
 def main() -> None:
     """Main func."""
     # Q1
@@ -0,0 +1,27 @@
+"""Synthetic input generator for day07."""
+import random
+
+from aoc.lib.synthetic import scaled
+
+HANDS = 1000
+CARDS = "23456789TJQKA"
+UNIQUE_LIMIT = len(CARDS) ** 5 // 2
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Hands and bids; ``scale`` multiplies the hand count.
+
+    Hands are distinct until the count gets close to the number of possible
+    hands, after which duplicates are allowed.
+    """
+    hand_count = scaled(HANDS, scale)
+    seen: set[str] = set()
+    lines: list[str] = []
+    while len(lines) < hand_count:
+        hand = "".join(rng.choices(CARDS, k=5))
+        if hand_count <= UNIQUE_LIMIT:
+            if hand in seen:
+                continue
+            seen.add(hand)
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+    return "\n".join(lines) + "\n"
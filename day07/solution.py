@@ -0,0 +1,23 @@
+"""Runner hooks for day07."""
+from aoc.solution import Solution
+from day07.day7 import INPUT, Hand, HandPart2, parse_lines, score_hands
+
+
+def parse(path: str) -> tuple[list[Hand], list[Hand]]:
+    """Parse hands once with normal rules and once with joker rules."""
+    return parse_lines(Hand, path), parse_lines(HandPart2, path)
+
+
+def solve_part1(hands: tuple[list[Hand], list[Hand]]) -> int:
+    """Total winnings with normal rules."""
+    return score_hands(hands[0])
+
+
+def solve_part2(hands: tuple[list[Hand], list[Hand]]) -> int:
+    """Total winnings with joker rules."""
+    return score_hands(hands[1])
+
+
+SOLUTION = Solution(
+    day=7, input_path=INPUT, parse=parse, part1=solve_part1, part2=solve_part2
+)
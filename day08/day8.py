@@ -4,13 +4,16 @@ import math
 from dataclasses import dataclass, field
 from typing import Iterator
 
+from aoc.lib import output
+from aoc.lib.cycles import brent
+
 INPUT = "day08/input.txt"
 INPUT_A = "day08/input-a.txt"
 INPUT_B = "day08/input-b.txt"
 INPUT_C = "day08/input-c.txt"
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """A location on our map, with names of other locations."""
 
@@ -19,7 +22,7 @@ class Location:
     right: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationStep:
     """Location + how many steps to get here."""
 
@@ -28,7 +31,7 @@ class LocationStep:
 
     def __hash__(self) -> int:
         """Custom hash function so we can compare/set this class."""
-        return hash(self.location.name + str(self.steps))
+        return hash((self.location.name, self.steps))
 
 
 class WorldMap:
@@ -148,12 +151,9 @@ def follow_directions_multi(directions: Directions, world_map: WorldMap) -> int:
     cycles = [find_cycle(node, world_map, directions) for node in nodes]
 
     for cycle in cycles:
-        print(
-            cycle.start_location,
-            cycle.cycle_start_index,
-            len(cycle.location_steps),
-            cycle.cycle_length,
-            cycle.end_zs,
+        output.verbose(
+            lambda: f"{cycle.start_location} {cycle.cycle_start_index} "
+            f"{len(cycle.location_steps)} {cycle.cycle_length} {cycle.end_zs}"
         )
 
     # each cycle only has one z in it.
@@ -164,12 +164,10 @@ def follow_directions_multi(directions: Directions, world_map: WorldMap) -> int:
     # That means it can be simplified by finding the lcm
 
     lcm = math.lcm(*[cycle.cycle_length for cycle in cycles])
-    print(lcm)  # 13,663,968,099,527
+    output.verbose(str(lcm))  # 13,663,968,099,527
 
-    index = cycles[0].end_zs[0]
-    index = lcm
     for cycle in cycles:
-        print(cycle.get_location(index))
+        output.verbose(lambda: str(cycle.get_location(lcm)))
 
     return lcm
 
@@ -177,33 +175,27 @@ def follow_directions_multi(directions: Directions, world_map: WorldMap) -> int:
 def find_cycle(
     location: Location, world_map: WorldMap, directions: Directions
 ) -> Cycle:
-    """Finds the cycle from a start location."""
-    start_location = location
-    nodes: list[LocationStep] = []
-    step_count = 0
-    mappings = world_map.mappings
+    """Finds the cycle from a start location.
 
-    node = LocationStep(location, step_count)
-    location_steps_lookup = set()
-
-    while True:
-        nodes.append(node)
-        location_steps_lookup.add(node)
-
-        direction = directions.steps[step_count]
-        if direction == "L":
-            location = mappings[location.left]
-        else:
-            location = mappings[location.right]
+    States are ``(location name, index into directions)`` pairs.
+    """
+    mappings = world_map.mappings
+    steps = directions.steps
 
-        node = LocationStep(location, step_count + 1)
-        if node in location_steps_lookup:
-            break
+    def step(state: tuple[str, int]) -> tuple[str, int]:
+        name, index = state
+        location = mappings[name]
+        name = location.left if steps[index] == "L" else location.right
+        return name, (index + 1) % len(steps)
 
-        step_count += 1
-        step_count %= len(directions.steps)
+    cycle = brent((location.name, 0), step)
+    nodes: list[LocationStep] = []
+    state = cycle.start
+    for _ in range(cycle.mu + cycle.lam):
+        nodes.append(LocationStep(mappings[state[0]], state[1]))
+        state = step(state)
 
-    return Cycle(start_location, nodes, node)
+    return Cycle(location, nodes, nodes[cycle.mu])
 
 
 def main() -> None:
@@ -0,0 +1,55 @@
+"""Synthetic input generator for day08."""
+import itertools
+import math
+import random
+import string
+
+from aoc.lib.synthetic import primes_between, scaled, unique_names
+
+NODES = 750
+GHOSTS = 6
+NAME_CHARS = string.ascii_uppercase + string.digits
+# names are three characters wide, which caps how far the map can grow
+MAX_NODES = 20000
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Directions plus one loop per ghost; ``scale`` multiplies the node count.
+
+    Ghost ``i`` walks ``start -> n1 -> ... -> end -> n1`` where the loop is
+    ``len(directions) * prime_i`` steps long. A node is always left on the
+    same direction index, so the branch not taken can point anywhere; this
+    keeps part2's lcm shortcut exact. The node count is capped at
+    ``MAX_NODES`` since names are fixed width.
+    """
+    per_ghost = max(2, min(scaled(NODES, scale), MAX_NODES) // GHOSTS)
+    direction_count = max(2, math.isqrt(per_ghost))
+    prime_target = max(2, per_ghost // direction_count)
+    candidates = primes_between(prime_target, 2 * prime_target + 100)
+    loop_primes = rng.sample(candidates[: GHOSTS * 3], GHOSTS)
+    directions = "".join(rng.choices("LR", k=direction_count))
+
+    loop_lengths = [direction_count * prime for prime in loop_primes]
+    inner_count = sum(loop_lengths) - GHOSTS
+    inner_names = [
+        name
+        for name in unique_names(rng, inner_count * 11 // 10 + 50, NAME_CHARS)
+        if name[-1] not in "AZ"
+    ][:inner_count]
+    prefixes = ["".join(pair) for pair in itertools.product(NAME_CHARS, repeat=2)]
+    prefixes = rng.sample([p for p in prefixes if p not in ("AA", "ZZ")], GHOSTS - 1)
+
+    lines: list[str] = []
+    for ghost, prefix in enumerate(["AA", *prefixes]):
+        end = "ZZZ" if ghost == 0 else prefix + "Z"
+        loop = [inner_names.pop() for _ in range(loop_lengths[ghost] - 1)] + [end]
+        path = [prefix + "A", *loop]
+        for index, name in enumerate(path):
+            next_name = path[index + 1] if index + 1 < len(path) else loop[0]
+            decoy = rng.choice(path)
+            if directions[index % direction_count] == "L":
+                lines.append(f"{name} = ({next_name}, {decoy})")
+            else:
+                lines.append(f"{name} = ({decoy}, {next_name})")
+    rng.shuffle(lines)
+    return directions + "\n\n" + "\n".join(lines) + "\n"
@@ -0,0 +1,25 @@
+"""Runner hooks for day08."""
+from aoc.solution import Solution
+from day08.day8 import (
+    INPUT,
+    Directions,
+    WorldMap,
+    follow_directions,
+    follow_directions_multi,
+    read_input,
+)
+
+
+def solve_part1(data: tuple[Directions, WorldMap]) -> int:
+    """Steps from ``AAA`` to ``ZZZ``."""
+    return follow_directions(*data)
+
+
+def solve_part2(data: tuple[Directions, WorldMap]) -> int:
+    """Steps until every ``**A`` node is on a ``**Z`` node."""
+    return follow_directions_multi(*data)
+
+
+SOLUTION = Solution(
+    day=8, input_path=INPUT, parse=read_input, part1=solve_part1, part2=solve_part2
+)
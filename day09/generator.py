@@ -0,0 +1,27 @@
+"""Synthetic input generator for day09."""
+import math
+import random
+
+from aoc.lib.synthetic import scaled
+
+LINES = 200
+LENGTH = 21
+MAX_DEGREE = 8
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Polynomial sequences; ``scale`` multiplies the line count.
+
+    Each line is a polynomial of degree <= ``MAX_DEGREE``, so repeated
+    differences always reach zero.
+    """
+    lines: list[str] = []
+    for _ in range(scaled(LINES, scale)):
+        degree = rng.randint(0, MAX_DEGREE)
+        coefficients = [rng.randint(-12, 12) for _ in range(degree + 1)]
+        values = [
+            sum(coef * math.comb(x, k) for k, coef in enumerate(coefficients))
+            for x in range(LENGTH)
+        ]
+        lines.append(" ".join(str(value) for value in values))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,5 @@
+"""Runner hooks for day09."""
+from aoc.solution import Solution
+from day09.day9 import INPUT, get_input, part1, part2
+
+SOLUTION = Solution(day=9, input_path=INPUT, parse=get_input, part1=part1, part2=part2)
@@ -1,7 +1,9 @@
 """day10 solution."""
 
 
-from day10.lib.direction import Direction
+from aoc.lib import output
+from aoc.lib.directions import OPPOSITE, Direction
+from aoc.lib.grid import Grid
 from day10.lib.pipebounds import PipeBounds
 from day10.lib.pipes import Pipe, PipeMap
 from day10.lib.position import Position
@@ -13,30 +15,16 @@ INPUT_C = "day10/input-c.txt"
 INPUT_D = "day10/input-d.txt"
 
 
-def process_input_line(row: int, line: str) -> list[Pipe]:
-    """Process a single line of input."""
-    return [Pipe(row, col, char) for col, char in enumerate(line.strip())]
-
-
 def read_input(path: str) -> PipeMap:
     """Read the map."""
-    with open(path, "r", encoding="utf8") as file:
-        pipes = [process_input_line(row, line) for row, line in enumerate(file)]
-        pipe_map = PipeMap(pipes)
-    return pipe_map
+    return PipeMap(Grid.load(path))
 
 
 def find_s(pipe_map: PipeMap) -> Position:
     """Finds the S pipe."""
-    for row_idx, row in enumerate(pipe_map.pipes):
-        finder = (col_idx for col_idx, pipe in enumerate(row) if pipe.is_start)
-        try:
-            col_idx = next(finder)
-            return Position(row_idx, col_idx)
-        except StopIteration:
-            continue
-
-    raise AssertionError("No S pipe found!")
+    if pipe_map.start is None:
+        raise AssertionError("No S pipe found!")
+    return Position(*pipe_map.pipes.row_col(pipe_map.start))
 
 
 def calculate_s(start: Position, pipe_map: PipeMap) -> str:
@@ -78,22 +66,26 @@ def calculate_s(start: Position, pipe_map: PipeMap) -> str:
     raise AssertionError("No mapping found for `s` pipe")
 
 
-def find_cycles(pipe_map: PipeMap) -> list[Pipe]:
-    """Finds the pipe path starting from S."""
+def find_cycles(pipe_map: PipeMap) -> list[int]:
+    """Finds the pipe path starting from S, as indices of ``pipe_map.pipes``."""
     # first find S, and re-assign it
     s_position: Position = find_s(pipe_map)
     s_char: str = calculate_s(s_position, pipe_map)
-    s_pipe: Pipe = pipe_map.get_pipe(s_position)
-    s_pipe.character = s_char
-
-    pipe_path: list[Pipe] = []
-    current_pipe: Pipe = s_pipe
-    direction: Direction | None = None
-    while current_pipe != s_pipe or len(pipe_path) == 0:
-        pipe_path.append(current_pipe)
-        direction, position = current_pipe.next_position(direction)
-        current_pipe = pipe_map.get_pipe(position)
-        current_pipe.is_loop = True
+    pipes, bounds = pipe_map.pipes, pipe_map.bounds
+    s_index = pipes.index(s_position.row, s_position.col)
+    pipes[s_index] = ord(s_char)
+
+    offsets = pipes.offsets
+    pipe_path: list[int] = []
+    index = s_index
+    came_from: int | None = None
+    while index != s_index or len(pipe_path) == 0:
+        pipe_path.append(index)
+        mapping = Pipe.PIPE_DIRECTION[pipes.char(index)]
+        direction = mapping[1] if came_from == mapping[0] else mapping[0]
+        came_from = OPPOSITE[direction]
+        index += offsets[direction]
+        bounds[index] = PipeBounds.PIPE.value
 
     return pipe_path
 
@@ -107,81 +99,56 @@ def flood_fill(pipe_map: PipeMap) -> int:
     Returns:
         int: how many tiles were filled
     """
-    visited_positions = set()
-    to_visit: list[Position] = [Position(0, 0)]
+    bounds = pipe_map.bounds
+    unknown, outside = PipeBounds.UNKNOWN.value, PipeBounds.OUTSIDE.value
+    start = bounds.index(0, 0)
+    if bounds[start] != unknown:
+        return 0
+    bounds[start] = outside
+    to_visit: list[int] = [start]
 
-    directions = list(Direction)
     num_outside = 0
     while len(to_visit) > 0:
-        position = to_visit.pop()
-
-        if position in visited_positions:
-            continue
-
-        # mark the position as outside
-        pipe: Pipe | None = pipe_map.get_pipe_safe(position)
-        if pipe is not None and not pipe.is_loop:
-            pipe.pipe_bounds = PipeBounds.OUTSIDE
-            num_outside += 1
-            for direction in directions:
-                new_position = position.next_position(direction)
-                to_visit.append(new_position)
-        visited_positions.add(position)
+        index = to_visit.pop()
+        num_outside += 1
+        # the border is already outside, so the fill stops there
+        for offset in bounds.offsets:
+            if bounds[index + offset] == unknown:
+                bounds[index + offset] = outside
+                to_visit.append(index + offset)
 
     return num_outside
 
 
-def process_big_input_line(row: int, line: str) -> list[Pipe]:
-    """Process a single line of input."""
-    return [
-        Pipe(row, col, char, is_loop=(char != " ")) for col, char in enumerate(line)
-    ]
-
-
 def expand_map(pipe_map: PipeMap) -> PipeMap:
     """Expands each pipe into a 3x3 tile."""
-    big_map = []
-
-    for row in pipe_map.pipes:
-        # three rows per original row:
-        big_rows = ["", "", ""]
-
-        for col in row:
-            big_pipe = expand_pipe(col.character, col.is_loop)
-
-            for row_idx, big_row in enumerate(big_pipe):
-                big_rows[row_idx] += big_row
-
-        big_map.extend(big_rows)
-
-    # now convert big_map into "nice" pipes:
-    pipes = [process_big_input_line(row, line) for row, line in enumerate(big_map)]
-
-    pipe_map = PipeMap(pipes)
-    return pipe_map
+    import numpy as np
+
+    # 3x3 tile of each character, as if it was part of the loop
+    tiles = np.full((256, 3, 3), ord(" "), dtype=np.uint8)
+    for character in Pipe.PIPE_DIRECTION:
+        if character != ".":
+            big_pipe = expand_pipe(character, True)
+            tiles[ord(character)] = [list(row.encode()) for row in big_pipe]
+
+    is_loop = pipe_map.bounds.interior() == PipeBounds.PIPE.value
+    characters = np.where(is_loop, pipe_map.pipes.interior(), ord(" "))
+    # (rows, cols, 3, 3) -> (rows, 3, cols, 3) -> (rows * 3, cols * 3)
+    big_tiles = tiles[characters].transpose(0, 2, 1, 3)
+    big_map = PipeMap(
+        Grid.from_view(big_tiles.reshape(pipe_map.height * 3, pipe_map.width * 3))
+    )
+    big_bounds = big_map.bounds.interior()
+    big_bounds[big_map.pipes.interior() != ord(" ")] = PipeBounds.PIPE.value
+    return big_map
 
 
 def reduce_map(big_map: PipeMap, small_map: PipeMap) -> PipeMap:
     """Converts from fat map back down to small map."""
-    rows = []
-    for row_idx in range(small_map.height):
-        row_tiles = []
-        big_map_row_idx = row_idx * 3 + 1
-        for col_idx in range(small_map.width):
-            big_map_col_idx = col_idx * 3 + 1
-            position = Position(big_map_row_idx, big_map_col_idx)
-            tile = big_map.get_pipe(position)
-            new_tile = Pipe(
-                row_idx,
-                col_idx,
-                tile.character,
-                is_loop=tile.is_loop,
-                pipe_bounds=tile.pipe_bounds,
-            )
-            row_tiles.append(new_tile)
-        rows.append(row_tiles)
-
-    return PipeMap(rows)
+    result = PipeMap(small_map.pipes.copy())
+    result.start = None  # the reduced map is drawn without ``S``
+    result.bounds.interior()[:] = big_map.bounds.interior()[1::3, 1::3]
+    return result
 
 
 def expand_pipe(character: str, is_loop: bool) -> tuple[str, str, str]:
@@ -233,33 +200,25 @@ def part2(pipe_map: PipeMap) -> int:
     """Finds tiles "inside" the loop."""
     find_cycles(pipe_map)
 
-    # print our map before we mutate it
-    print(pipe_map)
+    # show our map before we mutate it
+    output.visual(lambda: str(pipe_map))
 
     big_map: PipeMap = expand_map(pipe_map)
     # you can use this to view it lol.
-    with open("day10/big_unfilled.txt", "w", encoding="utf8") as file:
-        file.write(str(big_map))
+    output.write_file("day10/big_unfilled.txt", lambda: str(big_map))
 
     flood_fill(big_map)
-    with open("day10/big_filled.txt", "w", encoding="utf8") as file:
-        file.write(str(big_map))
+    output.write_file("day10/big_filled.txt", lambda: str(big_map))
 
     small_map: PipeMap = reduce_map(big_map, pipe_map)
 
-    pipes = small_map.pipes
-    total_unknown = 0
-    for row in pipes:
-        total_unknown += sum(
-            1 if col.pipe_bounds == PipeBounds.UNKNOWN else 0 for col in row
-        )
+    bounds = small_map.bounds.interior()
+    unknown = bounds == PipeBounds.UNKNOWN.value
+    total_unknown = int(unknown.sum())
 
     # extra step; mark unknown asn inside.
-    for row in pipes:
-        for col in row:
-            if col.pipe_bounds == PipeBounds.UNKNOWN:
-                col.pipe_bounds = PipeBounds.INSIDE
-    print(small_map)
+    bounds[unknown] = PipeBounds.INSIDE.value
+    output.visual(lambda: str(small_map))
 
     return total_unknown
 
@@ -0,0 +1,60 @@
+"""Synthetic input generator for day10."""
+import random
+
+from aoc.lib.synthetic import (
+    column_convex_loop,
+    random_grid,
+    random_walk,
+    render_grid,
+    scaled_side,
+    trace,
+)
+
+SIDE = 140
+JUNK = "|-LJ7F."
+JUNK_WEIGHTS = [1, 1, 1, 1, 1, 1, 2]
+# (row, col) offsets to the two neighbours a pipe connects
+PIPES = {
+    frozenset([(-1, 0), (1, 0)]): "|",
+    frozenset([(0, -1), (0, 1)]): "-",
+    frozenset([(-1, 0), (0, 1)]): "L",
+    frozenset([(-1, 0), (0, -1)]): "J",
+    frozenset([(1, 0), (0, -1)]): "7",
+    frozenset([(1, 0), (0, 1)]): "F",
+}
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """A single pipe loop surrounded by junk pipes; ``scale`` multiplies the area.
+
+    Junk next to ``S`` is cleared so that ``S`` only connects to the loop.
+    """
+    side = scaled_side(SIDE, scale, minimum=5)
+    grid = random_grid(rng, side, side, JUNK, JUNK_WEIGHTS)
+    mid = side // 2
+    columns = side - 3
+    tops = random_walk(rng, columns, 1, mid - 1, 3)
+    bottoms = random_walk(rng, columns, mid + 1, side - 2, 3)
+    loop = trace(column_convex_loop(tops, bottoms, [1] * columns))[:-1]
+    loop = [(row, col + 1) for row, col in loop]
+
+    for index, (row, col) in enumerate(loop):
+        prev_row, prev_col = loop[index - 1]
+        next_row, next_col = loop[(index + 1) % len(loop)]
+        offsets = frozenset(
+            [(prev_row - row, prev_col - col), (next_row - row, next_col - col)]
+        )
+        grid[row][col] = PIPES[offsets]
+
+    start_row, start_col = rng.choice(loop)
+    on_loop = set(loop)
+    for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        neighbour = (start_row + d_row, start_col + d_col)
+        if (
+            neighbour not in on_loop
+            and 0 <= neighbour[0] < side
+            and 0 <= neighbour[1] < side
+        ):
+            grid[neighbour[0]][neighbour[1]] = "."
+    grid[start_row][start_col] = "S"
+    return render_grid(grid)
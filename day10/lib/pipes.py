@@ -2,7 +2,8 @@
 from dataclasses import dataclass, field
 from typing import ClassVar
 
-from day10.lib.direction import Direction
+from aoc.lib.directions import Direction
+from aoc.lib.grid import Grid
 from day10.lib.pipebounds import PipeBounds
 from day10.lib.position import Position
 
@@ -17,11 +18,18 @@ PIPE_FONT = {
     "S": ["S", "S", "S", "S"],  # S is an "L" piece. manually done forehead
 }
 
+# how tiles that aren't part of the loop are drawn
+BOUNDS_FONT = {
+    PipeBounds.INSIDE: "*",
+    PipeBounds.OUTSIDE: ".",
+    PipeBounds.UNKNOWN: " ",
+    PipeBounds.PIPE: " ",
+}
 
 FONT = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Pipe:
     """The location and character representing the pipe."""
 
@@ -92,39 +100,75 @@ class Pipe:
 
     def __hash__(self) -> int:  # pragma: no cover
         """Custom hash function so we can compare pipes."""
-        return hash(f"{self.row},{self.col}")
+        return hash((self.row, self.col))
 
 
 @dataclass
 class PipeMap:
-    """A 2d array of pipes."""
+    """A 2d grid of pipe characters.
+
+    ``bounds`` holds the ``PipeBounds`` value of each tile, and the tiles
+    just outside the map are outside.
+    """
 
-    pipes: list[list[Pipe]]
+    pipes: Grid
 
+    bounds: Grid = field(init=False, repr=False)
+    start: int | None = field(init=False, repr=False)  # index of ``S``
     width: int = field(init=False, repr=False)
     height: int = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Pre-store width/height."""
-        self.width = len(self.pipes[0])
-        self.height = len(self.pipes)
+        """Pre-store width/height, find ``S`` and mark every tile unknown."""
+        self.width = self.pipes.num_cols
+        self.height = self.pipes.num_rows
+        self.bounds = Grid(
+            self.height,
+            self.width,
+            fill=PipeBounds.UNKNOWN.value,
+            border=PipeBounds.OUTSIDE.value,
+        )
+        starts = self.pipes.find(ord("S"))
+        self.start = starts[0] if starts else None
 
     def get_pipe(self, position: Position) -> Pipe:
         """Returns a pipe given its position."""
         if not self.is_in_map(position):
             raise ValueError(f"Position outside map {position}")
-        return self.pipes[position.row][position.col]
+        index = self.pipes.index(position.row, position.col)
+        bounds = PipeBounds(self.bounds[index])
+        return Pipe(
+            position.row,
+            position.col,
+            self.pipes.char(index),
+            is_loop=bounds == PipeBounds.PIPE,
+            pipe_bounds=bounds,
+        )
 
     def is_in_map(self, position: Position) -> bool:
         """Returns whether a position is in the map."""
-        return 0 <= position.row < self.height and 0 <= position.col < self.width
+        return self.pipes.in_bounds(position.row, position.col)
 
     def get_pipe_safe(self, position: Position) -> Pipe | None:
         """Gets a pipe or returns None if position is out of map."""
         if self.is_in_map(position):
-            return self.pipes[position.row][position.col]
+            return self.get_pipe(position)
         return None
 
     def __str__(self) -> str:
         """Human readable string of map."""
-        return "\n".join("".join(str(pipe) for pipe in line) for line in self.pipes)
+        import numpy as np
+
+        fonts = np.array(
+            [PIPE_FONT.get(chr(value), [" "] * 4)[FONT] for value in range(256)]
+        )
+        symbols = np.array([BOUNDS_FONT[bounds] for bounds in PipeBounds])
+        bounds = self.bounds.interior()
+        text = np.where(
+            bounds == PipeBounds.PIPE.value,
+            fonts[self.pipes.interior()],
+            symbols[bounds],
+        )
+        if self.start is not None:
+            text[self.pipes.row_col(self.start)] = "S"
+        return "\n".join("".join(row) for row in text.tolist())
@@ -0,0 +1,7 @@
+"""Runner hooks for day10."""
+from aoc.solution import Solution
+from day10.day10 import INPUT, part1, part2, read_input
+
+SOLUTION = Solution(
+    day=10, input_path=INPUT, parse=read_input, part1=part1, part2=part2
+)
@@ -2,11 +2,13 @@
 from dataclasses import dataclass, field
 from typing import Iterator
 
+from aoc.lib.grid import Grid
+
 INPUT = "day11/input.txt"
 INPUT_SMALL = "day11/input-small.txt"
 
 
-@dataclass
+@dataclass(slots=True)
 class Galaxy:
     """Galaxy represented as its position and unique id."""
 
@@ -34,33 +36,18 @@ class Galaxy:
         return result
 
 
-@dataclass
-class Point:
-    """Point represented by character and whether it is expanded."""
-
-    row: int
-    col: int
-    item: str
-    is_expanded: bool = field(default=False, init=False)
-
-    def get_point_distance(self, expansion_rate: int) -> int:
-        """Returns how big this "point" is based on if its expanded."""
-        if self.is_expanded:
-            return expansion_rate
-        return 1
-
-    def __str__(self) -> str:
-        """Show ``@`` if we're expanded, otherwise original value."""
-        if self.is_expanded:
-            return "@"
-        return self.item
+GALAXY = "#"
+EXPANDED = "@"
 
 
 @dataclass
 class Universe:
-    """Universe class; 2d array of . and #."""
+    """Universe class; 2d grid of ``.`` and ``#``.
 
-    contents: list[list[Point]]
+    Rows and columns without galaxies are marked ``@`` once expanded.
+    """
+
+    grid: Grid
     expansion_rate: int = 2
 
     num_rows: int = field(repr=False, init=False)
@@ -71,44 +58,34 @@ class Universe:
 
     def __post_init__(self) -> None:
         """Initialize num_rows/num_cols."""
-        self.num_rows = len(self.contents)
-        self.num_cols = len(self.contents[0])
+        self.num_rows = self.grid.num_rows
+        self.num_cols = self.grid.num_cols
 
-    def __getitem__(self, row_index: int) -> list[Point]:
-        """Returns index into a row.
+    def __getitem__(self, row_index: int) -> str:
+        """Returns a row.
 
         We can just use ``universe[row]``
-        instead of ``universe.contents[row]``
+        instead of ``universe.grid.rows()[row]``
         """
-        return self.contents[row_index]
+        start = self.grid.index(row_index % self.num_rows, 0)
+        return self.grid.cells[start : start + self.num_cols].decode("ascii")
 
-    def __iter__(self) -> Iterator[list[Point]]:
+    def __iter__(self) -> Iterator[str]:
         """Returns iterator over all rows.
 
         We can just use ``for row in universe``
-        instead of ``for row in universe.contents``
+        instead of ``for row in universe.grid.rows()``
         """
-        for row in self.contents:
-            yield row
+        yield from self.grid.rows()
 
     def expand_contents(self) -> None:
         """Expands the contents of the universe."""
-        expanded_rows = []
-        for row_index, row in enumerate(self.contents):
-            if is_empty(row):
-                for item in row:
-                    item.is_expanded = True
-                expanded_rows.append(row_index)
-
-        expanded_cols = []
-        col_index = 0
-        while col_index < len(self.contents[0]):
-            col = [row[col_index] for row in self.contents]
-            if is_empty(col):
-                for item in col:
-                    item.is_expanded = True
-                expanded_cols.append(col_index)
-            col_index += 1
+        cells = self.grid.interior()
+        galaxies = cells == ord(GALAXY)
+        expanded_rows: list[int] = (~galaxies.any(axis=1)).nonzero()[0].tolist()
+        expanded_cols: list[int] = (~galaxies.any(axis=0)).nonzero()[0].tolist()
+        cells[expanded_rows, :] = ord(EXPANDED)
+        cells[:, expanded_cols] = ord(EXPANDED)
 
         self.init_lookups(expanded_rows, expanded_cols)
 
@@ -134,35 +111,24 @@ class Universe:
 
     def grab_galaxies(self) -> list[Galaxy]:
         """Grabs all galaxies."""
-        results = []
-        galaxy_id = 0
-        for index_row, row in enumerate(self.contents):
-            for index_col, col in enumerate(row):
-                if col.item == "#":
-                    results.append(Galaxy(index_row, index_col, galaxy_id))
-                    galaxy_id += 1
-        return results
+        return [
+            Galaxy(*self.grid.row_col(index), galaxy_id)
+            for galaxy_id, index in enumerate(self.grid.find(ord(GALAXY)))
+        ]
 
     def __str__(self) -> str:
         """Custom string function to print this universe."""
-        return "\n".join("".join(str(col) for col in row) for row in self.contents)
+        return str(self.grid)
 
 
-def is_empty(items: list[Point]) -> bool:
-    """Returns True if all the content is ``.``."""
-    has_content = any(x.item == "#" for x in items)
-    return not has_content
+def is_empty(items: str) -> bool:
+    """Returns True if there are no galaxies (``#``)."""
+    return GALAXY not in items
 
 
 def parse_input(path: str) -> Universe:
     """Parse input file and return a universe."""
-    with open(path, "r", encoding="utf8") as file:
-        rows = []
-        for row, line in enumerate(file):
-            line = line.strip()
-            row_points = [Point(row, col, item) for col, item in enumerate(line)]
-            rows.append(row_points)
-        return Universe(rows)
+    return Universe(Grid.load(path))
 
 
 def get_total_distance(galaxies: list[Galaxy], universe: Universe) -> int:
@@ -175,9 +141,6 @@ def get_total_distance(galaxies: list[Galaxy], universe: Universe) -> int:
     return result
 
 
-import time
-
-
 def main() -> None:
     """Main function, runs q1 and q2."""
     universe: Universe = parse_input(INPUT)
@@ -0,0 +1,30 @@
+"""Synthetic input generator for day11."""
+import random
+
+from aoc.lib.synthetic import render_grid, scaled_side
+
+SIDE = 140
+GALAXY_CHANCE = 0.025
+EMPTY_CHANCE = 0.06
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Galaxy image; ``scale`` multiplies the area.
+
+    A few rows and columns are left empty so that expansion matters.
+    """
+    side = scaled_side(SIDE, scale)
+    empty_rows = {row for row in range(side) if rng.random() < EMPTY_CHANCE}
+    empty_cols = {col for col in range(side) if rng.random() < EMPTY_CHANCE}
+    grid = [
+        [
+            "#"
+            if row not in empty_rows
+            and col not in empty_cols
+            and rng.random() < GALAXY_CHANCE
+            else "."
+            for col in range(side)
+        ]
+        for row in range(side)
+    ]
+    return render_grid(grid)
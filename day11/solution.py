@@ -0,0 +1,29 @@
+"""Runner hooks for day11."""
+from aoc.solution import Solution
+from day11.day11 import INPUT, Galaxy, Universe, get_total_distance, parse_input
+
+
+def parse(path: str) -> tuple[Universe, list[Galaxy]]:
+    """Parse and expand the universe, then find its galaxies."""
+    universe: Universe = parse_input(path)
+    universe.expand_contents()
+    return universe, universe.grab_galaxies()
+
+
+def solve_part1(data: tuple[Universe, list[Galaxy]]) -> int:
+    """Total distance with an expansion rate of 2."""
+    universe, galaxies = data
+    universe.expansion_rate = 2
+    return get_total_distance(galaxies, universe)
+
+
+def solve_part2(data: tuple[Universe, list[Galaxy]]) -> int:
+    """Total distance with an expansion rate of 1000000."""
+    universe, galaxies = data
+    universe.expansion_rate = 1000000
+    return get_total_distance(galaxies, universe)
+
+
+SOLUTION = Solution(
+    day=11, input_path=INPUT, parse=parse, part1=solve_part1, part2=solve_part2
+)
@@ -26,10 +26,10 @@ def test_day11() -> None:
 def test_is_empty() -> None:
     """Tests is_empty function on universe."""
     universe: Universe = parse_input(INPUT_SMALL)
-    assert is_empty(universe.contents[3])
-    assert not is_empty(universe.contents[0])
-    assert not is_empty(universe.contents[1])
-    assert not is_empty(universe.contents[2])
+    assert is_empty(universe[3])
+    assert not is_empty(universe[0])
+    assert not is_empty(universe[1])
+    assert not is_empty(universe[2])
 
 
 def test_expansion() -> None:
@@ -1,11 +1,13 @@
 """day12 solution."""
 from dataclasses import dataclass, field
 
+from aoc.lib import budget, counters
+
 INPUT = "day12/input.txt"
 INPUT_SMALL = "day12/input-small.txt"
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     """Thes tate of a spring."""
 
@@ -35,13 +37,16 @@ class State:
         return hash(str(self.items) + ":" + str(self.broken_springs))
 
 
-@dataclass
+@dataclass(slots=True)
 class SpringLine:
     """Springline class."""
 
     items: str
     broken_springs: list[int]
     big_cache: dict[State, int] = field(init=False, repr=False, default_factory=dict)
+    hits: int = field(init=False, repr=False, default=0)
+    misses: int = field(init=False, repr=False, default=0)
+    track: bool = field(init=False, repr=False, default=False)
 
     def unfold(self) -> "SpringLine":
         """Makes it 5x bigger (part2)."""
@@ -50,11 +55,27 @@ class SpringLine:
     def calculate(self) -> int:
         """Brute force with backtracking lets go..."""
         first_state = State(self.items[:], self.broken_springs[:])
-        return self.calculate_recursive(first_state)
+        self.track = counters.enabled()
+        hits, misses = self.hits, self.misses
+        result = self.calculate_recursive(first_state)
+        counters.add("memo_hits", self.hits - hits)
+        counters.add("memo_misses", self.misses - misses)
+        return result
 
     def set_and_return(self, state: State, value: int) -> int:
         """Sets and returns in one line."""
+        if self.track:
+            self.misses += 1
         self.big_cache[state] = value
+        if not len(self.big_cache) & 0xFFF:  # every 4096 states
+            budget.check()
+        return value
+
+    def lookup(self, state: State) -> int | None:
+        """Memoized count of ``state``, if there is one."""
+        value = self.big_cache.get(state)
+        if value is not None and self.track:
+            self.hits += 1
         return value
 
     def calculate_recursive(self, state: State) -> int:
@@ -65,8 +86,8 @@ class SpringLine:
         3. state[0] == "." chop it and continue
         4. state[0] == "#". get next number, and "enforce" it, chopping things. If anything is wrong, fail
         """
-        if state in self.big_cache:
-            return self.big_cache[state]
+        if (memoized := self.lookup(state)) is not None:
+            return memoized
         if len(state.items) == 0:
             return self.set_and_return(state, state.valid())
         if state[0] == ".":
@@ -114,7 +135,16 @@ def get_input(path: str) -> list[SpringLine]:
 
 def calculate_sum(spring_lines: list[SpringLine]) -> int:
     """Calculates every spring line and then adds the totals."""
-    return sum(spring_line.calculate() for spring_line in spring_lines)
+    total = 0
+    for index, spring_line in enumerate(spring_lines):
+        fraction = index / len(spring_lines)
+        budget.check(fraction, total)
+        try:
+            total += spring_line.calculate()
+        except budget.BudgetExceeded:
+            # out of time partway through a line; report the lines done
+            raise budget.BudgetExceeded(fraction, total) from None
+    return total
 
 
 def main() -> None:
@@ -0,0 +1,46 @@
+"""Synthetic input generator for day12."""
+import math
+import random
+
+from aoc.lib.synthetic import scaled
+
+LINES = 1000
+LENGTH = 20
+UNKNOWN_CHANCE = 0.5
+
+
+def spring_row(rng: random.Random, length: int) -> tuple[str, list[int]]:
+    """Returns a fully known row of ``length`` springs and its broken groups."""
+    springs: list[str] = []
+    groups: list[int] = []
+    while len(springs) < length:
+        if springs and springs[-1] == "#" or rng.random() < 0.4:
+            springs.append(".")
+            continue
+        group = min(rng.randint(1, 6), length - len(springs))
+        springs.extend("#" * group)
+        groups.append(group)
+    if not groups:
+        springs[rng.randrange(length)] = "#"
+        groups.append(1)
+    return "".join(springs), groups
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Spring rows; ``scale`` grows both the row length and the row count.
+
+    Rows grow with ``sqrt(scale)`` and so does their count, so the total
+    input size grows with ``scale``. Long rows are where part2 gets hard.
+    """
+    growth = math.sqrt(scale)
+    max_length = max(3, round(LENGTH * growth))
+    lines: list[str] = []
+    for _ in range(scaled(LINES, growth)):
+        springs, groups = spring_row(
+            rng, rng.randint(max(1, max_length // 2), max_length)
+        )
+        masked = "".join(
+            "?" if rng.random() < UNKNOWN_CHANCE else spring for spring in springs
+        )
+        lines.append(masked + " " + ",".join(str(group) for group in groups))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,13 @@
+"""Runner hooks for day12."""
+from aoc.solution import Solution
+from day12.day12 import INPUT, SpringLine, calculate_sum, get_input
+
+
+def solve_part2(spring_lines: list[SpringLine]) -> int:
+    """Sum of arrangements once every line is unfolded."""
+    return calculate_sum([spring_line.unfold() for spring_line in spring_lines])
+
+
+SOLUTION = Solution(
+    day=12, input_path=INPUT, parse=get_input, part1=calculate_sum, part2=solve_part2
+)
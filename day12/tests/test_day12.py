@@ -1,4 +1,7 @@
 """day12 tests."""
+import pytest
+
+from aoc.lib import budget
 from day12.day12 import INPUT_SMALL, SpringLine, calculate_sum, get_input
 
 
@@ -28,3 +31,11 @@ def test_spring_line() -> None:
     unfolded = spring_line.unfold()
     assert unfolded.items == "???.###????.###????.###????.###????.###"
     assert unfolded.broken_springs == [1, 1, 3, 1, 1, 3, 1, 1, 3, 1, 1, 3, 1, 1, 3]
+
+
+def test_budget() -> None:
+    """A long line stops partway through once out of time."""
+    spring_line = SpringLine("?" * 30, [1, 2, 3]).unfold()
+    with budget.deadline(0), pytest.raises(budget.BudgetExceeded):
+        spring_line.calculate()
+    assert 0 < len(spring_line.big_cache) < 0x2000
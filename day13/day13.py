@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from aoc.lib.grid import load_grids, to_strings
+
 INPUT = "day13/input.txt"
 INPUT_SMALL = "day13/input-small.txt"
 
@@ -76,20 +78,7 @@ def read_input(path: str) -> list[Maze]:
     Returns:
         list[Maze]: list of well defined Mazes.
     """
-    mazes: list[Maze] = []
-    with open(path) as file:
-        lines: list[str] = []
-        for line in file:
-            if line.strip() == "":
-                maze = Maze(lines)
-                mazes.append(maze)
-                lines = []
-            else:
-                lines.append(line.strip())
-        maze = Maze(lines)
-        mazes.append(maze)
-
-    return mazes
+    return [Maze(to_strings(grid)) for grid in load_grids(path)]
 
 
 def main() -> None:
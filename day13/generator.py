@@ -0,0 +1,81 @@
+"""Synthetic input generator for day13."""
+import random
+
+from aoc.lib.synthetic import scaled
+
+PATTERNS = 100
+MIN_SIDE = 5
+MAX_SIDE = 17
+
+
+def mirror_lines(rows: list[str], smudges: int) -> list[int]:
+    """Horizontal mirror lines whose reflections differ in exactly ``smudges`` cells."""
+    result: list[int] = []
+    for line in range(1, len(rows)):
+        pairs = zip(reversed(rows[:line]), rows[line:])
+        total = sum(a != b for top, bottom in pairs for a, b in zip(top, bottom))
+        if total == smudges:
+            result.append(line)
+    return result
+
+
+def transpose(rows: list[str]) -> list[str]:
+    """Swaps rows and columns."""
+    return ["".join(chars) for chars in zip(*rows)]
+
+
+def has_single_mirrors(rows: list[str]) -> bool:
+    """Whether there is exactly one perfect and exactly one smudged mirror."""
+    return all(
+        len(mirror_lines(rows, smudges) + mirror_lines(transpose(rows), smudges)) == 1
+        for smudges in (0, 1)
+    )
+
+
+def pattern(rng: random.Random) -> list[str]:
+    """One pattern with a perfect column mirror and a smudged row mirror.
+
+    Rows mirror around a row line, and every row mirrors around a column
+    line. Flipping one cell that the column mirror doesn't reach, in a row
+    that the row mirror does, leaves exactly one smudge on the row mirror.
+    """
+    height = rng.randint(MIN_SIDE, MAX_SIDE)
+    width = rng.randint(MIN_SIDE, MAX_SIDE)
+    col_line = rng.choice([col for col in range(1, width) if 2 * col != width])
+    row_line = rng.randint(1, height - 1)
+
+    def mirror(index: int, line: int, size: int) -> int:
+        """Same value for an index and its reflection."""
+        reflected = 2 * line - 1 - index
+        return min(index, reflected) if 0 <= reflected < size else index
+
+    base = [[rng.choice("#.") for _ in range(width)] for _ in range(height)]
+    grid = [
+        [
+            base[mirror(row, row_line, height)][mirror(col, col_line, width)]
+            for col in range(width)
+        ]
+        for row in range(height)
+    ]
+    free_cols = [col for col in range(width) if not 0 <= 2 * col_line - 1 - col < width]
+    mirrored_rows = [
+        row for row in range(height) if 0 <= 2 * row_line - 1 - row < height
+    ]
+    row, col = rng.choice(mirrored_rows), rng.choice(free_cols)
+    grid[row][col] = "#" if grid[row][col] == "." else "."
+    rows = ["".join(chars) for chars in grid]
+    return transpose(rows) if rng.random() < 0.5 else rows
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Mirror patterns; ``scale`` multiplies the pattern count.
+
+    Like a real input, each pattern has exactly one perfect mirror and
+    exactly one mirror that is off by a single smudge.
+    """
+    patterns: list[str] = []
+    while len(patterns) < scaled(PATTERNS, scale):
+        rows = pattern(rng)
+        if has_single_mirrors(rows):
+            patterns.append("\n".join(rows))
+    return "\n\n".join(patterns) + "\n"
@@ -0,0 +1,18 @@
+"""Runner hooks for day13."""
+from aoc.solution import Solution
+from day13.day13 import INPUT, Maze, read_input
+
+
+def solve_part1(mazes: list[Maze]) -> int:
+    """Summarize perfect reflections."""
+    return sum(maze.solve(0) for maze in mazes)
+
+
+def solve_part2(mazes: list[Maze]) -> int:
+    """Summarize reflections with exactly one smudge."""
+    return sum(maze.solve(distance=1) for maze in mazes)
+
+
+SOLUTION = Solution(
+    day=13, input_path=INPUT, parse=read_input, part1=solve_part1, part2=solve_part2
+)
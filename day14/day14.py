@@ -1,9 +1,11 @@
 """day14 solution."""
 
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any
 
-from day14.lib.direction import Direction
+from aoc.lib.cycles import find_cycle, fingerprint
+from aoc.lib.directions import Direction
+from aoc.lib.grid import load_grid, to_strings
 
 INPUT_SMALL = "day14/input-small.txt"
 INPUT = "day14/input.txt"
@@ -14,19 +16,19 @@ class World:
     """2d array of boulders (square/round) and empty space."""
 
     data: Any
-    left_is: Direction = Direction.West
+    left_is: Direction = Direction.WEST
 
     score: int | None = None
 
     def rotate_world_cw(self) -> "World":
         """Rotate world clockwise."""
         rotated = list(zip(*self.data[::-1]))
-        return World(rotated, self.left_is.next_direction_ccw())
+        return World(rotated, self.left_is.counter_clockwise())
 
     def rotate_world_ccw(self) -> "World":
         """Rotate world anti-clockwise."""
         rotated = list(zip(*self.data))[::-1]
-        return World(rotated, self.left_is.next_direction_cw())
+        return World(rotated, self.left_is.clockwise())
 
     def __hash__(self) -> int:
         """Custom hash function for use with ``set()``."""
@@ -49,15 +51,15 @@ class World:
     def correct_side(self) -> "World":
         """Return world oriented with North at the top."""
         world = self
-        if world.left_is == Direction.West:
+        if world.left_is == Direction.WEST:
             return self
-        elif world.left_is == Direction.North:
+        elif world.left_is == Direction.NORTH:
             return world.rotate_world_cw()
-        elif world.left_is == Direction.East:
+        elif world.left_is == Direction.EAST:
             world = world.rotate_world_cw()
             world = world.rotate_world_cw()
             return world
-        elif world.left_is == Direction.South:
+        elif world.left_is == Direction.SOUTH:
             return world.rotate_world_ccw()
         raise AssertionError(f"Unsupported Direction: {world.left_is}")
 
@@ -110,19 +112,31 @@ def simulate_world(world_rows: list[list[str]]) -> list[list[str]]:
 
 def get_input(path: str) -> World:
     """Grabs input, rotated so that left is north."""
-    with open(path) as file:
-        lines = [line.strip() for line in file]
-
-    return World(lines)
+    return World(to_strings(load_grid(path)))
 
 
 def question1(world: World) -> int:
     """Returns world's score after rotating the world once."""
-    while world.left_is != Direction.North:
+    while world.left_is != Direction.NORTH:
         world = world.rotate_world_ccw()
     return sum(simulate_row(row)[1] for row in world.data)
 
 
+def spin(world: World) -> World:
+    """Rolls the boulders north, west, south then east.
+
+    ``world`` must have north on the left; so does the result.
+    """
+    for _ in range(4):
+        world = World(simulate_world(world.data), world.left_is).rotate_world_cw()
+    return world
+
+
+def world_key(world: World) -> int:
+    """Compact fingerprint of the boulders in a world."""
+    return fingerprint("".join("".join(row) for row in world.data).encode())
+
+
 def question2(world: World) -> int:
     """Finds a loop in world rotation.
 
@@ -135,52 +149,11 @@ def question2(world: World) -> int:
     Returns:
         int: "weight" to the north after 1000000000 cycles.
     """
-    cache: dict[World, int] = {}
-    cycle_results: list[World] = []
-
-    # starting state: left_is north
-    while world.left_is != Direction.North:
+    while world.left_is != Direction.NORTH:
         world = world.rotate_world_ccw()
-    world.data = simulate_world(world.data)
-
-    cycle_index = 0
-    cycle_start: Optional[int] = None
-    cycle_end: Optional[int] = None
-
-    while cycle_start is None and cycle_end is None:
-        for direction in [
-            Direction.North,  # left_is north
-            Direction.West,  # left_is west
-            Direction.South,  # left_is south
-            Direction.East,  # left_is east
-        ]:
-            if direction == Direction.East:  # calculate score *before*
-                if world in cache:
-                    cycle_start = cache[world]
-                    cycle_end = cycle_index
-                else:
-                    cache[world] = cycle_index
-                    cycle_results.append(world)
-            world = world.rotate_world_cw()
-            world.data = simulate_world(world.data)
-            world.score = world.get_score()
-
-        cycle_index += 1
-
-    if cycle_end is None or cycle_start is None:
-        raise AssertionError("cycle_end and cycle_end should not be None")
-
-    cycle_length = cycle_end - cycle_start
-    print(f"cycle length: {cycle_length}")
-
-    final_target = 1000000000
-    target = (final_target - cycle_start - 1) % cycle_length
-    result = cycle_results[cycle_start + target]
-
-    if result.score is None:
-        raise AssertionError("No score found!")
 
-    return result.score
+    cycle = find_cycle(world, spin, world_key)
+    return cycle.state_after(1000000000).get_score()
 
 
 def main() -> None:
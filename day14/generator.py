@@ -0,0 +1,12 @@
+"""Synthetic input generator for day14."""
+import random
+
+from aoc.lib.synthetic import random_grid, render_grid, scaled_side
+
+SIDE = 100
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Round and cube rocks; ``scale`` multiplies the area."""
+    side = scaled_side(SIDE, scale)
+    return render_grid(random_grid(rng, side, side, "O#.", [0.2, 0.15, 0.65]))
@@ -1 +0,0 @@
-"""day14 library modules."""
@@ -0,0 +1,7 @@
+"""Runner hooks for day14."""
+from aoc.solution import Solution
+from day14.day14 import INPUT, get_input, question1, question2
+
+SOLUTION = Solution(
+    day=14, input_path=INPUT, parse=get_input, part1=question1, part2=question2
+)
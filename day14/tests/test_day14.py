@@ -1,4 +1,5 @@
 """Tests for main day14 functions."""
+from aoc.lib.directions import Direction
 from day14.day14 import (
     INPUT_SMALL,
     World,
@@ -7,7 +8,6 @@ from day14.day14 import (
     question2,
     simulate_row,
 )
-from day14.lib.direction import Direction
 
 INPUT_ARROW = "day14/input-arrow.txt"
 
@@ -36,7 +36,7 @@ def test_rotate_world() -> None:
     """Test rotating the world."""
     world: World = get_input(INPUT_ARROW)
 
-    assert world.left_is == Direction.West
+    assert world.left_is == Direction.WEST
 
     ARROW_WEST = [
         (".", ".", ".", ".", ".", "."),
@@ -50,7 +50,7 @@ def test_rotate_world() -> None:
         (".", ".", ".", ".", ".", "."),
     ]
     assert world.rotate_world_ccw().data == ARROW_WEST
-    assert world.rotate_world_ccw().left_is == Direction.North
+    assert world.rotate_world_ccw().left_is == Direction.NORTH
 
     ARROW_SOUTH = [
         (".", ".", ".", ".", "#", ".", ".", ".", "."),
@@ -61,7 +61,7 @@ def test_rotate_world() -> None:
         (".", ".", ".", ".", "#", ".", ".", ".", "."),
     ]
     assert world.rotate_world_cw().rotate_world_cw().data == ARROW_SOUTH
-    assert world.rotate_world_cw().rotate_world_cw().left_is == Direction.East
+    assert world.rotate_world_cw().rotate_world_cw().left_is == Direction.EAST
 
     ARROW_EAST = [
         (".", ".", ".", ".", ".", "."),
@@ -76,7 +76,7 @@ def test_rotate_world() -> None:
     ]
 
     assert world.rotate_world_cw().data == ARROW_EAST
-    assert world.rotate_world_cw().left_is == Direction.South
+    assert world.rotate_world_cw().left_is == Direction.SOUTH
 
     world1 = world.rotate_world_cw().rotate_world_ccw()
     world2 = world.rotate_world_ccw()
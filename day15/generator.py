@@ -0,0 +1,27 @@
+"""Synthetic input generator for day15."""
+import random
+import string
+
+from aoc.lib.synthetic import scaled
+
+STEPS = 4000
+LABELS = 500
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Comma separated steps; ``scale`` multiplies steps and distinct labels.
+
+    There is no trailing newline; part1 hashes the raw text.
+    """
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(scaled(LABELS, scale))
+    ]
+    steps: list[str] = []
+    for _ in range(scaled(STEPS, scale)):
+        label = rng.choice(labels)
+        if rng.random() < 0.3:
+            steps.append(f"{label}-")
+        else:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps)
@@ -10,7 +10,7 @@ class AddRemove(IntEnum):
     Remove = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """well defined step."""
 
@@ -20,7 +20,7 @@ class Step:
     focal_length: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Lens:
     """Lens object."""
 
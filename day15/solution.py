@@ -0,0 +1,7 @@
+"""Runner hooks for day15."""
+from aoc.solution import Solution
+from day15.day15 import INPUT, get_input, question1, question2
+
+SOLUTION = Solution(
+    day=15, input_path=INPUT, parse=get_input, part1=question1, part2=question2
+)
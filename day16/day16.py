@@ -1,11 +1,9 @@
 """day16 solution."""
-
-
-import os
-
-from tqdm.contrib.concurrent import process_map
-
-from day16.lib.direction import Direction
+from aoc.lib import budget, shared
+from aoc.lib.counters import count_worker
+from aoc.lib.directions import Direction
+from aoc.lib.grid import Grid
+from aoc.lib.profiling import profile_worker
 from day16.lib.laser import Laser
 from day16.lib.parsers import get_input
 from day16.lib.world import World
@@ -13,16 +11,32 @@ from day16.lib.world import World
 INPUT = "day16/input.txt"
 INPUT_SMALL = "day16/input-small.txt"
 
+# the world a worker process solves, built once from the shared grid
+_world: World | None = None
+
 
 def solve_task(task: Laser, world: World) -> int:
     """Calculates number of energized tiles."""
     return world.solve(task).num_energized()
 
 
-def solve_task_wrapper(args: tuple[Laser, World]) -> int:
-    """Wraps solve_task in multiprocessing, since it only takes one arg."""
-    task, world = args
-    return solve_task(task, world)
+def init_world() -> None:
+    """Builds the world of a worker process from the shared grid."""
+    global _world
+    _world = World(Grid.from_view(shared.get("grid")))
+
+
+@count_worker
+@profile_worker
+def solve_task_wrapper(task: Laser) -> int | None:
+    """Solves one laser with the worker's world.
+
+    Returns None without solving once the time budget has run out.
+    """
+    if budget.expired():
+        return None
+    assert _world is not None, "init_world wasn't run"
+    return solve_task(task, _world)
 
 
 def part1(world: World) -> int:
@@ -39,19 +53,23 @@ def part2(world: World) -> int:
     # 1T -> 3.3s
     # 12T -> 1.1s
     for col in range(world.num_cols):
-        tasks.append((Laser(0, col, Direction.SOUTH), world))
-        tasks.append((Laser(world.num_rows - 1, col, Direction.NORTH), world))
+        tasks.append(Laser(0, col, Direction.SOUTH))
+        tasks.append(Laser(world.num_rows - 1, col, Direction.NORTH))
 
     for row in range(world.num_rows):
-        tasks.append((Laser(row, 0, Direction.EAST), world))
-        tasks.append((Laser(row, world.num_cols - 1, Direction.WEST), world))
-
-    cpu_count = os.cpu_count() or 1
-    chunk_size = (len(tasks) // cpu_count) + 1
-    results: list[int]
-    results = process_map(solve_task_wrapper, tasks, chunksize=chunk_size)  # type: ignore
-
-    return max(results)
+        tasks.append(Laser(row, 0, Direction.EAST))
+        tasks.append(Laser(row, world.num_cols - 1, Direction.WEST))
+
+    # workers get the grid once through shared memory, and just the lasers
+    grid = {"grid": world.grid.interior()}
+    results = shared.map_tasks(solve_task_wrapper, tasks, grid, init_world)
+
+    solved = [result for result in results if result is not None]
+    if len(solved) < len(results):
+        raise budget.BudgetExceeded(
+            len(solved) / len(results), max(solved, default=None)
+        )
+    return max(solved)
 
 
 def main() -> None:
@@ -0,0 +1,13 @@
+"""Synthetic input generator for day16."""
+import random
+
+from aoc.lib.synthetic import random_grid, render_grid, scaled_side
+
+SIDE = 110
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Mirrors and splitters on empty space; ``scale`` multiplies the area."""
+    side = scaled_side(SIDE, scale)
+    weights = [0.9, 0.025, 0.025, 0.025, 0.025]
+    return render_grid(random_grid(rng, side, side, ".|-/\\", weights))
@@ -1,18 +1,21 @@
 """Cell classes."""
-from abc import ABC, abstractmethod
-from typing import Callable, Dict, Type, TypeVar
+from typing import Callable, ClassVar, Dict, Type
 
-from day16.lib.direction import Direction
+from aoc.lib.directions import DIRECTIONS, EAST, MIRRORS, NORTH, SOUTH, WEST, Direction
 from day16.lib.laser import Laser
 
+# directions lasers leave a cell in, per direction they entered it in
+Exits = tuple[tuple[int, ...], ...]
 
-class Cell(ABC):
-    """Abstract cell class."""
+
+class Cell:
+    """Base cell class; each cell type says where lasers leave it in ``EXITS``."""
 
     contents: str
 
     # each cell can register itself to us
     CELL_TYPES: Dict[str, Type["Cell"]] = {}
+    EXITS: ClassVar[Exits]
 
     def __init__(self, contents: str):
         """Default constructor, sets our contents."""
@@ -38,89 +41,45 @@ class Cell(ABC):
         except KeyError:
             raise AssertionError(f"unrecognized content {contents}")
 
-    @abstractmethod
     def next_lasers(self, laser: Laser) -> list[Laser]:
         """Return next lasers given a laser entering this cell."""
-        raise AssertionError("Not supported", laser)
+        lasers = []
+        for direction in self.EXITS[laser.direction]:
+            row, col = Direction(direction).offset(laser.row, laser.col)
+            lasers.append(Laser(row, col, Direction(direction)))
+        return lasers
 
 
 @Cell.register_cell_type(".")
 class DotCell(Cell):
-    """A dot cell."""
+    """A dot cell; lasers pass directly through it."""
 
-    def next_lasers(self, laser: Laser) -> list[Laser]:
-        """Lasers pass directly through this tile."""
-        row, col = laser.direction.offset(laser.row, laser.col)
-        return [Laser(row, col, laser.direction)]
+    EXITS = tuple((direction,) for direction in DIRECTIONS)
 
 
 @Cell.register_cell_type("-")
 class DashCell(Cell):
-    """A ``-`` cell."""
+    """A ``-`` cell; lasers end up going east/west after passing through it."""
 
-    def next_lasers(self, laser: Laser) -> list[Laser]:
-        """Lasers must end up going east/west after passing through this cell."""
-        if laser.direction in [Direction.EAST, Direction.WEST]:
-            row, col = laser.direction.offset(laser.row, laser.col)
-            return [Laser(row, col, laser.direction)]
-        elif laser.direction in [Direction.NORTH, Direction.SOUTH]:
-            row, col = laser.row, laser.col
-            return [
-                Laser(row, col + 1, Direction.EAST),
-                Laser(row, col - 1, Direction.WEST),
-            ]
-        raise AssertionError(f"Unknown direction {laser.direction}")
+    EXITS = ((EAST, WEST), (EAST,), (EAST, WEST), (WEST,))
 
 
 @Cell.register_cell_type("|")
 class PipeCell(Cell):
-    """A ``|`` cell."""
+    """A ``|`` cell; lasers end up going north/south after passing through it."""
 
-    def next_lasers(self, laser: Laser) -> list[Laser]:
-        """Lasers must end up going north/south after passing through this cell."""
-        if laser.direction in [Direction.NORTH, Direction.SOUTH]:
-            row, col = laser.direction.offset(laser.row, laser.col)
-            return [Laser(row, col, laser.direction)]
-        elif laser.direction in [Direction.EAST, Direction.WEST]:
-            row, col = laser.row, laser.col
-            return [
-                Laser(row - 1, col, Direction.NORTH),
-                Laser(row + 1, col, Direction.SOUTH),
-            ]
-        raise AssertionError(f"Unknown direction {laser.direction}")
+    EXITS = ((NORTH,), (NORTH, SOUTH), (SOUTH,), (NORTH, SOUTH))
 
 
 @Cell.register_cell_type("/")
 class ForwardSlashCell(Cell):
-    """A ``/`` cell."""
+    """A ``/`` cell; lasers go diagonal mode."""
 
-    def next_lasers(self, laser: Laser) -> list[Laser]:
-        """Lasers go diagonal mode."""
-        row, col = laser.row, laser.col
-        if laser.direction == Direction.EAST:
-            return [Laser(row - 1, col, Direction.NORTH)]
-        if laser.direction == Direction.NORTH:
-            return [Laser(row, col + 1, Direction.EAST)]
-        if laser.direction == Direction.SOUTH:
-            return [Laser(row, col - 1, Direction.WEST)]
-        if laser.direction == Direction.WEST:
-            return [Laser(row + 1, col, Direction.SOUTH)]
-        raise AssertionError(f"Unknown direction {laser.direction}")
+    EXITS = tuple((direction,) for direction in MIRRORS["/"])
 
 
 @Cell.register_cell_type("\\")
 class BackSlashCell(Cell):
-    r"""A ``\`` cell."""
+    r"""A ``\`` cell; lasers go diagonal mode."""
 
-    def next_lasers(self, laser: Laser) -> list[Laser]:
-        """Lasers go diagonal mode."""
-        row, col = laser.row, laser.col
-        if laser.direction == Direction.EAST:
-            return [Laser(row + 1, col, Direction.SOUTH)]
-        if laser.direction == Direction.SOUTH:
-            return [Laser(row, col + 1, Direction.EAST)]
-        if laser.direction == Direction.NORTH:
-            return [Laser(row, col - 1, Direction.WEST)]
-        if laser.direction == Direction.WEST:
-            return [Laser(row - 1, col, Direction.NORTH)]
-        raise AssertionError(f"Unknown direction {laser.direction}")
+    EXITS = tuple((direction,) for direction in MIRRORS["\\"])
@@ -1,10 +1,10 @@
 """laser instance class."""
 from dataclasses import dataclass
 
-from day16.lib.direction import Direction
+from aoc.lib.directions import Direction
 
 
-@dataclass(frozen=True)  # frozen so we can hash
+@dataclass(frozen=True, slots=True)  # frozen so we can hash
 class Laser:
     """Laser position + direction."""
 
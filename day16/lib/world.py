@@ -1,83 +1,99 @@
 """Well defined world classes."""
 from dataclasses import dataclass, field
 
-from day16.lib.cells import Cell
+from aoc.lib import counters
+from aoc.lib.grid import BORDER, Grid
+from day16.lib.cells import Cell, Exits
 from day16.lib.laser import Laser
 
 
 class SolvedWorld:
-    """A solved world class, stores how many lasers are in each tile."""
+    """A solved world class, stores which lasers passed through each tile.
 
-    data: list[list[list[Laser]]]
+    Each cell holds a bitmask with one bit per direction a laser left it in.
+    """
+
+    grid: Grid
 
     def __init__(self, num_rows: int, num_cols: int):
-        """Initialises empty 2d array of lists of lasers."""
-        self.data = [[[] for _ in range(num_cols)] for _ in range(num_rows)]
+        """Initialises an empty grid of bitmasks."""
+        self.grid = Grid(num_rows, num_cols, fill=0)
 
     def already_solved(self, laser: Laser) -> bool:
         """Returns true if laser already calculated."""
-        solutions = self.data[laser.row][laser.col]
-        if laser in solutions:
-            return True
-        return False
+        index = self.grid.index(laser.row, laser.col)
+        return bool(self.grid[index] & (1 << laser.direction))
 
     def add_laser(self, laser: Laser) -> None:
         """Adds laser to cell."""
-        solutions = self.data[laser.row][laser.col]
-        solutions.append(laser)
+        index = self.grid.index(laser.row, laser.col)
+        self.grid[index] |= 1 << laser.direction
 
     def __str__(self) -> str:
         """Custom str to show how many lasers on each tile."""
-        row_strs = []
-        for row in self.data:
-            row_str = "".join(str(len(col)) for col in row)
-            row_strs.append(row_str)
-        return "\n".join(row_strs)
+        return "\n".join(
+            "".join(str(ord(bits).bit_count()) for bits in row)
+            for row in self.grid.rows()
+        )
+
+    def num_lasers(self) -> int:
+        """Return number of (tile, direction) pairs lasers passed through."""
+        return sum(bits.bit_count() for bits in self.grid.cells)
 
     def num_energized(self) -> int:
         """Return number of energized cells."""
-        result: int = 0
-        for row in self.data:
-            result += sum(1 if len(col) >= 1 else 0 for col in row)
-        return result
+        return self.grid.num_rows * self.grid.num_cols - self.grid.count(0)
 
 
 @dataclass
 class World:
-    """The input world (mirrors/empty tiles)."""
+    """The input world (mirrors/empty tiles), as a grid of characters."""
 
-    data: list[list[Cell]]
+    grid: Grid
 
     num_rows: int = field(init=False, repr=False)
     num_cols: int = field(init=False, repr=False)
+    cells: dict[int, Cell] = field(init=False, repr=False)
+    exits: dict[int, Exits] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Initializes our num_rows/num_cols."""
-        self.num_rows = len(self.data)
-        self.num_cols = len(self.data[0])
+        """Initializes our num_rows/num_cols and the cell for each character."""
+        self.num_rows = self.grid.num_rows
+        self.num_cols = self.grid.num_cols
+        self.cells = {
+            ord(char): Cell.construct(char)
+            for char in {chr(value) for value in self.grid.cells} - {chr(BORDER)}
+        }
+        self.exits = {value: cell.EXITS for value, cell in self.cells.items()}
 
     def solve(self, start_laser: Laser) -> SolvedWorld:
-        """Solve our world."""
+        """Solve our world.
+
+        Lasers are ``index << 2 | direction`` ints rather than ``Laser``
+        objects, and each cell's exits are looked up instead of computed.
+        """
+        grid, offsets, exits = self.grid, self.grid.offsets, self.exits
         solved_world = SolvedWorld(self.num_rows, self.num_cols)
-        active_lasers = [start_laser]
-        while len(active_lasers) > 0:
-            laser = active_lasers.pop(0)
-            if self.is_oob(laser):
+        solved = solved_world.grid.cells
+        start = grid.index(start_laser.row, start_laser.col)
+        active_lasers = [start << 2 | start_laser.direction]
+        hits = 0
+        while active_lasers:
+            laser = active_lasers.pop()
+            index, direction = laser >> 2, laser & 3
+            value = grid.cells[index]
+            if value == BORDER:  # just left the world
                 continue
-            if solved_world.already_solved(laser):
+            if solved[index] & (1 << direction):
+                hits += 1
                 continue
-            solved_world.add_laser(laser)
-
-            cell: Cell = self.data[laser.row][laser.col]
-            next_lasers = cell.next_lasers(laser)
-            active_lasers.extend(next_lasers)
+            solved[index] |= 1 << direction
+
+            for exit_direction in exits[value][direction]:
+                active_lasers.append(
+                    (index + offsets[exit_direction]) << 2 | exit_direction
+                )
+        counters.add("memo_hits", hits)
+        if counters.enabled():
+            counters.add("lasers_traced", solved_world.num_lasers())
         return solved_world
-
-    def is_oob(self, laser: Laser) -> bool:
-        """True if laser is out of bounds."""
-        return (
-            laser.row < 0
-            or laser.row >= self.num_rows
-            or laser.col < 0
-            or laser.col >= self.num_cols
-        )
@@ -0,0 +1,13 @@
+"""Runner hooks for day16."""
+from aoc.solution import Solution
+from day16.day16 import INPUT, part1, part2
+from day16.lib.parsers import get_input
+
+SOLUTION = Solution(
+    day=16,
+    input_path=INPUT,
+    parse=get_input,
+    part1=part1,
+    part2=part2,
+    forking_parts=(2,),
+)
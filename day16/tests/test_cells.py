@@ -1,4 +1,5 @@
 """Tests for each cell."""
+from aoc.lib.directions import Direction
 from day16.lib.cells import (
     BackSlashCell,
     Cell,
@@ -7,7 +8,6 @@ from day16.lib.cells import (
     ForwardSlashCell,
     PipeCell,
 )
-from day16.lib.direction import Direction
 from day16.lib.laser import Laser
 
 WEST_LASER = Laser(5, 4, Direction.WEST)
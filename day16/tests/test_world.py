@@ -1,8 +1,8 @@
 """Test World class."""
 from typing import TYPE_CHECKING
 
+from aoc.lib.directions import Direction
 from day16.day16 import INPUT_SMALL
-from day16.lib.direction import Direction
 from day16.lib.laser import Laser
 from day16.lib.parsers import get_input
 
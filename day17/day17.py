@@ -1,8 +1,7 @@
 """day17 solution."""
 from typing import Optional
 
-from colorama import Back
-
+from aoc.lib import output
 from day17.lib.classes import Step, WorldPart1, WorldPart2
 from day17.lib.parsers import get_input
 
@@ -11,18 +10,25 @@ INPUT_SMALL = "day17/input-small.txt"
 INPUT_PT2 = "day17/input-pt2.txt"
 
 
-def solve_and_print(world: WorldPart1) -> int:
-    """Solve and print."""
-    result = world.solve()
+def render_path(world: WorldPart1, result: Step) -> str:
+    """The world's costs, with the path to ``result`` highlighted."""
+    from colorama import Back
+
     world_string = [[str(val) for val in row] for row in world.costs]
 
     step: Optional[Step] = result
     while step is not None:
-        output_str = Back.GREEN + str(step.direction) + Back.BLACK
+        output_str = Back.GREEN + step.direction.arrow + Back.BLACK
         world_string[step.row][step.col] = output_str
         step = step.src_step
 
-    print("\n".join("".join(val for val in row) for row in world_string))
+    return "\n".join("".join(val for val in row) for row in world_string)
+
+
+def solve_and_print(world: WorldPart1) -> int:
+    """Solve, and show the path when visual output is on."""
+    result = world.solve()
+    output.visual(lambda: render_path(world, result))
     return result.total_cost
 
 
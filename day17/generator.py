@@ -0,0 +1,12 @@
+"""Synthetic input generator for day17."""
+import random
+
+from aoc.lib.synthetic import random_grid, render_grid, scaled_side
+
+SIDE = 141
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Heat loss digits; ``scale`` multiplies the area."""
+    side = scaled_side(SIDE, scale, minimum=5)
+    return render_grid(random_grid(rng, side, side, "123456789", [1.0] * 9))
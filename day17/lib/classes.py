@@ -1,12 +1,13 @@
 """classes for day 17."""
 from dataclasses import dataclass, field
-from queue import PriorityQueue
-from typing import Optional
+from typing import ClassVar, Optional
 
-from day17.lib.direction import ALL_DIRECTIONS, Direction
+from aoc.lib import search
+from aoc.lib.directions import DIRECTIONS, OPPOSITE, Direction
+from aoc.lib.grid import Grid
 
 
-@dataclass(order=True, frozen=True)
+@dataclass(order=True, frozen=True, slots=True)
 class Step:
     """Represents one "step", which could be a multi-step."""
 
@@ -19,189 +20,119 @@ class Step:
     src_step: Optional["Step"] = field(repr=False, hash=False)
 
 
-class TileCache:
-    """A cache of shortest routes to a tile from each direction."""
-
-    cache: dict[Direction, list[Step | None]]
-    cache_min: int  # min steps in direction
-    cache_max: int  # max steps in direction
-
-    def __init__(self, cache_min: int, cache_max: int):
-        """Initialize the tile with an empty entry from each direction."""
-        cache_length = cache_max - cache_min + 1
-        self.cache = {key: [None] * cache_length for key in ALL_DIRECTIONS}
-        self.cache_min = cache_min
-        self.cache_max = cache_max
-
-    def __getitem__(self, dir_steps: tuple[Direction, int]) -> Step | None:
-        """Lookup our cache based on how many steps in one direction we took to get here."""
-        direction, steps = dir_steps
-        return self.cache[direction][steps - self.cache_min]
-
-    def __setitem__(self, dir_steps: tuple[Direction, int], item: Step) -> None:
-        """Set steps based on how many steps in one direction we took to get here."""
-        direction, steps = dir_steps
-        self.cache[direction][steps - self.cache_min] = item
-
-
-class SolutionCache:
-    """2d array of tilecaches."""
-
-    cache: list[list[TileCache]]
-
-    def __init__(self, num_rows: int, num_cols: int, cache_min: int, cache_max: int):
-        """Generate empty tile cache."""
-        self.cache = [
-            [TileCache(cache_min, cache_max) for _ in range(num_cols)]
-            for _ in range(num_rows)
-        ]
-
-    def add_solution(self, step: Step) -> bool:
-        """Adds solution to cache returns whether an improvement was made."""
-        tile_cache = self.cache[step.row][step.col]
-        existing_item = tile_cache[step.direction, step.consecutive_steps]
-        if existing_item is None:
-            tile_cache[step.direction, step.consecutive_steps] = step
-            return True
-
-        # due to the way that we run in BFS, we shouldn't be getting
-        # into this branch
-        if step.total_cost < existing_item.total_cost:
-            raise AssertionError("this shouldn't be possible")
-            # tile_cache[step.direction, step.consecutive_steps] = step
-            # return True
-        return False
-
-
 @dataclass
 class WorldPart1:
-    """World for part1."""
+    """World for part1.
+
+    Costs are kept in a ``Grid`` whose border cells cost 0, which marks
+    them as off the map.
+    """
+
+    # most cells in a row in one direction, and how far a turn moves
+    MAX_STEPS: ClassVar[int] = 3
+    TURN_STEPS: ClassVar[int] = 1
 
     costs: list[list[int]]
+    grid: Grid = field(init=False, repr=False)
     num_rows: int = field(init=False)
     num_cols: int = field(init=False)
 
     def __post_init__(self) -> None:
         """Post initialize cached properties."""
-        self.num_rows = len(self.costs)
-        self.num_cols = len(self.costs[0])
+        self.grid = Grid.from_rows(self.costs)
+        self.num_rows = self.grid.num_rows
+        self.num_cols = self.grid.num_cols
 
     def __getitem__(self, row_col: tuple[int, int]) -> int | None:
-        """Returns cost at given row/col."""
+        """Returns cost at given row/col, or None just off the map."""
         row, col = row_col
-        if self.is_oob(row, col):
-            return None
-        return self.costs[row][col]
-
-    def create_step(self, step: Step, direction: Direction) -> Step | None:
-        """Create step from previous step and a given direction.
-
-        Returns None if the step is invalid or suboptimal
-        """
-        row, col = direction.offset(step.row, step.col)
-        if (cost := self[row, col]) is None:
-            return None
-
-        if direction == step.direction.opposite():
-            return None
-        if direction == step.direction:
-            consecutive = step.consecutive_steps + 1
-            if consecutive > 3:
-                return None
-        else:
-            consecutive = 1
-
-        return Step(step.total_cost + cost, row, col, direction, consecutive, step)
-
-    def solve(self) -> Step:
-        """Solve using dynamic programming.
-
-        Returns final step which contains src steps;
-        so we have the entire path
-        """
-        # we need to do this via DP
-        solution_cache = SolutionCache(self.num_rows, self.num_cols, 1, 3)
-        step: Step = Step(0, 0, 0, Direction.NORTH, 0, None)
-        steps_to_explore: PriorityQueue[Step] = PriorityQueue()
-        steps_to_explore.put(step)
-
-        while not steps_to_explore.empty():
-            step = steps_to_explore.get()
-            if step.row == self.num_rows - 1 and step.col == self.num_cols - 1:
-                return step  # result!
-            if not solution_cache.add_solution(step):
+        return self.grid[self.grid.index(row, col)] or None
+
+    def state(self, index: int, direction: int, consecutive: int) -> int:
+        """Encodes a cell, the direction we entered it in and the run length."""
+        return (index * 4 + direction) * (self.MAX_STEPS + 1) + consecutive
+
+    def split_state(self, state: int) -> tuple[int, int, int]:
+        """Decodes a state into ``(index, direction, consecutive)``."""
+        cell_direction, consecutive = divmod(state, self.MAX_STEPS + 1)
+        index, direction = divmod(cell_direction, 4)
+        return index, direction, consecutive
+
+    def next_states(self, state: int) -> list[tuple[int, int]]:
+        """States reachable from ``state`` in one move, with their costs."""
+        cells, offsets = self.grid.cells, self.grid.offsets
+        max_steps, turn_steps = self.MAX_STEPS, self.TURN_STEPS
+        run_lengths = max_steps + 1
+        cell_direction, consecutive = divmod(state, run_lengths)
+        index, direction = divmod(cell_direction, 4)
+        result = []
+        for new_direction in DIRECTIONS:
+            if new_direction == OPPOSITE[direction]:
                 continue
+            offset = offsets[new_direction]
+            if new_direction == direction:
+                if consecutive == max_steps:
+                    continue
+                new_index = index + offset
+                if cost := cells[new_index]:  # the border costs 0
+                    result.append((state + 4 * run_lengths * offset + 1, cost))
+                continue
+            cost = self.move_cost(index, offset, turn_steps)
+            if cost >= 0:
+                new_index = index + offset * turn_steps
+                new_state = (new_index * 4 + new_direction) * run_lengths + turn_steps
+                result.append((new_state, cost))
+        return result
 
-            for direction in ALL_DIRECTIONS:
-                if (new_step := self.create_step(step, direction)) is not None:
-                    steps_to_explore.put(new_step)
-
-        raise AssertionError("No solution found!")
-
-    def is_oob(self, row: int, col: int) -> bool:
-        """Returns if we are out of bounds.
-
-        Args:
-            row (int): row to check
-            col (int): col to check
+    def solve(self) -> Step:
+        """Solve using Dijkstra's algorithm.
 
-        Returns:
-            bool: if we are out of bounds.
+        States are ints encoding the cell, the direction we entered it in
+        and how many cells in a row we've moved that way. Returns final
+        step which contains src steps; so we have the entire path
         """
-        return row < 0 or row >= self.num_rows or col < 0 or col >= self.num_cols
+        end = self.grid.index(self.num_rows - 1, self.num_cols - 1)
+        start = self.state(self.grid.index(0, 0), Direction.NORTH, 0)
+        result = search.dijkstra(
+            [start],
+            self.next_states,
+            lambda state: state // (4 * (self.MAX_STEPS + 1)) == end,
+        )
+        if result.goal is None:
+            raise AssertionError("No solution found!")
+        return self.build_path(result)
+
+    def move_cost(self, index: int, offset: int, distance: int) -> int:
+        """Cost of moving ``distance`` cells from ``index``; -1 if off the map."""
+        cells = self.grid.cells
+        cost = 0
+        for _ in range(distance):
+            index += offset
+            if not cells[index]:  # the border costs 0
+                return -1
+            cost += cells[index]
+        return cost
+
+    def build_path(self, result: search.SearchResult) -> Step:
+        """Converts the states leading to the goal into a chain of steps."""
+        step: Step | None = None
+        for state in result.path():
+            index, direction, consecutive = self.split_state(state)
+            row, col = self.grid.row_col(index)
+            step = Step(
+                result.distances[state],
+                row,
+                col,
+                Direction(direction),
+                consecutive,
+                step,
+            )
+        assert step is not None
+        return step
 
 
 class WorldPart2(WorldPart1):
     """Extension of part1 with a few overrides."""
 
-    def create_step(self, step: Step, direction: Direction) -> Step | None:
-        """Create step from previous step and a given direction."""
-        if direction == step.direction.opposite():
-            return None
-        if direction == step.direction:
-            row, col = direction.offset(step.row, step.col)
-            cost = self[row, col]
-            if cost is None:
-                return None
-            consecutive = step.consecutive_steps + 1
-            if consecutive > 10:
-                return None
-            return Step(step.total_cost + cost, row, col, direction, consecutive, step)
-        else:
-            consecutive = 4
-            row_cols = direction.offset_list(step.row, step.col)
-            multi_cost = 0
-            for row_col in row_cols:
-                row, col = row_col
-                cost = self[row, col]
-                if cost is None:
-                    return None
-                multi_cost += cost
-
-            return Step(
-                step.total_cost + multi_cost, row, col, direction, consecutive, step
-            )
-
-    def solve(self) -> Step:
-        """Solve using DP.
-
-        Returns final step which contains src steps;
-        so we have the entire path
-        """
-        # we need to do this via DP
-        solution_cache = SolutionCache(self.num_rows, self.num_cols, 4, 10)
-        step: Step = Step(0, 0, 0, Direction.NORTH, 0, None)
-        steps_to_explore: PriorityQueue[Step] = PriorityQueue()
-        steps_to_explore.put(step)
-
-        while not steps_to_explore.empty():
-            step = steps_to_explore.get()
-            if step.row == self.num_rows - 1 and step.col == self.num_cols - 1:
-                return step  # result!
-            if not solution_cache.add_solution(step):
-                continue
-
-            for direction in ALL_DIRECTIONS:
-                if (new_step := self.create_step(step, direction)) is not None:
-                    steps_to_explore.put(new_step)
-        raise AssertionError("No solution found!")
+    MAX_STEPS = 10
+    TURN_STEPS = 4
@@ -1,10 +1,7 @@
 """parse input file."""
+from aoc.lib.grid import load_grid, to_digits
 
 
 def get_input(path: str) -> list[list[int]]:
     """Convert input into world dataclass."""
-    with open(path, "r", encoding="utf8") as file:
-        data: list[list[int]] = []
-        for line in file:
-            data.append([int(char) for char in line.strip()])
-        return data
+    return to_digits(load_grid(path))
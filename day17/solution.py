@@ -0,0 +1,6 @@
+"""Runner hooks for day17."""
+from aoc.solution import Solution
+from day17.day17 import INPUT, part1, part2
+from day17.lib.parsers import get_input
+
+SOLUTION = Solution(day=17, input_path=INPUT, parse=get_input, part1=part1, part2=part2)
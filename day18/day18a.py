@@ -2,15 +2,17 @@
 
 from dataclasses import dataclass
 from enum import StrEnum
-from queue import Queue
 
+from aoc.lib import output, search
+from aoc.lib.directions import COL_DELTAS, EAST, NORTH, ROW_DELTAS, SOUTH, WEST
+from aoc.lib.grid import BORDER, Grid
 from day18.lib.tile import EdgeTile, HoleTile, Tile
 
 INPUT = "day18/input.txt"
 INPUT_SMALL = "day18/input-small.txt"
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Simple 2d point."""
 
@@ -35,7 +37,16 @@ class Direction(StrEnum):
         return self.name
 
 
-@dataclass(frozen=True)
+# compass direction (see ``aoc.lib.directions``) of each ``UDLR`` direction
+COMPASS = {
+    Direction.Up: NORTH,
+    Direction.Right: EAST,
+    Direction.Down: SOUTH,
+    Direction.Left: WEST,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Command:
     """Well defined command dataclass."""
 
@@ -54,27 +65,26 @@ def generate_offsets(
         direction (Direction): direction of travel
         steps (int): number of steps to generate
 
-    Raises:
-        AssertionError: If direciton is invalid.
-
     Returns:
         list[Position]: list of new positions.
     """
-    if direction == Direction.Right:
-        return [Position(position.row, position.col + i) for i in range(1, steps + 1)]
-    if direction == Direction.Left:
-        return [Position(position.row, position.col - i) for i in range(1, steps + 1)]
-    if direction == Direction.Down:
-        return [Position(position.row + i, position.col) for i in range(1, steps + 1)]
-    if direction == Direction.Up:
-        return [Position(position.row - i, position.col) for i in range(1, steps + 1)]
-    raise AssertionError(f"Direction not supported{direction}")
+    compass = COMPASS[direction]
+    row_delta, col_delta = ROW_DELTAS[compass], COL_DELTAS[compass]
+    return [
+        Position(position.row + row_delta * i, position.col + col_delta * i)
+        for i in range(1, steps + 1)
+    ]
 
 
 class Matrix:
-    """2d array representing world."""
+    """2d array representing world.
+
+    ``contents`` holds the tiles to print, and ``grid`` the character of
+    each tile for the flood fill to search.
+    """
 
     contents: list[list[Tile]]
+    grid: Grid
 
     min_pos: Position
     max_pos: Position
@@ -92,6 +102,7 @@ class Matrix:
         self.contents = [
             [Tile() for _ in range(self.num_cols)] for _ in range(self.num_rows)
         ]
+        self.grid = Grid(self.num_rows, self.num_cols, fill=ord(Tile.contents))
 
     def process_command(self, miner_pos: Position, command: Command) -> Position:
         """Process command.
@@ -109,49 +120,35 @@ class Matrix:
         self.wall_tiles += len(offsets)
         for offset in offsets:
             self.contents[offset.row][offset.col] = EdgeTile(color=command.color)
+            self.grid[self.grid.index(offset.row, offset.col)] = ord(EdgeTile.contents)
         return offsets[-1]
 
     def dig_out(self) -> None:
         """Dig out non-perimeter tiles using flood-fill."""
-        # cache for what's been visited
-        visited: list[list[bool]] = [
-            [False for _ in range(self.num_cols)] for _ in range(self.num_rows)
-        ]
-
-        # list of nodes to explore
-        to_process: Queue[Position] = Queue()
-        to_process.put(Position(self.num_rows // 2, self.num_cols // 2))
-
-        while not to_process.empty():
-            position: Position = to_process.get()
-            if self.is_oob(position):
-                raise AssertionError("pre-allocated matrix shouldn't cause OOB")
-            if visited[position.row][position.col]:
-                continue
-            if self.contents[position.row][position.col].contents != ".":
-                continue
-            self.contents[position.row][position.col] = HoleTile()
-            visited[position.row][position.col] = True
-            self.dug_tiles += 1
-
-            for direction in Direction:
-                to_process.put(generate_offsets(position, direction, 1)[0])
-
-    def is_oob(self, position: Position) -> bool:
-        """Returns if a position is out of bounds.
-
-        Args:
-            position (Position): position to check.
-
-        Returns:
-            bool: True if out of bounds.
-        """
-        return (
-            position.row < 0
-            or position.row >= self.num_rows
-            or position.col < 0
-            or position.col >= self.num_cols
-        )
+        grid = self.grid
+        cells, offsets = grid.cells, grid.offsets
+        ground, hole = ord(Tile.contents), ord(HoleTile.contents)
+
+        def neighbours(index: int) -> list[int]:
+            result = []
+            for offset in offsets:
+                if cells[index + offset] == BORDER:
+                    raise AssertionError("pre-allocated matrix shouldn't cause OOB")
+                if cells[index + offset] == ground:
+                    result.append(index + offset)
+            return result
+
+        start = grid.index(self.num_rows // 2, self.num_cols // 2)
+        starts = [start] if cells[start] == ground else []
+        dug = list(search.bfs(starts, neighbours).distances)
+        for index in dug:
+            cells[index] = hole
+
+        hole_tile = HoleTile()
+        for index in dug:
+            row, col = grid.row_col(index)
+            self.contents[row][col] = hole_tile
+        self.dug_tiles += len(dug)
 
     def __str__(self) -> str:
         """Custom __str__ for pretty printing matrix."""
@@ -208,13 +205,14 @@ def get_solution(commands: list[Command]) -> int:
     for command in commands:
         position = matrix.process_command(position, command)
 
-    print(matrix)
+    output.visual(lambda: str(matrix))
     matrix.dig_out()
-    print("\n" * 10)
-    print(matrix)
-    print(f"Dug: {matrix.dug_tiles}")
-    print(f"Wall: {matrix.wall_tiles}")
-    print(f"Total: {matrix.dug_tiles + matrix.wall_tiles}")
+    output.visual(lambda: "\n" * 10 + str(matrix))
+    output.verbose(
+        lambda: f"Dug: {matrix.dug_tiles}\n"
+        f"Wall: {matrix.wall_tiles}\n"
+        f"Total: {matrix.dug_tiles + matrix.wall_tiles}"
+    )
     return matrix.dug_tiles + matrix.wall_tiles
 
 
@@ -2,11 +2,13 @@
 from dataclasses import dataclass
 from enum import IntEnum
 
+from aoc.lib.directions import COL_DELTAS, EAST, NORTH, ROW_DELTAS, SOUTH, WEST
+
 INPUT = "day18/input.txt"
 INPUT_SMALL = "day18/input-small.txt"
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Simple 2d vector."""
 
@@ -23,7 +25,11 @@ class Direction(IntEnum):
     Up = 3
 
 
-@dataclass(init=False)
+# compass direction (see ``aoc.lib.directions``) of each ``Direction``
+COMPASS = (EAST, SOUTH, WEST, NORTH)
+
+
+@dataclass(init=False, slots=True)
 class Command:
     """Command from hexstring."""
 
@@ -36,6 +42,11 @@ class Command:
         self.direction = Direction(int(hexcode[-1]))
 
 
+def from_direction(direction: str, steps: int) -> Command:
+    """Command to move ``steps`` in a ``UDLR`` direction, via its hex code."""
+    return Command(f"{steps:05x}{'RDLU'.index(direction)}")
+
+
 def get_input(path: str) -> list[Command]:
     """Grabs input from file, parsing into well-formed commands."""
     commands = []
@@ -49,15 +60,11 @@ def get_input(path: str) -> list[Command]:
 
 def process_command(command: Command, position: Position) -> Position:
     """Process a command and return new position."""
-    if command.direction == Direction.Right:
-        return Position(position.row, position.col + command.steps)
-    if command.direction == Direction.Down:
-        return Position(position.row + command.steps, position.col)
-    if command.direction == Direction.Left:
-        return Position(position.row, position.col - command.steps)
-    if command.direction == Direction.Up:
-        return Position(position.row - command.steps, position.col)
-    raise AssertionError(f"unsupported directoin {command.direction}")
+    compass = COMPASS[command.direction]
+    return Position(
+        position.row + ROW_DELTAS[compass] * command.steps,
+        position.col + COL_DELTAS[compass] * command.steps,
+    )
 
 
 def calculate_area(positions: list[Position], perimeter: int) -> int:
@@ -0,0 +1,59 @@
+"""Synthetic input generator for day18."""
+import random
+
+from aoc.lib.synthetic import Point, column_convex_loop, random_walk, scaled
+
+COLUMNS = 175
+HEIGHT = 400
+MAX_WIDTH = 4
+HEIGHT_PART2 = 1_000_000
+MAX_WIDTH_PART2 = 200_000
+# direction digit used by part2's hex codes
+HEX_DIRECTIONS = "RDLU"
+
+
+def dig_loop(
+    rng: random.Random, columns: int, height: int, max_width: int
+) -> list[Point]:
+    """Corners of a loop whose bounding box centre is well inside it.
+
+    Every column spans the middle rows, and the loop touches both the top
+    and bottom of its bounding box, which is where part1 starts digging.
+    Neighbouring columns never line up, so the loop has ``4 * columns``
+    corners.
+    """
+    mid = height // 2
+    tops = random_walk(rng, columns, 1, mid - 3, max(1, height // 20))
+    bottoms = random_walk(rng, columns, mid + 3, height - 1, max(1, height // 20))
+    tops[rng.randrange(columns)] = 0
+    bottoms[rng.randrange(columns)] = height
+    widths = [rng.randint(1, max_width) for _ in range(columns)]
+    return column_convex_loop(tops, bottoms, widths)
+
+
+def commands(corners: list[Point]) -> list[tuple[str, int]]:
+    """Turns loop corners into ``(direction, steps)`` pairs."""
+    result: list[tuple[str, int]] = []
+    for (row, col), (next_row, next_col) in zip(corners, corners[1:]):
+        if next_row != row:
+            result.append(("D" if next_row > row else "U", abs(next_row - row)))
+        else:
+            result.append(("R" if next_col > col else "L", abs(next_col - col)))
+    return result
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Dig plan for both parts; ``scale`` multiplies the number of commands.
+
+    Part1's lagoon keeps its height, so its area grows with ``scale`` too.
+    The hex codes describe a second, much larger loop with the same number
+    of commands.
+    """
+    columns = scaled(COLUMNS, scale, minimum=2)
+    small = commands(dig_loop(rng, columns, HEIGHT, MAX_WIDTH))
+    big = commands(dig_loop(rng, columns, HEIGHT_PART2, MAX_WIDTH_PART2))
+    lines = [
+        f"{direction} {steps} (#{big_steps:05x}{HEX_DIRECTIONS.index(big_direction)})"
+        for (direction, steps), (big_direction, big_steps) in zip(small, big)
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,37 @@
+"""Runner hooks for day18."""
+from aoc.solution import Solution
+from day18 import day18a, day18b
+
+
+def parse(path: str) -> tuple[list[day18a.Command], list[day18b.Command]]:
+    """Parse the dig plan as direction commands and as hex commands."""
+    return day18a.get_input(path), day18b.get_input(path)
+
+
+def solve_part1(data: tuple[list[day18a.Command], list[day18b.Command]]) -> int:
+    """Lagoon size using the direction commands."""
+    return day18a.get_solution(data[0])
+
+
+def solve_part1_shoelace(
+    data: tuple[list[day18a.Command], list[day18b.Command]],
+) -> int:
+    """Lagoon size of the direction commands, by part 2's shoelace formula."""
+    return day18b.get_solution(
+        [day18b.from_direction(command.direction, command.steps) for command in data[0]]
+    )
+
+
+def solve_part2(data: tuple[list[day18a.Command], list[day18b.Command]]) -> int:
+    """Lagoon size using the hex commands."""
+    return day18b.get_solution(data[1])
+
+
+SOLUTION = Solution(
+    day=18,
+    input_path=day18a.INPUT,
+    parse=parse,
+    part1=solve_part1,
+    part2=solve_part2,
+    engines={1: {"shoelace": solve_part1_shoelace}},
+)
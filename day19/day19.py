@@ -1,7 +1,8 @@
 """Day19 solution."""
-from queue import Queue
+from collections import deque
 
-from day19.lib.classes import Part, PartRange, PartRangeDest, Workflow
+from aoc.lib.intervals import Box, box_size
+from day19.lib.classes import Part, Workflow
 from day19.lib.parsers import parse_part_string, parse_workflow_string
 
 """
@@ -75,25 +76,15 @@ def solve_part2(workflows: dict[str, Workflow]) -> int:
     Returns:
         int: total number of parts that pass.
     """
-    min_xmas = Part(1, 1, 1, 1)
-    max_xmas = Part(4001, 4001, 4001, 4001)
-    part_range = PartRange(min_xmas, max_xmas)
-
-    starting_condition = PartRangeDest(part_range, "in")
-
-    to_process: Queue[PartRangeDest] = Queue()
-    to_process.put(starting_condition)
+    to_process: deque[tuple[str, Box]] = deque([("in", ((1, 4001),) * 4)])
     result = 0
-    while not to_process.empty():
-        part_range_dest = to_process.get()
-        part_range, dest = part_range_dest.part_range, part_range_dest.destination
-
-        to_add: list[PartRangeDest] = workflows[dest].process_part_range(part_range)
-        for item in to_add:
-            if item.destination == "A":
-                result += item.part_range.size()
-            elif item.destination != "R":
-                to_process.put(item)
+    while to_process:
+        name, box = to_process.popleft()
+        for destination, sub_box in workflows[name].process_box(box):
+            if destination == "A":
+                result += box_size(sub_box)
+            elif destination != "R":
+                to_process.append((destination, sub_box))
     return result
 
 
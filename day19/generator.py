@@ -0,0 +1,54 @@
+"""Synthetic input generator for day19."""
+import random
+from collections import deque
+
+from aoc.lib.synthetic import scaled, unique_names
+
+WORKFLOWS = 550
+PARTS = 200
+CHILD_CHANCE = 0.6
+
+
+def rule(rng: random.Random, destination: str) -> str:
+    """A conditional rule such as ``a<2006:qkq``."""
+    return f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{destination}"
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Workflows and parts; ``scale`` multiplies both counts.
+
+    Workflows form a tree rooted at ``in``, so every part ends in ``A`` or
+    ``R``.
+    """
+    names = [
+        name
+        for name in unique_names(rng, scaled(WORKFLOWS, scale) + 1, length=2)
+        if name != "in"
+    ][: scaled(WORKFLOWS, scale) - 1]
+    pending = deque(["in"])
+    workflows: list[str] = []
+    while pending:
+        name = pending.popleft()
+        destinations: list[str] = []
+        slots = rng.randint(2, 4)
+        for slot in range(slots):
+            force_child = (
+                not pending
+                and slot == slots - 1
+                and not any(destination.islower() for destination in destinations)
+            )
+            if names and (force_child or rng.random() < CHILD_CHANCE):
+                child = names.pop()
+                pending.append(child)
+                destinations.append(child)
+            else:
+                destinations.append(rng.choice("AR"))
+        rules = [rule(rng, destination) for destination in destinations[:-1]]
+        workflows.append(f"{name}{{{','.join([*rules, destinations[-1]])}}}")
+    rng.shuffle(workflows)
+
+    parts = [
+        "{" + ",".join(f"{key}={rng.randint(1, 4000)}" for key in "xmas") + "}"
+        for _ in range(scaled(PARTS, scale))
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
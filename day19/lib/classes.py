@@ -3,8 +3,10 @@ from dataclasses import dataclass
 from enum import StrEnum
 from typing import Optional
 
+from aoc.lib.intervals import Box, box_size, split_box
 
-@dataclass
+
+@dataclass(slots=True)
 class Part:
     """Well defined part with x,m,a,s values."""
 
@@ -61,22 +63,35 @@ class Component(StrEnum):
     A = "a"
     S = "s"
 
+    @property
+    def axis(self) -> int:
+        """Which dimension of a part range box this component is."""
+        return "xmas".index(self.value)
+
 
-@dataclass
+@dataclass(slots=True)
 class PartRange:
     """A range of parts (min/max) based on component values."""
 
     min_values: Part  # from
     max_values: Part  # to, non-inclusive
 
+    @classmethod
+    def from_box(cls, box: Box) -> "PartRange":
+        """Part range of an ``(x, m, a, s)`` box of intervals."""
+        (x_low, x_high), (m_low, m_high), (a_low, a_high), (s_low, s_high) = box
+        return cls(
+            Part(x_low, m_low, a_low, s_low), Part(x_high, m_high, a_high, s_high)
+        )
+
+    def box(self) -> Box:
+        """``(x, m, a, s)`` box of half-open intervals."""
+        low, high = self.min_values, self.max_values
+        return ((low.x, high.x), (low.m, high.m), (low.a, high.a), (low.s, high.s))
+
     def size(self) -> int:
         """Returns the size of the partrange."""
-        return (
-            (self.max_values.x - self.min_values.x)
-            * (self.max_values.m - self.min_values.m)
-            * (self.max_values.a - self.min_values.a)
-            * (self.max_values.s - self.min_values.s)
-        )
+        return box_size(self.box())
 
     def split(
         self, component: Component, split_value: int
@@ -89,19 +104,10 @@ class PartRange:
         range = 100-200; split == 50 -> return [None, (100-200)]
         range = 100-200, split == 150 -> return [(100-150), (150-200)]
         """
-        min_value = self.min_values.get_value(component)
-        max_value = self.max_values.get_value(component)
-        if split_value >= max_value:
-            return (self, None)
-        if split_value < min_value:
-            return (None, self)
-
-        mid_high = self.min_values.clone_modify(component, split_value)
-        mid_low = self.max_values.clone_modify(component, split_value)
-
+        low, high = split_box(self.box(), component.axis, split_value)
         return (
-            PartRange(self.min_values, mid_low),
-            PartRange(mid_high, self.max_values),
+            None if low is None else PartRange.from_box(low),
+            None if high is None else PartRange.from_box(high),
         )
 
     def __str__(self) -> str:
@@ -116,7 +122,7 @@ class PartRange:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PartRangeDest:
     """Combinatoin of partrange and a destination workflow."""
 
@@ -135,7 +141,7 @@ class Comparator(StrEnum):
     GreaterThan = ">"
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition:
     """A condition for a part to succeed/fail."""
 
@@ -188,16 +194,24 @@ class Condition:
         Returns:
             tuple[Optional[PartRange], Optional[PartRange]]: successful part range, failed partrange
         """
+        success, fail = self.process_box(part_range.box())
+        return (
+            None if success is None else PartRange.from_box(success),
+            None if fail is None else PartRange.from_box(fail),
+        )
+
+    def process_box(self, box: Box) -> tuple[Box | None, Box | None]:
+        """Splits a box of parts into the ones that succeed and fail."""
         if self.sign == Comparator.LessThan:
-            success, fail = part_range.split(self.component, self.value)
+            success, fail = split_box(box, self.component.axis, self.value)
             return (success, fail)
         if self.sign == Comparator.GreaterThan:
-            fail, success = part_range.split(self.component, self.value + 1)
+            fail, success = split_box(box, self.component.axis, self.value + 1)
             return (success, fail)
         raise AssertionError(f"Unknown comparator: {self.sign}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     """A Rule consists of a condition + destination."""
 
@@ -230,19 +244,22 @@ class Rule:
         Returns:
             tuple[Optional[PartRangeDest], Optional[PartRange]]: success, fail
         """
-        success: Optional[PartRange]
-        fail: Optional[PartRange]
-        if self.condition is None:  # pass all
-            success, fail = part_range, None
-        else:  # split up range
-            success, fail = self.condition.process_part_range(part_range)
-        if success is not None:
-            return (PartRangeDest(success, self.destination), fail)
+        success, fail = self.process_box(part_range.box())
+        return (
+            None
+            if success is None
+            else PartRangeDest(PartRange.from_box(success), self.destination),
+            None if fail is None else PartRange.from_box(fail),
+        )
 
-        return None, fail
+    def process_box(self, box: Box) -> tuple[Box | None, Box | None]:
+        """Splits a box into the parts that pass this rule and the remainder."""
+        if self.condition is None:  # pass all
+            return box, None
+        return self.condition.process_box(box)
 
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class Workflow:
     """The name of the workflow + a bunch of rules for parts to follow."""
 
@@ -263,15 +280,22 @@ class Workflow:
         Each success has to branch off.
         Each failure continues down the chain.
         """
-        results: list[PartRangeDest] = []
-        remainder: Optional[PartRange] = part_range
+        return [
+            PartRangeDest(PartRange.from_box(box), destination)
+            for destination, box in self.process_box(part_range.box())
+        ]
+
+    def process_box(self, box: Box) -> list[tuple[str, Box]]:
+        """Follow rule list, returning each destination and the box sent there."""
+        results: list[tuple[str, Box]] = []
+        remainder: Box | None = box
 
         index = 0
         while remainder is not None:
             rule = self.rules[index]
-            success, remainder = rule.process_part_range(remainder)
+            success, remainder = rule.process_box(remainder)
             if success is not None:
-                results.append(success)
+                results.append((rule.destination, success))
             index += 1
 
         return results
@@ -0,0 +1,20 @@
+"""Runner hooks for day19."""
+from aoc.solution import Solution
+from day19.day19 import INPUT, get_input, part1, part2
+from day19.lib.classes import Part, Workflow
+
+
+def solve_part1(data: tuple[list[Workflow], list[Part]]) -> int:
+    """Sum of ratings of accepted parts."""
+    return part1(*data)
+
+
+def solve_part2(data: tuple[list[Workflow], list[Part]]) -> int:
+    """Number of accepted xmas combinations."""
+    workflows, _ = data
+    return part2(workflows)
+
+
+SOLUTION = Solution(
+    day=19, input_path=INPUT, parse=get_input, part1=solve_part1, part2=solve_part2
+)
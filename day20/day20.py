@@ -2,12 +2,11 @@
 import math
 import os
 import shutil
-from queue import Queue
-from typing import Optional, Type, TypeVar, cast
-
-import graphviz
-from tqdm.contrib.concurrent import process_map
+from collections import deque
+from typing import TYPE_CHECKING, Optional, Type, TypeVar, cast
 
+from aoc.lib import budget, output
+from aoc.lib.cycles import CycleDetector
 from day20.lib.classes import (
     BaseModule,
     BroadcastModule,
@@ -21,6 +20,9 @@ from day20.lib.classes import (
 )
 from day20.lib.parsers import get_modules
 
+if TYPE_CHECKING:
+    import graphviz
+
 FILE_A = "day20/input-a.txt"
 FILE_B = "day20/input-b.txt"
 FILE_PT2 = "day20/input-test2.txt"
@@ -38,13 +40,13 @@ def simulate(
 
     If you pass in stored_pulses, we will append every pulse to it
     """
-    pulses: Queue[PulseTarget] = Queue()
-    pulses.put(PulseTarget(Pulse.LOW, "button", "broadcaster"))
+    pulses: deque[PulseTarget] = deque()
+    pulses.append(PulseTarget(Pulse.LOW, "button", "broadcaster"))
     low = 0
     high = 0
 
-    while not pulses.empty():
-        pulse_target: PulseTarget = pulses.get()
+    while pulses:
+        pulse_target: PulseTarget = pulses.popleft()
         if stored_pulses is not None:
             stored_pulses.append(pulse_target)
         if pulse_target.pulse == Pulse.LOW:
@@ -56,8 +58,7 @@ def simulate(
         results: list[PulseTarget] = module.handle_pulse(
             pulse_target.src, pulse_target.pulse
         )
-        for result in results:
-            pulses.put(result)
+        pulses.extend(results)
 
     return low, high
 
@@ -90,9 +91,13 @@ def get_loop_paths(
     return path
 
 
-def path_is_start_state(modules: list[BaseModule]) -> bool:
-    """For every module in the path, make sure its in its "initial" state."""
-    return all(module.is_initial_state() for module in modules)
+def path_key(modules: list[BaseModule]) -> int:
+    """Compact fingerprint of a path: one bit per remembered pulse."""
+    key = 1
+    for module in modules:
+        for pulse in module.memory():
+            key = key << 1 | bool(pulse)
+    return key
 
 
 T = TypeVar("T", bound=BaseModule)
@@ -131,8 +136,10 @@ def get_module_groups(module_map: dict[str, BaseModule]) -> ModuleGroups:
     return ModuleGroups(broadcaster, loop_paths, loop_tails, last_conjunction, sink)
 
 
-def graph_modules(module_groups: ModuleGroups, index: int) -> graphviz.Digraph:
+def graph_modules(module_groups: ModuleGroups, index: int) -> "graphviz.Digraph":
     """Graphs the modules."""
+    import graphviz
+
     index_str = str(index).zfill(4)
     graph_attr = {"labelloc": "t", "label": index_str}
     dot = graphviz.Digraph(f"Push {index_str}", format="png", graph_attr=graph_attr)
@@ -169,7 +176,7 @@ def graph_modules(module_groups: ModuleGroups, index: int) -> graphviz.Digraph:
 
 
 def export_graph(
-    dots: list[graphviz.Graph],
+    dots: list["graphviz.Graph"],
     module_groups: ModuleGroups,
     simulation_counter: int,
     export_graphs: bool,
@@ -182,30 +189,35 @@ def export_graph(
 
 def part2(
     modules: list[BaseModule], export_graphs: bool = False
-) -> tuple[int, list[graphviz.Graph]]:
+) -> tuple[int, list["graphviz.Graph"]]:
     """We find out the loop length for each of the 4~ paths."""
     module_map = {module.name: module for module in modules}
     module_groups: ModuleGroups = get_module_groups(module_map)
 
     # graph modules in initial state
-    dots: list[graphviz.Graph] = []
+    dots: list["graphviz.Graph"] = []
     simulation_counter = 0
     loop_counter: LoopCounter = LoopCounter(len(module_groups.loops))
 
     # output our initial state:
     export_graph(dots, module_groups, simulation_counter, export_graphs)
 
+    detectors = [CycleDetector() for _ in module_groups.loops]
+    for loop_path, detector in zip(module_groups.loops, detectors):
+        detector.add(path_key(loop_path))
+
     # run simulation, screenshotting everytime one of the paths "loops"
     while not loop_counter.finished:
+        budget.check(loop_counter.num_results / loop_counter.target_loop_count)
         simulate(module_map)
         simulation_counter += 1
-        for loop_path in module_groups.loops:
-            if path_is_start_state(loop_path):
-                loop_end_name = loop_path[-1].name
-                loop_counter.add_result(loop_end_name, simulation_counter)
+        for loop_path, detector in zip(module_groups.loops, detectors):
+            if not detector.found and detector.add(path_key(loop_path)):
+                assert detector.lam is not None
+                loop_counter.add_result(loop_path[-1].name, detector.lam)
         export_graph(dots, module_groups, simulation_counter, export_graphs)
 
-    print(loop_counter)
+    output.verbose(lambda: str(loop_counter))
     result = math.lcm(*list(loop_counter.loop_lengths.values()))
     return result, dots
 
@@ -220,25 +232,27 @@ def part1(modules: list[BaseModule]) -> int:
         low_total += low
         high_total += high
 
-    print(low_total, high_total)
+    output.verbose(lambda: f"{low_total} {high_total}")
     return low_total * high_total
 
 
-def output_graph(dot: graphviz.Graph, directory: str) -> None:
+def output_graph(dot: "graphviz.Graph", directory: str) -> None:
     """Saves a dot to file."""
     dot.render(directory=directory)
 
 
-def output_graph_wrapper(args: tuple[graphviz.Graph, str]) -> None:
+def output_graph_wrapper(args: tuple["graphviz.Graph", str]) -> None:
     """Since process_map doesnt support star_args, we gotta use this."""
     dot, directory = args
     output_graph(dot, directory)
 
 
-def output_files(dots: list[graphviz.Graph], directory: str) -> None:
+def output_files(dots: list["graphviz.Graph"], directory: str) -> None:
     """Saves a list of dots to file."""
     if len(dots) == 0:
         return
+    from tqdm.contrib.concurrent import process_map
+
     shutil.rmtree(directory, ignore_errors=True)
     os.makedirs(directory, exist_ok=True)
     dot_dirs = [(dot, directory) for dot in dots]
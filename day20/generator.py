@@ -0,0 +1,67 @@
+"""Synthetic input generator for day20."""
+import random
+
+from aoc.lib.synthetic import primes_between, scaled, unique_names
+
+COUNTERS = 4
+BITS = 12
+
+
+def counter(rng: random.Random, names: list[str], period: int, tail: str) -> list[str]:
+    """Module lines for a ``BITS`` wide binary counter that wraps every ``period`` presses.
+
+    Flip-flops with a set bit in ``period`` feed the counter's conjunction;
+    the conjunction feeds back into bit 0 and every unset bit, which resets
+    the counter, and pulses ``tail``.
+    """
+    flip_flops, conjunction = names[:BITS], names[BITS]
+    lines: list[str] = []
+    feedback = [tail]
+    for bit, name in enumerate(flip_flops):
+        outputs = flip_flops[bit + 1 : bit + 2]
+        if period >> bit & 1:
+            outputs.append(conjunction)
+        if bit == 0 or not period >> bit & 1:
+            feedback.append(name)
+        rng.shuffle(outputs)
+        lines.append(f"%{name} -> {', '.join(outputs)}")
+    rng.shuffle(feedback)
+    lines.append(f"&{conjunction} -> {', '.join(feedback)}")
+    return lines
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Broadcaster into binary counters that join at ``rx``.
+
+    ``scale`` multiplies the number of counters. Each counter wraps after
+    an odd period with its top bit set, which is the structure part2 relies
+    on; periods are distinct primes while there are enough of them.
+    """
+    counter_count = scaled(COUNTERS, scale)
+    periods = primes_between(1 << (BITS - 1), 1 << BITS)
+    if counter_count > len(periods):
+        periods = list(range((1 << (BITS - 1)) + 1, 1 << BITS, 2))
+    if counter_count > len(periods):
+        chosen = rng.choices(periods, k=counter_count)
+    else:
+        chosen = rng.sample(periods, counter_count)
+
+    per_counter = BITS + 2
+    names = [
+        name
+        for name in unique_names(rng, counter_count * per_counter + 2, length=2)
+        if name != "rx"
+    ]
+    final = names.pop()
+    heads: list[str] = []
+    lines: list[str] = []
+    for index, period in enumerate(chosen):
+        counter_names = names[index * per_counter : (index + 1) * per_counter]
+        tail = counter_names[-1]
+        heads.append(counter_names[0])
+        lines.extend(counter(rng, counter_names, period, tail))
+        lines.append(f"&{tail} -> {final}")
+    lines.append(f"&{final} -> rx")
+    lines.append(f"broadcaster -> {', '.join(heads)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
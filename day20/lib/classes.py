@@ -3,8 +3,10 @@ import itertools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Flag
+from typing import TYPE_CHECKING
 
-from graphviz import Digraph
+if TYPE_CHECKING:
+    from graphviz import Digraph
 
 
 class Pulse(Flag):
@@ -28,7 +30,7 @@ class MappingModule:
     outputs: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PulseTarget:
     """A pulse(low/high) from src to dest."""
 
@@ -67,13 +69,17 @@ class BaseModule(ABC):
             self.num_high += 1
         return []
 
-    def add_to_graph(self, dot: Digraph) -> None:
+    def add_to_graph(self, dot: "Digraph") -> None:
         """Adds edges only to the graph. inheritors need to handle their repr."""
         attrs = {"color": self.arrow_color()}
 
         for output in self.outputs:
             dot.edge(self.name, output, **attrs)
 
+    def memory(self) -> list[Pulse]:
+        """Pulses this module remembers between button presses."""
+        return []
+
     @abstractmethod
     def is_initial_state(self) -> bool:
         """Returns if the module is in the initial state."""
@@ -100,7 +106,7 @@ class FlipFlopModule(BaseModule):
         self.state = Pulse(not self.state)
         return [PulseTarget(self.state, self.name, target) for target in self.outputs]
 
-    def add_to_graph(self, dot: Digraph) -> None:
+    def add_to_graph(self, dot: "Digraph") -> None:
         """Adds ourselves to a graphviz digraph."""
         attrs = {"shape": "box", "style": "filled"}
         if self.state == Pulse.LOW:
@@ -110,6 +116,10 @@ class FlipFlopModule(BaseModule):
         dot.node(self.name, **attrs)
         super().add_to_graph(dot)
 
+    def memory(self) -> list[Pulse]:
+        """Our current state."""
+        return [self.state]
+
     def is_initial_state(self) -> bool:
         """Returns true if we are in our initial state."""
         return self.state == Pulse.LOW
@@ -149,7 +159,7 @@ class ConjunctionModule(BaseModule):
             ]
         return [PulseTarget(Pulse.HIGH, self.name, target) for target in self.outputs]
 
-    def add_to_graph(self, dot: Digraph) -> None:
+    def add_to_graph(self, dot: "Digraph") -> None:
         """Add this module to a GraphViz Digraph."""
         count = self.current_count()
         length = len(list(self.inputs.values()))
@@ -161,6 +171,10 @@ class ConjunctionModule(BaseModule):
         """Returns current count of inputs that sent ``high``."""
         return list(self.inputs.values()).count(Pulse.HIGH)
 
+    def memory(self) -> list[Pulse]:
+        """The last pulse from each input."""
+        return list(self.inputs.values())
+
     def is_initial_state(self) -> bool:
         """Returns True if all our inputs are LOW."""
         return self.current_count() == 0
@@ -175,7 +189,7 @@ class BroadcastModule(BaseModule):
         super().handle_pulse(input, pulse)
         return [PulseTarget(pulse, self.name, target) for target in self.outputs]
 
-    def add_to_graph(self, dot: Digraph) -> None:
+    def add_to_graph(self, dot: "Digraph") -> None:
         """Add node to graphviz digraph."""
         dot.node(self.name)
         super().add_to_graph(dot)
@@ -194,7 +208,7 @@ class SinkModule(BaseModule):
         super().handle_pulse(input, pulse)
         return []
 
-    def add_to_graph(self, dot: Digraph) -> None:
+    def add_to_graph(self, dot: "Digraph") -> None:
         """Adds this node to the graph."""
         dot.node(self.name)
         super().add_to_graph(dot)
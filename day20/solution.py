@@ -0,0 +1,16 @@
+"""Runner hooks for day20."""
+from aoc.solution import Solution
+from day20.day20 import FILE_PROD, part1, part2
+from day20.lib.classes import BaseModule
+from day20.lib.parsers import get_modules
+
+
+def solve_part2(modules: list[BaseModule]) -> int:
+    """Button presses until ``rx`` gets a low pulse."""
+    result, _ = part2(modules)
+    return result
+
+
+SOLUTION = Solution(
+    day=20, input_path=FILE_PROD, parse=get_modules, part1=part1, part2=solve_part2
+)
@@ -1,9 +1,9 @@
 """day21 solution."""
 
 from dataclasses import dataclass
-from queue import Queue
-from typing import Optional
 
+from aoc.lib import output, search
+from aoc.lib.positions import Positions
 from day21.lib.classes import (
     BaseDistanceMaze,
     DistanceMaze,
@@ -12,7 +12,6 @@ from day21.lib.classes import (
     GiantNodeType,
     Maze,
     Position,
-    PositionDist,
 )
 from day21.lib.parsers import parse_maze
 
@@ -33,36 +32,22 @@ GIGA_TARGET = 26_501_365  # even parity
 def mini_solve(
     start_pos: Position, maze: Maze, steps: int, distances: BaseDistanceMaze
 ) -> BaseDistanceMaze:
-    """Given a BaseDistanceMaze, runs `steps` steps then returns the maze."""
-    nodes: Queue[PositionDist] = Queue()
-    nodes.put(PositionDist(start_pos.row, start_pos.col, distance=0))
-
-    distance_reached: bool = False
-    while not nodes.empty() and not distance_reached:
-        pos: PositionDist = nodes.get()
-        if pos.distance >= steps + 1:
-            distance_reached = True
-            continue
-        # expand
-        distance: Optional[int] = distances[pos]
-        maze_node: Optional[str] = maze[pos]
-
-        if distance is None:  # oob
-            continue
-        if distance != -1:  # already explored
-            continue
-        if maze_node == "#":  # hitting a wall
-            continue
-        # undiscovered!
-        distances[pos] = pos.distance
-
-        south = pos.replace(row=pos.row + 1)
-        north = pos.replace(row=pos.row - 1)
-        east = pos.replace(col=pos.col + 1)
-        west = pos.replace(col=pos.col - 1)
-
-        for direction in [north, south, east, west]:
-            nodes.put(direction)
+    """Given a BaseDistanceMaze, runs `steps` steps then returns the maze.
+
+    The search runs over int positions of a window just big enough to hold
+    every tile within `steps`, then copies the distances into the maze.
+    """
+    size = 2 * steps + 1
+    window = Positions(size, size)
+    top, left = start_pos.row - steps, start_pos.col - steps
+    open_tiles = maze.open_tiles(top, left, size, size, wraps=distances.WRAPS)
+
+    # tiles within `steps` of the centre never step off the window
+    start = window.index(steps, steps)
+    starts = [start] if open_tiles[start] else []
+    tile_distances = search.grid_bfs(starts, open_tiles, window.offsets, steps)
+    rows = [tile_distances[row * size : (row + 1) * size] for row in range(size)]
+    distances.fill(top, left, rows)
     return distances
 
 
@@ -79,7 +64,7 @@ def naive_solve(
 ) -> int:
     """Naively solve a maze."""
     distances = mini_solve(start_pos, maze, steps, distances)
-    print(distances.overlay(maze))
+    output.visual(lambda: distances.overlay(maze))
     return distances.calc_steps(steps % 2)
 
 
@@ -89,7 +74,7 @@ def calculate_smart_steps(board_size: int, steps: int) -> SmartSteps:
     if steps_remaining != board_size // 2:
         raise ValueError("big mode only supported for steps_remaining == maze_rows//2")
     boards_to_edge = steps // board_size
-    print("boards_to_edge", boards_to_edge)
+    output.verbose(f"boards_to_edge {boards_to_edge}")
 
     if boards_to_edge % 2 == 0:
         sim_steps = board_size * 2 + steps_remaining
@@ -147,7 +132,7 @@ def solve(
         node_steps = node.calc_steps(remainder)
         node_count = giant_parser.get_node_count(node_type)
         node_type_steps = node_steps * node_count
-        print(f"{node_type.name}, count: {node_count}, steps: {node_steps}")
+        output.verbose(f"{node_type.name}, count: {node_count}, steps: {node_steps}")
         result += node_type_steps
 
     return result
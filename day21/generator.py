@@ -0,0 +1,45 @@
+"""Synthetic input generator for day21."""
+import math
+import random
+
+from aoc.lib.synthetic import render_grid
+from day21.day21 import GIGA_TARGET
+
+SIDE = 131
+ROCK_CHANCE = 0.12
+
+
+def supported_sides(largest: int) -> list[int]:
+    """Grid sides part2 can extrapolate: ``GIGA_TARGET % side == side // 2``."""
+    return [
+        side
+        for side in range(SIDE, max(SIDE, largest) + 1, 2)
+        if GIGA_TARGET % side == side // 2
+    ]
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Garden with ``S`` in the middle; ``scale`` multiplies the area.
+
+    Part2 only supports sides that line up with ``GIGA_TARGET``, so the side
+    snaps down to the nearest of those (131, 393, ...). The border and the
+    middle row and column are clear, like a real input.
+    """
+    target = round(SIDE * math.sqrt(scale))
+    side = supported_sides(target)[-1]
+    mid = side // 2
+    grid = [
+        [
+            "#"
+            if 0 < row < side - 1
+            and 0 < col < side - 1
+            and row != mid
+            and col != mid
+            and rng.random() < ROCK_CHANCE
+            else "."
+            for col in range(side)
+        ]
+        for row in range(side)
+    ]
+    grid[mid][mid] = "S"
+    return render_grid(grid)
@@ -5,12 +5,16 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import ClassVar, Optional
 
-from colorama import Back
+from aoc.lib import output
+from aoc.lib.grid import Grid
 
+# translates a row of the maze to 1 for each open tile and 0 for each wall
+OPEN_TILES = bytes(value != ord("#") for value in range(256))
 
-@dataclass(unsafe_hash=True)
+
+@dataclass(unsafe_hash=True, slots=True)
 class Position:
     """Simple 2d vector.
 
@@ -25,7 +29,7 @@ class Position:
         return f"{self.row}, {self.col}"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PositionDist(Position):
     """Position + distance."""
 
@@ -52,36 +56,64 @@ class PositionDist(Position):
 
 
 class Maze:
-    """2d grid of items."""
+    """2d grid of items, repeating infinitely in every direction."""
 
-    grid: list[str]
+    grid: Grid
 
     num_rows: int
     num_cols: int
 
-    def __init__(self, data: list[str]) -> None:
-        """Constructs maze from list of strings."""
-        self.grid = data
-        self.num_rows = len(data)
-        self.num_cols = len(data[0])
+    def __init__(self, grid: Grid) -> None:
+        """Constructs maze from a grid of characters."""
+        self.grid = grid
+        self.num_rows = grid.num_rows
+        self.num_cols = grid.num_cols
 
     def __str__(self) -> str:
         """Pretty-print."""
-        return "\n".join(row for row in self.grid)
+        return str(self.grid)
 
-    def __getitem__(self, position: Position) -> Optional[str]:
+    def __getitem__(self, position: Position) -> str:
         """Get item via position. Always wraps."""
         if not isinstance(position, Position):
             raise AssertionError(f"position is not a Position, {type(position)}")
 
         row = position.row % self.num_rows
         col = position.col % self.num_cols
-        return self.grid[row][col]
+        return chr(self.grid.cells[self.grid.index(row, col)])
+
+    def open_tiles(
+        self, top: int, left: int, num_rows: int, num_cols: int, wraps: bool = True
+    ) -> bytearray:
+        """Flags each open tile of a window of the maze, row by row.
+
+        Tiles are 1 if they aren't a wall. Tiles off the maze are walls too,
+        unless it ``wraps``.
+        """
+        rows = [row.encode("latin-1").translate(OPEN_TILES) for row in self.grid.rows()]
+        repeats = num_cols // self.num_cols + 2
+        result = bytearray()
+        for row in range(top, top + num_rows):
+            line = bytearray(num_cols)
+            if wraps:
+                start = left % self.num_cols
+                line[:] = (rows[row % self.num_rows] * repeats)[
+                    start : start + num_cols
+                ]
+            elif 0 <= row < self.num_rows:
+                low, high = max(left, 0), min(left + num_cols, self.num_cols)
+                if low < high:
+                    line[low - left : high - left] = rows[row][low:high]
+            result += line
+        return result
 
 
 class BaseDistanceMaze(ABC):
     """Abstract distance maze."""
 
+    # whether the maze repeats forever, rather than stopping at its edges
+    WRAPS: ClassVar[bool]
+
     @abstractmethod
     def overlay(self, maze: Maze) -> str:
         """Overlays on top of a maze."""
@@ -103,10 +135,19 @@ class BaseDistanceMaze(ABC):
     def __getitem__(self, position: Position) -> Optional[int]:
         """Get the integer distance based on position."""
 
+    @abstractmethod
+    def fill(self, top: int, left: int, rows: list[list[int]]) -> None:
+        """Copies the distances of a window whose first tile is ``(top, left)``.
+
+        Tiles that weren't reached are -1 and left as they are.
+        """
+
 
 class DistanceMaze(BaseDistanceMaze):
     """Distance Maze == Maze.size."""
 
+    WRAPS = False
+
     grid: list[list[int]]
     num_rows: int
     num_cols: int
@@ -134,6 +175,14 @@ class DistanceMaze(BaseDistanceMaze):
             return None
         return self.grid[position.row][position.col]
 
+    def fill(self, top: int, left: int, rows: list[list[int]]) -> None:
+        """Copies the distances of the window's tiles that are in bounds."""
+        for row in range(max(top, 0), min(top + len(rows), self.num_rows)):
+            values, target = rows[row - top], self.grid[row]
+            for col in range(max(left, 0), min(left + len(values), self.num_cols)):
+                if (value := values[col - left]) != -1:
+                    target[col] = value
+
     def __str__(self) -> str:
         """Prettyprint distance maze."""
         return "\n".join(
@@ -168,11 +217,14 @@ class DistanceMaze(BaseDistanceMaze):
 
     def overlay(self, maze: Maze) -> str:
         """Overlay this distance_maze on a maze."""
+        from colorama import Back
+
         new_strings: list[str] = []
         base_str: str = str(self)
         is_complete = self.is_complete()
+        maze_rows = maze.grid.rows()
         for row, line in enumerate(base_str.split("\n")):
-            other_str = maze.grid[row]
+            other_str = maze_rows[row]
             my_str = ""
             for col, value in enumerate(line):
                 if is_complete and self.centre_cell(row, col):
@@ -205,6 +257,8 @@ class DistanceMaze(BaseDistanceMaze):
 class DistanceMazes(BaseDistanceMaze):
     """An array of distance mazes, able to extend infinitely."""
 
+    WRAPS = True
+
     grid: dict[Position, DistanceMaze]
 
     rows_per_maze: int
@@ -236,6 +290,19 @@ class DistanceMazes(BaseDistanceMaze):
         big_pos, sub_pos = self.get_split_pos(position)
         self.grid[big_pos][sub_pos] = value
 
+    def fill(self, top: int, left: int, rows: list[list[int]]) -> None:
+        """Copies the distances into each maze the window reached."""
+        maze_rows, maze_cols = self.rows_per_maze, self.cols_per_maze
+        bottom, right = top + len(rows), left + len(rows[0])
+        for big_row in range(top // maze_rows, (bottom - 1) // maze_rows + 1):
+            sub_top = top - big_row * maze_rows
+            row_slice = slice(max(-sub_top, 0), min(maze_rows - sub_top, len(rows)))
+            for big_col in range(left // maze_cols, (right - 1) // maze_cols + 1):
+                sub_left = left - big_col * maze_cols
+                low, high = max(-sub_left, 0), maze_cols - sub_left
+                if any(max(values[low:high]) != -1 for values in rows[row_slice]):
+                    self.grid[Position(big_row, big_col)].fill(sub_top, sub_left, rows)
+
     def get_split_pos(self, position: Position) -> tuple[Position, Position]:
         """Split global position.
 
@@ -339,8 +406,8 @@ class GiantNodeParser:
         self.distance_mazes = distance_mazes
         self.full_edge_dist = nodes_to_edge  # edge dist of mega map
         self.edge_dist = max(pos.row for pos in distance_mazes.grid)
-        print("nodes_to_edge", nodes_to_edge)
-        print("calculated_nodes_to_edge", self.edge_dist)
+        output.verbose(f"nodes_to_edge {nodes_to_edge}")
+        output.verbose(f"calculated_nodes_to_edge {self.edge_dist}")
 
     def get_node(self, node_type: GiantNodeType) -> DistanceMaze:  # noqa: C901
         """Returns a giant node given its type."""
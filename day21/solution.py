@@ -0,0 +1,22 @@
+"""Runner hooks for day21."""
+from aoc.solution import Solution
+from day21.day21 import FILE_MAIN, GIGA_TARGET, solve
+from day21.lib.classes import Maze, Position
+from day21.lib.parsers import parse_maze
+
+
+def solve_part1(data: tuple[Position, Maze]) -> int:
+    """Plots reachable in exactly 64 steps."""
+    start_pos, maze = data
+    return solve(start_pos, maze, 64)
+
+
+def solve_part2(data: tuple[Position, Maze]) -> int:
+    """Plots reachable in ``GIGA_TARGET`` steps on the infinite map."""
+    start_pos, maze = data
+    return solve(start_pos, maze, GIGA_TARGET, True, False)
+
+
+SOLUTION = Solution(
+    day=21, input_path=FILE_MAIN, parse=parse_maze, part1=solve_part1, part2=solve_part2
+)
@@ -1,6 +1,7 @@
 """Test classes for day21."""
 import pytest
 
+from aoc.lib.grid import Grid
 from day21.lib.classes import (
     DistanceMaze,
     DistanceMazes,
@@ -25,7 +26,7 @@ def test_position_dist() -> None:
 
 def test_maze() -> None:
     """Test ``Maze`` class."""
-    maze: Maze = Maze(["...", ".S.", "..."])
+    maze: Maze = Maze(Grid.from_rows(["...", ".S.", "..."]))
 
     assert str(maze) == "...\n.S.\n..."
 
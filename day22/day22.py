@@ -1,9 +1,10 @@
-"""Day22 solution."""
-import vpython
+"""Day22 solution.
 
+vpython (and ``day22.lib.vis``, which needs it) is only imported when
+animating, since importing it is slow.
+"""
 from day22.lib.classes import BoxData, Matrix
 from day22.lib.parsers import get_boxes
-from day22.lib.vis import CAMERA_AXIS_1, CAMERA_POS_1, bind_keys, follow_block, init_vis
 
 INPUT = "day22/input.txt"
 INPUT_SMALL = "day22/input-small.txt"
@@ -29,9 +30,13 @@ class Visualization:
         """
         self.boxes = boxes
         self.boxes.sort(key=lambda x: x.z_val_bot)
-        self.matrix = Matrix()
+        z_height = max((box.z_val_top for box in boxes), default=0) + 2
+        xy = max((max(box.end_pos.x, box.end_pos.y) for box in boxes), default=0) + 1
+        self.matrix = Matrix(max(z_height, 400), max(xy, 10))
         self.animate = animate
         if self.animate:
+            from day22.lib.vis import bind_keys, init_vis
+
             init_vis(self.boxes)
             bind_keys(self.start)
 
@@ -40,11 +45,15 @@ class Visualization:
     def vis_rate(self, rate: float) -> None:
         """Wait a given amount if we are animating."""
         if self.animate:
+            import vpython
+
             vpython.rate(rate)
 
     def follow_block(self, y: float, box: BoxData) -> None:
         """Snap camera to a given box."""
         if self.animate:
+            from day22.lib.vis import follow_block
+
             follow_block(y, box)
 
     def start(self) -> None:
@@ -53,7 +62,19 @@ class Visualization:
             return
         self.has_started = True
 
+        self.drop_boxes()
+
+        print(self.calculate_part1())
+        print(self.calculate_part2())
+
+        self.animate_part1()
+        self.animate_part2()
+
+    def drop_boxes(self) -> None:
+        """Drop every box as far as it goes, then link supports and hats."""
         if self.animate:
+            import vpython
+
             camera_height = vpython.scene.camera.pos.y
         else:
             camera_height = 0
@@ -72,12 +93,6 @@ class Visualization:
             hats = self.matrix.get_hats(box)
             box.set_hats(hats)
 
-        print(self.calculate_part1())
-        print(self.calculate_part2())
-
-        self.animate_part1()
-        self.animate_part2()
-
     def calculate_part1(self) -> int:
         """Calculate part1. (number of boxes that can fly up)."""
         # short answer
@@ -90,6 +105,10 @@ class Visualization:
     def animate_part1(self) -> None:
         """Animate part 1."""
         if self.animate:
+            import vpython
+
+            from day22.lib.vis import CAMERA_AXIS_1, CAMERA_POS_1
+
             vpython.scene.camera.pos = CAMERA_POS_1
             vpython.scene.camera.axis = CAMERA_AXIS_1
             for box in self.boxes:
@@ -105,6 +124,10 @@ class Visualization:
     def animate_part2(self) -> None:
         """Animate part2."""
         if self.animate:
+            import vpython
+
+            from day22.lib.vis import CAMERA_AXIS_1, CAMERA_POS_1
+
             vpython.scene.camera.pos = CAMERA_POS_1
             vpython.scene.camera.axis = CAMERA_AXIS_1
             reversed_boxes = sorted(
@@ -127,6 +150,8 @@ class Visualization:
 
 def main() -> None:
     """Grab boxes and solve, while animating solution."""
+    import vpython
+
     boxes: list[BoxData] = get_boxes(INPUT)
     vis = Visualization(boxes, ANIMATE)
 
@@ -0,0 +1,47 @@
+"""Synthetic input generator for day22."""
+import random
+
+from aoc.lib.synthetic import scaled
+
+BRICKS = 1250
+HEIGHT = 330
+FOOTPRINT = 10
+MAX_LENGTH = 5
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Falling bricks on a 10x10 footprint; ``scale`` multiplies brick count and height.
+
+    Bricks are straight lines along one axis and never overlap.
+    """
+    height = scaled(HEIGHT, scale, minimum=MAX_LENGTH + 1)
+    occupied = bytearray((height + MAX_LENGTH) * FOOTPRINT * FOOTPRINT)
+    lines: list[str] = []
+    for _ in range(scaled(BRICKS, scale)):
+        while True:
+            start = [
+                rng.randrange(FOOTPRINT),
+                rng.randrange(FOOTPRINT),
+                rng.randint(1, height),
+            ]
+            end = list(start)
+            axis = rng.randrange(3)
+            end[axis] += rng.randrange(MAX_LENGTH)
+            if axis < 2 and end[axis] >= FOOTPRINT:
+                continue
+            cells = [
+                (z * FOOTPRINT + x) * FOOTPRINT + y
+                for x in range(start[0], end[0] + 1)
+                for y in range(start[1], end[1] + 1)
+                for z in range(start[2], end[2] + 1)
+            ]
+            if not any(occupied[cell] for cell in cells):
+                break
+        for cell in cells:
+            occupied[cell] = 1
+        lines.append(
+            ",".join(str(value) for value in start)
+            + "~"
+            + ",".join(str(value) for value in end)
+        )
+    return "\n".join(lines) + "\n"
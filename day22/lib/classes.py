@@ -1,11 +1,12 @@
 """Classes for day22."""
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import vpython
+if TYPE_CHECKING:
+    import vpython
 
 
-@dataclass
+@dataclass(slots=True)
 class Vector3:
     """Simple 3d vector."""
 
@@ -14,14 +15,14 @@ class Vector3:
     z: int
 
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class BoxData:
     """A box in 3d space."""
 
     name: str = field(hash=True)
     start_pos: Vector3 = field(hash=False)
     end_pos: Vector3 = field(hash=False)
-    vbox: Optional[vpython.box] = field(
+    vbox: Optional["vpython.box"] = field(
         init=False, repr=False, hash=False, default=None
     )
     supports: set["BoxData"] = field(
@@ -35,8 +36,10 @@ class BoxData:
     )
 
     @property
-    def vpos(self) -> vpython.vector:
+    def vpos(self) -> "vpython.vector":
         """Pos according to vpython."""
+        import vpython
+
         pos = self.start_pos
         return vpython.vector(
             pos.x + self.length / 2, pos.z + self.height / 2, pos.y + self.width / 2
@@ -70,7 +73,7 @@ class BoxData:
     ####################################
     # Visualisation calls  (not ci'ed) #
     ####################################
-    def set_vbox(self, vbox: vpython.box) -> None:  # pragma: no cover
+    def set_vbox(self, vbox: "vpython.box") -> None:  # pragma: no cover
         """Store a vpython box onto this boxdata."""
         self.vbox = vbox
 
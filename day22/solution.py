@@ -0,0 +1,27 @@
+"""Runner hooks for day22."""
+from aoc.solution import Solution
+from day22.day22 import INPUT, Visualization
+from day22.lib.classes import BoxData
+from day22.lib.parsers import get_boxes
+
+
+def settle(boxes: list[BoxData]) -> Visualization:
+    """Drop every box without animating."""
+    vis = Visualization(boxes, animate=False)
+    vis.drop_boxes()
+    return vis
+
+
+def solve_part1(boxes: list[BoxData]) -> int:
+    """Number of boxes that can be safely removed."""
+    return settle(boxes).calculate_part1()
+
+
+def solve_part2(boxes: list[BoxData]) -> int:
+    """Sum of boxes that fall when each box is removed."""
+    return settle(boxes).calculate_part2()
+
+
+SOLUTION = Solution(
+    day=22, input_path=INPUT, parse=get_boxes, part1=solve_part1, part2=solve_part2
+)
@@ -1,4 +1,5 @@
 """Day23 solution."""
+from aoc.lib import output
 from day23.lib.classes import Maze, Path, Solver1
 from day23.lib.classes2 import Solver2
 from day23.lib.parsers import get_maze
@@ -12,7 +13,7 @@ def part1(maze: Maze) -> int:
     solver = Solver1(maze, True)
     paths: list[Path] = solver.solve()
     paths.sort(key=lambda path: len(path), reverse=True)
-    print(paths[0].overlay(maze))
+    output.visual(lambda: paths[0].overlay(maze))
     return len(paths[0])
 
 
@@ -0,0 +1,85 @@
+"""Synthetic input generator for day23."""
+import random
+
+from aoc.lib.synthetic import Point, render_grid, scaled_side, trace
+
+JUNCTIONS = 6
+MIN_GAP = 8
+MAX_GAP = 30
+BUMP_CHANCE = 0.7
+
+
+def lattice(rng: random.Random, count: int) -> list[int]:
+    """Rows (or cols) of the junction lattice, with a margin before the first."""
+    result = [rng.randint(4, 12)]
+    while len(result) < count:
+        result.append(result[-1] + rng.randint(MIN_GAP, MAX_GAP))
+    return result
+
+
+def corridor(rng: random.Random, start: Point, end: Point, space: int) -> list[Point]:
+    """Corners of a corridor between two junctions on the same row or col.
+
+    Horizontal corridors may detour upwards and vertical ones leftwards,
+    using at most half of ``space`` and only their first half. That keeps
+    every detour clear of its neighbours.
+    """
+    vertical = start[1] == end[1]
+    if vertical:
+        start, end = start[::-1], end[::-1]
+    (line, begin), (_, finish) = start, end
+    half = (finish - begin) // 2
+    corners: list[Point] = [(line, begin)]
+    if half >= 6 and space // 2 - 2 >= 1 and rng.random() < BUMP_CHANCE:
+        first = rng.randint(begin + 3, begin + half - 3)
+        second = rng.randint(first + 2, begin + half - 1)
+        depth = rng.randint(1, space // 2 - 2)
+        corners.extend(
+            [
+                (line, first),
+                (line - depth, first),
+                (line - depth, second),
+                (line, second),
+            ]
+        )
+    corners.append((line, finish))
+    return [corner[::-1] for corner in corners] if vertical else corners
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Hiking trails on a lattice of junctions; ``scale`` multiplies the area.
+
+    Slopes sit on both ends of every corridor and point right or down, so
+    part1's graph is acyclic like a real input's. Corridors randomly detour
+    so that paths differ in length.
+    """
+    count = scaled_side(JUNCTIONS, scale, minimum=2)
+    rows, cols = lattice(rng, count), lattice(rng, count)
+    height = rows[-1] + rng.randint(4, 12)
+    width = cols[-1] + rng.randint(5, 12)
+    grid = [["#"] * width for _ in range(height)]
+    slopes: list[tuple[Point, str]] = [
+        ((rows[0], cols[0] - 1), ">"),
+        ((rows[-1], cols[-1] + 1), ">"),
+    ]
+    paths = [
+        [(0, 1), (rows[0], 1), (rows[0], cols[0])],
+        [(rows[-1], cols[-1]), (rows[-1], width - 2), (height - 1, width - 2)],
+    ]
+    for i, row in enumerate(rows):
+        for j, col in enumerate(cols):
+            if j + 1 < count:
+                space = row - rows[i - 1] if i > 0 else row
+                paths.append(corridor(rng, (row, col), (row, cols[j + 1]), space))
+                slopes += [((row, col + 1), ">"), ((row, cols[j + 1] - 1), ">")]
+            if i + 1 < count:
+                space = col - cols[j - 1] if j > 0 else col
+                paths.append(corridor(rng, (row, col), (rows[i + 1], col), space))
+                slopes += [((row + 1, col), "v"), ((rows[i + 1] - 1, col), "v")]
+
+    for path in paths:
+        for row, col in trace(path):
+            grid[row][col] = "."
+    for (row, col), slope in slopes:
+        grid[row][col] = slope
+    return render_grid(grid)
@@ -1,9 +1,18 @@
 """Classes for part1."""
-from copy import deepcopy
+from collections import deque
 from dataclasses import dataclass
-from queue import Queue
 from typing import Any, Optional
 
+from aoc.lib import budget, counters
+from aoc.lib.directions import EAST, NORTH, SOUTH, WEST
+from aoc.lib.grid import Grid
+
+PATH = "."
+WALL = "#"
+NODE = "X"  # a fork in the maze, marked by part 2
+# the only direction each one-way tile can be left in
+HILLS = {"^": NORTH, ">": EAST, "v": SOUTH, "<": WEST}
+
 
 @dataclass(frozen=True, slots=True)
 class Position:
@@ -30,35 +39,26 @@ class Position:
         """Pretty-printable representation."""
         return f"{self.row}, {self.col}"
 
-    def expand(self) -> list["Position"]:
-        """Expand in 4 cardinal directions."""
-        return [
-            self.copy_modify(row=-1),
-            self.copy_modify(row=+1),
-            self.copy_modify(col=-1),
-            self.copy_modify(col=+1),
-        ]
-
 
 class Path:
-    """A list of Positions."""
+    """A list of positions, as indices of the maze's grid."""
 
-    route: list[Position]
-    nodes: set[Position]
+    route: list[int]
+    nodes: set[int]
 
     def __init__(self) -> None:
         """Creates an empty path."""
         self.route = []
         self.nodes = set()
 
-    def can_add(self, position: Position) -> bool:
+    def can_add(self, position: int) -> bool:
         """Whether we can add a given position.
 
         If we have already visited the position, we can't
         """
         return position not in self.nodes
 
-    def add(self, position: Position) -> None:
+    def add(self, position: int) -> None:
         """Add a position to the path."""
         self.route.append(position)
         self.nodes.add(position)
@@ -76,14 +76,14 @@ class Path:
         result.route.reverse()
         return result
 
-    def last(self) -> Position:
+    def last(self) -> int:
         """Return last position in path.
 
         Raises:
             ValueError: if we have no positions.
 
         Returns:
-            Position: last position in path
+            int: last position in path
         """
         if len(self.route) == 0:
             raise ValueError("Don't call last when i'm empty 4head")
@@ -101,7 +101,8 @@ class Path:
         base_str = str(maze)
         char_array: list[list[str]] = [list(line) for line in base_str.split("\n")]
         for node in self.route:
-            char_array[node.row][node.col] = "O"
+            row, col = maze.grid.row_col(node)
+            char_array[row][col] = "O"
         return "\n".join("".join(char for char in row) for row in char_array)
 
     def __len__(self) -> int:
@@ -123,62 +124,55 @@ class Path:
 
 
 class Maze:
-    """2d array of chars."""
+    """2d array of chars, walled in.
+
+    The cells just outside the maze read as walls, so positions one step
+    out of bounds need no special casing.
+    """
 
-    grid: list[list[str]]  # 2d array of chars
+    grid: Grid
     num_rows: int
     num_cols: int
 
-    def __init__(self, data: list[list[str]]) -> None:
+    def __init__(self, grid: Grid) -> None:
         """Initializes us and our row/col fields."""
-        self.grid = data
-        self.num_rows = len(data)
-        self.num_cols = len(data[0])
+        self.grid = grid
+        self.num_rows = grid.num_rows
+        self.num_cols = grid.num_cols
 
     def __str__(self) -> str:
         """Pretty-print."""
-        return "\n".join("".join(col for col in row) for row in self.grid)
+        return str(self.grid)
 
-    def __getitem__(self, position: Position) -> Optional[str]:
-        """Get item via position. Returns None if out of bounds."""
+    def __getitem__(self, position: Position) -> str:
+        """Get item via position; ``#`` just outside the maze."""
         if not isinstance(position, Position):
             raise AssertionError(f"position is not a Position, {type(position)}")
-        if self.is_oob(position):
-            return None
-        return self.grid[position.row][position.col]
+        return self.grid.char(self.grid.index(position.row, position.col))
 
     def __setitem__(self, position: Position, value: str) -> None:
-        """Get item via position. Returns None if out of bounds."""
+        """Set item via position."""
         if not isinstance(position, Position):
             raise AssertionError(f"position is not a Position, {type(position)}")
-        if self.is_oob(position):
+        if not self.grid.in_bounds(position.row, position.col):
             raise AssertionError("can't set outside our maze!")
-        self.grid[position.row][position.col] = value
-
-    def is_oob(self, position: Position) -> bool:
-        """True if position is out of bounds."""
-        return (
-            position.row < 0
-            or position.row >= self.num_rows
-            or position.col < 0
-            or position.col >= self.num_cols
-        )
+        self.grid[self.grid.index(position.row, position.col)] = ord(value)
 
     def copy(self) -> "Maze":
         """Copies us."""
-        result = Maze(deepcopy(self.grid))
-        return result
+        return Maze(self.grid.copy())
 
     def get_cell_branches(self, position: Position) -> int:
         """Returns how many branches come out of this tile."""
-        result = 0
-        if self[position] != ".":
+        return self.branches(self.grid.index(position.row, position.col))
+
+    def branches(self, index: int) -> int:
+        """Returns how many branches come out of the tile at a grid index."""
+        grid = self.grid
+        if grid[index] != ord(PATH):
             return 0
-        for direction in position.expand():
-            tile = self[direction]
-            if tile is not None and tile != "#":
-                result += 1
-        return result
+        wall = ord(WALL)
+        return sum(1 for offset in grid.offsets if grid[index + offset] != wall)
 
 
 class Solver1:
@@ -199,64 +193,59 @@ class Solver1:
 
     def solve(self) -> list[Path]:
         """Solve the maze, using bfs."""
-        paths: Queue[Path] = Queue()
+        grid = self.maze.grid
+        paths: deque[Path] = deque()
         first_path = Path()
-        first_path.add(Position(0, 1))
-        paths.put(first_path)
+        first_path.add(grid.index(0, 1))
+        paths.append(first_path)
+        last_row = grid.index(self.maze.num_rows - 1, 0)
         # bfs all paths simultaneously
         results: list[Path] = []
-        count = 1
-        while not paths.empty():
-            path = paths.get()
-            if path.last().row == self.maze.num_rows - 1:
+        expanded = peak = 0
+        track = counters.enabled()
+        while paths:
+            if track:
+                peak = max(peak, len(paths))
+            path = paths.popleft()
+            if path.last() >= last_row:
                 results.append(path)
                 continue
 
-            expansions = self.expand_path(path)
-            for expansion in expansions:
-                paths.put(expansion)
-            count += 1
+            expanded += 1
+            if not expanded & 0xFFF:
+                budget.check(best=max(map(len, results), default=None))
+            paths.extend(self.expand_path(path))
 
+        counters.add("expanded", expanded)
+        counters.maximum("queue_peak", peak)
         return results
 
-    def expand_hill(self, position: Position, tile: str) -> list[Position]:
+    def expand_hill(self, position: int, tile: str) -> list[int]:
         """Expand valid positions based on our current tile."""
-        if tile == "^":
-            return [position.copy_modify(row=-1)]
-        elif tile == "v":
-            return [position.copy_modify(row=+1)]
-        elif tile == "<":
-            return [position.copy_modify(col=-1)]
-        elif tile == ">":
-            return [position.copy_modify(col=+1)]
-        else:
-            return position.expand()
+        offsets = self.maze.grid.offsets
+        if tile in HILLS:
+            return [position + offsets[HILLS[tile]]]
+        return [position + offset for offset in offsets]
 
     def expand_path(self, path: Path) -> list[Path]:
         """Expand path based on current path."""
-        current_pos: Position = path.last()
-        current_tile: Optional[str] = self.maze[current_pos]
-        if current_tile is None:
-            raise AssertionError("there's no shot we got a tile outside the maze")
-        expansions: list[Position]
+        grid = self.maze.grid
+        current_pos = path.last()
+        expansions: list[int]
         if self.handle_hills:
-            expansions = self.expand_hill(current_pos, current_tile)
+            expansions = self.expand_hill(current_pos, grid.char(current_pos))
         else:
-            expansions = current_pos.expand()
+            expansions = grid.neighbours(current_pos)
 
+        wall = ord(WALL)
         valid_expansions = []
         for expansion in expansions:
-            expansion_tile = self.maze[expansion]
-            if (
-                path.can_add(expansion)
-                and expansion_tile is not None
-                and expansion_tile != "#"
-            ):
+            if path.can_add(expansion) and grid.cells[expansion] != wall:
                 valid_expansions.append(expansion)
         return generate_paths(path, valid_expansions)
 
 
-def generate_paths(path: Path, expansions: list[Position]) -> list[Path]:
+def generate_paths(path: Path, expansions: list[int]) -> list[Path]:
     """Given a path and valid expansions, (optionally) copies the path.
 
     Returns a list of new paths.
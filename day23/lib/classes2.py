@@ -1,21 +1,51 @@
 """part 2 solution."""
-import math
-import os
-import time
-from concurrent.futures import ProcessPoolExecutor as Pool
+import functools
+from collections import deque
 from dataclasses import dataclass, field
-from queue import Queue
-from typing import Any
-
-import colorama
+from typing import TYPE_CHECKING, Any
 
+from aoc.lib import budget, counters, output, shared
+from aoc.lib.profiling import profile_worker
+from aoc.lib.workers import worker_count
 from day23.lib import classes
-from day23.lib.classes import Maze, Path, Position
+from day23.lib.classes import NODE, PATH, WALL, Maze, Path, Position
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# a search with a time budget is split into at least this many prefixes
+MIN_PREFIXES = 1000
+# otherwise into this many per worker, so that uneven prefixes even out
+PREFIXES_PER_WORKER = 8
+
+# a path's last node, its length and the nodes before its last
+Prefix = tuple[int, int, set[int]]
+# ``(neighbour, length)`` of each edge of each node
+Adjacency = list[list[tuple[int, int]]]
+
+# the graph a worker process searches, built once from the shared arrays
+_adjacency: Adjacency = []
+_destination = 0
+
+
+@functools.cache
+def init_colorama() -> None:
+    """Lets Windows terminals show the maze colours; only needed once."""
+    import colorama
+
+    colorama.init(convert=True)
 
-colorama.init(convert=True)
 
+def highlight_nodes(maze: Maze) -> str:
+    """The maze, with its nodes highlighted in green."""
+    import colorama
 
-@dataclass(eq=True)
+    init_colorama()
+    highlighted = colorama.Back.GREEN + NODE + colorama.Back.BLACK
+    return str(maze).replace(NODE, highlighted)
+
+
+@dataclass(eq=True, slots=True)
 class Node:
     """Node representing a fork to another."""
 
@@ -28,7 +58,7 @@ class Node:
         return f"{self.name}: ({self.position}) {[str(edge) for edge in self.edges]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     """Edge class, representing a path between nodes."""
 
@@ -71,20 +101,18 @@ class Solver2:
         start = Position(0, 1)
         nodes.append(Node(0, start))
         name = 1
-        for row in range(maze.num_rows):
-            for col in range(maze.num_cols):
-                pos = Position(row, col)
-                if maze.get_cell_branches(pos) > 2:
-                    node = Node(name, pos)
-                    name += 1
-                    nodes.append(node)
+        for index in maze.grid.indices():
+            if maze.branches(index) > 2:
+                node = Node(name, Position(*maze.grid.row_col(index)))
+                name += 1
+                nodes.append(node)
 
         # add start and end coz they are dumb
         end = Position(maze.num_rows - 1, maze.num_cols - 2)
         nodes.append(Node(name, end))
 
         for node in nodes:
-            maze[node.position] = colorama.Back.GREEN + "X" + colorama.Back.BLACK
+            maze[node.position] = NODE
         return {node.position: node for node in nodes}
 
     @staticmethod
@@ -96,41 +124,40 @@ class Solver2:
         Modifies the maze inplace, filling it in with #.
         Modifies the node and its connecting nodes by adding Edges
         """
+        grid = maze.grid
+        indices = {
+            grid.index(position.row, position.col): node
+            for position, node in nodes.items()
+        }
+        start = grid.index(start_node.position.row, start_node.position.col)
         first_path = Path()
-        first_path.add(start_node.position)
-        paths: Queue[Path] = Queue()
-        paths.put(first_path)
-        while not paths.empty():
-            path = paths.get()
+        first_path.add(start)
+        paths: deque[Path] = deque([first_path])
+        while paths:
+            path = paths.popleft()
             pos = path.last()
-            if pos != start_node.position and pos in nodes:
+            if pos != start and pos in indices:
                 # reached an edge
-                edge = Edge(start_node.name, nodes[pos].name, path)
+                end_node = indices[pos]
+                edge = Edge(start_node.name, end_node.name, path)
                 start_node.edges.append(edge)
-                end_node = nodes[pos]
                 end_node.edges.append(edge.flip())
                 continue
-            expansions = Solver2.expand_path(path, maze)
-            for path in expansions:
-                paths.put(path)
+            paths.extend(Solver2.expand_path(path, maze))
 
     @staticmethod
     def expand_path(path: Path, maze: Maze) -> list[Path]:
         """Expands a path, nuking that section of the maze using #."""
-        current_pos: Position = path.last()
-        expansions = current_pos.expand()
+        cells = maze.grid.cells
+        wall, path_tile = ord(WALL), ord(PATH)
 
         valid_expansions = []
-        for expansion in expansions:
-            expansion_tile = maze[expansion]
-            if (
-                path.can_add(expansion)
-                and expansion_tile is not None
-                and expansion_tile != "#"
-            ):
+        for expansion in maze.grid.neighbours(path.last()):
+            expansion_tile = cells[expansion]
+            if path.can_add(expansion) and expansion_tile != wall:
                 valid_expansions.append(expansion)
-                if expansion_tile == ".":
-                    maze[expansion] = "#"
+                if expansion_tile == path_tile:
+                    cells[expansion] = wall
         return classes.generate_paths(path, valid_expansions)
 
     def build_nodes(self) -> list[Node]:
@@ -138,7 +165,7 @@ class Solver2:
         # make backup of maze
         maze_copy = self.input_maze.copy()
         nodes: dict[Position, Node] = self.get_nodes(maze_copy)
-        print(maze_copy)
+        output.visual(lambda: highlight_nodes(maze_copy))
         for node in nodes.values():
             self.calculate_edges(node, nodes, maze_copy)
 
@@ -148,71 +175,133 @@ class Solver2:
         """Solves the maze."""
         nodes: list[Node] = self.build_nodes()
 
-        print("\n".join(str(node) for node in nodes))
-        start = time.time()
-        cpu_count = os.cpu_count() or 2
-        levels = int(math.log(cpu_count, 2))
-        result = solve2(nodes, 0, len(nodes) - 1, 0, set(), levels)
-        print(f"Executed in: {time.time() - start}")
-        return result
+        output.verbose(lambda: "\n".join(str(node) for node in nodes))
+        # the dfs is too hot to count in; its work grows with the graph's size
+        counters.maximum("graph_nodes", len(nodes))
+        counters.maximum("graph_edges", sum(len(node.edges) for node in nodes) // 2)
+        destination = len(nodes) - 1
+        if budget.active() or worker_count() > 1:
+            return solve2_parallel(nodes, destination)
+        return solve2(adjacency(nodes), 0, destination, 0, set())
+
+
+def adjacency(nodes: list[Node]) -> Adjacency:
+    """``(neighbour, length)`` of each node's edges, for the search to loop over."""
+    return [[(edge.node2, edge.length) for edge in node.edges] for node in nodes]
+
+
+def graph_arrays(nodes: list[Node]) -> dict[str, "npt.NDArray[Any]"]:
+    """The graph as flat arrays, for sharing with worker processes.
+
+    Node ``i``'s edges are ``edge_starts[i]`` to ``edge_starts[i + 1]`` of
+    ``edge_targets`` and ``edge_lengths``.
+    """
+    import numpy as np
+
+    edges = adjacency(nodes)
+    starts = np.cumsum([0] + [len(node_edges) for node_edges in edges])
+    pairs = np.array([pair for node_edges in edges for pair in node_edges])
+    pairs = pairs.reshape(-1, 2)
+    return {
+        "edge_starts": starts.astype(np.int64),
+        "edge_targets": pairs[:, 0].astype(np.int64),
+        "edge_lengths": pairs[:, 1].astype(np.int64),
+    }
+
+
+def init_graph(destination: int) -> None:
+    """Builds the graph of a worker process from the shared arrays."""
+    global _adjacency, _destination
+    starts = shared.get("edge_starts").tolist()
+    targets = shared.get("edge_targets").tolist()
+    lengths = shared.get("edge_lengths").tolist()
+    _adjacency = [
+        list(zip(targets[start:end], lengths[start:end]))
+        for start, end in zip(starts, starts[1:])
+    ]
+    _destination = destination
 
 
 def solve2(
-    nodes: list[Node],
+    edges: Adjacency,
     current: int,
     destination: int,
     distance: int,
     seen: set[int],
-    forks_remaining: int,
 ) -> int:
-    """Solves a dfs by creating forking into multiprocessing."""
+    """Longest path to ``destination`` that avoids ``seen``, by dfs."""
     if current == destination:
         return distance
 
     best = 0
     seen.add(current)
-
-    # run the code in this thread
-    if forks_remaining == 0 or len(nodes[current].edges) == 1:
-        for edge in nodes[current].edges:
-            neighbor, weight = edge.node2, edge.length
-            if neighbor in seen:
-                continue
-
-            result = solve2(
-                nodes,
-                neighbor,
-                destination,
-                distance + weight,
-                seen,
-                forks_remaining,
-            )
+    for neighbor, weight in edges[current]:
+        if neighbor not in seen:
+            result = solve2(edges, neighbor, destination, distance + weight, seen)
             best = max(best, result)
-    else:  # Use multiprocessing.Pool for parallel execution
-        tasks = []
-        for edge in nodes[current].edges:
-            neighbor, weight = edge.node2, edge.length
-            if neighbor in seen:
-                continue
-            tasks.append(
-                [
-                    nodes,
-                    neighbor,
-                    destination,
-                    distance + weight,
-                    seen,
-                    forks_remaining - 1,
-                ]
-            )
-        with Pool(len(tasks)) as pool:
-            for result in pool.map(solve2_helper, tasks):
-                best = max(best, result)
-
     seen.remove(current)
 
     return best
 
 
-def solve2_helper(args: list[Any]) -> int:
-    """ThreadPoolExecutor doesnt have starmap so we use a helper."""
-    return solve2(*args)
+def prefixes(nodes: list[Node], destination: int, count: int) -> list[Prefix]:
+    """Paths from the first node, one edge longer at a time until there's ``count``.
+
+    Paths that reach ``destination`` aren't extended, and dead ends are
+    dropped since they don't lead there.
+    """
+    paths: list[Prefix] = [(0, 0, set())]
+    extended = True
+    while extended and len(paths) < count:
+        extended = False
+        longer: list[Prefix] = []
+        for current, distance, seen in paths:
+            if current == destination:
+                longer.append((current, distance, seen))
+                continue
+            extended = True
+            before = seen | {current}
+            for edge in nodes[current].edges:
+                if edge.node2 not in before:
+                    longer.append((edge.node2, distance + edge.length, before))
+        paths = longer
+    return paths
+
+
+def solve2_parallel(nodes: list[Node], destination: int) -> int:
+    """``solve2``, split into prefixes that workers search from.
+
+    The workers get the graph once through shared memory, and then just the
+    prefixes. With a time budget there are enough prefixes to stop between.
+
+    Raises:
+        BudgetExceeded: with the longest path found, once out of time.
+    """
+    workers = worker_count()
+    count = MIN_PREFIXES if budget.active() else workers * PREFIXES_PER_WORKER
+    tasks = prefixes(nodes, destination, count)
+    if workers == 1:
+        edges, best = adjacency(nodes), 0
+        for index, (current, distance, seen) in enumerate(tasks):
+            budget.check(index / len(tasks), best)
+            best = max(best, solve2(edges, current, destination, distance, seen))
+        return best
+
+    graph = graph_arrays(nodes)
+    # one prefix at a time, so workers that finish early take the rest
+    results = shared.map_tasks(
+        solve2_prefix, tasks, graph, init_graph, (destination,), workers, chunksize=1
+    )
+    solved = [result for result in results if result is not None]
+    if len(solved) < len(results):
+        raise budget.BudgetExceeded(len(solved) / len(results), max(solved, default=0))
+    return max(solved, default=0)
+
+
+@profile_worker
+def solve2_prefix(prefix: Prefix) -> int | None:
+    """``solve2`` from the end of a prefix; None once out of time."""
+    if budget.expired():
+        return None
+    current, distance, seen = prefix
+    return solve2(_adjacency, current, _destination, distance, seen)
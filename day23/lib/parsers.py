@@ -1,10 +1,8 @@
 """Day23 parsers."""
-from day23.lib.classes import Maze
+from aoc.lib.grid import Grid
+from day23.lib.classes import WALL, Maze
 
 
 def get_maze(path: str) -> Maze:
     """Parse input file and return wellformed maze."""
-    rows: list[list[str]] = []
-    with open(path, encoding="utf8") as file:
-        rows = [list(line.strip()) for line in file]
-    return Maze(rows)
+    return Maze(Grid.load(path, border=ord(WALL)))
@@ -0,0 +1,13 @@
+"""Runner hooks for day23."""
+from aoc.solution import Solution
+from day23.day23 import INPUT, part1, part2
+from day23.lib.parsers import get_maze
+
+SOLUTION = Solution(
+    day=23,
+    input_path=INPUT,
+    parse=get_maze,
+    part1=part1,
+    part2=part2,
+    forking_parts=(2,),
+)
@@ -22,7 +22,7 @@ def test_maze() -> None:
     maze: Maze = get_maze(INPUT_SMALL)
     assert maze[Position(0, 0)] == "#"
     assert maze[Position(0, 1)] == "."
-    assert maze[Position(-1, 0)] is None
+    assert maze[Position(-1, 0)] == "#"  # outside the maze is walled
 
     position_checks = [
         (Position(0, 1), 1),
@@ -40,21 +40,18 @@ def test_solver1() -> None:
     """Test ``Solver`` class."""
     maze: Maze = get_maze(INPUT_SMALL)
     solver: Solver1 = Solver1(maze)
+    index = maze.grid.index
 
     expands = [
-        (
-            Position(5, 5),
-            " ",
-            {Position(4, 5), Position(6, 5), Position(5, 4), Position(5, 6)},
-        ),
-        (Position(5, 5), "^", {Position(4, 5)}),
-        (Position(5, 5), ">", {Position(5, 6)}),
-        (Position(5, 5), "<", {Position(5, 4)}),
-        (Position(5, 5), "v", {Position(6, 5)}),
+        (" ", {index(4, 5), index(6, 5), index(5, 4), index(5, 6)}),
+        ("^", {index(4, 5)}),
+        (">", {index(5, 6)}),
+        ("<", {index(5, 4)}),
+        ("v", {index(6, 5)}),
     ]
 
-    for pos, tile, result in expands:
-        assert set(solver.expand_hill(pos, tile)) == result
+    for tile, result in expands:
+        assert set(solver.expand_hill(index(5, 5), tile)) == result
 
     # solve part2 naively, to make sure the code works
     maze = get_maze(INPUT_SMALL)
@@ -72,32 +69,32 @@ def test_path() -> None:
     # assert that path.last() fails when calling on empty path
     with pytest.raises(ValueError):
         path.last()
-    path.add(Position(0, 0))
-    path.add(Position(0, 1))
-    assert path.last() == Position(0, 1)
+    path.add(0)
+    path.add(1)
+    assert path.last() == 1
 
     path2 = path.copy()
 
-    assert path2.last() == Position(0, 1)
-    path2.add(Position(0, 2))
-    assert path.last() == Position(0, 1)
-    assert path2.last() == Position(0, 2)
+    assert path2.last() == 1
+    path2.add(2)
+    assert path.last() == 1
+    assert path2.last() == 2
 
 
 def test_generate_paths() -> None:
     """Test ``generate_paths()``."""
     path = Path()
-    path.add(Position(0, 0))
-    path.add(Position(0, 1))
+    path.add(0)
+    path.add(1)
 
     # manually generate the paths
     path1 = path.copy()
-    path1.add(Position(0, 2))
+    path1.add(2)
     path2 = path.copy()
-    path2.add(Position(-1, 1))
+    path2.add(-1)
 
     # note that the original path is modified in-place!
-    paths: list[Path] = generate_paths(path, [Position(0, 2), Position(-1, 1)])
+    paths: list[Path] = generate_paths(path, [2, -1])
     assert len(paths) == 2
 
     auto_path1 = paths[0]
@@ -110,7 +107,7 @@ def test_generate_paths() -> None:
     # test that we modify the path inplace when passed one position
     path_before = path  # reference
     len_before = len(path_before.route)
-    paths = generate_paths(path, [Position(69, 69)])
+    paths = generate_paths(path, [69])
     assert (
         len(paths) == 1
         and paths[0] == path_before
@@ -1,9 +1,19 @@
 """Test day23 part 2."""
 from typing import TYPE_CHECKING
 
+import pytest
+
+from aoc.lib.workers import WORKERS_ENV
 from day23.day23 import INPUT_SMALL
 from day23.lib.classes import Position
-from day23.lib.classes2 import Node, Solver2
+from day23.lib.classes2 import (
+    Node,
+    Solver2,
+    adjacency,
+    prefixes,
+    solve2,
+    solve2_parallel,
+)
 from day23.lib.parsers import get_maze
 
 if TYPE_CHECKING:
@@ -32,3 +42,30 @@ def test_solver2() -> None:
     assert nodes_list[0].edges[0].length == 15
 
     assert solver.solve() == 154
+
+
+def test_prefixes() -> None:
+    """Splitting the search into prefixes doesn't change the longest path."""
+    nodes = Solver2(get_maze(INPUT_SMALL)).build_nodes()
+    destination = len(nodes) - 1
+    edges = adjacency(nodes)
+    for count, expected in ((1, 1), (3, 4), (1000, 12)):
+        paths = prefixes(nodes, destination, count)
+        assert len(paths) == expected
+        assert (
+            max(
+                solve2(edges, current, destination, distance, seen)
+                for current, distance, seen in paths
+            )
+            == 154
+        )
+    assert solve2_parallel(nodes, destination) == 154
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_no_path(workers: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without a path to the destination, both ways of solving give 0."""
+    monkeypatch.setenv(WORKERS_ENV, workers)
+    nodes = [Node(0, Position(0, 1)), Node(1, Position(2, 1))]
+    assert prefixes(nodes, 1, 8) == []
+    assert solve2_parallel(nodes, 1) == 0
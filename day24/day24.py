@@ -1,8 +1,8 @@
 """day24 solution."""
 from typing import Optional
 
-import z3
 
+from aoc.lib import output
 from day24.lib.classes import Hailstone, Vector2
 from day24.lib.parsers import parse_input
 
@@ -44,7 +44,7 @@ def within_2d(point: Vector2, min_max: Vector2) -> bool:
 def part1(hailstones: list[Hailstone], valid_range: Vector2) -> int:
     """Solve part1: list of hailstones that are within a given rectangle."""
     result = 0
-    print(len(hailstones))
+    output.verbose(f"{len(hailstones)} hailstones")
     left: Hailstone
     right: Hailstone
     for index, left in enumerate(hailstones[:-1]):
@@ -62,6 +62,8 @@ def part1(hailstones: list[Hailstone], valid_range: Vector2) -> int:
 
 def part2(hailstones: list[Hailstone]) -> int:
     """Solve part2: a magic hailstone that passes through all other hailstones."""
+    import z3
+
     x, y, z = z3.Reals("x y z")
     vx, vy, vz = z3.Reals("vx vy vz")
 
@@ -77,7 +79,7 @@ def part2(hailstones: list[Hailstone]) -> int:
         solver.add(y + vy * t == pos.y + vel.y * t)
         solver.add(z + vz * t == pos.z + vel.z * t)
 
-    print(solver.check())
+    output.verbose(str(solver.check()))
 
     model = solver.model()
 
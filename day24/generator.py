@@ -0,0 +1,31 @@
+"""Synthetic input generator for day24."""
+import random
+
+from aoc.lib.synthetic import scaled
+
+HAILSTONES = 300
+AREA = (200_000_000_000_000, 400_000_000_000_000)
+MAX_SPEED = 300
+TIMES = (10_000_000_000, 200_000_000_000)
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Hailstones that one thrown rock hits; ``scale`` multiplies the count.
+
+    The rock starts inside the part1 test area and each hailstone is hit at
+    a distinct time, so part2 has an exact integer answer.
+    """
+    count = scaled(HAILSTONES, scale, minimum=3)
+    rock = [rng.randint(*AREA) for _ in range(3)]
+    rock_velocity = [rng.randint(-MAX_SPEED, MAX_SPEED) for _ in range(3)]
+    lines: list[str] = []
+    for time in rng.sample(range(*TIMES), count):
+        velocity = [rng.randint(-MAX_SPEED, MAX_SPEED) for _ in range(3)]
+        position = [
+            start + (speed - hail_speed) * time
+            for start, speed, hail_speed in zip(rock, rock_velocity, velocity)
+        ]
+        position_str = ", ".join(str(value) for value in position)
+        velocity_str = ", ".join(str(value) for value in velocity)
+        lines.append(f"{position_str} @ {velocity_str}")
+    return "\n".join(lines) + "\n"
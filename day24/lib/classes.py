@@ -24,7 +24,7 @@ class Vector2:
     y: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hailstone:
     """Hailstone has a 3d vector for pos/velocity."""
 
@@ -0,0 +1,35 @@
+"""Runner hooks for day24."""
+import filecmp
+import os
+
+from aoc.solution import ROOT, Solution
+from day24.day24 import INPUT, INPUT_SMALL, part1, part2
+from day24.lib.classes import Hailstone, Vector2
+from day24.lib.parsers import parse_input
+
+
+def parse(path: str) -> tuple[list[Hailstone], Vector2]:
+    """Parse hailstones; the test area depends on which input we're given.
+
+    The example's small test area is used for any copy of the example, however
+    its path is spelled, and the real one for everything else.
+    """
+    small_path, small_range = INPUT_SMALL
+    is_small = filecmp.cmp(path, os.path.join(ROOT, small_path), shallow=False)
+    return parse_input(path), small_range if is_small else INPUT[1]
+
+
+def solve_part1(data: tuple[list[Hailstone], Vector2]) -> int:
+    """Number of future xy intersections inside the test area."""
+    return part1(*data)
+
+
+def solve_part2(data: tuple[list[Hailstone], Vector2]) -> int:
+    """Sum of the rock's starting coordinates."""
+    hailstones, _ = data
+    return part2(hailstones)
+
+
+SOLUTION = Solution(
+    day=24, input_path=INPUT[0], parse=parse, part1=solve_part1, part2=solve_part2
+)
@@ -1,7 +1,12 @@
 """Test main functions in day24."""
-from day24.day24 import INPUT_SMALL, get_intersection_2d, part1, part2, within_2d
+import os
+import pathlib
+import shutil
+
+from day24.day24 import INPUT, INPUT_SMALL, get_intersection_2d, part1, part2, within_2d
 from day24.lib.classes import Hailstone, Vector2, Vector3
 from day24.lib.parsers import parse_input
+from day24.solution import SOLUTION
 
 
 def test_part1() -> None:
@@ -39,3 +44,14 @@ def test_within_2d() -> None:
     assert not within_2d(v3, valid_range)
     assert not within_2d(v4, valid_range)
     assert not within_2d(v5, valid_range)
+
+
+def test_parse_test_area(tmp_path: pathlib.Path) -> None:
+    """The example's test area doesn't depend on how its path is spelled."""
+    file_path, valid_range = INPUT_SMALL
+    copy = tmp_path / "input.txt"
+    shutil.copy(file_path, copy)
+    for path in (file_path, f"./{file_path}", os.path.abspath(file_path), str(copy)):
+        assert SOLUTION.parse(path)[1] == valid_range
+    copy.write_text("19, 13, 30 @ -2, 1, -2\n", encoding="utf8")
+    assert SOLUTION.parse(str(copy))[1] == INPUT[1]
@@ -1,8 +1,11 @@
 """day25 solution."""
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
-import networkx as nx
+from aoc.lib import output
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 INPUT_SMALL = "day25/input-small.txt"
 INPUT = "day25/input.txt"
@@ -40,8 +43,11 @@ def get_data(path: str) -> list[Connection]:
     return connections
 
 
-def show_graph(graph: nx.Graph) -> None:  # pragma: no cover
+def show_graph(graph: "nx.Graph") -> None:  # pragma: no cover
     """Draws a graph that you can see."""
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     nx.draw(graph, with_labels=True)
     plt.draw()
     plt.show()
@@ -49,6 +55,8 @@ def show_graph(graph: nx.Graph) -> None:  # pragma: no cover
 
 def solve_nodes(connections: list[Connection]) -> int:
     """Graphs the modules."""
+    import networkx as nx
+
     G = nx.Graph()
 
     nodes: set[str] = set()
@@ -63,7 +71,7 @@ def solve_nodes(connections: list[Connection]) -> int:
     if SHOW_GRAPH:  # pragma: no cover
         show_graph(G)
     cut_value, partition = nx.stoer_wagner(G)
-    print(f"num_cuts: {cut_value}")
+    output.verbose(f"num_cuts: {cut_value}")
     return len(partition[0]) * len(partition[1])
 
 
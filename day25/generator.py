@@ -0,0 +1,52 @@
+"""Synthetic input generator for day25."""
+import random
+from collections import defaultdict
+
+from aoc.lib.synthetic import scaled, unique_names
+
+NODES = 1500
+EXTRA_EDGES = 0.5
+
+
+def edge(first: str, second: str) -> tuple[str, str]:
+    """An undirected edge in a canonical order."""
+    return (first, second) if first < second else (second, first)
+
+
+def component(rng: random.Random, nodes: list[str]) -> list[tuple[str, str]]:
+    """Edges of a 4-edge-connected graph over ``nodes``.
+
+    Each node links to the next two around a ring, plus a few random
+    chords.
+    """
+    size = len(nodes)
+    edges = {
+        edge(nodes[index], nodes[(index + step) % size])
+        for index in range(size)
+        for step in (1, 2)
+    }
+    for _ in range(round(size * EXTRA_EDGES)):
+        edges.add(edge(*rng.sample(nodes, 2)))
+    return sorted(edges)
+
+
+def generate(scale: float, rng: random.Random) -> str:
+    """Two components joined by exactly three wires; ``scale`` multiplies the node count.
+
+    Both components are 4-edge-connected, so the three joining wires are
+    the only minimum cut.
+    """
+    names = unique_names(rng, scaled(NODES, scale, minimum=10))
+    split = rng.randint(len(names) * 2 // 5, len(names) * 3 // 5)
+    left, right = names[:split], names[split:]
+    edges = component(rng, left) + component(rng, right)
+    edges += zip(rng.sample(left, 3), rng.sample(right, 3))
+
+    connections: dict[str, list[str]] = defaultdict(list)
+    for first, second in edges:
+        if rng.random() < 0.5:
+            first, second = second, first
+        connections[first].append(second)
+    lines = [f"{src}: {' '.join(dests)}" for src, dests in connections.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
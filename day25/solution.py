@@ -0,0 +1,5 @@
+"""Runner hooks for day25; there is no part2 on the last day."""
+from aoc.solution import Solution
+from day25.day25 import INPUT, get_data, solve_nodes
+
+SOLUTION = Solution(day=25, input_path=INPUT, parse=get_data, part1=solve_nodes)